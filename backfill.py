@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Usage: poetry run backfill DE --data-type production --start 2022-01-01 --end 2023-01-01
+"""
+
+from datetime import datetime, timezone
+from logging import INFO, basicConfig, getLogger
+from pathlib import Path
+
+import click
+
+from parsers.lib.backfill import run_backfill
+from parsers.lib.runner import ParserJob, ParserRunner
+
+logger = getLogger(__name__)
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@click.command()
+@click.argument("key")
+@click.option("--data-type", default=None, help="Defaults to production or exchange.")
+@click.option("--start", required=True, help="ISO 8601 datetime, UTC if naive.")
+@click.option("--end", required=True, help="ISO 8601 datetime, UTC if naive.")
+@click.option(
+    "--output",
+    default=None,
+    help="Newline-delimited JSON file, defaults to <key>_<data type>.ndjson.",
+)
+@click.option("--max-workers", default=8, show_default=True)
+@click.option("--max-requests-per-host", default=4, show_default=True)
+@click.option(
+    "--http-cache",
+    is_flag=True,
+    help="Caches the responses on disk, see parsers.lib.session.mount_response_cache.",
+)
+def backfill(
+    key: str,
+    data_type: str | None,
+    start: str,
+    end: str,
+    output: str | None,
+    max_workers: int,
+    max_requests_per_host: int,
+    http_cache: bool,
+):
+    """
+    Fetches the data of a zone or an exchange over a date range, calling the parser
+    once per refetch frequency, and appends it to a newline-delimited JSON file.
+    Running the same command again resumes an interrupted backfill.
+    \n
+    Examples
+    -------
+    >>> poetry run backfill DE --start 2023-01-01 --end 2023-02-01
+    >>> poetry run backfill "DE->FR" --start 2023-01-01 --end 2023-02-01 --output DE-FR.ndjson
+    """
+    basicConfig(
+        level=INFO, format="%(asctime)s %(levelname)-8s %(name)-30s %(message)s"
+    )
+    if data_type is None:
+        data_type = "exchange" if "->" in key else "production"
+    job = ParserJob(key, data_type)
+    output_path = Path(output or f"{key.replace('->', '-')}_{data_type}.ndjson")
+    runner = ParserRunner(
+        max_workers, max_requests_per_host, logger, cache_responses=http_cache
+    )
+    result = run_backfill(
+        job,
+        _parse_datetime(start),
+        _parse_datetime(end),
+        output_path,
+        runner=runner,
+        logger=logger,
+    )
+    print(
+        f"{result.targets} calls, {result.skipped} already done, "
+        f"{len(result.failed)} failed\n"
+        f"{result.records} records written to {output_path}, "
+        f"{result.duplicates} duplicates skipped"
+    )
+    for target, error in sorted(result.failed.items()):
+        print(f"{target.isoformat()}: {error}")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    backfill()
@@ -2,6 +2,7 @@
 Usage: poetry run capacity_update --zone FR --target_datetime "2022-01-01"
 """
 
+import shlex
 from datetime import datetime
 from logging import DEBUG, basicConfig, getLogger
 
@@ -9,7 +10,8 @@ import click
 from requests import Session
 
 from electricitymap.contrib.lib.types import ZoneKey
-from scripts.update_capacity_configuration import update_source, update_zone
+from parsers.lib.session import get_cache_metrics, get_cached_session
+from scripts.update_capacity_configuration import update_sources, update_zone
 from scripts.utils import ROOT_PATH, run_shell_command
 
 logger = getLogger(__name__)
@@ -18,39 +20,78 @@ basicConfig(level=DEBUG, format="%(asctime)s %(levelname)-8s %(name)-30s %(messa
 
 @click.command()
 @click.option("--zone", default=None)
-@click.option("--source", default=None)
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    help="Can be repeated, the sources are fetched concurrently.",
+)
 @click.option("--target_datetime")
 @click.option("--update_aggregate", default=False)
+@click.option(
+    "--http-cache",
+    is_flag=True,
+    help="Caches the downloads on disk for a day, to reuse them between runs.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Prints the changes of the zone configs of the sources instead of writing them.",
+)
 def capacity_update(
     zone: ZoneKey,
-    source: str,
+    sources: tuple[str, ...],
     target_datetime: str,
     update_aggregate: bool = False,
+    http_cache: bool = False,
+    dry_run: bool = False,
 ):
     """Parameters
     ----------
-    zone: a two letter zone from the map or a zone group (EIA, ENTSOE, EMBER, IRENA)
+    zone: a two letter zone from the map
+    source: a capacity source (EIA, ENTSOE, EMBER, IRENA...), can be repeated
     target_datetime: ISO 8601 string, such as 2018-05-30 15:00
     \n
     Examples
     -------
     >>> poetry run capacity_update --zone FR --target_datetime "2022-01-01"
     >>> poetry run capacity_update --source ENTSOE --target_datetime "2022-01-01"
+    >>> poetry run capacity_update --source EMBER --target_datetime "2022-01-01" --http-cache
+    >>> poetry run capacity_update --source EMBER --source IRENA --target_datetime "2022-01-01" --dry-run
     """
-    assert zone is not None or source is not None, "Either zone or source must be set"
-    assert not (zone is None and source is None), "Zone and source cannot be both set"
+    assert zone is not None or sources, "Either zone or source must be set"
+    assert zone is None or not sources, "Zone and source cannot be both set"
+    assert zone is None or not dry_run, "Dry runs are only supported for sources"
 
-    session = Session()
+    # The IRENA API is queried with POST requests.
+    session = (
+        get_cached_session("capacity", methods=("GET", "POST"))
+        if http_cache
+        else Session()
+    )
     update_aggregate = eval(update_aggregate)
     parsed_target_datetime = None
     if target_datetime is None:
         raise ValueError("target_datetime must be specified")
     parsed_target_datetime = datetime.fromisoformat(target_datetime)
 
-    if source is not None:
-        update_source(source, parsed_target_datetime, session)
+    if sources:
+        paths = update_sources(
+            list(sources), parsed_target_datetime, session, dry_run=dry_run
+        )
     else:
-        update_zone(zone, parsed_target_datetime, session, update_aggregate)
+        paths = update_zone(zone, parsed_target_datetime, session, update_aggregate)
+    if http_cache:
+        metrics = get_cache_metrics(session)
+        print(
+            f"HTTP cache: {metrics['hit']} hits, {metrics['revalidated']} revalidated, "
+            f"{metrics['miss']} misses"
+        )
 
-    print("Running prettier...")
-    run_shell_command("web/node_modules/.bin/prettier --write .", cwd=ROOT_PATH)
+    if paths:
+        print(f"Running prettier on {len(paths)} updated files...")
+        run_shell_command(
+            "web/node_modules/.bin/prettier --write "
+            + " ".join(shlex.quote(str(path)) for path in paths),
+            cwd=ROOT_PATH,
+        )
@@ -4,10 +4,10 @@ from logging import getLogger
 from typing import Any
 
 import pandas as pd
-import pycountry
 from bs4 import BeautifulSoup
 from requests import Response, Session
 
+from electricitymap.contrib.capacity_parsers.countries import alpha_3_to_alpha_2
 from electricitymap.contrib.config import ZoneKey
 
 """ Collects capacity data from the yearly electricity data from Ember. The data and documentation can be found here: https://ember-climate.org/data-catalogue/yearly-electricity-data/"""
@@ -77,6 +77,26 @@ EMBER_ZONES = [
 ]
 
 
+# The columns of the long format CSV used to compute the capacities. The text
+# columns have few distinct values and are read as categories.
+EMBER_CATEGORY_COLUMNS = [
+    "Country code",
+    "Area type",
+    "Category",
+    "Subcategory",
+    "Variable",
+]
+EMBER_COLUMNS = [*EMBER_CATEGORY_COLUMNS, "Year", "Value"]
+SPECIFIC_MODE_MAPPING_TABLE = pd.DataFrame(
+    [
+        (zone, variable, mode)
+        for zone, modes in SPECIFIC_MODE_MAPPING.items()
+        for variable, mode in modes.items()
+    ],
+    columns=["zone_key", "variable", "mode"],
+)
+
+
 def map_variable_to_mode(data: pd.Series) -> str:
     zone = data["zone_key"]
     variable = data["variable"]
@@ -86,6 +106,25 @@ def map_variable_to_mode(data: pd.Series) -> str:
         return EMBER_VARIABLE_TO_MODE[variable]
 
 
+def map_variables_to_modes(df: pd.DataFrame) -> pd.Series:
+    """
+    Maps the variables of all the rows to modes at once, as `map_variable_to_mode`
+    does for a row: the zone specific modes are merged in and the others default to
+    the mode of the variable.
+    """
+    specific_modes = df[["zone_key", "variable"]].merge(
+        SPECIFIC_MODE_MAPPING_TABLE, how="left", on=["zone_key", "variable"]
+    )["mode"]
+    modes = pd.Series(specific_modes.to_numpy(), index=df.index).fillna(
+        df["variable"].map(EMBER_VARIABLE_TO_MODE)
+    )
+    if modes.isna().any():
+        raise ValueError(
+            f"Unknown Ember variables: {sorted(df.loc[modes.isna(), 'variable'].unique())}"
+        )
+    return modes
+
+
 def get_data_from_url(session: Session) -> pd.DataFrame:
     yearly_catalogue_url = EMBER_URL + "/data-catalogue/yearly-electricity-data/"
     r: Response = session.get(yearly_catalogue_url)
@@ -94,7 +133,12 @@ def get_data_from_url(session: Session) -> pd.DataFrame:
         "href"
     ]
     r_csv: Response = session.get(EMBER_URL + csv_link)
-    df = pd.read_csv(io.StringIO(r_csv.text))
+    # Read from the bytes, decoding the whole file as text first is slow.
+    df = pd.read_csv(
+        io.BytesIO(r_csv.content),
+        usecols=EMBER_COLUMNS,
+        dtype={column: "category" for column in EMBER_CATEGORY_COLUMNS},
+    )
     return df
 
 
@@ -106,15 +150,17 @@ def format_ember_data(df: pd.DataFrame, year: int) -> pd.DataFrame:
     df_filtered = df_filtered.loc[
         (df_filtered["Category"] == "Capacity") & (df_filtered["Subcategory"] == "Fuel")
     ]
-    # filter out Kosovo because it is not a country in pycountry
-    df_filtered = df_filtered.loc[df_filtered["Area"] != "Kosovo"]
-
-    df_filtered["country_code_iso2"] = df_filtered["Country code"].apply(
-        lambda x: pycountry.countries.get(alpha_3=x).alpha_2
+    # Codes which are not countries in pycountry, e.g. Kosovo, are mapped to NaN
+    # and filtered out with the zones Ember isn't used for.
+    df_filtered["country_code_iso2"] = (
+        df_filtered["Country code"].astype("category").map(alpha_3_to_alpha_2())
     )
     df_filtered = df_filtered.loc[df_filtered["country_code_iso2"].isin(EMBER_ZONES)]
 
-    df_capacity = df_filtered[["country_code_iso2", "Year", "Variable", "Value"]]
+    # Grouping by categories would add the combinations which aren't observed.
+    df_capacity = df_filtered[
+        ["country_code_iso2", "Year", "Variable", "Value"]
+    ].astype({"country_code_iso2": object, "Variable": object})
     df_capacity = df_capacity.rename(
         columns={
             "country_code_iso2": "zone_key",
@@ -123,10 +169,12 @@ def format_ember_data(df: pd.DataFrame, year: int) -> pd.DataFrame:
             "Value": "value",
         }
     )
-    df_capacity["datetime"] = df_capacity["datetime"].apply(lambda x: datetime(x, 1, 1))
+    df_capacity["datetime"] = pd.to_datetime(
+        df_capacity["datetime"].astype(str), format="%Y"
+    )
     df_capacity["value"] = df_capacity["value"] * 1000  # convert from GW to MW
 
-    df_capacity["mode"] = df_capacity.apply(map_variable_to_mode, axis=1)
+    df_capacity["mode"] = map_variables_to_modes(df_capacity)
     df_capacity = df_capacity.dropna(subset=["value"])
 
     df_capacity = (
@@ -140,16 +188,12 @@ def format_ember_data(df: pd.DataFrame, year: int) -> pd.DataFrame:
 
 def get_capacity_dict_from_df(df_capacity: pd.DataFrame) -> dict[str, Any]:
     all_capacity = {}
-    for zone in df_capacity.index.unique():
-        df_zone = df_capacity.loc[zone]
-        zone_capacity = {}
-        for i, data in df_zone.iterrows():
-            mode_capacity = {}
-            mode_capacity["datetime"] = data["datetime"].strftime("%Y-%m-%d")
-            mode_capacity["value"] = round(float(data["value"]), 0)
-            mode_capacity["source"] = SOURCE
-            zone_capacity[data["mode"]] = mode_capacity
-        all_capacity[zone] = zone_capacity
+    for data in df_capacity.reset_index().itertuples(index=False):
+        all_capacity.setdefault(data.zone_key, {})[data.mode] = {
+            "datetime": data.datetime.strftime("%Y-%m-%d"),
+            "value": round(float(data.value), 0),
+            "source": SOURCE,
+        }
     return all_capacity
 
 
@@ -2,7 +2,6 @@ from datetime import datetime
 from logging import getLogger
 from typing import Any
 
-from bs4 import BeautifulSoup
 from requests import Session
 
 from electricitymap.contrib.config import ZoneKey
@@ -11,6 +10,7 @@ from parsers.ENTSOE import (
     ENTSOE_PARAMETER_BY_GROUP,
     query_ENTSOE,
 )
+from parsers.lib.entsoe_xml import iter_time_series
 
 """
 Update capacity configurations for ENTOS-E zones for a chosen year.
@@ -94,21 +94,19 @@ def fetch_production_capacity(
     zone_key: ZoneKey, target_datetime: datetime, session: Session
 ) -> dict[str, Any] | None:
     xml_str = query_capacity(ENTSOE_DOMAIN_MAPPINGS[zone_key], session, target_datetime)
-    soup = BeautifulSoup(xml_str, "html.parser")
     # Each time series is dedicated to a different fuel type.
     capacity_dict = {}
-    for timeseries in soup.find_all("timeseries"):
-        fuel_code = str(
-            timeseries.find_all("mktpsrtype")[0].find_all("psrtype")[0].contents[0]
-        )
-        end_date = datetime.strptime(
-            timeseries.find_all("end")[0].contents[0], "%Y-%m-%dT%H:00Z"
-        )
-        if end_date.year != target_datetime.year:
+    for periods in iter_time_series(xml_str):
+        if not periods:
+            continue
+        # A time series can have several periods, only the latest one is current.
+        series = max(periods, key=lambda period: period.start)
+        fuel_code = series.attributes["MktPSRType.psrType"]
+        end_date = series.end
+        if end_date is None or end_date.year != target_datetime.year:
             pass  # query_ENTSOE fetches data for 2 years, so we need to filter out the data for the previous year
         else:
-            point = timeseries.find_all("point")
-            value = float(point[0].find_all("quantity")[0].contents[0])
+            value = float(series.values["quantity"][0])
             if ENTSOE_PARAMETER_BY_GROUP[fuel_code] not in capacity_dict:
                 capacity_dict[ENTSOE_PARAMETER_BY_GROUP[fuel_code]] = {
                     "value": 0,
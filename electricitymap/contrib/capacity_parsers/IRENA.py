@@ -3,9 +3,10 @@ from datetime import datetime
 from logging import getLogger
 from typing import Any
 
-import pycountry
+import pandas as pd
 from requests import Response, Session
 
+from electricitymap.contrib.capacity_parsers.countries import alpha_3_to_alpha_2
 from electricitymap.contrib.config import ZoneKey
 
 """The data is downloaded from the IRENA API. """
@@ -37,6 +38,14 @@ IRENA_JSON_TO_MODE_MAPPING = {
 SPECIFIC_MODE_MAPPING = {
     "IS": {16: "oil"}
 }  # After investigating the data, it seems like IRENA reports oil production as unknown so it will be reallocated as oil.
+SPECIFIC_MODE_MAPPING_TABLE = pd.DataFrame(
+    [
+        (zone, mode_code, mode)
+        for zone, modes in SPECIFIC_MODE_MAPPING.items()
+        for mode_code, mode in modes.items()
+    ],
+    columns=["zone_key", "mode_code", "mode"],
+)
 
 
 def get_data_from_url(target_datetime: datetime, session: Session) -> list:
@@ -90,41 +99,33 @@ def get_capacity_data_for_all_zones(
     target_datetime: datetime, session: Session
 ) -> dict:
     data = get_data_from_url(target_datetime, session)
+    df = pd.DataFrame(
+        [(*item["key"][:2], item["key"][-1], item["values"][0]) for item in data],
+        columns=["country_code", "mode_code", "year", "value"],
+    )
+    df["zone_key"] = df["country_code"].map(alpha_3_to_alpha_2())
+    # Codes which are not countries in pycountry can't be mapped to a zone.
+    df = df.dropna(subset=["zone_key"])
+    df["mode_code"] = df["mode_code"].astype(int)
+    specific_modes = (
+        df[["zone_key", "mode_code"]]
+        .merge(SPECIFIC_MODE_MAPPING_TABLE, how="left", on=["zone_key", "mode_code"])
+        .set_index(df.index)["mode"]
+    )
+    df["mode"] = specific_modes.fillna(df["mode_code"].map(IRENA_JSON_TO_MODE_MAPPING))
+    df["value"] = df["value"].astype(float).round(0)
+    df["datetime"] = pd.to_datetime(df["year"], format="%y").dt.strftime("%Y-%m-%d")
+
+    df_capacity = df.groupby(["zone_key", "mode"], sort=False).agg(
+        datetime=("datetime", "first"), value=("value", "sum")
+    )
     capacity_dict = {}
-    for item in data:
-        if pycountry.countries.get(alpha_3=item["key"][0]) is not None:
-            zone = pycountry.countries.get(alpha_3=item["key"][0]).alpha_2
-        else:
-            pass
-        mode: str = IRENA_JSON_TO_MODE_MAPPING[int(item["key"][1])]
-        value: float = round(float(item["values"][0]), 0)
-        datetime_value: datetime = datetime.strptime(item["key"][-1], "%y")
-
-        if zone not in capacity_dict:
-            zone_dict = {
-                mode: {
-                    "datetime": datetime_value.strftime("%Y-%m-%d"),
-                    "value": value,
-                    "source": SOURCE,
-                }
-            }
-            capacity_dict[zone] = zone_dict
-        else:
-            mode = reallocate_capacity_mode(zone, int(item["key"][1]))
-            if mode in capacity_dict[zone]:
-                zone_dict = capacity_dict[zone][mode]
-                capacity_dict[zone][mode]["value"] += value
-            else:
-                capacity_dict[zone] = {
-                    **capacity_dict[zone],
-                    **{
-                        mode: {
-                            "datetime": datetime_value.strftime("%Y-%m-%d"),
-                            "value": value,
-                            "source": SOURCE,
-                        }
-                    },
-                }
+    for (zone, mode), capacity in df_capacity.iterrows():
+        capacity_dict.setdefault(zone, {})[mode] = {
+            "datetime": capacity["datetime"],
+            "value": float(capacity["value"]),
+            "source": SOURCE,
+        }
     return capacity_dict
 
 
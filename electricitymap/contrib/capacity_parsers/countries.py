@@ -0,0 +1,16 @@
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+
+import pycountry
+
+
+@cache
+def alpha_3_to_alpha_2() -> Mapping[str, str]:
+    """
+    Maps the ISO 3166-1 alpha-3 country codes to alpha-2 codes. Built once, to map
+    whole columns of country codes rather than looking them up one at a time.
+    """
+    return MappingProxyType(
+        {country.alpha_3: country.alpha_2 for country in pycountry.countries}
+    )
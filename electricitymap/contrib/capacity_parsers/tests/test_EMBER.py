@@ -2,7 +2,13 @@ import unittest
 
 import pandas as pd
 
-from electricitymap.contrib.capacity_parsers.EMBER import map_variable_to_mode
+from electricitymap.contrib.capacity_parsers.EMBER import (
+    SOURCE,
+    format_ember_data,
+    get_capacity_dict_from_df,
+    map_variable_to_mode,
+    map_variables_to_modes,
+)
 
 test_df = pd.DataFrame(
     [
@@ -21,6 +27,53 @@ class testEmber(unittest.TestCase):
             test_df["mode"].tolist(), ["oil", "geothermal", "oil", "solar"]
         )
 
+    def test_map_variables_to_modes(self):
+        self.assertEqual(
+            map_variables_to_modes(test_df).tolist(),
+            test_df.apply(map_variable_to_mode, axis=1).tolist(),
+        )
+
+    def test_format_ember_data(self):
+        rows = [
+            ("TUR", "Country", 2022, "Capacity", "Fuel", "Other Fossil", 0.5),
+            ("TUR", "Country", 2022, "Capacity", "Fuel", "Gas", 25.1),
+            ("TUR", "Country", 2021, "Capacity", "Fuel", "Gas", 25.0),
+            ("TUR", "Country", 2022, "Generation", "Fuel", "Gas", 70.0),
+            ("XKX", "Country", 2022, "Capacity", "Fuel", "Coal", 1.3),
+            ("COL", "Country", 2022, "Capacity", "Fuel", "Other Fossil", 0.2),
+            ("COL", "Country", 2022, "Capacity", "Fuel", "Bioenergy", 0.1),
+        ]
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "Country code",
+                "Area type",
+                "Year",
+                "Category",
+                "Subcategory",
+                "Variable",
+                "Value",
+            ],
+        ).astype({"Country code": "category", "Variable": "category"})
+        capacity = get_capacity_dict_from_df(format_ember_data(df, 2022))
+        self.assertEqual(
+            capacity,
+            {
+                "CO": {
+                    "biomass": {
+                        "datetime": "2022-01-01",
+                        "value": 100,
+                        "source": SOURCE,
+                    },
+                    "oil": {"datetime": "2022-01-01", "value": 200, "source": SOURCE},
+                },
+                "TR": {
+                    "gas": {"datetime": "2022-01-01", "value": 25100, "source": SOURCE},
+                    "oil": {"datetime": "2022-01-01", "value": 500, "source": SOURCE},
+                },
+            },
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from electricitymap.contrib.capacity_parsers.ENTSOE import fetch_production_capacity
+
+CAPACITY_DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<GL_MarketDocument>
+    <TimeSeries>
+        <mRID>1</mRID>
+        <MktPSRType><psrType>B14</psrType></MktPSRType>
+        <Period>
+            <timeInterval>
+                <start>2022-12-31T23:00Z</start>
+                <end>2023-06-30T22:00Z</end>
+            </timeInterval>
+            <resolution>P1Y</resolution>
+            <Point><position>1</position><quantity>1000</quantity></Point>
+        </Period>
+        <Period>
+            <timeInterval>
+                <start>2023-06-30T22:00Z</start>
+                <end>2023-12-31T23:00Z</end>
+            </timeInterval>
+            <resolution>P1Y</resolution>
+            <Point><position>1</position><quantity>1200</quantity></Point>
+        </Period>
+    </TimeSeries>
+    <TimeSeries>
+        <mRID>2</mRID>
+        <MktPSRType><psrType>B16</psrType></MktPSRType>
+        <Period>
+            <timeInterval>
+                <start>2022-12-31T23:00Z</start>
+                <end>2023-12-31T23:00Z</end>
+            </timeInterval>
+            <resolution>P1Y</resolution>
+            <Point><position>1</position><quantity>300</quantity></Point>
+        </Period>
+    </TimeSeries>
+    <TimeSeries>
+        <mRID>3</mRID>
+        <MktPSRType><psrType>B16</psrType></MktPSRType>
+        <Period>
+            <timeInterval>
+                <start>2021-12-31T23:00Z</start>
+                <end>2022-12-31T23:00Z</end>
+            </timeInterval>
+            <resolution>P1Y</resolution>
+            <Point><position>1</position><quantity>200</quantity></Point>
+        </Period>
+    </TimeSeries>
+</GL_MarketDocument>
+"""
+
+
+class TestENTSOE(unittest.TestCase):
+    @patch(
+        "electricitymap.contrib.capacity_parsers.ENTSOE.query_capacity",
+        return_value=CAPACITY_DOCUMENT,
+    )
+    def test_fetch_production_capacity(self, _):
+        capacity = fetch_production_capacity("FR", datetime(2023, 1, 1), None)
+        self.assertEqual(
+            capacity,
+            {
+                # Only the latest period of the time series is used.
+                "nuclear": {
+                    "value": 1200,
+                    "datetime": "2023-01-01",
+                    "source": "entsoe.eu",
+                },
+                "solar": {
+                    "value": 300,
+                    "datetime": "2023-01-01",
+                    "source": "entsoe.eu",
+                },
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
+from datetime import datetime
+from unittest.mock import patch
 
 from electricitymap.contrib.capacity_parsers.IRENA import (
     IRENA_JSON_TO_MODE_MAPPING,
+    get_capacity_data_for_all_zones,
     reallocate_capacity_mode,
 )
 
@@ -24,6 +27,42 @@ class TestIRENA(unittest.TestCase):
             reallocate_capacity_mode(zone_key, mode) == IRENA_JSON_TO_MODE_MAPPING[mode]
         )
 
+    @patch("electricitymap.contrib.capacity_parsers.IRENA.get_data_from_url")
+    def test_get_capacity_data_for_all_zones(self, mock_get_data_from_url):
+        mock_get_data_from_url.return_value = [
+            {"key": ["ISL", "16", "22"], "values": ["120.4"]},
+            {"key": ["ISL", "14", "22"], "values": ["10.4"]},
+            {"key": ["ISL", "4", "22"], "values": ["2000"]},
+            {"key": ["XKX", "0", "22"], "values": ["5"]},
+            {"key": ["NIC", "16", "22"], "values": ["3"]},
+            {"key": ["NIC", "18", "22"], "values": ["2"]},
+        ]
+        capacity = get_capacity_data_for_all_zones(datetime(2022, 1, 1), None)
+        self.assertEqual(
+            capacity,
+            {
+                "IS": {
+                    "oil": {
+                        "datetime": "2022-01-01",
+                        "value": 130,
+                        "source": "IRENA.org",
+                    },
+                    "hydro": {
+                        "datetime": "2022-01-01",
+                        "value": 2000,
+                        "source": "IRENA.org",
+                    },
+                },
+                "NI": {
+                    "unknown": {
+                        "datetime": "2022-01-01",
+                        "value": 5,
+                        "source": "IRENA.org",
+                    }
+                },
+            },
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
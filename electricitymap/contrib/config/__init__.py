@@ -1,9 +1,10 @@
 """Global config variables with data read from the config directory."""
 
-from copy import deepcopy
 from pathlib import Path
 
 from electricitymap.contrib.config.co2eq_parameters import generate_co2eq_parameters
+from electricitymap.contrib.config.compiled import load_compiled
+from electricitymap.contrib.config.emission_factors import EmissionFactorIndex
 from electricitymap.contrib.config.reading import (
     read_defaults,
     read_exchanges_config,
@@ -20,8 +21,16 @@ from electricitymap.contrib.lib.types import ZoneKey
 
 CONFIG_DIR = Path(__file__).parent.parent.parent.parent.joinpath("config").resolve()
 
-ZONES_CONFIG = read_zones_config(CONFIG_DIR)
-EXCHANGES_CONFIG = read_exchanges_config(CONFIG_DIR)
+# Parsing the YAML files is slow, the result is cached until the config changes.
+ZONES_CONFIG, EXCHANGES_CONFIG, defaults = load_compiled(
+    "yaml",
+    CONFIG_DIR,
+    lambda: (
+        read_zones_config(CONFIG_DIR),
+        read_exchanges_config(CONFIG_DIR),
+        read_defaults(CONFIG_DIR),
+    ),
+)
 
 EU_ZONES = [
     "AT",
@@ -89,7 +98,6 @@ EU_ZONES = [
 EU_ZONES_CONFIG = {k: v for k, v in ZONES_CONFIG.items() if k in EU_ZONES}
 
 # Prepare the CO2eq parameters config dicts.
-defaults = read_defaults(CONFIG_DIR)
 (
     co2eq_parameters_all,
     co2eq_parameters_direct,
@@ -99,6 +107,15 @@ CO2EQ_PARAMETERS_DIRECT = {**co2eq_parameters_all, **co2eq_parameters_direct}
 CO2EQ_PARAMETERS_LIFECYCLE = {**co2eq_parameters_all, **co2eq_parameters_lifecycle}
 CO2EQ_PARAMETERS = CO2EQ_PARAMETERS_LIFECYCLE  # Global LCA is the default
 
+# Index the emission factors of each zone, resolving the overrides and yearly values.
+EMISSION_FACTORS_DIRECT = EmissionFactorIndex.from_co2eq_parameters(
+    CO2EQ_PARAMETERS_DIRECT
+)
+EMISSION_FACTORS_LIFECYCLE = EmissionFactorIndex.from_co2eq_parameters(
+    CO2EQ_PARAMETERS_LIFECYCLE
+)
+EMISSION_FACTORS = EMISSION_FACTORS_LIFECYCLE
+
 # Make a dict mapping each zone to its bounding box.
 ZONE_BOUNDING_BOXES: dict[ZoneKey, BoundingBox] = zone_bounding_boxes(ZONES_CONFIG)
 
@@ -114,24 +131,5 @@ ALL_NEIGHBOURS: dict[ZoneKey, list[ZoneKey]] = generate_all_neighbours(EXCHANGES
 
 
 def emission_factors(zone_key: ZoneKey) -> dict[str, float]:
-    """Looks up the emission factors for a given zone."""
-    override = CO2EQ_PARAMETERS["emissionFactors"]["zoneOverrides"].get(zone_key, {})
-    defaults = CO2EQ_PARAMETERS["emissionFactors"]["defaults"]
-
-    def get_most_recent_value(emission_factors: dict) -> dict:
-        _emission_factors = deepcopy(emission_factors)
-        keys_with_yearly = [
-            k for (k, v) in _emission_factors.items() if isinstance(v, list)
-        ]
-        for k in keys_with_yearly:
-            _emission_factors[k] = max(
-                _emission_factors[k], key=lambda x: x["datetime"]
-            )
-        return _emission_factors
-
-    # Only use most recent yearly numbers from defaults & overrides
-    defaults = get_most_recent_value(defaults)
-    override = get_most_recent_value(override)
-
-    merged = {**defaults, **override}
-    return {k: (v or {}).get("value") for (k, v) in merged.items()}
+    """Looks up the most recent emission factors for a given zone."""
+    return dict(EMISSION_FACTORS.latest(zone_key))
@@ -1,29 +1,161 @@
-from datetime import datetime
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from functools import cache
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from electricitymap.contrib.config import ZONES_CONFIG
+from electricitymap.contrib.lib.types import ZoneKey
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Capacities in the old format have no datetime and are valid since forever.
+MIN_TIMESTAMP = np.iinfo(np.int64).min
+
+
+class CapacityTimeline:
+    """
+    The capacity of a mode, as sorted datetimes from which each value is valid.
+    Datetimes before the first one get the first value, naive datetimes are UTC.
+    """
+
+    __slots__ = ("datetimes", "values", "_timestamps", "_arrays")
+
+    def __init__(self, datetimes: Iterable[datetime | None], values: Iterable):
+        capacities = sorted(
+            zip(datetimes, values, strict=True),
+            key=lambda capacity: _to_timestamp(capacity[0]),
+        )
+        if not capacities:
+            raise ValueError("A capacity timeline needs at least one value")
+        self.datetimes: tuple[datetime | None, ...] = tuple(d for d, _ in capacities)
+        self.values: tuple[float | None, ...] = tuple(v for _, v in capacities)
+        # Timestamps in microseconds since the epoch, for bisecting.
+        self._timestamps = tuple(_to_timestamp(d) for d in self.datetimes)
+        # Only built for `at_many`, single lookups bisect the tuples.
+        self._arrays: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_config(cls, mode_capacity: list | dict | float | None):
+        if isinstance(mode_capacity, list):
+            return cls(
+                (_parse_datetime(d["datetime"]) for d in mode_capacity),
+                (d["value"] for d in mode_capacity),
+            )
+        if isinstance(mode_capacity, dict):
+            return cls([None], [mode_capacity["value"]])
+        # TODO: This part is used for the old capacity format. It shoud be removed once all capacity configs are updated
+        return cls([None], [mode_capacity])
+
+    def at(self, dt: datetime) -> float | None:
+        """Returns the capacity valid at the given datetime."""
+        if len(self.values) == 1:
+            return self.values[0]
+        index = bisect_right(self._timestamps, _to_timestamp(dt))
+        return self.values[max(index - 1, 0)]
+
+    def at_many(self, datetimes: Iterable[datetime] | pd.DatetimeIndex) -> np.ndarray:
+        """
+        Returns the capacities valid at the given datetimes as a float array,
+        missing capacities are NaN.
+        """
+        index = pd.DatetimeIndex(datetimes)
+        index = (
+            index.tz_localize(timezone.utc)
+            if index.tz is None
+            else index.tz_convert(timezone.utc)
+        )
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self._timestamps, dtype=np.int64),
+                np.array(
+                    [np.nan if v is None else v for v in self.values], dtype=float
+                ),
+            )
+        timestamps, values = self._arrays
+        # DatetimeIndex values are nanoseconds since the epoch.
+        positions = np.searchsorted(timestamps, index.asi8 // 1000, side="right") - 1
+        return values[np.maximum(positions, 0)]
+
+
+def _parse_datetime(value: str | datetime) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _to_utc_naive(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is None else dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _list_capacity_at(mode_capacity: list[dict], dt: datetime) -> float | None:
+    """
+    Returns the capacity valid at the given datetime, as `CapacityTimeline.at` does,
+    without compiling a timeline for a single lookup.
+    """
+    dt = _to_utc_naive(dt)
+    first = latest = None
+    for capacity in mode_capacity:
+        capacity_dt = _to_utc_naive(_parse_datetime(capacity["datetime"]))
+        if first is None or capacity_dt < first[0]:
+            first = (capacity_dt, capacity["value"])
+        if capacity_dt <= dt and (latest is None or capacity_dt >= latest[0]):
+            latest = (capacity_dt, capacity["value"])
+    if first is None:
+        raise ValueError("A capacity timeline needs at least one value")
+    return (latest or first)[1]
+
+
+def _to_timestamp(dt: datetime | None) -> int:
+    if dt is None:
+        return MIN_TIMESTAMP
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def get_capacity_timelines(capacity_config: dict) -> dict[str, CapacityTimeline]:
+    """Compiles the capacity config of a zone to one timeline per mode."""
+    return {
+        mode: CapacityTimeline.from_config(mode_capacity)
+        for mode, mode_capacity in capacity_config.items()
+    }
+
+
+@cache
+def get_zone_capacity_timelines(zone_key: ZoneKey) -> Mapping[str, CapacityTimeline]:
+    """Returns the capacity timelines of a zone from ZONES_CONFIG, compiled once."""
+    return MappingProxyType(
+        get_capacity_timelines(ZONES_CONFIG.get(zone_key, {}).get("capacity", {}))
+    )
 
 
 def get_capacity_data(capacity_config: dict, dt: datetime) -> dict[str, float]:
     """Gets the capacity data for a given zone and datetime from ZONES_CONFIG."""
-    capacity = {}
-    for mode, capacity_value in capacity_config.items():
-        if isinstance(capacity_value, int | float):
-            # TODO: This part is used for the old capacity format. It shoud be removed once all capacity configs are updated
-            capacity[mode] = capacity_value
-        else:
-            capacity[mode] = get_capacity_value_with_datetime(capacity_value, dt)
-    return capacity
+    return {
+        mode: get_capacity_value_with_datetime(mode_capacity, dt)
+        for mode, mode_capacity in capacity_config.items()
+    }
+
+
+def get_zone_capacity_data(zone_key: ZoneKey, dt: datetime) -> dict[str, float]:
+    """
+    Gets the capacity data of a zone from ZONES_CONFIG at a given datetime, using the
+    timelines compiled once by `get_zone_capacity_timelines`.
+    """
+    return {
+        mode: timeline.at(dt)
+        for mode, timeline in get_zone_capacity_timelines(zone_key).items()
+    }
 
 
 def get_capacity_value_with_datetime(
-    mode_capacity: list | dict, dt: datetime
+    mode_capacity: list | dict | float | None, dt: datetime
 ) -> float | None:
+    if isinstance(mode_capacity, list):
+        return _list_capacity_at(mode_capacity, dt)
     if isinstance(mode_capacity, dict):
         return mode_capacity["value"]
-    elif isinstance(mode_capacity, list):
-        capacity_tuples = [(d["datetime"], d["value"]) for d in mode_capacity]
-
-        if dt.isoformat() <= min(capacity_tuples)[0]:
-            return min(capacity_tuples)[1]
-        else:
-            # valid datetime is the max datetime that is lower than the given datetime
-            # In other words, it is the most recent value that is valid for the given dt
-            return max([(d, v) for d, v in capacity_tuples if d <= dt.isoformat()])[1]
+    # TODO: This part is used for the old capacity format. It shoud be removed once all capacity configs are updated
+    return mode_capacity
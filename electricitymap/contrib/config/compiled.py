@@ -0,0 +1,96 @@
+"""Caches the config compiled from the config directory between processes.
+
+Reading the ~800 YAML files of the config directory takes a few seconds, which
+every process importing the config would otherwise pay on startup.
+The compiled objects are pickled to a cache directory, in files keyed by a hash
+of the content of the config directory and of the code compiling it.
+Any change to a YAML file therefore makes the next import rebuild the artifacts.
+
+The cache directory defaults to `$XDG_CACHE_HOME/electricitymaps/config` and can be
+overridden with the `ELECTRICITYMAPS_CONFIG_CACHE_DIR` environment variable.
+Setting `ELECTRICITYMAPS_CONFIG_CACHE=0` disables the cache.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# The code compiling the config, any change to it invalidates the artifacts.
+CONFIG_PACKAGE_DIR = Path(__file__).parent
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("ELECTRICITYMAPS_CONFIG_CACHE", "1") != "0"
+
+
+def cache_dir() -> Path:
+    if "ELECTRICITYMAPS_CONFIG_CACHE_DIR" in os.environ:
+        return Path(os.environ["ELECTRICITYMAPS_CONFIG_CACHE_DIR"])
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home, "electricitymaps", "config")
+
+
+@cache
+def config_hash(config_dir: Path) -> str:
+    """Returns a hash of the YAML files of the config directory and of the code reading them."""
+    digest = hashlib.sha256(f"pickle-{pickle.HIGHEST_PROTOCOL}".encode())
+    for root, paths in (
+        (config_dir, config_dir.rglob("*.yaml")),
+        (CONFIG_PACKAGE_DIR, CONFIG_PACKAGE_DIR.glob("*.py")),
+    ):
+        for path in sorted(paths):
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def load_compiled(name: str, config_dir: Path, build: Callable[[], T]) -> T:
+    """
+    Returns the artifact `name` compiled from `config_dir` by `build`.
+    The artifact is loaded from the cache if the config directory didn't change since
+    it was built, otherwise it is built and stored in the cache.
+    The artifact is stored before being returned, so the caller may mutate it.
+    """
+    if not cache_enabled():
+        return build()
+
+    path = cache_dir() / f"{name}-{config_hash(config_dir)}.pickle"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable compiled config {path}: {e}")
+
+    artifact = build()
+    try:
+        _store(path, artifact)
+    except OSError as e:
+        logger.warning(f"Could not store compiled config {path}: {e}")
+    return artifact
+
+
+def _store(path: Path, artifact) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so concurrent processes never read a partial file.
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, path)
+    # Remove the artifacts compiled from previous versions of the config.
+    name = path.name.rsplit("-", 1)[0]
+    for stale_path in path.parent.glob(f"{name}-*.pickle"):
+        if stale_path != path:
+            stale_path.unlink(missing_ok=True)
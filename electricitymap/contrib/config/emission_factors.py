@@ -0,0 +1,133 @@
+"""Contains an index of the emission factors of every zone, built from the co2eq parameters.
+
+Emission factors are either a single value or a list of yearly values, each of them
+effective from its datetime onwards, e.g.
+
+    battery discharge:
+      - datetime: '2015-01-01'
+        value: 411.8
+      - datetime: '2016-01-01'
+        value: 551.2
+
+The index resolves the zone overrides and sorts the yearly values once, so that
+looking up the emission factors of a zone doesn't copy or scan the config.
+"""
+
+from bisect import bisect_right
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from electricitymap.contrib.lib.types import ZoneKey
+
+# Emission factors without a datetime are effective since forever.
+MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class EmissionFactorTimeline(NamedTuple):
+    """The values of an emission factor, sorted by the datetime they are effective from."""
+
+    datetimes: tuple[datetime, ...]
+    values: tuple[float | None, ...]
+
+    @classmethod
+    def from_config(cls, config: dict | list | None) -> "EmissionFactorTimeline":
+        entries = config if isinstance(config, list) else [config or {}]
+        values: dict[datetime, float | None] = {}
+        for entry in entries:
+            # Of two values effective from the same datetime, the first one wins.
+            values.setdefault(_parse_datetime(entry), entry.get("value"))
+        datetimes = sorted(values)
+        return cls(tuple(datetimes), tuple(values[dt] for dt in datetimes))
+
+    @property
+    def latest(self) -> float | None:
+        return self.values[-1]
+
+    def at(self, dt: datetime) -> float | None:
+        """
+        Returns the value effective at the given datetime, naive datetimes are
+        assumed to be UTC. The earliest value is used before it is effective.
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return self.values[max(bisect_right(self.datetimes, dt) - 1, 0)]
+
+
+def _parse_datetime(entry: dict[str, Any]) -> datetime:
+    if not entry.get("datetime"):
+        return MIN_DATETIME
+    return datetime.fromisoformat(entry["datetime"]).replace(tzinfo=timezone.utc)
+
+
+class EmissionFactorIndex:
+    """
+    Emission factors of every zone keyed by production mode, the zone overrides
+    replacing the defaults mode by mode.
+    Zones without overrides use the defaults.
+    """
+
+    def __init__(
+        self, defaults: dict[str, Any], zone_overrides: dict[ZoneKey, dict[str, Any]]
+    ):
+        self._defaults = MappingProxyType(
+            {
+                mode: EmissionFactorTimeline.from_config(v)
+                for mode, v in defaults.items()
+            }
+        )
+        self._zones = {
+            zone_key: MappingProxyType(
+                {
+                    **self._defaults,
+                    **{
+                        mode: EmissionFactorTimeline.from_config(v)
+                        for mode, v in overrides.items()
+                    },
+                }
+            )
+            for zone_key, overrides in zone_overrides.items()
+        }
+        self._latest_defaults = _latest_values(self._defaults)
+        self._latest = {
+            zone_key: _latest_values(timelines)
+            for zone_key, timelines in self._zones.items()
+        }
+
+    @classmethod
+    def from_co2eq_parameters(cls, co2eq_parameters: dict[str, Any]):
+        """Builds the index of CO2EQ_PARAMETERS_DIRECT or CO2EQ_PARAMETERS_LIFECYCLE."""
+        emission_factors = co2eq_parameters["emissionFactors"]
+        return cls(emission_factors["defaults"], emission_factors["zoneOverrides"])
+
+    def timelines(self, zone_key: ZoneKey) -> Mapping[str, EmissionFactorTimeline]:
+        return self._zones.get(zone_key, self._defaults)
+
+    def latest(self, zone_key: ZoneKey) -> Mapping[str, float | None]:
+        """Returns the most recent emission factors of a zone."""
+        return self._latest.get(zone_key, self._latest_defaults)
+
+    def at(self, zone_key: ZoneKey, dt: datetime) -> dict[str, float | None]:
+        """Returns the emission factors of a zone effective at the given datetime."""
+        return {
+            mode: timeline.at(dt) for mode, timeline in self.timelines(zone_key).items()
+        }
+
+    def value(
+        self, zone_key: ZoneKey, mode: str, dt: datetime | None = None
+    ) -> float | None:
+        """
+        Returns the emission factor of a mode, effective at the given datetime or the
+        most recent one. Raises a KeyError if the mode has no emission factor.
+        """
+        timeline = self.timelines(zone_key)[mode]
+        return timeline.latest if dt is None else timeline.at(dt)
+
+
+def _latest_values(
+    timelines: Mapping[str, EmissionFactorTimeline],
+) -> Mapping[str, float | None]:
+    return MappingProxyType(
+        {mode: timeline.latest for mode, timeline in timelines.items()}
+    )
@@ -15,10 +15,12 @@ from pydantic.utils import import_string
 from electricitymap.contrib.config import (
     CO2EQ_PARAMETERS_DIRECT,
     CO2EQ_PARAMETERS_LIFECYCLE,
+    CONFIG_DIR,
     EXCHANGES_CONFIG,
     ZONE_NEIGHBOURS,
     ZONES_CONFIG,
 )
+from electricitymap.contrib.config.compiled import load_compiled
 from electricitymap.contrib.config.types import Point
 from electricitymap.contrib.lib.types import ZoneKey
 
@@ -317,13 +319,23 @@ class CO2eqConfigModel(StrictBaseModel):
 
 
 def _load_config_model() -> ConfigModel:
+    return ConfigModel(exchanges=EXCHANGES_CONFIG, zones=ZONES_CONFIG)
+
+
+def _load_co2eq_config_model() -> CO2eqConfigModel:
+    return CO2eqConfigModel(
+        direct=CO2EQ_PARAMETERS_DIRECT, lifecycle=CO2EQ_PARAMETERS_LIFECYCLE
+    )
+
+
+def _set_zone_keys() -> None:
     for zone_key, zone in ZONES_CONFIG.items():
         zone["key"] = zone_key
 
-    return ConfigModel(exchanges=EXCHANGES_CONFIG, zones=ZONES_CONFIG)
-
 
-CONFIG_MODEL = _load_config_model()
-CO2EQ_CONFIG_MODEL = CO2eqConfigModel(
-    direct=CO2EQ_PARAMETERS_DIRECT, lifecycle=CO2EQ_PARAMETERS_LIFECYCLE
+# The zone configs are also used as is, so their key is set even on cache hits.
+_set_zone_keys()
+# Validating the config is slow, the models are cached until the config changes.
+CONFIG_MODEL, CO2EQ_CONFIG_MODEL = load_compiled(
+    "models", CONFIG_DIR, lambda: (_load_config_model(), _load_co2eq_config_model())
 )
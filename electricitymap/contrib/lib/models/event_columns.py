@@ -0,0 +1,515 @@
+"""
+Columnar storage for the events of an EventList.
+
+Instead of keeping one pydantic model per event, the events are stored in typed arrays:
+the datetimes as int64 microseconds since the epoch, the modes as a float64 matrix with
+NaN for unset values and bitmasks of the modes that have been set, set to None or
+corrected, and the zones, sources and timezones interned in small tables.
+Events are only materialised as pydantic models when they are accessed.
+"""
+
+from abc import abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import cache
+from logging import Logger
+from typing import Any
+
+import numpy as np
+
+from electricitymap.contrib.lib.models.events import (
+    Event,
+    EventSourceType,
+    ProductionBreakdown,
+    ProductionMix,
+    StorageMix,
+    _batch_errors,
+    _construct_validated,
+    _log_batch_error,
+    _to_float_array,
+    _validate_batch_datetimes,
+)
+from electricitymap.contrib.lib.types import ZoneKey
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+SOURCE_TYPES = tuple(EventSourceType)
+# The columns of the mode matrices, in the order of the fields of the mixes.
+PRODUCTION_COLUMNS = tuple(ProductionMix.__fields__)
+STORAGE_COLUMNS = tuple(StorageMix.__fields__)
+
+
+class _InternTable:
+    """Gives a small integer code to each distinct value of a column."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values: list[Any] = []
+        self._codes: dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        try:
+            key = (value,)
+            code = self._codes.get(key)
+        except TypeError:
+            # Some timezones (e.g. dateutil's) are not hashable.
+            key = ("id", id(value))
+            code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+@cache
+def _columns_of_mask(
+    mask: int, columns: tuple[str, ...]
+) -> tuple[tuple[int, str], ...]:
+    """The (column, mode) pairs of the modes flagged in a bitmask."""
+    return tuple((bit, mode) for bit, mode in enumerate(columns) if mask >> bit & 1)
+
+
+def _modes_of_mask(mask: int, columns: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(mode for _, mode in _columns_of_mask(mask, columns))
+
+
+def _mask_of_modes(modes: Iterable[str], columns: tuple[str, ...]) -> int:
+    return sum(1 << columns.index(mode) for mode in set(modes))
+
+
+def _to_masks(is_set: np.ndarray) -> np.ndarray:
+    """Packs a boolean matrix (events x modes) into one bitmask per event."""
+    return (is_set.astype(np.int64) << np.arange(is_set.shape[1])).sum(axis=1)
+
+
+def _to_datetime(timestamp: int, tz: tzinfo) -> datetime:
+    return (EPOCH + timedelta(microseconds=timestamp)).astimezone(tz)
+
+
+class EventColumns(Sequence):
+    """
+    The fields shared by all the events, stored column by column.
+    Subclasses add the columns of their kind of event and materialise the events.
+    """
+
+    def __init__(self):
+        self._timestamps = array("q")
+        self._timezone_codes = array("H")
+        self._zone_codes = array("H")
+        self._source_codes = array("I")
+        self._source_types = array("B")
+        self._timezones = _InternTable()
+        self._zones = _InternTable()
+        self._sources = _InternTable()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._materialise(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._materialise(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self._materialise(index)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        for event in events:
+            self.append(event)
+
+    @abstractmethod
+    def append(self, event: Event) -> None:
+        """Stores an event that has already been validated."""
+        pass
+
+    @abstractmethod
+    def _materialise(self, index: int) -> Event:
+        pass
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """The datetimes of the events, as microseconds since the epoch."""
+        return np.array(self._timestamps, dtype=np.int64)
+
+    @property
+    def zone_keys(self) -> np.ndarray:
+        return np.array(self._zones.values, dtype=object)[
+            np.array(self._zone_codes, dtype=np.intp)
+        ]
+
+    @property
+    def sources(self) -> np.ndarray:
+        return np.array(self._sources.values, dtype=object)[
+            np.array(self._source_codes, dtype=np.intp)
+        ]
+
+    @property
+    def source_types(self) -> np.ndarray:
+        return np.array(SOURCE_TYPES, dtype=object)[
+            np.array(self._source_types, dtype=np.intp)
+        ]
+
+    def _append_fields(
+        self,
+        zoneKey: ZoneKey,
+        event_datetime: datetime,
+        source: str,
+        sourceType: EventSourceType,
+    ) -> None:
+        self._timestamps.append((event_datetime - EPOCH) // ONE_MICROSECOND)
+        self._timezone_codes.append(self._timezones.code(event_datetime.tzinfo))
+        self._zone_codes.append(self._zones.code(zoneKey))
+        self._source_codes.append(self._sources.code(source))
+        self._source_types.append(SOURCE_TYPES.index(sourceType))
+
+    def _extend_fields(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        sourceType: EventSourceType,
+    ) -> None:
+        """Stores the fields of a batch of events sharing their zone, source and source type."""
+        self._timestamps.extend((d - EPOCH) // ONE_MICROSECOND for d in datetimes)
+        self._timezone_codes.extend(self._timezones.code(d.tzinfo) for d in datetimes)
+        n_events = len(datetimes)
+        self._zone_codes.extend(array("H", [self._zones.code(zoneKey)]) * n_events)
+        self._source_codes.extend(array("I", [self._sources.code(source)]) * n_events)
+        self._source_types.extend(
+            array("B", [SOURCE_TYPES.index(sourceType)]) * n_events
+        )
+
+    def _fields(self, index: int) -> dict[str, Any]:
+        return {
+            "sourceType": SOURCE_TYPES[self._source_types[index]],
+            "zoneKey": self._zones.values[self._zone_codes[index]],
+            "datetime": _to_datetime(
+                self._timestamps[index],
+                self._timezones.values[self._timezone_codes[index]],
+            ),
+            "source": self._sources.values[self._source_codes[index]],
+        }
+
+
+class ProductionBreakdownColumns(EventColumns):
+    """
+    Production breakdowns stored column by column, see the module docstring.
+    Events are materialised on access, so modifying an accessed event doesn't modify
+    the stored one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Flat matrices (events x modes), in the order of the *_COLUMNS.
+        self._production = array("d")
+        self._production_set = array("H")
+        self._production_none = array("H")
+        self._corrected = array("H")
+        self._storage = array("d")
+        self._storage_set = array("B")
+        self._storage_none = array("B")
+
+    def append(self, event: ProductionBreakdown) -> None:
+        self._append_fields(
+            event.zoneKey, event.datetime, event.source, event.sourceType
+        )
+        production, storage = event.production, event.storage
+        self._production.extend(_mix_row(production, PRODUCTION_COLUMNS))
+        self._production_set.append(
+            0
+            if production is None
+            else _mask_of_modes(production.__fields_set__, PRODUCTION_COLUMNS)
+        )
+        self._production_none.append(
+            _mask_of_none_modes(production, PRODUCTION_COLUMNS)
+        )
+        self._corrected.append(
+            0
+            if production is None
+            else _mask_of_modes(production.corrected_negative_modes, PRODUCTION_COLUMNS)
+        )
+        self._storage.extend(_mix_row(storage, STORAGE_COLUMNS))
+        self._storage_set.append(
+            0
+            if storage is None
+            else _mask_of_modes(storage.__fields_set__, STORAGE_COLUMNS)
+        )
+        self._storage_none.append(_mask_of_none_modes(storage, STORAGE_COLUMNS))
+
+    def append_batch(
+        self,
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        production: dict[str, Sequence[float | None]] | None = None,
+        storage: dict[str, Sequence[float | None]] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> None:
+        """
+        Validates and stores a batch of production breakdowns, as
+        `ProductionBreakdown.create_batch` would without constructing the events.
+        """
+        n_events = len(datetimes)
+        production_values = np.full((n_events, len(PRODUCTION_COLUMNS)), np.nan)
+        production_set = np.zeros((n_events, len(PRODUCTION_COLUMNS)), dtype=bool)
+        production_none = np.zeros((n_events, len(PRODUCTION_COLUMNS)), dtype=bool)
+        corrected = np.zeros((n_events, len(PRODUCTION_COLUMNS)), dtype=bool)
+        storage_values = np.full((n_events, len(STORAGE_COLUMNS)), np.nan)
+        storage_set = np.zeros((n_events, len(STORAGE_COLUMNS)), dtype=bool)
+        storage_none = np.zeros((n_events, len(STORAGE_COLUMNS)), dtype=bool)
+        is_empty = np.zeros(n_events, dtype=bool)
+        for modes, columns, kind in [
+            (production, PRODUCTION_COLUMNS, "production"),
+            (storage, STORAGE_COLUMNS, "storage"),
+        ]:
+            for mode, values in (modes or {}).items():
+                if mode not in columns:
+                    raise ValueError(f"Unknown {kind} mode: {mode}")
+                if len(values) != n_events:
+                    raise ValueError(
+                        f"Expected {n_events} values for {kind} {mode}, got {len(values)}"
+                    )
+        if production is not None:
+            is_none = np.ones((n_events, len(production)), dtype=bool)
+            for index, (mode, values) in enumerate(production.items()):
+                column = PRODUCTION_COLUMNS.index(mode)
+                production_values[:, column], is_none[:, index] = _to_float_array(
+                    values
+                )
+                production_set[:, column] = True
+                production_none[:, column] = is_none[:, index]
+            corrected = production_values < 0
+            production_values[corrected] = np.nan
+            production_none |= corrected
+            is_empty = is_none.all(axis=1)
+            if corrected.any():
+                logger.warning(
+                    f"Negative production values were detected in {corrected.any(axis=1).sum()} events: \
+                    {sorted(PRODUCTION_COLUMNS[column] for column in np.flatnonzero(corrected.any(axis=0)))}.\
+                    They have been set to None."
+                )
+        if storage is not None:
+            for mode, values in storage.items():
+                column = STORAGE_COLUMNS.index(mode)
+                storage_values[:, column], storage_none[:, column] = _to_float_array(
+                    values
+                )
+                storage_set[:, column] = True
+            # Storage mixes without any value are dropped, as in `create_batch`.
+            storage_set[~(storage_set & ~storage_none).any(axis=1)] = False
+            storage_none &= storage_set
+
+        keys = ProductionBreakdown._validate_batch_keys(
+            logger, "production breakdown", zoneKey, sourceType
+        )
+        if keys is None:
+            return
+        zoneKey, sourceType = keys
+        datetime_errors = _validate_batch_datetimes(datetimes, sourceType)
+        value_errors = _batch_errors(datetimes, (is_empty, "Mix is completely empty"))
+        is_valid = np.ones(n_events, dtype=bool)
+        for index, (datetime_error, value_error) in enumerate(
+            zip(datetime_errors, value_errors)
+        ):
+            if datetime_error is not None or value_error is not None:
+                _log_batch_error(
+                    logger,
+                    "production breakdown",
+                    zoneKey,
+                    datetimes[index],
+                    datetime_error,
+                    value_error,
+                )
+                is_valid[index] = False
+
+        self._extend_fields(
+            zoneKey,
+            [d for d, valid in zip(datetimes, is_valid) if valid],
+            source,
+            sourceType,
+        )
+        self._production.frombytes(production_values[is_valid].tobytes())
+        self._production_set.frombytes(
+            _to_masks(production_set[is_valid]).astype(np.uint16).tobytes()
+        )
+        self._production_none.frombytes(
+            _to_masks(production_none[is_valid]).astype(np.uint16).tobytes()
+        )
+        self._corrected.frombytes(
+            _to_masks(corrected[is_valid]).astype(np.uint16).tobytes()
+        )
+        self._storage.frombytes(storage_values[is_valid].tobytes())
+        self._storage_set.frombytes(
+            _to_masks(storage_set[is_valid]).astype(np.uint8).tobytes()
+        )
+        self._storage_none.frombytes(
+            _to_masks(storage_none[is_valid]).astype(np.uint8).tobytes()
+        )
+
+    @property
+    def production(self) -> np.ndarray:
+        """The production matrix (events x PRODUCTION_COLUMNS), NaN for unset or None values."""
+        return np.array(self._production).reshape(len(self), len(PRODUCTION_COLUMNS))
+
+    @property
+    def production_set(self) -> np.ndarray:
+        """Flags the production modes that have been set, even to None."""
+        return _from_masks(self._production_set, len(PRODUCTION_COLUMNS))
+
+    @property
+    def corrected(self) -> np.ndarray:
+        """Flags the production modes that have been corrected from a negative value."""
+        return _from_masks(self._corrected, len(PRODUCTION_COLUMNS))
+
+    @property
+    def storage(self) -> np.ndarray:
+        """The storage matrix (events x STORAGE_COLUMNS), NaN for unset or None values."""
+        return np.array(self._storage).reshape(len(self), len(STORAGE_COLUMNS))
+
+    @property
+    def storage_set(self) -> np.ndarray:
+        """Flags the storage modes that have been set, even to None."""
+        return _from_masks(self._storage_set, len(STORAGE_COLUMNS))
+
+    def _production_mix(self, index: int) -> ProductionMix | None:
+        set_mask, corrected_mask = self._production_set[index], self._corrected[index]
+        # A production mix always has a value or a corrected mode, see its validator.
+        if not set_mask and not corrected_mask:
+            return None
+        production_mix = _construct_validated(
+            ProductionMix,
+            _row_values(
+                self._production,
+                index,
+                set_mask,
+                self._production_none[index],
+                PRODUCTION_COLUMNS,
+            ),
+        )
+        production_mix._corrected_negative_values.update(
+            _modes_of_mask(corrected_mask, PRODUCTION_COLUMNS)
+        )
+        return production_mix
+
+    def _storage_mix(self, index: int) -> StorageMix | None:
+        set_mask = self._storage_set[index]
+        if not set_mask:
+            return None
+        return _construct_validated(
+            StorageMix,
+            _row_values(
+                self._storage,
+                index,
+                set_mask,
+                self._storage_none[index],
+                STORAGE_COLUMNS,
+            ),
+        )
+
+    def _materialise(self, index: int) -> ProductionBreakdown:
+        return _construct_validated(
+            ProductionBreakdown,
+            {
+                **self._fields(index),
+                "production": self._production_mix(index),
+                "storage": self._storage_mix(index),
+            },
+        )
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """
+        Returns the events as `ProductionBreakdown.to_dict` does, sorted by datetime,
+        without materialising them.
+        """
+        order = np.argsort(self.timestamps, kind="stable")
+        production = self.production.tolist()
+        storage = self.storage.tolist()
+        dicts = []
+        for index in order.tolist():
+            set_mask, corrected_mask = (
+                self._production_set[index],
+                self._corrected[index],
+            )
+            corrected_modes = _modes_of_mask(corrected_mask, PRODUCTION_COLUMNS)
+            production_dict = _mix_dict(
+                production[index],
+                set_mask,
+                self._production_none[index],
+                PRODUCTION_COLUMNS,
+            )
+            for mode in corrected_modes:
+                production_dict.setdefault(mode, None)
+            fields = self._fields(index)
+            dicts.append(
+                {
+                    "datetime": fields["datetime"],
+                    "zoneKey": fields["zoneKey"],
+                    "production": production_dict,
+                    "storage": _mix_dict(
+                        storage[index],
+                        self._storage_set[index],
+                        self._storage_none[index],
+                        STORAGE_COLUMNS,
+                    ),
+                    "source": fields["source"],
+                    "sourceType": fields["sourceType"],
+                    "correctedModes": list(set(corrected_modes))
+                    if set_mask or corrected_mask
+                    else [],
+                }
+            )
+        return dicts
+
+
+def _mix_row(
+    mix: ProductionMix | StorageMix | None, columns: tuple[str, ...]
+) -> list[float]:
+    if mix is None:
+        return [np.nan] * len(columns)
+    values = mix.__dict__
+    return [np.nan if values[mode] is None else float(values[mode]) for mode in columns]
+
+
+def _mask_of_none_modes(
+    mix: ProductionMix | StorageMix | None, columns: tuple[str, ...]
+) -> int:
+    """The bitmask of the modes set to None, to tell them apart from NaN values."""
+    if mix is None:
+        return 0
+    values = mix.__dict__
+    return _mask_of_modes(
+        (mode for mode in mix.__fields_set__ if values[mode] is None), columns
+    )
+
+
+def _row_values(
+    matrix: array, index: int, mask: int, none_mask: int, columns: tuple[str, ...]
+) -> dict[str, float | None]:
+    """The values of the set modes of a row of a flat matrix."""
+    start = index * len(columns)
+    return {
+        mode: None if none_mask >> column & 1 else matrix[start + column]
+        for column, mode in _columns_of_mask(mask, columns)
+    }
+
+
+def _mix_dict(
+    row: list[float], mask: int, none_mask: int, columns: tuple[str, ...]
+) -> dict[str, float | None]:
+    return {
+        mode: None if none_mask >> column & 1 else row[column]
+        for column, mode in _columns_of_mask(mask, columns)
+    }
+
+
+def _from_masks(masks: array, n_columns: int) -> np.ndarray:
+    """Unpacks bitmasks into a boolean matrix (events x modes)."""
+    return (np.array(masks, dtype=np.int64)[:, None] >> np.arange(n_columns)) & 1 == 1
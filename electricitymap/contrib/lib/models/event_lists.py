@@ -4,8 +4,15 @@ from datetime import datetime
 from logging import Logger
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from electricitymap.contrib.config.constants import PRODUCTION_MODES, STORAGE_MODES
+from electricitymap.contrib.lib.models.event_columns import (
+    PRODUCTION_COLUMNS,
+    STORAGE_COLUMNS,
+    ProductionBreakdownColumns,
+)
 from electricitymap.contrib.lib.models.events import (
     Event,
     EventSourceType,
@@ -25,6 +32,8 @@ class EventList(ABC):
 
     logger: Logger
     events: list[Event]
+    # The fields shared by the events of a batch, see `append_frame`.
+    frame_keys: tuple[str, ...] = ("zoneKey", "source", "sourceType")
 
     def __init__(self, logger: Logger):
         self.events = []
@@ -44,6 +53,76 @@ class EventList(ABC):
             [event.to_dict() for event in self.events], key=lambda x: x["datetime"]
         )
 
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Gives the events as a frame indexed by their UTC datetime and sorted as in `to_list`,
+        with a column per key shared by the events of a batch and a float column per value.
+        Missing values are NaN.
+        """
+        events = list(self.events)
+        return _events_frame(
+            pd.to_datetime([event.datetime for event in events], utc=True),
+            {
+                **{
+                    key: [getattr(event, key) for event in events]
+                    for key in self.frame_keys
+                },
+                **self._value_columns(events),
+            },
+        )
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, logger: Logger, **keys: Any):
+        """Creates an event list from a frame, see `append_frame`."""
+        event_list = cls(logger)
+        event_list.append_frame(frame, **keys)
+        return event_list
+
+    def append_frame(self, frame: pd.DataFrame, **keys: Any) -> None:
+        """
+        Handles the creation of the events of a frame indexed by tz-aware datetimes, as
+        given by `to_frame`, and adds them to the batch. Missing values (NaN) are None.
+        The keys (see `frame_keys`) are taken from the keyword arguments or from the columns
+        of the frame, and the events are created in one batch per combination of keys.
+        """
+        missing = [
+            key
+            for key in self.frame_keys
+            if key not in keys and key not in frame.columns and key != "sourceType"
+        ]
+        if missing:
+            raise ValueError(
+                f"Missing {', '.join(missing)} to create {type(self).__name__} events from a frame"
+            )
+        columns = [
+            key for key in self.frame_keys if key not in keys and key in frame.columns
+        ]
+        if not columns:
+            self._append_frame_batch(
+                pd.DatetimeIndex(frame.index).to_pydatetime(), frame, **keys
+            )
+            return
+        for values, group in frame.groupby(columns, sort=False, dropna=False):
+            values = values if isinstance(values, tuple) else (values,)
+            self._append_frame_batch(
+                pd.DatetimeIndex(group.index).to_pydatetime(),
+                group,
+                **keys,
+                **dict(zip(columns, values)),
+            )
+
+    @abstractmethod
+    def _value_columns(self, events: list[Event]) -> dict[str, np.ndarray]:
+        """The float columns of the values of the events, for `to_frame`."""
+        pass
+
+    @abstractmethod
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        """Adds the events of a frame sharing the same keys, for `append_frame`."""
+        pass
+
     @property
     def dataframe(self) -> pd.DataFrame:
         """Gives the dataframe representation of the events, indexed by datetime."""
@@ -151,6 +230,31 @@ class ExchangeList(AggregatableEventList):
         if event:
             self.events.append(event)
 
+    def append_batch(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        netFlows: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        """Handles the creation of many events at once and adds them to the batch."""
+        self.events.extend(
+            Exchange.create_batch(
+                self.logger, zoneKey, datetimes, source, netFlows, sourceType
+            )
+        )
+
+    def _value_columns(self, events: list[Exchange]) -> dict[str, np.ndarray]:
+        return {"netFlow": _float_column([event.netFlow for event in events])}
+
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        self.append_batch(
+            datetimes=datetimes, netFlows=_optional_floats(frame["netFlow"]), **keys
+        )
+
     @staticmethod
     def merge_exchanges(
         ungrouped_exchanges: list["ExchangeList"], logger: Logger
@@ -164,19 +268,25 @@ class ExchangeList(AggregatableEventList):
         if ExchangeList.is_completely_empty(ungrouped_exchanges, logger):
             return exchanges
 
-        # Create a dataframe for each parser output, then flatten the exchanges.
-        exchange_dfs = [
-            pd.json_normalize(exchanges.to_list()).set_index("datetime")
-            for exchanges in ungrouped_exchanges
-            if len(exchanges.events) > 0
-        ]
-
-        exchange_df = pd.concat(exchange_dfs)
-        exchange_df = exchange_df.rename(columns={"sortedZoneKeys": "zoneKey"})
+        exchange_df = pd.concat(
+            [
+                exchanges.to_frame()
+                for exchanges in ungrouped_exchanges
+                if len(exchanges.events) > 0
+            ]
+        )
         zone_key, sources, source_type = ExchangeList.get_zone_source_type(exchange_df)
         exchange_df = exchange_df.groupby(level="datetime", dropna=False).sum(
             numeric_only=True
         )
+        # The frames are indexed in UTC, give the datetimes back in the timezone of the events.
+        exchange_df = exchange_df.tz_convert(
+            next(
+                exchanges.events[0].datetime.tzinfo
+                for exchanges in ungrouped_exchanges
+                if len(exchanges.events) > 0
+            )
+        )
         for dt, row in exchange_df.iterrows():
             exchanges.append(
                 zone_key, dt.to_pydatetime(), sources, row["netFlow"], source_type
@@ -186,7 +296,16 @@ class ExchangeList(AggregatableEventList):
 
 
 class ProductionBreakdownList(AggregatableEventList):
-    events: list[ProductionBreakdown]
+    events: list[ProductionBreakdown] | ProductionBreakdownColumns
+
+    def __init__(self, logger: Logger, columnar: bool = False):
+        """
+        Columnar lists store their events in typed arrays rather than as pydantic models,
+        which uses a fraction of the memory for long lists, see `ProductionBreakdownColumns`.
+        """
+        super().__init__(logger)
+        if columnar:
+            self.events = ProductionBreakdownColumns()
 
     def append(
         self,
@@ -203,6 +322,100 @@ class ProductionBreakdownList(AggregatableEventList):
         if event:
             self.events.append(event)
 
+    def append_batch(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        production: dict[str, Sequence[float | None]] | None = None,
+        storage: dict[str, Sequence[float | None]] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        """
+        Handles the creation of many events at once and adds them to the batch.
+        Production and storage are given as one sequence of values per mode.
+        """
+        if isinstance(self.events, ProductionBreakdownColumns):
+            self.events.append_batch(
+                self.logger, zoneKey, datetimes, source, production, storage, sourceType
+            )
+            return
+        self.events.extend(
+            ProductionBreakdown.create_batch(
+                self.logger, zoneKey, datetimes, source, production, storage, sourceType
+            )
+        )
+
+    def to_list(self) -> list[dict[str, Any]]:
+        if isinstance(self.events, ProductionBreakdownColumns):
+            return self.events.to_dicts()
+        return super().to_list()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Gives the events as a frame, see `EventList.to_frame`, with one float column per
+        production and storage mode set in any event, e.g. `production.wind`.
+        Corrected negative values are NaN.
+        """
+        if not isinstance(self.events, ProductionBreakdownColumns):
+            return super().to_frame()
+        columns = self.events
+        # Reorders the columns of the matrices as the modes of `_to_mode_matrix`.
+        production_order = [PRODUCTION_COLUMNS.index(mode) for mode in PRODUCTION_MODES]
+        storage_order = [STORAGE_COLUMNS.index(mode) for mode in STORAGE_MODES]
+        return _events_frame(
+            pd.to_datetime(columns.timestamps, unit="us", utc=True),
+            {
+                "zoneKey": columns.zone_keys,
+                "source": columns.sources,
+                "sourceType": columns.source_types,
+                **_mode_columns(
+                    "production",
+                    PRODUCTION_MODES,
+                    columns.production[:, production_order],
+                    columns.production_set[:, production_order],
+                ),
+                **_mode_columns(
+                    "storage",
+                    STORAGE_MODES,
+                    columns.storage[:, storage_order],
+                    columns.storage_set[:, storage_order],
+                ),
+            },
+        )
+
+    def _value_columns(
+        self, events: list[ProductionBreakdown]
+    ) -> dict[str, np.ndarray]:
+        production, _, production_set = ProductionBreakdownList._to_mode_matrix(
+            events, "production", PRODUCTION_MODES
+        )
+        storage, _, storage_set = ProductionBreakdownList._to_mode_matrix(
+            events, "storage", STORAGE_MODES
+        )
+        return {
+            **_mode_columns("production", PRODUCTION_MODES, production, production_set),
+            **_mode_columns("storage", STORAGE_MODES, storage, storage_set),
+        }
+
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        mixes: dict[str, dict[str, list[float | None]]] = {
+            "production": {},
+            "storage": {},
+        }
+        for column in frame.columns:
+            mix, _, mode = column.partition(".")
+            if mix in mixes and mode:
+                mixes[mix][mode] = _optional_floats(frame[column])
+        self.append_batch(
+            datetimes=datetimes,
+            production=mixes["production"] or None,
+            storage=mixes["storage"] or None,
+            **keys,
+        )
+
     @staticmethod
     def merge_production_breakdowns(
         ungrouped_production_breakdowns: list["ProductionBreakdownList"],
@@ -222,30 +435,199 @@ class ProductionBreakdownList(AggregatableEventList):
         ):
             return production_breakdowns
         len_ungrouped_production_breakdowns = len(ungrouped_production_breakdowns)
-        df = pd.concat(
-            [
-                production_breakdowns.dataframe
-                for production_breakdowns in ungrouped_production_breakdowns
-                if len(production_breakdowns.events) > 0
-            ]
+        events: list[ProductionBreakdown] = [
+            event
+            for production_breakdowns_to_merge in ungrouped_production_breakdowns
+            for event in production_breakdowns_to_merge.events
+        ]
+        zone_key, _, source_type = ProductionBreakdownList.get_zone_source_type(
+            pd.DataFrame(
+                {
+                    "zoneKey": [event.zoneKey for event in events],
+                    "source": [event.source for event in events],
+                    "sourceType": [event.sourceType for event in events],
+                }
+            )
         )
-        _, _, _ = ProductionBreakdownList.get_zone_source_type(df)
 
-        df = df.drop(columns=["source", "sourceType", "zoneKey"])
-        df = df.groupby(level=0, dropna=False)["data"].apply(list)
+        # Group the events by timestamp, keeping the order in which they were given.
+        timestamps = pd.to_datetime(
+            [event.datetime for event in events], utc=True
+        ).values
+        _, group, counts = np.unique(
+            timestamps, return_inverse=True, return_counts=True
+        )
+        order = np.argsort(group, kind="stable")
+        layer = np.empty(len(events), dtype=int)
+        layer[order] = (
+            np.arange(len(events)) - (np.cumsum(counts) - counts)[group[order]]
+        )
         if matching_timestamps_only:
             logger.info(
                 f"Filtering production breakdowns to keep \
                 only the timestamps where all the production breakdowns \
-                have data, {len(df[df.apply(lambda x: len(x) != len_ungrouped_production_breakdowns)])}\
+                have data, {int((counts != len_ungrouped_production_breakdowns).sum())}\
                 points where discarded."
             )
-            df = df[df.apply(lambda x: len(x) == len_ungrouped_production_breakdowns)]
-        for row in df:
-            prod = ProductionBreakdown.aggregate(row)
-            production_breakdowns.events.append(prod)
+
+        merged_production, merged_storage = (
+            ProductionBreakdownList._sum_modes(
+                *ProductionBreakdownList._to_mode_matrix(events, mix_attribute, modes),
+                group,
+                layer,
+                len(counts),
+            )
+            for mix_attribute, modes in (
+                ("production", PRODUCTION_MODES),
+                ("storage", STORAGE_MODES),
+            )
+        )
+        sources = ProductionBreakdownList._group_sources(
+            events, group, layer, len(counts)
+        )
+
+        # Index of the members of each group, in order, -1 for missing members.
+        members = np.full((len(counts), layer.max() + 1), -1)
+        members[group, layer] = np.arange(len(events))
+        for group_index in range(len(counts)):
+            if (
+                matching_timestamps_only
+                and counts[group_index] != len_ungrouped_production_breakdowns
+            ):
+                continue
+            group_events = [events[i] for i in members[group_index] if i >= 0]
+            production_mix = ProductionMix(
+                **ProductionBreakdownList._mix_values(
+                    PRODUCTION_MODES,
+                    *(matrix[group_index] for matrix in merged_production),
+                )
+            )
+            for event in group_events:
+                if event.production is not None:
+                    production_mix._corrected_negative_values.update(
+                        event.production.corrected_negative_modes
+                    )
+            storage_mix = StorageMix(
+                **ProductionBreakdownList._mix_values(
+                    STORAGE_MODES,
+                    *(matrix[group_index] for matrix in merged_storage),
+                )
+            )
+            production_breakdowns.events.append(
+                ProductionBreakdown(
+                    zoneKey=zone_key,
+                    datetime=group_events[0].datetime,
+                    source=sources[group_index],
+                    production=production_mix,
+                    storage=storage_mix,
+                    sourceType=source_type,
+                )
+            )
         return production_breakdowns
 
+    @staticmethod
+    def _to_mode_matrix(
+        events: list[ProductionBreakdown], mix_attribute: str, modes: list[str]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extracts the modes of a mix of the events into a numeric matrix (events x
+        modes), NaN when the mode is unset or None. The boolean matrices flag the
+        modes that have a value, which may be NaN, and the modes that have been set
+        (even to None).
+        """
+        values = np.full((len(events), len(modes)), np.nan)
+        has_value = np.zeros(values.shape, dtype=bool)
+        is_set = np.zeros(values.shape, dtype=bool)
+        mode_index = {mode: index for index, mode in enumerate(modes)}
+        for row, event in enumerate(events):
+            mix = getattr(event, mix_attribute)
+            if mix is None:
+                continue
+            for mode in mix.__fields_set__:
+                column = mode_index.get(mode)
+                if column is None:
+                    continue
+                is_set[row, column] = True
+                value = mix.__dict__[mode]
+                if value is not None:
+                    values[row, column] = value
+                    has_value[row, column] = True
+        return values, has_value, is_set
+
+    @staticmethod
+    def _sum_modes(
+        values: np.ndarray,
+        has_value: np.ndarray,
+        is_set: np.ndarray,
+        group: np.ndarray,
+        layer: np.ndarray,
+        n_groups: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sums the mode matrix per group. The n-th events of all the groups are added
+        at once, which mirrors the sequential `Mix.add_value` calls: None values are
+        ignored, a mode is None only if all its values are None, NaN values are
+        summed as any other value and the sum is rounded after each addition.
+        """
+        merged = np.full((n_groups, values.shape[1]), np.nan)
+        merged_has_value = np.zeros(merged.shape, dtype=bool)
+        merged_set = np.zeros(merged.shape, dtype=bool)
+        for n in range(layer.max() + 1):
+            rows = layer == n
+            groups = group[rows]
+            layer_values = values[rows]
+            layer_has_value = has_value[rows]
+            current = merged[groups]
+            current_has_value = merged_has_value[groups]
+            summed = np.where(
+                current_has_value,
+                current + np.where(layer_has_value, layer_values, 0),
+                layer_values,
+            )
+            summed_has_value = current_has_value | layer_has_value
+            current[summed_has_value] = [
+                round(value, 6) for value in summed[summed_has_value].tolist()
+            ]
+            merged[groups] = current
+            merged_has_value[groups] = summed_has_value
+            merged_set[groups] |= is_set[rows]
+        return merged, merged_has_value, merged_set
+
+    @staticmethod
+    def _group_sources(
+        events: list[ProductionBreakdown],
+        group: np.ndarray,
+        layer: np.ndarray,
+        n_groups: int,
+    ) -> list[str]:
+        """
+        Returns the comma-separated sources of each group, in order of appearance.
+        Sources are computed once per distinct combination of sources.
+        """
+        source_codes, source_names = pd.factorize(
+            pd.Series([event.source for event in events])
+        )
+        codes = np.full((n_groups, layer.max() + 1), -1)
+        codes[group, layer] = source_codes
+        combinations, combination_index = np.unique(codes, axis=0, return_inverse=True)
+        combination_sources = [
+            ", ".join(dict.fromkeys(source_names[code] for code in row if code >= 0))
+            for row in combinations
+        ]
+        return [combination_sources[index] for index in combination_index.ravel()]
+
+    @staticmethod
+    def _mix_values(
+        modes: list[str], values: np.ndarray, has_value: np.ndarray, is_set: np.ndarray
+    ) -> dict[str, float | None]:
+        return {
+            mode: value if mode_has_value else None
+            for mode, value, mode_has_value, mode_is_set in zip(
+                modes, values.tolist(), has_value, is_set
+            )
+            if mode_is_set
+        }
+
 
 class TotalProductionList(EventList):
     events: list[TotalProduction]
@@ -264,6 +646,31 @@ class TotalProductionList(EventList):
         if event:
             self.events.append(event)
 
+    def append_batch(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        values: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        """Handles the creation of many events at once and adds them to the batch."""
+        self.events.extend(
+            TotalProduction.create_batch(
+                self.logger, zoneKey, datetimes, source, values, sourceType
+            )
+        )
+
+    def _value_columns(self, events: list[TotalProduction]) -> dict[str, np.ndarray]:
+        return {"value": _float_column([event.value for event in events])}
+
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        self.append_batch(
+            datetimes=datetimes, values=_optional_floats(frame["value"]), **keys
+        )
+
 
 class TotalConsumptionList(EventList):
     events: list[TotalConsumption]
@@ -282,9 +689,37 @@ class TotalConsumptionList(EventList):
         if event:
             self.events.append(event)
 
+    def append_batch(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        consumptions: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        """Handles the creation of many events at once and adds them to the batch."""
+        self.events.extend(
+            TotalConsumption.create_batch(
+                self.logger, zoneKey, datetimes, source, consumptions, sourceType
+            )
+        )
+
+    def _value_columns(self, events: list[TotalConsumption]) -> dict[str, np.ndarray]:
+        return {"consumption": _float_column([event.consumption for event in events])}
+
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        self.append_batch(
+            datetimes=datetimes,
+            consumptions=_optional_floats(frame["consumption"]),
+            **keys,
+        )
+
 
 class PriceList(EventList):
     events: list[Price]
+    frame_keys = ("zoneKey", "source", "sourceType", "currency")
 
     def append(
         self,
@@ -300,3 +735,59 @@ class PriceList(EventList):
         )
         if event:
             self.events.append(event)
+
+    def append_batch(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        prices: Sequence[float | None],
+        currency: str,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        """Handles the creation of many events at once and adds them to the batch."""
+        self.events.extend(
+            Price.create_batch(
+                self.logger, zoneKey, datetimes, source, prices, currency, sourceType
+            )
+        )
+
+    def _value_columns(self, events: list[Price]) -> dict[str, np.ndarray]:
+        return {"price": _float_column([event.price for event in events])}
+
+    def _append_frame_batch(
+        self, datetimes: Sequence[datetime], frame: pd.DataFrame, **keys: Any
+    ) -> None:
+        self.append_batch(
+            datetimes=datetimes, prices=_optional_floats(frame["price"]), **keys
+        )
+
+
+def _events_frame(
+    index: pd.DatetimeIndex, columns: dict[str, Sequence[Any]]
+) -> pd.DataFrame:
+    """The frame of `EventList.to_frame`, sorted by datetime as in `to_list`."""
+    frame = pd.DataFrame(columns, index=index.rename("datetime"))
+    return frame.sort_index(kind="stable")
+
+
+def _float_column(values: Sequence[float | None]) -> np.ndarray:
+    # None values are converted to NaN.
+    return np.array(values, dtype=float)
+
+
+def _optional_floats(column: pd.Series) -> list[float | None]:
+    """The values of a frame column, NaN being None."""
+    values = column.to_numpy(dtype=float)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _mode_columns(
+    mix: str, modes: Sequence[str], values: np.ndarray, is_set: np.ndarray
+) -> dict[str, np.ndarray]:
+    """One column per mode set in any event, named e.g. `production.wind`."""
+    return {
+        f"{mix}.{mode}": values[:, column]
+        for column, mode in enumerate(modes)
+        if is_set[:, column].any()
+    }
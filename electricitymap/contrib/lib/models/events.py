@@ -1,12 +1,14 @@
 # pylint: disable=no-member
 import datetime as dt
 from abc import ABC, abstractmethod
-from collections.abc import Set
+from collections.abc import Sequence, Set
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import cache
 from logging import Logger
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, PrivateAttr, ValidationError, validator
 
@@ -27,6 +29,104 @@ def _none_safe_round(value: float | None, precision: int = 6) -> float | None:
     return None if value is None else round(value, precision)
 
 
+@cache
+def _field_defaults(model: type[BaseModel]) -> dict[str, Any]:
+    return {name: field.default for name, field in model.__fields__.items()}
+
+
+def _construct_validated(model: type[BaseModel], values: dict[str, Any]) -> Any:
+    """
+    A lighter `BaseModel.construct` for values that have already been validated in batch.
+    Fields that are not provided are left unset with their default value.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", {**_field_defaults(model), **values})
+    object.__setattr__(instance, "__fields_set__", set(values))
+    for name, private_attribute in model.__private_attributes__.items():
+        object.__setattr__(instance, name, private_attribute.get_default())
+    return instance
+
+
+def _to_float_array(values: Sequence[float | None]) -> tuple[np.ndarray, np.ndarray]:
+    """Converts a sequence of optional floats to a float array (NaN for None) and a None mask."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fiu":
+        return values.astype(float), np.zeros(len(values), dtype=bool)
+    is_none = np.array([value is None for value in values], dtype=bool)
+    array = np.array(
+        [np.nan if value is None else value for value in values], dtype=float
+    )
+    return array, is_none
+
+
+def _batch_errors(
+    values: Sequence[Any], *checks: tuple[np.ndarray, str]
+) -> list[str | None]:
+    """
+    Returns the first error message of each row given boolean masks and message templates,
+    None for rows that passed all the checks. Templates are formatted with the row value.
+    """
+    errors: list[str | None] = [None] * len(values)
+    for mask, message in checks:
+        for index in np.flatnonzero(mask):
+            if errors[index] is None:
+                errors[index] = message.format(values[index])
+    return errors
+
+
+def _validate_batch_datetimes(
+    datetimes: Sequence[datetime],
+    sourceType: "EventSourceType",
+    allow_future: bool = False,
+) -> list[str | None]:
+    """
+    Validates all the datetimes of a batch at once, mirroring `Event._validate_datetime`.
+    Returns an error message for each invalid datetime and None for valid ones.
+    """
+    is_aware = np.array(
+        [isinstance(v, datetime) and v.tzinfo is not None for v in datetimes],
+        dtype=bool,
+    )
+    timestamps = np.fromiter(
+        (v.timestamp() if aware else np.nan for v, aware in zip(datetimes, is_aware)),
+        dtype=float,
+        count=len(datetimes),
+    )
+    is_future = np.zeros(len(datetimes), dtype=bool)
+    if not allow_future and sourceType != EventSourceType.forecasted:
+        is_future = (
+            timestamps > (datetime.now(timezone.utc) + timedelta(days=1)).timestamp()
+        )
+    return _batch_errors(
+        datetimes,
+        (~is_aware, "Missing timezone: {}"),
+        (
+            timestamps < LOWER_DATETIME_BOUND.timestamp(),
+            "Date is before 2000, this is not plausible: {}",
+        ),
+        (is_future, "Date is in the future and this is not a forecasted point: {}"),
+    )
+
+
+def _log_batch_error(
+    logger: Logger,
+    kind: str,
+    zoneKey: ZoneKey,
+    event_datetime: Any,
+    *errors: str | None,
+) -> None:
+    """Logs the errors of an event of a batch, as `create` does."""
+    logger.error(
+        f"Error(s) creating {kind} Event {event_datetime}: {', '.join(e for e in errors if e is not None)}",
+        extra={
+            "zoneKey": zoneKey,
+            "datetime": event_datetime.strftime("%Y-%m-%dT%H:%M:%SZ")
+            if isinstance(event_datetime, datetime)
+            else event_datetime,
+            "kind": kind,
+        },
+    )
+
+
 class Mix(BaseModel, ABC):
     def add_value(
         self,
@@ -271,6 +371,79 @@ class Event(BaseModel, ABC):
         """To avoid having one Event failure crashing the whole parser, we use a factory method to create the Event."""
         pass
 
+    @classmethod
+    def _validate_batch_keys(
+        cls,
+        logger: Logger,
+        kind: str,
+        zoneKey: ZoneKey,
+        sourceType: EventSourceType,
+    ) -> tuple[ZoneKey, EventSourceType] | None:
+        """
+        Validates the zone and source type shared by all the events of a batch.
+        Returns None and logs the error if one of them is invalid.
+        """
+        try:
+            return cls._validate_zone_key(zoneKey), EventSourceType(sourceType)
+        except ValueError as e:
+            logger.error(
+                f"Error(s) creating {kind} Events: {e}",
+                extra={"zoneKey": zoneKey, "kind": kind},
+            )
+            return None
+
+    @classmethod
+    def _construct_batch(
+        cls,
+        logger: Logger,
+        kind: str,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        sourceType: EventSourceType,
+        fields: dict[str, Sequence[Any]],
+        value_errors: list[str | None],
+        allow_future: bool = False,
+    ) -> list[Any]:
+        """
+        Validates the fields shared by all the events of a batch once, the datetimes in a vectorized way,
+        and constructs the valid events without running the pydantic validation again.
+        Invalid events are logged and skipped, as in `create`.
+        """
+        for name, values in fields.items():
+            if len(values) != len(datetimes):
+                raise ValueError(
+                    f"Expected {len(datetimes)} values for {name}, got {len(values)}"
+                )
+        keys = cls._validate_batch_keys(logger, kind, zoneKey, sourceType)
+        if keys is None:
+            return []
+        zoneKey, sourceType = keys
+        datetime_errors = _validate_batch_datetimes(datetimes, sourceType, allow_future)
+        names = list(fields)
+        events = []
+        for event_datetime, datetime_error, value_error, *values in zip(
+            datetimes, datetime_errors, value_errors, *fields.values()
+        ):
+            if datetime_error is not None or value_error is not None:
+                _log_batch_error(
+                    logger, kind, zoneKey, event_datetime, datetime_error, value_error
+                )
+                continue
+            events.append(
+                _construct_validated(
+                    cls,
+                    {
+                        "sourceType": sourceType,
+                        "zoneKey": zoneKey,
+                        "datetime": event_datetime,
+                        "source": source,
+                        **dict(zip(names, values)),
+                    },
+                )
+            )
+        return events
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         """As part of a backwards compatibility, the points will be converted to a dict before being sent to the database."""
@@ -387,6 +560,34 @@ class Exchange(Event):
                 },
             )
 
+    @staticmethod
+    def create_batch(
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        netFlows: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> list["Exchange"]:
+        """Creates exchanges in bulk, validating the whole batch at once. Invalid points are logged and skipped."""
+        rounded = [_none_safe_round(value) for value in np.asarray(netFlows).tolist()]
+        values, is_none = _to_float_array(rounded)
+        value_errors = _batch_errors(
+            rounded,
+            (is_none, "Exchange cannot be None: {}"),
+            (np.abs(values) > 100000, "Exchange is implausibly high, above 100GW: {}"),
+        )
+        return Exchange._construct_batch(
+            logger,
+            "exchange",
+            zoneKey,
+            datetimes,
+            source,
+            sourceType,
+            {"netFlow": rounded},
+            value_errors,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "datetime": self.datetime,
@@ -440,6 +641,35 @@ class TotalProduction(Event):
                 },
             )
 
+    @staticmethod
+    def create_batch(
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        values: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> list["TotalProduction"]:
+        """Creates total productions in bulk, validating the whole batch at once. Invalid points are logged and skipped."""
+        rounded = [_none_safe_round(value) for value in np.asarray(values).tolist()]
+        array, is_none = _to_float_array(rounded)
+        value_errors = _batch_errors(
+            rounded,
+            (is_none, "Total production cannot be None: {}"),
+            (array < 0, "Total production cannot be negative: {}"),
+            (array > 500000, "Total production is implausibly high, above 500GW: {}"),
+        )
+        return TotalProduction._construct_batch(
+            logger,
+            "production",
+            zoneKey,
+            datetimes,
+            source,
+            sourceType,
+            {"value": rounded},
+            value_errors,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "datetime": self.datetime,
@@ -507,6 +737,82 @@ class ProductionBreakdown(AggregatableEvent):
                 },
             )
 
+    @staticmethod
+    def create_batch(
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        production: dict[str, Sequence[float | None]] | None = None,
+        storage: dict[str, Sequence[float | None]] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> list["ProductionBreakdown"]:
+        """
+        Creates production breakdowns in bulk from one sequence of values per mode,
+        validating the whole batch at once. Invalid points are logged and skipped.
+        Negative production values are set to None and tracked as corrected, like in `ProductionMix`.
+        """
+        n_events = len(datetimes)
+        production_mixes: list[ProductionMix | None] = [None] * n_events
+        storage_mixes: list[StorageMix | None] = [None] * n_events
+        is_empty = np.zeros(n_events, dtype=bool)
+        if production is not None:
+            for mode in production:
+                if mode not in PRODUCTION_MODES:
+                    raise ValueError(f"Unknown production mode: {mode}")
+            modes = list(production)
+            columns = []
+            is_none = np.ones((n_events, len(modes)), dtype=bool)
+            is_negative = np.zeros((n_events, len(modes)), dtype=bool)
+            for column, mode in enumerate(modes):
+                values, is_none[:, column] = _to_float_array(production[mode])
+                is_negative[:, column] = values < 0
+                column_values = values.astype(object)
+                column_values[is_none[:, column] | is_negative[:, column]] = None
+                columns.append(column_values)
+            is_empty = is_none.all(axis=1)
+            rows = zip(*columns) if modes else [()] * n_events
+            production_mixes = [
+                _construct_validated(ProductionMix, dict(zip(modes, row)))
+                for row in rows
+            ]
+            for index, column in zip(*np.nonzero(is_negative)):
+                production_mixes[index]._corrected_negative_values.add(modes[column])
+            if is_negative.any():
+                logger.warning(
+                    f"Negative production values were detected in {is_negative.any(axis=1).sum()} events: \
+                    {sorted({modes[column] for column in np.nonzero(is_negative)[1]})}.\
+                    They have been set to None."
+                )
+        if storage is not None:
+            for mode in storage:
+                if mode not in STORAGE_MODES:
+                    raise ValueError(f"Unknown storage mode: {mode}")
+            storage_modes = list(storage)
+            storage_columns = []
+            is_none = np.ones((n_events, len(storage_modes)), dtype=bool)
+            for column, mode in enumerate(storage_modes):
+                values, is_none[:, column] = _to_float_array(storage[mode])
+                column_values = values.astype(object)
+                column_values[is_none[:, column]] = None
+                storage_columns.append(column_values)
+            has_storage = ~is_none.all(axis=1)
+            for index, row in enumerate(zip(*storage_columns)):
+                if has_storage[index]:
+                    storage_mixes[index] = _construct_validated(
+                        StorageMix, dict(zip(storage_modes, row))
+                    )
+        return ProductionBreakdown._construct_batch(
+            logger,
+            "production breakdown",
+            zoneKey,
+            datetimes,
+            source,
+            sourceType,
+            {"production": production_mixes, "storage": storage_mixes},
+            _batch_errors(datetimes, (is_empty, "Mix is completely empty")),
+        )
+
     @staticmethod
     def aggregate(events: list["ProductionBreakdown"]) -> "ProductionBreakdown":
         """Merge ProductionBreakdown events into one."""
@@ -609,6 +915,38 @@ class TotalConsumption(Event):
                 },
             )
 
+    @staticmethod
+    def create_batch(
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        consumptions: Sequence[float | None],
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> list["TotalConsumption"]:
+        """Creates total consumptions in bulk, validating the whole batch at once. Invalid points are logged and skipped."""
+        rounded = [
+            _none_safe_round(value) for value in np.asarray(consumptions).tolist()
+        ]
+        array, is_none = _to_float_array(rounded)
+        value_errors = _batch_errors(
+            rounded,
+            (is_none, "Total consumption cannot be None: {}"),
+            (array < 0, "Total consumption cannot be negative: {}"),
+            (array > 500000, "Total consumption is implausibly high, above 500GW: {}"),
+            (array == 0, "Total consumption cannot be 0 MW: {}"),
+        )
+        return TotalConsumption._construct_batch(
+            logger,
+            "consumption",
+            zoneKey,
+            datetimes,
+            source,
+            sourceType,
+            {"consumption": rounded},
+            value_errors,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "datetime": self.datetime,
@@ -674,6 +1012,40 @@ class Price(Event):
                 },
             )
 
+    @staticmethod
+    def create_batch(
+        logger: Logger,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        source: str,
+        prices: Sequence[float | None],
+        currency: str,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> list["Price"]:
+        """Creates prices in bulk, validating the whole batch at once. Invalid points are logged and skipped."""
+        try:
+            currency = Price._validate_currency(currency)
+        except ValueError as e:
+            logger.error(
+                f"Error(s) creating price Events: {e}",
+                extra={"zoneKey": zoneKey, "kind": "price"},
+            )
+            return []
+        values = np.asarray(prices).tolist()
+        _, is_none = _to_float_array(values)
+        value_errors = _batch_errors(values, (is_none, "Price cannot be None: {}"))
+        return Price._construct_batch(
+            logger,
+            "price",
+            zoneKey,
+            datetimes,
+            source,
+            sourceType,
+            {"price": values, "currency": [currency] * len(values)},
+            value_errors,
+            allow_future=True,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "datetime": self.datetime,
@@ -2,9 +2,12 @@ import logging
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import numpy as np
+import pandas as pd
 
+from electricitymap.contrib.config.constants import PRODUCTION_MODES
 from electricitymap.contrib.lib.models.event_lists import (
     ExchangeList,
     PriceList,
@@ -114,6 +117,37 @@ class TestExchangeList(unittest.TestCase):
         assert exchanges.events[0].datetime == datetime(2023, 1, 1, tzinfo=timezone.utc)
         assert exchanges.events[0].netFlow == -10
 
+    def test_merge_exchanges_keeps_timezone(self):
+        exchange_lists = []
+        for net_flow in [1, 2]:
+            exchange_list = ExchangeList(logging.Logger("test"))
+            exchange_list.append(
+                zoneKey=ZoneKey("AT->DE"),
+                datetime=datetime(2023, 1, 1, tzinfo=ZoneInfo("Europe/Vienna")),
+                netFlow=net_flow,
+                source="trust.me",
+            )
+            exchange_lists.append(exchange_list)
+        exchanges = ExchangeList.merge_exchanges(exchange_lists, logging.Logger("test"))
+        assert exchanges.events[0].datetime == datetime(
+            2023, 1, 1, tzinfo=ZoneInfo("Europe/Vienna")
+        )
+        assert exchanges.events[0].datetime.tzinfo == ZoneInfo("Europe/Vienna")
+
+    def test_append_batch(self):
+        exchange_list = ExchangeList(logging.Logger("test"))
+        exchange_list.append_batch(
+            zoneKey=ZoneKey("AT->DE"),
+            datetimes=[
+                datetime(2023, 1, 1, tzinfo=timezone.utc),
+                datetime(2023, 1, 2, tzinfo=timezone.utc),
+            ],
+            netFlows=np.array([1.0, 2.0]),
+            source="trust.me",
+        )
+        assert len(exchange_list.events) == 2
+        assert exchange_list.to_list()[1]["netFlow"] == 2
+
 
 class TestConsumptionList(unittest.TestCase):
     def test_consumption_list(self):
@@ -369,6 +403,35 @@ class TestProductionBreakdownList(unittest.TestCase):
         assert merged_dict["production"].keys() == {"coal", "hydro", "wind"}
         assert merged_dict["storage"].keys() == {"hydro"}
 
+    def test_merge_production_list_keeps_nan_values(self):
+        production_list_1 = ProductionBreakdownList(logging.Logger("test"))
+        production_list_1.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            production=ProductionMix(wind=np.nan),
+            source="trust.me",
+        )
+        production_list_1.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, 1, tzinfo=timezone.utc),
+            production=ProductionMix(wind=5, solar=1),
+            source="trust.me",
+        )
+        production_list_2 = ProductionBreakdownList(logging.Logger("test"))
+        production_list_2.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, 1, tzinfo=timezone.utc),
+            production=ProductionMix(wind=np.nan, solar=None),
+            source="trust.me",
+        )
+        merged = ProductionBreakdownList.merge_production_breakdowns(
+            [production_list_1, production_list_2], logging.Logger("test")
+        )
+        assert len(merged.events) == 2
+        assert np.isnan(merged.events[0].production.wind)
+        assert np.isnan(merged.events[1].production.wind)
+        assert merged.events[1].production.solar == 1
+
     def test_merge_production_list_predicted(self):
         production_list_1 = ProductionBreakdownList(logging.Logger("test"))
         production_list_1.append(
@@ -502,6 +565,180 @@ class TestProductionBreakdownList(unittest.TestCase):
             "biomass",
         }
 
+    def test_merge_production_list_aggregates_sources_per_datetime(self):
+        production_list_1 = ProductionBreakdownList(logging.Logger("test"))
+        production_list_1.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            production=ProductionMix(wind=10),
+            source="trust.me",
+        )
+        production_list_1.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            production=ProductionMix(wind=0.1234567),
+            source="trust.me",
+        )
+        production_list_2 = ProductionBreakdownList(logging.Logger("test"))
+        production_list_2.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            production=ProductionMix(coal=0.2),
+            storage=StorageMix(battery=-1),
+            source="trust2.me",
+        )
+        merged = ProductionBreakdownList.merge_production_breakdowns(
+            [production_list_1, production_list_2], logging.Logger("test")
+        )
+        assert len(merged.events) == 2
+        assert merged.events[0].source == "trust.me"
+        assert merged.events[0].storage is None
+        assert merged.events[1].source == "trust.me, trust2.me"
+        assert merged.events[1].production.wind == 0.123457
+        assert merged.events[1].production.coal == 0.2
+        assert merged.events[1].storage.battery == -1
+
+    def test_merge_production_list_matching_timestamps_only(self):
+        production_list_1 = ProductionBreakdownList(logging.Logger("test"))
+        production_list_2 = ProductionBreakdownList(logging.Logger("test"))
+        for day in range(1, 4):
+            production_list_1.append(
+                zoneKey=ZoneKey("AT"),
+                datetime=datetime(2023, 1, day, tzinfo=timezone.utc),
+                production=ProductionMix(wind=10),
+                source="trust.me",
+            )
+        production_list_2.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            production=ProductionMix(wind=20),
+            source="trust.me",
+        )
+        merged = ProductionBreakdownList.merge_production_breakdowns(
+            [production_list_1, production_list_2],
+            logging.Logger("test"),
+            matching_timestamps_only=True,
+        )
+        assert len(merged.events) == 1
+        assert merged.events[0].datetime == datetime(2023, 1, 2, tzinfo=timezone.utc)
+        assert merged.events[0].production.wind == 30
+
+
+class TestColumnarProductionBreakdownList(unittest.TestCase):
+    def _append_events(self, production_list: ProductionBreakdownList):
+        production_mix = ProductionMix(wind=-10, coal=10)
+        production_mix.add_value("solar", -10, correct_negative_with_zero=True)
+        production_list.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            production=production_mix,
+            storage=StorageMix(hydro=1, battery=None),
+            source="trust.me",
+        )
+        production_list.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, 1, tzinfo=ZoneInfo("Europe/Vienna")),
+            production=ProductionMix(hydro=None, nuclear=12.5),
+            source="other.source",
+        )
+        production_list.append_batch(
+            zoneKey=ZoneKey("AT"),
+            datetimes=[
+                datetime(2023, 1, 3, tzinfo=timezone.utc),
+                datetime(2023, 1, 4, tzinfo=timezone.utc),
+                datetime(2023, 1, 5),
+                datetime(2023, 1, 6, tzinfo=timezone.utc),
+            ],
+            production={"wind": [1, -2, 3, None], "solar": [None, 4.5, 1, 0]},
+            storage={"battery": [None, -1, 2, 0]},
+            source="trust.me",
+        )
+
+    def test_same_outputs_as_list_of_events(self):
+        logger = logging.getLogger("test")
+        production_list = ProductionBreakdownList(logger)
+        columnar_list = ProductionBreakdownList(logger, columnar=True)
+        with self.assertLogs(logger, level="WARNING") as logs:
+            self._append_events(production_list)
+        with self.assertLogs(logger, level="WARNING") as columnar_logs:
+            self._append_events(columnar_list)
+        assert columnar_logs.output == logs.output
+
+        assert len(columnar_list) == len(production_list) == 5
+        assert list(columnar_list.events) == production_list.events
+        for event, columnar_event in zip(production_list.events, columnar_list.events):
+            assert columnar_event.datetime.tzinfo == event.datetime.tzinfo
+            assert (
+                columnar_event.to_dict()["production"] == event.to_dict()["production"]
+            )
+            assert columnar_event.to_dict()["storage"] == event.to_dict()["storage"]
+            assert columnar_event.__fields_set__ == event.__fields_set__
+        columnar_dicts, dicts = columnar_list.to_list(), production_list.to_list()
+        for columnar_dict, expected in zip(columnar_dicts, dicts, strict=True):
+            assert sorted(columnar_dict.pop("correctedModes")) == sorted(
+                expected.pop("correctedModes")
+            )
+            assert columnar_dict == expected
+        assert columnar_list.dataframe.index.equals(production_list.dataframe.index)
+
+    def test_nan_values_are_kept(self):
+        for columnar in [False, True]:
+            production_list = ProductionBreakdownList(
+                logging.Logger("test"), columnar=columnar
+            )
+            production_list.append(
+                zoneKey=ZoneKey("AT"),
+                datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                production=ProductionMix(gas=np.nan, coal=1.0, hydro=None),
+                storage=StorageMix(hydro=np.nan),
+                source="trust.me",
+            )
+            production_list.append_batch(
+                zoneKey=ZoneKey("AT"),
+                datetimes=[datetime(2023, 1, 2, tzinfo=timezone.utc)],
+                production={"gas": [np.nan], "coal": [1.0], "hydro": [None]},
+                storage={"hydro": [np.nan]},
+                source="trust.me",
+            )
+            for event in production_list.to_list():
+                assert event["production"]["coal"] == 1.0, columnar
+                assert np.isnan(event["production"]["gas"]), columnar
+                assert event["production"]["hydro"] is None, columnar
+                assert np.isnan(event["storage"]["hydro"]), columnar
+            for event in production_list.events:
+                assert np.isnan(event.production.gas), columnar
+                assert event.production.hydro is None, columnar
+
+    def test_lazy_access(self):
+        production_list = ProductionBreakdownList(logging.Logger("test"), columnar=True)
+        self._append_events(production_list)
+        events = production_list.events
+        assert events[-1].datetime == datetime(2023, 1, 6, tzinfo=timezone.utc)
+        assert events[-1].production.wind is None
+        assert events[-1].storage.battery == 0
+        assert events[3].production.corrected_negative_modes == {"wind"}
+        assert events[1].storage is None
+        assert [event.source for event in events[:2]] == ["trust.me", "other.source"]
+        with self.assertRaises(IndexError):
+            events[5]
+        assert events.production.shape == (5, len(PRODUCTION_MODES))
+        assert events.corrected.sum() == 3
+        # 2023-01-02T00:00:00Z in microseconds since the epoch.
+        assert events.timestamps[0] == 1672617600 * 10**6
+
+    def test_merge(self):
+        logger = logging.Logger("test")
+        production_list = ProductionBreakdownList(logger)
+        columnar_list = ProductionBreakdownList(logger, columnar=True)
+        self._append_events(production_list)
+        self._append_events(columnar_list)
+        merged = ProductionBreakdownList.merge_production_breakdowns(
+            [production_list, columnar_list], logger
+        )
+        assert len(merged.events) == 5
+        assert merged.events[0].production.nuclear == 25
+        assert merged.events[0].source == "other.source"
+
 
 class TestTotalProductionList(unittest.TestCase):
     def test_total_production_list(self):
@@ -538,4 +775,106 @@ class TestListFeatures(unittest.TestCase):
         _test = production_list_1.dataframe  # TODO: Can this be removed?
 
 
+class TestFrames(unittest.TestCase):
+    def test_exchange_frame(self):
+        exchange_list = ExchangeList(logging.Logger("test"))
+        exchange_list.append_batch(
+            zoneKey=ZoneKey("AT->DE"),
+            datetimes=[
+                datetime(2023, 1, 2, tzinfo=timezone.utc),
+                datetime(2023, 1, 1, 1, tzinfo=ZoneInfo("Europe/Vienna")),
+            ],
+            netFlows=[1.5, -2],
+            source="trust.me",
+        )
+        frame = exchange_list.to_frame()
+        assert str(frame.index.tz) == "UTC"
+        assert frame.index.name == "datetime"
+        assert frame.index[0] == datetime(2023, 1, 1, tzinfo=timezone.utc)
+        assert frame["netFlow"].dtype == float
+        assert frame["netFlow"].tolist() == [-2, 1.5]
+        assert frame["zoneKey"].tolist() == ["AT->DE", "AT->DE"]
+        assert frame["sourceType"].tolist() == [EventSourceType.measured] * 2
+
+        from_frame = ExchangeList.from_frame(frame, logging.Logger("test"))
+        assert from_frame.to_list() == exchange_list.to_list()
+
+    def test_from_frame_with_keys(self):
+        frame = pd.DataFrame(
+            {"price": [1.0, np.nan, 3.0]},
+            index=pd.date_range("2023-01-01", periods=3, freq="H", tz="UTC"),
+        )
+        with self.assertRaises(ValueError):
+            PriceList.from_frame(frame, logging.Logger("test"), zoneKey="DE")
+        logger = logging.getLogger("test")
+        with self.assertLogs(logger, level="ERROR"):
+            price_list = PriceList.from_frame(
+                frame, logger, zoneKey=ZoneKey("DE"), source="trust.me", currency="EUR"
+            )
+        assert [event.price for event in price_list.events] == [1.0, 3.0]
+        assert price_list.to_frame()["currency"].tolist() == ["EUR", "EUR"]
+
+    def test_from_frame_groups_keys(self):
+        frame = pd.DataFrame(
+            {
+                "zoneKey": ["DE", "FR", "DE"],
+                "source": "trust.me",
+                "consumption": [1.0, 2.0, 3.0],
+            },
+            index=pd.date_range("2023-01-01", periods=3, freq="H", tz="UTC"),
+        )
+        consumption_list = TotalConsumptionList.from_frame(
+            frame, logging.Logger("test"), sourceType=EventSourceType.estimated
+        )
+        assert [
+            (event.zoneKey, event.consumption, event.sourceType)
+            for event in consumption_list.events
+        ] == [
+            ("DE", 1.0, EventSourceType.estimated),
+            ("DE", 3.0, EventSourceType.estimated),
+            ("FR", 2.0, EventSourceType.estimated),
+        ]
+        total_production = TotalProductionList.from_frame(
+            frame.rename(columns={"consumption": "value"}), logging.Logger("test")
+        )
+        assert total_production.to_frame()["value"].tolist() == [1.0, 2.0, 3.0]
+
+    def test_production_breakdown_frame(self):
+        production_list = ProductionBreakdownList(logging.Logger("test"))
+        production_list.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            production=ProductionMix(wind=-10, coal=10),
+            storage=StorageMix(hydro=1),
+            source="trust.me",
+        )
+        production_list.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            production=ProductionMix(coal=12, solar=None),
+            source="trust.me",
+        )
+        frame = production_list.to_frame()
+        assert list(frame.columns) == [
+            "zoneKey",
+            "source",
+            "sourceType",
+            "production.coal",
+            "production.wind",
+            "production.solar",
+            "storage.hydro",
+        ]
+        assert frame.dtypes["production.coal"] == float
+        np.testing.assert_array_equal(frame["production.wind"], [np.nan, np.nan])
+        np.testing.assert_array_equal(frame["storage.hydro"], [1, np.nan])
+
+        columnar_list = ProductionBreakdownList(logging.Logger("test"), columnar=True)
+        columnar_list.append_frame(frame)
+        pd.testing.assert_frame_equal(columnar_list.to_frame(), frame)
+        from_frame = ProductionBreakdownList.from_frame(frame, logging.Logger("test"))
+        assert from_frame.events[0].production.coal == 10
+        assert from_frame.events[0].storage.hydro == 1
+        assert from_frame.events[1].storage is None
+
+
 print(type(ZoneKey("AT")))
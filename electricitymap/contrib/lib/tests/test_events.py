@@ -105,6 +105,44 @@ class TestExchange(unittest.TestCase):
             )
             mock_error.assert_called_once()
 
+    def test_create_batch(self):
+        logger = logging.Logger("test")
+        datetimes = [
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 1, 2),
+            datetime(2023, 1, 3, tzinfo=ZoneInfo("Europe/Paris")),
+            datetime(2023, 1, 4, tzinfo=timezone.utc),
+        ]
+        net_flows = [1.1234567, 1, None, 200000]
+        with patch.object(logger, "error") as mock_error:
+            exchanges = Exchange.create_batch(
+                logger=logger,
+                zoneKey=ZoneKey("AT->DE"),
+                datetimes=datetimes,
+                netFlows=net_flows,
+                source="trust.me",
+            )
+            assert mock_error.call_count == 3
+        assert [exchange.to_dict() for exchange in exchanges] == [
+            Exchange.create(
+                logger, ZoneKey("AT->DE"), datetimes[0], "trust.me", net_flows[0]
+            ).to_dict()
+        ]
+        assert exchanges[0].netFlow == 1.123457
+
+    def test_create_batch_logs_error_for_invalid_zone_key(self):
+        logger = logging.Logger("test")
+        with patch.object(logger, "error") as mock_error:
+            exchanges = Exchange.create_batch(
+                logger=logger,
+                zoneKey=ZoneKey("DE->AT"),
+                datetimes=[datetime(2023, 1, 1, tzinfo=timezone.utc)],
+                netFlows=[1],
+                source="trust.me",
+            )
+            mock_error.assert_called_once()
+        assert exchanges == []
+
 
 class TestConsumption(unittest.TestCase):
     def test_create_consumption(self):
@@ -421,6 +459,61 @@ class TestProductionBreakdown(unittest.TestCase):
         assert dict_form["production"]["wind"] == 10
         assert dict_form["production"]["solar"] is None
 
+    def test_create_batch(self):
+        logger = logging.Logger("test")
+        datetimes = [
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 1, 2, tzinfo=timezone.utc),
+            datetime(2023, 1, 3, tzinfo=timezone.utc),
+        ]
+        with patch.object(logger, "warning") as mock_warning, patch.object(
+            logger, "error"
+        ) as mock_error:
+            breakdowns = ProductionBreakdown.create_batch(
+                logger=logger,
+                zoneKey=ZoneKey("DE"),
+                datetimes=datetimes,
+                production={"wind": [10, -1, None], "hydro": [None, 5, None]},
+                storage={"battery": [None, -3, None]},
+                source="trust.me",
+            )
+            mock_warning.assert_called_once()
+            # The last mix is completely empty.
+            mock_error.assert_called_once()
+        assert len(breakdowns) == 2
+        assert breakdowns[0].storage is None
+        assert breakdowns[1].production.wind is None
+        assert breakdowns[1].production.corrected_negative_modes == {"wind"}
+        assert breakdowns[1].storage.battery == -3
+        assert [breakdown.to_dict() for breakdown in breakdowns] == [
+            ProductionBreakdown.create(
+                logger,
+                ZoneKey("DE"),
+                datetimes[0],
+                "trust.me",
+                ProductionMix(wind=10, hydro=None),
+                StorageMix(battery=None),
+            ).to_dict(),
+            ProductionBreakdown.create(
+                logger,
+                ZoneKey("DE"),
+                datetimes[1],
+                "trust.me",
+                ProductionMix(wind=-1, hydro=5),
+                StorageMix(battery=-3),
+            ).to_dict(),
+        ]
+
+    def test_create_batch_unknown_production_mode_raises(self):
+        with self.assertRaises(ValueError):
+            ProductionBreakdown.create_batch(
+                logger=logging.Logger("test"),
+                zoneKey=ZoneKey("DE"),
+                datetimes=[datetime(2023, 1, 1, tzinfo=timezone.utc)],
+                production={"not_a_mode": [1]},
+                source="trust.me",
+            )
+
 
 class TestTotalProduction(unittest.TestCase):
     def test_create_generation(self):
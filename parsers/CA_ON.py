@@ -12,6 +12,8 @@ import arrow
 import pandas as pd
 from requests import Session
 
+from parsers.lib.single_flight import coalesce
+
 """
 Some notes about timestamps:
 
@@ -86,11 +88,10 @@ def _fetch_ieso_xml(
         .replace(hour=0, minute=0, second=0, microsecond=0)
     )
 
-    r = session or Session()
     url = url_template.format(YYYYMMDD=dt.format("YYYYMMDD"))
-    response = r.get(url)
+    text = _download_ieso_report(url, session or Session())
 
-    if not response.ok:
+    if text is None:
         # Data is generally available for past 3 months. Requesting files older than this
         # returns an HTTP 404 error.
         logger.info(
@@ -98,11 +99,20 @@ def _fetch_ieso_xml(
         )
         return dt, None
 
-    xml = ET.fromstring(response.text)
+    xml = ET.fromstring(text)
 
     return dt, xml
 
 
+# The daily reports are shared by the zone and all its exchanges.
+@coalesce()
+def _download_ieso_report(url: str, session: Session) -> str | None:
+    response = session.get(url)
+    if not response.ok:
+        return None
+    return response.text
+
+
 def _parse_ieso_hour(output, target_dt):
     hour = int(output.find(XML_NS_TEXT + "Hour").text)
     return target_dt.shift(hours=hour).datetime
@@ -8,6 +8,8 @@ and exposes them via a unified API.
 Requires an API key, set in the EIA_KEY environment variable. Get one here:
 https://www.eia.gov/opendata/register.php
 """
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
 from typing import Any
@@ -368,8 +370,19 @@ PRODUCTION_MIX = (
     f"{BASE_URL}/fuel-type-data/data/"
     "?data[]=value&facets[respondent][]={}&facets[fueltype][]={}&frequency=hourly"
 )
+# Queries for several respondents, fuel types or exchanges at once.
+REGIONS_DATA = f"{BASE_URL}/region-data/data/?data[]=value{{}}&frequency=hourly"
+PRODUCTION_MIXES = f"{BASE_URL}/fuel-type-data/data/?data[]=value{{}}&frequency=hourly"
+EXCHANGE_FACETS_PATTERN = re.compile(
+    r"&facets\[fromba\]\[\]=(\w+)&facets\[toba\]\[\]=(\w+)"
+)
 EXCHANGE = f"{BASE_URL}/interchange-data/data/" "?data[]=value{}&frequency=hourly"
 
+# Maximum number of EIA requests sent in parallel by a single fetch function.
+MAX_CONCURRENT_REQUESTS = 8
+# Maximum number of rows returned by the API in a single response.
+BULK_PAGE_LENGTH = 5000
+
 
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
@@ -394,7 +407,6 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    consumption_list = TotalConsumptionList(logger)
     consumption = _fetch(
         zone_key,
         CONSUMPTION.format(REGIONS[zone_key]),
@@ -402,6 +414,13 @@ def fetch_consumption(
         target_datetime=target_datetime,
         logger=logger,
     )
+    return _consumption_list(zone_key, consumption, logger).to_list()
+
+
+def _consumption_list(
+    zone_key: ZoneKey, consumption: list[dict[str, Any]], logger: Logger
+) -> TotalConsumptionList:
+    consumption_list = TotalConsumptionList(logger)
     for point in consumption:
         consumption_list.append(
             zoneKey=zone_key,
@@ -409,8 +428,7 @@ def fetch_consumption(
             consumption=point["value"],
             source="eia.gov",
         )
-
-    return consumption_list.to_list()
+    return consumption_list
 
 
 @refetch_frequency(timedelta(days=1))
@@ -467,20 +485,47 @@ def fetch_production_mix(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
+    session = session or Session()
+    production_values_per_series = _fetch_production_mixes(
+        _production_mix_series(zone_key),
+        session=session,
+        target_datetime=target_datetime,
+        logger=logger,
+    )
+    return _merge_production_mix(zone_key, production_values_per_series, logger)
+
+
+def _zones_to_integrate(zone_key: ZoneKey, production_mode: str) -> dict[str, float]:
+    """Returns the zones supplying their production of a mode to a zone, with their share."""
+    supplying_zones = PRODUCTION_ZONES_TRANSFERS.get(zone_key, {})
+    return {
+        **supplying_zones.get("all", {}),
+        **supplying_zones.get(production_mode, {}),
+    }
+
+
+def _production_mix_series(zone_key: ZoneKey) -> list[tuple[str, str]]:
+    """Returns the (zone key, production mode) series needed for the production mix of a zone."""
+    return [
+        (zone, production_mode)
+        for production_mode in TYPES
+        for zone in [zone_key, *_zones_to_integrate(zone_key, production_mode)]
+    ]
+
+
+def _merge_production_mix(
+    zone_key: ZoneKey,
+    production_values_per_series: dict[tuple[str, str], list[dict[str, Any]]],
+    logger: Logger,
+) -> list[dict[str, Any]]:
+    """Merges the series of a zone and of the zones supplying it into its production mix."""
     all_production_breakdowns: list[ProductionBreakdownList] = []
-    for production_mode, code in TYPES.items():
+    for production_mode in TYPES:
         negative_threshold = NEGATIVE_PRODUCTION_THRESHOLDS_TYPE.get(
             production_mode, NEGATIVE_PRODUCTION_THRESHOLDS_TYPE["default"]
         )
         production_breakdown = ProductionBreakdownList(logger)
-        url_prefix = PRODUCTION_MIX.format(REGIONS[zone_key], code)
-        production_values = _fetch(
-            zone_key,
-            url_prefix,
-            session=session,
-            target_datetime=target_datetime,
-            logger=logger,
-        )
+        production_values = production_values_per_series[(zone_key, production_mode)]
         # TODO Currently manually filtering out datapoints with null values
         # As null values can cause problems in the estimation models if there's
         # only null values.
@@ -500,8 +545,10 @@ def fetch_production_mix(
         # https://www.epa.gov/energy/emissions-generation-resource-integrated-database-egrid
 
         if zone_key == "US-CAR-SCEG" and production_mode == "nuclear":
-            for point in production_values:
-                point.update({"value": point["value"] * (1 - SC_VIRGIL_OWNERSHIP)})
+            production_values = [
+                {**point, "value": point["value"] * (1 - SC_VIRGIL_OWNERSHIP)}
+                for point in production_values
+            ]
 
         for point in production_values:
             production_mix, storage_mix = create_production_storage(
@@ -517,21 +564,11 @@ def fetch_production_mix(
         all_production_breakdowns.append(production_breakdown)
         # Integrate the supplier zones in the zones they supply
 
-        supplying_zones = PRODUCTION_ZONES_TRANSFERS.get(zone_key, {})
-        zones_to_integrate = {
-            **supplying_zones.get("all", {}),
-            **supplying_zones.get(production_mode, {}),
-        }
-        for zone, percentage in zones_to_integrate.items():
-            url_prefix = PRODUCTION_MIX.format(REGIONS[zone], code)
+        for zone, percentage in _zones_to_integrate(zone_key, production_mode).items():
             additional_breakdown = ProductionBreakdownList(logger)
-            additional_production = _fetch(
-                zone,
-                url_prefix,
-                session=session,
-                target_datetime=target_datetime,
-                logger=logger,
-            )
+            additional_production = production_values_per_series[
+                (zone, production_mode)
+            ]
             # TODO Currently manually filtering out datapoints with null values
             # As null values can cause problems in the estimation models if there's
             # only null values.
@@ -542,7 +579,8 @@ def fetch_production_mix(
                 if datapoint["value"] is not None
             ]
             for point in additional_production:
-                point.update({"value": point["value"] * percentage})
+                # The series may be shared with other zones, don't update it in place.
+                point = {**point, "value": point["value"] * percentage}
                 production_mix, storage_mix = create_production_storage(
                     production_mode, point, negative_threshold
                 )
@@ -592,7 +630,6 @@ def fetch_exchange(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     sortedcodes = "->".join(sorted([zone_key1, zone_key2]))
-    exchange_list = ExchangeList(logger)
     exchange = _fetch(
         sortedcodes,
         url_prefix=EXCHANGE.format(EXCHANGES[sortedcodes]),
@@ -600,6 +637,27 @@ def fetch_exchange(
         target_datetime=target_datetime,
         logger=logger,
     )
+    remapped_exchanges = {
+        remapped_exchange: _fetch(
+            remapped_exchange,
+            url_prefix=EXCHANGE.format(EXCHANGES[remapped_exchange]),
+            session=session,
+            target_datetime=target_datetime,
+            logger=logger,
+        )
+        for remapped_exchange in EXCHANGE_TRANSFERS.get(sortedcodes, {})
+    }
+    return _merge_exchanges(sortedcodes, exchange, remapped_exchanges, logger)
+
+
+def _merge_exchanges(
+    sortedcodes: str,
+    exchange: list[dict[str, Any]],
+    remapped_exchanges: dict[str, list[dict[str, Any]]],
+    logger: Logger,
+) -> list[dict[str, Any]]:
+    """Merges an exchange with the exchanges remapped to it."""
+    exchange_list = ExchangeList(logger)
     for point in exchange:
         exchange_list.append(
             zoneKey=ZoneKey(point["zoneKey"]),
@@ -611,16 +669,8 @@ def fetch_exchange(
         )
 
     # Integrate remapped exchanges
-    remapped_exchanges = EXCHANGE_TRANSFERS.get(sortedcodes, {})
     remapped_exchange_list = ExchangeList(logger)
-    for remapped_exchange in remapped_exchanges:
-        exchange = _fetch(
-            remapped_exchange,
-            url_prefix=EXCHANGE.format(EXCHANGES[remapped_exchange]),
-            session=session,
-            target_datetime=target_datetime,
-            logger=logger,
-        )
+    for remapped_exchange, exchange in remapped_exchanges.items():
         for point in exchange:
             remapped_exchange_list.append(
                 zoneKey=ZoneKey(sortedcodes),
@@ -638,6 +688,213 @@ def fetch_exchange(
     return exchange_list.to_list()
 
 
+def fetch_production_bulk(
+    zone_keys: list[ZoneKey] | None = None,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """
+    Bulk version of `fetch_production` for many zones, all the regions by default.
+    The bulk functions fetch the 24 hours before the target datetime, or before the
+    latest period published by EIA, for all the zones at once with a handful of
+    paginated requests.
+    """
+    return _fetch_regions_data_bulk(
+        zone_keys or list(REGIONS), "NG", session or Session(), target_datetime
+    )
+
+
+def fetch_consumption_bulk(
+    zone_keys: list[ZoneKey] | None = None,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk version of `fetch_consumption` for many zones, all the regions by default."""
+    consumptions = _fetch_regions_data_bulk(
+        zone_keys or list(REGIONS), "D", session or Session(), target_datetime
+    )
+    return {
+        zone_key: _consumption_list(zone_key, consumption, logger).to_list()
+        for zone_key, consumption in consumptions.items()
+    }
+
+
+def fetch_production_mix_bulk(
+    zone_keys: list[ZoneKey] | None = None,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk version of `fetch_production_mix` for many zones, all the regions by default."""
+    zone_keys = zone_keys or list(REGIONS)
+    production_values_per_series = _fetch_production_mixes_bulk(
+        [
+            series
+            for zone_key in zone_keys
+            for series in _production_mix_series(zone_key)
+        ],
+        session or Session(),
+        target_datetime,
+    )
+    return {
+        zone_key: _merge_production_mix(zone_key, production_values_per_series, logger)
+        for zone_key in zone_keys
+    }
+
+
+def fetch_exchange_bulk(
+    exchange_keys: list[str] | None = None,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[str, list[dict[str, Any]]]:
+    """Bulk version of `fetch_exchange` for many exchanges, all the exchanges by default."""
+    exchange_keys = exchange_keys or list(EXCHANGES)
+    all_exchange_keys = list(
+        dict.fromkeys(
+            exchange_key
+            for sortedcodes in exchange_keys
+            for exchange_key in [sortedcodes, *EXCHANGE_TRANSFERS.get(sortedcodes, {})]
+        )
+    )
+    exchange_keys_per_balancing_authorities: dict[tuple[str, str], list[str]] = {}
+    for exchange_key in all_exchange_keys:
+        match = EXCHANGE_FACETS_PATTERN.fullmatch(EXCHANGES[exchange_key])
+        if match is None:
+            raise ValueError(f"Unexpected facets for exchange {exchange_key}")
+        exchange_keys_per_balancing_authorities.setdefault(match.groups(), []).append(
+            exchange_key
+        )
+    # The query returns all the exchanges between the given balancing authorities,
+    # the ones that aren't needed are filtered out.
+    from_bas, to_bas = zip(*exchange_keys_per_balancing_authorities)
+    facets = "".join(
+        [f"&facets[fromba][]={ba}" for ba in dict.fromkeys(from_bas)]
+        + [f"&facets[toba][]={ba}" for ba in dict.fromkeys(to_bas)]
+    )
+    exchanges: dict[str, list[dict[str, Any]]] = {key: [] for key in all_exchange_keys}
+    for datapoint in _fetch_bulk(
+        EXCHANGE.format(facets), session or Session(), target_datetime
+    ):
+        for exchange_key in exchange_keys_per_balancing_authorities.get(
+            (datapoint["fromba"], datapoint["toba"]), []
+        ):
+            exchanges[exchange_key].append(_to_point(exchange_key, datapoint))
+    return {
+        sortedcodes: _merge_exchanges(
+            sortedcodes,
+            exchanges[sortedcodes],
+            {
+                remapped_exchange: exchanges[remapped_exchange]
+                for remapped_exchange in EXCHANGE_TRANSFERS.get(sortedcodes, {})
+            },
+            logger,
+        )
+        for sortedcodes in exchange_keys
+    }
+
+
+def _zone_keys_per_respondent(zone_keys: list[str]) -> dict[str, list[str]]:
+    # Some zones share the same respondent.
+    zone_keys_per_respondent: dict[str, list[str]] = {}
+    for zone_key in dict.fromkeys(zone_keys):
+        zone_keys_per_respondent.setdefault(REGIONS[zone_key], []).append(zone_key)
+    return zone_keys_per_respondent
+
+
+def _fetch_regions_data_bulk(
+    zone_keys: list[ZoneKey],
+    data_type: str,
+    session: Session,
+    target_datetime: datetime | None = None,
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    zone_keys_per_respondent = _zone_keys_per_respondent(zone_keys)
+    facets = "".join(
+        f"&facets[respondent][]={respondent}" for respondent in zone_keys_per_respondent
+    )
+    values: dict[ZoneKey, list[dict[str, Any]]] = {
+        zone_key: [] for zone_key in zone_keys
+    }
+    for datapoint in _fetch_bulk(
+        REGIONS_DATA.format(f"{facets}&facets[type][]={data_type}"),
+        session,
+        target_datetime,
+    ):
+        for zone_key in zone_keys_per_respondent.get(datapoint["respondent"], []):
+            values[zone_key].append(_to_point(zone_key, datapoint))
+    return values
+
+
+def _fetch_production_mixes_bulk(
+    series: list[tuple[str, str]],
+    session: Session,
+    target_datetime: datetime | None = None,
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    """Fetches all the (zone key, production mode) series with a single query."""
+    series = list(dict.fromkeys(series))
+    zone_keys_per_respondent = _zone_keys_per_respondent([zone for zone, _ in series])
+    production_modes_per_fuel_type = {
+        TYPES[production_mode]: production_mode
+        for production_mode in dict.fromkeys(mode for _, mode in series)
+    }
+    # The query returns all the fuel types of all the respondents, the series
+    # that aren't needed are filtered out.
+    facets = "".join(
+        [
+            f"&facets[respondent][]={respondent}"
+            for respondent in zone_keys_per_respondent
+        ]
+        + [f"&facets[fueltype][]={code}" for code in production_modes_per_fuel_type]
+    )
+    production_values: dict[tuple[str, str], list[dict[str, Any]]] = {
+        key: [] for key in series
+    }
+    for datapoint in _fetch_bulk(
+        PRODUCTION_MIXES.format(facets), session, target_datetime
+    ):
+        production_mode = production_modes_per_fuel_type.get(datapoint["fueltype"])
+        for zone_key in zone_keys_per_respondent.get(datapoint["respondent"], []):
+            if (zone_key, production_mode) in production_values:
+                production_values[(zone_key, production_mode)].append(
+                    _to_point(zone_key, datapoint)
+                )
+    return production_values
+
+
+def _fetch_production_mixes(
+    series: list[tuple[str, str]],
+    session: Session,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    """
+    Fetches the production of each (zone key, production mode) series.
+    For a target datetime, all the series are fetched at once with a single query
+    filtering on all their respondents and fuel types. Otherwise the latest 24 points
+    of each series are needed, which the API can only return one series at a time,
+    so the series are fetched concurrently.
+    """
+    if target_datetime:
+        return _fetch_production_mixes_bulk(series, session, target_datetime)
+
+    series = list(dict.fromkeys(series))
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = {
+            (zone, mode): executor.submit(
+                _fetch,
+                zone,
+                PRODUCTION_MIX.format(REGIONS[zone], TYPES[mode]),
+                session=session,
+                target_datetime=target_datetime,
+                logger=logger,
+            )
+            for zone, mode in series
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
 def _fetch(
     zone_key: str,
     url_prefix: str,
@@ -645,40 +902,87 @@ def _fetch(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
+    return [
+        _to_point(zone_key, datapoint)
+        for datapoint in _fetch_datapoints(url_prefix, session, target_datetime)
+    ]
+
+
+def _fetch_datapoints(
+    url_prefix: str,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+) -> list[dict[str, Any]]:
     # get EIA API key
     API_KEY = get_token("EIA_KEY")
 
     if target_datetime:
-        try:
-            target_datetime = arrow.get(target_datetime).datetime
-        except arrow.parser.ParserError:
-            raise ValueError(
-                f"target_datetime must be a valid datetime - received {target_datetime}"
-            )
-        utc = tz.gettz("UTC")
-        eia_ts_format = "%Y-%m-%dT%H"
-        end = target_datetime.astimezone(utc) + timedelta(hours=1)
-        start = end - timedelta(days=1)
-        url = f"{url_prefix}&api_key={API_KEY}&start={start.strftime(eia_ts_format)}&end={end.strftime(eia_ts_format)}"
+        url = f"{url_prefix}&api_key={API_KEY}{_time_window(target_datetime)}"
     else:
         url = f"{url_prefix}&api_key={API_KEY}&sort[0][column]=period&sort[0][direction]=desc&length=24"
 
-    s = session or Session()
-    req = s.get(url)
-    raw_data = req.json()
-    if raw_data.get("response", {}).get("data", None) is None:
-        return []
-    return [
-        {
-            "zoneKey": zone_key,
-            "datetime": _get_utc_datetime_from_datapoint(
-                parser.parse(datapoint["period"])
-            ),
-            "value": datapoint["value"],
-            "source": "eia.gov",
-        }
-        for datapoint in raw_data["response"]["data"]
-    ]
+    raw_data = (session or Session()).get(url).json()
+    return raw_data.get("response", {}).get("data", None) or []
+
+
+def _fetch_bulk(
+    url_prefix: str,
+    session: Session,
+    target_datetime: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fetches all the datapoints of a query in the 24 hours before the target datetime,
+    following the pagination of the API. Without a target datetime, the window ends at
+    the latest period of the query, as EIA publishes its data with a lag of a day or more.
+    """
+    API_KEY = get_token("EIA_KEY")
+    if target_datetime is None:
+        latest_datapoints = (
+            session.get(
+                f"{url_prefix}&api_key={API_KEY}&sort[0][column]=period&sort[0][direction]=desc&length=1"
+            )
+            .json()
+            .get("response", {})
+            .get("data", None)
+        )
+        if not latest_datapoints:
+            return []
+        target_datetime = _get_utc_datetime_from_datapoint(
+            parser.parse(latest_datapoints[0]["period"])
+        )
+    window = _time_window(target_datetime)
+    datapoints = []
+    while True:
+        url = f"{url_prefix}&api_key={API_KEY}{window}&offset={len(datapoints)}&length={BULK_PAGE_LENGTH}"
+        response = session.get(url).json().get("response", {})
+        page = response.get("data", None) or []
+        datapoints += page
+        if not page or len(datapoints) >= int(response.get("total", 0)):
+            return datapoints
+
+
+def _time_window(target_datetime: datetime) -> str:
+    """Returns the query parameters for the 24 hours before the target datetime."""
+    try:
+        target_datetime = arrow.get(target_datetime).datetime
+    except arrow.parser.ParserError:
+        raise ValueError(
+            f"target_datetime must be a valid datetime - received {target_datetime}"
+        )
+    utc = tz.gettz("UTC")
+    eia_ts_format = "%Y-%m-%dT%H"
+    end = target_datetime.astimezone(utc) + timedelta(hours=1)
+    start = end - timedelta(days=1)
+    return f"&start={start.strftime(eia_ts_format)}&end={end.strftime(eia_ts_format)}"
+
+
+def _to_point(zone_key: str, datapoint: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "zoneKey": zone_key,
+        "datetime": _get_utc_datetime_from_datapoint(parser.parse(datapoint["period"])),
+        "value": datapoint["value"],
+        "source": "eia.gov",
+    }
 
 
 def _conform_timestamp_convention(dt: datetime):
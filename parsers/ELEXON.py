@@ -20,8 +20,11 @@ import pandas as pd
 from requests import Session
 
 from electricitymap.contrib.config.constants import PRODUCTION_MODES
+from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
+from electricitymap.contrib.lib.types import ZoneKey
 from parsers.lib.config import refetch_frequency
 from parsers.lib.exceptions import ParserException
+from parsers.lib.single_flight import coalesce
 from parsers.lib.utils import get_token
 from parsers.lib.validation import validate
 
@@ -127,9 +130,11 @@ def query_additional_eso_data(
     return response.json()["result"]["records"]
 
 
-def query_ELEXON(report, session: Session, params):
+# The exchange reports are shared by all the interconnectors.
+@coalesce()
+def query_ELEXON(report, session: Session, params) -> str:
     params["APIKey"] = get_token("ELEXON_TOKEN")
-    return session.get(ELEXON_ENDPOINT.format(report), params=params)
+    return session.get(ELEXON_ENDPOINT.format(report), params=params).text
 
 
 def query_exchange(session: Session, target_datetime=None):
@@ -140,8 +145,7 @@ def query_exchange(session: Session, target_datetime=None):
     to_date = target_datetime.strftime("%Y-%m-%d")
 
     params = {"FromDate": from_date, "ToDate": to_date, "ServiceType": "csv"}
-    response = query_ELEXON("INTERFUELHH", session, params)
-    return response.text
+    return query_ELEXON("INTERFUELHH", session, params)
 
 
 def query_production(
@@ -174,8 +178,7 @@ def query_production(
             "Period": "*",
             "ServiceType": "csv",
         }
-    response = query_ELEXON(report, session, params)
-    return response.text
+    return query_ELEXON(report, session, params)
 
 
 def parse_exchange(
@@ -246,7 +249,9 @@ def parse_production_FUELINST(
         raise ParserException("ELEXON.py", "Production file is empty.")
     report = REPORT_META["FUELINST"]
     # create DataFrame from slice of CSV rows
-    df = pd.read_csv(StringIO(csv_data), skiprows=1, skipfooter=1, header=None)
+    df = pd.read_csv(
+        StringIO(csv_data), skiprows=1, skipfooter=1, header=None, engine="python"
+    )
     # check field count in report is as expected
     field_count = len(df.columns)
     if field_count != report["expected_fields"]:
@@ -261,13 +266,8 @@ def parse_production_FUELINST(
     for index, fuel in enumerate(FUEL_INST_MAPPING.values()):
         mapping[index + 4] = fuel
     df = df.rename(columns=mapping)
-    df["Settlement Date"] = df["Settlement Date"].apply(
-        lambda x: datetime.strptime(str(x), "%Y%m%d")
-    )
-    df["Settlement Period"] = df["Settlement Period"].astype(int)
-    df["datetime"] = df.apply(
-        lambda x: datetime_from_date_sp(x["Settlement Date"], x["Settlement Period"]),
-        axis=1,
+    df["datetime"] = datetimes_from_date_sp(
+        df["Settlement Date"], df["Settlement Period"], date_format="%Y%m%d"
     )
     return df.set_index("datetime")
 
@@ -275,55 +275,51 @@ def parse_production_FUELINST(
 def parse_additional_eso_production(raw_data: list[dict]) -> pd.DataFrame:
     """Parse additional eso data for embedded wind/solar and hydro storage."""
     df = pd.DataFrame.from_records(raw_data)
-    df["datetime"] = df.apply(
-        lambda x: datetime_from_date_sp(x["SETTLEMENT_DATE"], x["SETTLEMENT_PERIOD"]),
-        axis=1,
+    df["datetime"] = datetimes_from_date_sp(
+        df["SETTLEMENT_DATE"], df["SETTLEMENT_PERIOD"]
     )
     df = df.rename(columns=ESO_FUEL_MAPPING)
     return df.set_index("datetime")
 
 
 def process_production_events(
-    fuel_inst_data: pd.DataFrame, eso_data: pd.DataFrame
-) -> list[dict]:
+    fuel_inst_data: pd.DataFrame,
+    eso_data: pd.DataFrame,
+    logger: Logger = getLogger(__name__),
+) -> ProductionBreakdownList:
     """Combine FUELINST report and ESO data together to get the full picture and to EM Format."""
     df = fuel_inst_data.join(eso_data, rsuffix="_eso")
     df = df.rename(columns={"wind_eso": "wind", "solar_eso": "solar"})
+    df = df.loc[:, df.columns.isin([*PRODUCTION_MODES, "hydro storage"])]
     df = df.groupby(df.columns, axis=1).sum()
-    data_points = list()
-    for time_t in pd.unique(df.index):
-        time_df = df[df.index == time_t]
-
-        data_point = {
-            "zoneKey": "GB",
-            "datetime": time_t.to_pydatetime(),
-            "source": "bmreports.com",
-            "production": dict(),
-            "storage": dict(),
-        }
-
-        for row in time_df.iterrows():
-            electricity_production = row[1].to_dict()
-            for key in electricity_production.keys():
-                if key in PRODUCTION_MODES:
-                    data_point["production"][key] = electricity_production[key]
-                elif key == "hydro storage":
-                    # According to National Grid Eso:
-                    # The demand due to pumping at hydro pump storage units; the -ve signifies pumping load.
-                    # We store the pump loading as a positive value and discharge as negative.
-                    data_point["storage"]["hydro"] = -electricity_production[key]
-
-        data_points.append(data_point)
-    return data_points
+    # FUELINST has several spot times per settlement period, the last one is kept.
+    df = df[~df.index.duplicated(keep="last")]
+
+    storage = None
+    if "hydro storage" in df.columns:
+        # According to National Grid Eso:
+        # The demand due to pumping at hydro pump storage units; the -ve signifies pumping load.
+        # We store the pump loading as a positive value and discharge as negative.
+        storage = {"hydro": _optional_values(-df.pop("hydro storage"))}
+    production_breakdowns = ProductionBreakdownList(logger)
+    production_breakdowns.append_batch(
+        zoneKey=ZoneKey("GB"),
+        datetimes=df.index.to_pydatetime(),
+        source="bmreports.com",
+        production={mode: _optional_values(df[mode]) for mode in df.columns},
+        storage=storage,
+    )
+    return production_breakdowns
 
 
 def parse_production(
     csv_text: str,
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
-):
+) -> ProductionBreakdownList:
+    production_breakdowns = ProductionBreakdownList(logger)
     if not csv_text:
-        return None
+        return production_breakdowns
 
     report = REPORT_META["B1620"]
 
@@ -342,60 +338,69 @@ def parse_production(
     # filter out undesired columns
     df = df.iloc[:-1, [7, 8, 9, 4]]
 
-    df["Settlement Date"] = df["Settlement Date"].apply(
-        lambda x: datetime.strptime(x, "%Y-%m-%d")
-    )
-    df["Settlement Period"] = df["Settlement Period"].astype(int)
-    df["datetime"] = df.apply(
-        lambda x: datetime_from_date_sp(x["Settlement Date"], x["Settlement Period"]),
-        axis=1,
-    )
-
     # map from report fuel names to electricitymap fuel names
     fuel_column = "Power System Resource  Type"
-    df[fuel_column] = df[fuel_column].apply(lambda x: RESOURCE_TYPE_TO_FUEL[x])
+    unknown_types = set(df[fuel_column]) - RESOURCE_TYPE_TO_FUEL.keys()
+    if unknown_types:
+        raise ParserException(
+            "ELEXON.py", f"Unknown B1620 resource types: {sorted(unknown_types)}"
+        )
+    df = df.assign(
+        datetime=datetimes_from_date_sp(
+            df["Settlement Date"], df["Settlement Period"], date_format="%Y-%m-%d"
+        ),
+        fuel=df[fuel_column].map(RESOURCE_TYPE_TO_FUEL),
+    )
 
-    # loop through unique datetimes and create each data point
-    data_points = list()
-    for time_t in pd.unique(df["datetime"]):
-        time_df = df[df["datetime"] == time_t]
+    # One row per datetime and one column per fuel, summing the quantities of the
+    # resource types sharing a fuel e.g. 'Wind Onshore' and 'Wind Offshore' both
+    # have the key 'wind' here.
+    quantities = df.pivot_table(
+        index="datetime", columns="fuel", values="Quantity", aggfunc="sum"
+    )
+    production, storage = {}, {}
+    for fuel in quantities.columns:
+        if "storage" in fuel:
+            # ELEXON storage is negative when storing and positive when
+            # discharging (the opposite to electricitymap)
+            storage[fuel.replace("storage", "").strip()] = _optional_values(
+                -quantities[fuel]
+            )
+        else:
+            production[fuel] = _optional_values(quantities[fuel])
+
+    production_breakdowns.append_batch(
+        zoneKey=ZoneKey("GB"),
+        datetimes=quantities.index.to_pydatetime(),
+        source="bmreports.com",
+        production=production,
+        storage=storage or None,
+    )
+    return production_breakdowns
 
-        data_point = {
-            "zoneKey": "GB",
-            "datetime": time_t.to_pydatetime(),
-            "source": "bmreports.com",
-            "production": dict(),
-            "storage": dict(),
-        }
 
-        for row in time_df.iterrows():
-            fields = row[1].to_dict()
-            fuel = fields[fuel_column]
-            quantity = fields["Quantity"]
-
-            # check if storage value and if so correct key
-            if "storage" in fuel:
-                fuel_key = fuel.replace("storage", "").strip()
-                # ELEXON storage is negative when storing and positive when
-                # discharging (the opposite to electricitymap)
-                data_point["storage"][fuel_key] = quantity * -1
-            else:
-                # if/else structure allows summation of multiple quantities
-                # e.g. 'Wind Onshore' and 'Wind Offshore' both have the
-                # key 'wind' here.
-                if fuel in data_point["production"].keys():
-                    data_point["production"][fuel] += quantity
-                else:
-                    data_point["production"][fuel] = quantity
+def _optional_values(values: pd.Series) -> list[float | None]:
+    """Returns the values of the series, with None for missing values."""
+    return [None if pd.isna(value) else value for value in values.tolist()]
 
-        data_points.append(data_point)
 
-    return data_points
+def datetime_from_date_sp(date, sp):
+    """
+    Settlement periods are the half hours of the local day, the first one starting at
+    midnight, so there are 46 or 50 of them on clock change days.
+    """
+    midnight = arrow.get(date).replace(tzinfo="Europe/London")
+    return midnight.to("UTC").shift(minutes=30 * (sp - 1)).to("Europe/London").datetime
 
 
-def datetime_from_date_sp(date, sp):
-    datetime = arrow.get(date).shift(minutes=30 * (sp - 1))
-    return datetime.replace(tzinfo="Europe/London").datetime
+def datetimes_from_date_sp(
+    dates: pd.Series, periods: pd.Series, date_format: str | None = None
+) -> pd.Series:
+    """Vectorized `datetime_from_date_sp` for columns of settlement dates and periods."""
+    midnights = pd.to_datetime(dates.astype(str), format=date_format)
+    return midnights.dt.tz_localize("Europe/London") + pd.to_timedelta(
+        (periods.astype(int) - 1) * 30, unit="min"
+    )
 
 
 def _fetch_wind(
@@ -415,8 +420,7 @@ def _fetch_wind(
         "ToDateTime": end.strftime("%Y-%m-%d %H:%M:%S"),
         "ServiceType": "csv",
     }
-    response = query_ELEXON("FUELINST", session, params)
-    csv_text = response.text
+    csv_text = query_ELEXON("FUELINST", session, params)
 
     NO_DATA_TXT_ANSWER = "<httpCode>204</httpCode><errorType>No Content</errorType>"
     if NO_DATA_TXT_ANSWER in csv_text:
@@ -438,13 +442,8 @@ def _fetch_wind(
 
     df = df.iloc[:, [1, 2, 3, 8]]
     df.columns = ["Settlement Date", "Settlement Period", "published", "Wind"]
-    df["Settlement Date"] = df["Settlement Date"].apply(
-        lambda x: datetime.strptime(str(x), "%Y%m%d")
-    )
-    df["Settlement Period"] = df["Settlement Period"].astype(int)
-    df["datetime"] = df.apply(
-        lambda x: datetime_from_date_sp(x["Settlement Date"], x["Settlement Period"]),
-        axis=1,
+    df["datetime"] = datetimes_from_date_sp(
+        df["Settlement Date"], df["Settlement Period"], date_format="%Y%m%d"
     )
 
     df["published"] = df["published"].apply(
@@ -495,7 +494,7 @@ def fetch_production(
     fuel_inst_data = parse_production_FUELINST(response, target_datetime, logger)
     raw_additional_data = query_additional_eso_data(target_datetime, session)
     additional_data = parse_additional_eso_production(raw_additional_data)
-    data = process_production_events(fuel_inst_data, additional_data)
+    data = process_production_events(fuel_inst_data, additional_data, logger).to_list()
     # We are fetching from FUELINST directly.
     if False:
         # At times B1620 has had poor quality data for wind so fetch from FUELINST
@@ -12,11 +12,14 @@ Generation Forecast
 Consumption Forecast
 """
 import itertools
-import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from logging import Logger, getLogger
 from random import shuffle
-from typing import Any
+from typing import Any, NamedTuple
 
 import arrow
 import numpy as np
@@ -28,13 +31,10 @@ from electricitymap.contrib.lib.models.event_lists import (
     PriceList,
     ProductionBreakdownList,
 )
-from electricitymap.contrib.lib.models.events import (
-    EventSourceType,
-    ProductionMix,
-    StorageMix,
-)
+from electricitymap.contrib.lib.models.events import EventSourceType
 from parsers.lib.config import refetch_frequency
 
+from .lib.entsoe_xml import iter_series
 from .lib.exceptions import ParserException
 from .lib.utils import get_token
 from .lib.validation import validate
@@ -188,6 +188,9 @@ ENTSOE_EIC_MAPPING: dict[str, str] = {
     # TODO: ADD DE
 }
 
+# Maximum number of ENTSOE queries sent in parallel by a single fetch function.
+MAX_CONCURRENT_QUERIES = 4
+
 # Define zone_keys to an array of zone_keys for aggregated production data
 ZONE_KEY_AGGREGATES: dict[str, list[str]] = {
     "IT-SO": ["IT-CA", "IT-SO"],
@@ -542,6 +545,49 @@ def query_ENTSOE(
     )
 
 
+class QueryResult(NamedTuple):
+    key: str
+    text: str | None
+    error: Exception | None
+    duration: float
+
+
+def _timed_query(key: str, query: Callable[[], str | None]) -> QueryResult:
+    start = time.perf_counter()
+    try:
+        return QueryResult(key, query(), None, time.perf_counter() - start)
+    except Exception as e:
+        return QueryResult(key, None, e, time.perf_counter() - start)
+
+
+def query_ENTSOE_concurrently(
+    queries: dict[str, Callable[[], str | None]], logger: Logger
+) -> Iterator[QueryResult]:
+    """
+    Runs independent ENTSOE queries in parallel and yields their results as they arrive.
+    Only queries whose results are all used should be sent at once, a query depending
+    on the result of another one is better sent after it.
+    Errors are returned rather than raised so that the caller can decide which ones are fatal.
+    Each query rotates through the API tokens on its own, as in `query_ENTSOE`.
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(len(queries), MAX_CONCURRENT_QUERIES) or 1
+    ) as executor:
+        futures = [executor.submit(_timed_query, k, q) for k, q in queries.items()]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                logger.debug(
+                    f"ENTSOE query {result.key} took {result.duration:.2f}s"
+                    + (f" and failed: {result.error}" if result.error else "")
+                )
+                yield result
+        finally:
+            # Don't start the remaining queries if the caller stopped early.
+            for future in futures:
+                future.cancel()
+
+
 def query_consumption(
     domain: str, session: Session, target_datetime: datetime | None = None
 ) -> str | None:
@@ -708,20 +754,6 @@ def query_wind_solar_production_forecast(
     )
 
 
-def datetime_from_position(
-    start: arrow.Arrow, position: int, resolution: str
-) -> datetime:
-    """Finds time granularity of data."""
-
-    m = re.search(r"PT(\d+)([M])", resolution)
-    if m is not None:
-        digits = int(m.group(1))
-        scale = m.group(2)
-        if scale == "M":
-            return start.shift(minutes=(position - 1) * digits).datetime
-    raise NotImplementedError("Could not recognise resolution %s" % resolution)
-
-
 def parse_scalar(
     xml_text: str,
     only_inBiddingZone_Domain: bool = False,
@@ -729,48 +761,25 @@ def parse_scalar(
 ) -> tuple[list[float], list[datetime]] | None:
     if not xml_text:
         return None
-    soup = BeautifulSoup(xml_text, "html.parser")
     # Get all points
     values = []
     datetimes = []
-    for timeseries in soup.find_all("timeseries"):
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start = arrow.get(timeseries.find_all("start")[0].contents[0])
+    for series in iter_series(xml_text):
         if only_inBiddingZone_Domain:
-            if not len(timeseries.find_all("inBiddingZone_Domain.mRID".lower())):
+            if "inBiddingZone_Domain.mRID" not in series.attributes:
                 continue
         elif only_outBiddingZone_Domain:
-            if not len(timeseries.find_all("outBiddingZone_Domain.mRID".lower())):
+            if "outBiddingZone_Domain.mRID" not in series.attributes:
                 continue
-        for entry in timeseries.find_all("point"):
-            position = int(entry.find_all("position")[0].contents[0])
-            value = float(entry.find_all("quantity")[0].contents[0])
-            datetime = datetime_from_position(datetime_start, position, resolution)
-            values.append(value)
-            datetimes.append(datetime)
+        values += series.values["quantity"].tolist()
+        datetimes += series.datetimes
 
     return values, datetimes
 
 
-def create_production_storage(
-    fuel_code: str, quantity: float, logger: Logger, zoneKey: ZoneKey
-) -> tuple[ProductionMix | None, StorageMix | None]:
-    production = ProductionMix()
-    storage = StorageMix()
-    fuel_em_type = ENTSOE_PARAMETER_BY_GROUP[fuel_code]
-    if fuel_code in ENTSOE_STORAGE_PARAMETERS:
-        # Only include consumption if it's for storage. In other cases
-        # it is power plant self-consumption which should be ignored.
-        storage.add_value(fuel_em_type, -quantity)
-        return None, storage
-    if 0 > quantity > -50:
-        logger.info(
-            f"Self consumption value {quantity} for {fuel_em_type} has been set to 0.",
-            extra={"key": zoneKey, "fuel_type": fuel_em_type},
-        )
-        quantity = 0
-    production.add_value(fuel_em_type, quantity)
-    return production, None
+def _round(values: np.ndarray) -> list[float]:
+    """Rounds the values to 6 decimal places, a precision of 1 W, as `Mix.add_value` does."""
+    return [round(value, 6) for value in values.tolist()]
 
 
 def parse_production(
@@ -785,39 +794,43 @@ def parse_production(
         return ProductionBreakdownList.merge_production_breakdowns(
             all_production_breakdowns, logger
         )
-    soup = BeautifulSoup(xml, "html.parser")
 
     # Each timeserie is dedicated to a different fuel type.
-    for timeseries in soup.find_all("timeseries"):
+    for series in iter_series(xml):
         production_breakdowns = ProductionBreakdownList(logger)
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start: arrow.Arrow = arrow.get(
-            timeseries.find_all("start")[0].contents[0]
-        )
-        fuel_code = str(
-            timeseries.find_all("mktpsrtype")[0].find_all("psrtype")[0].contents[0]
-        )
-
-        for entry in timeseries.find_all("point"):
-            quantity = float(entry.find_all("quantity")[0].contents[0])
-            position = int(entry.find_all("position")[0].contents[0])
-            # Since all values in ENTSOE are positive, we need to check if
-            # the value is production or consumption so we can set the quantity
-            # to a negative value if it is consumption.
-            is_production = (
-                len(timeseries.find_all("inBiddingZone_Domain.mRID".lower())) > 0
-            )
-            datetime = datetime_from_position(datetime_start, position, resolution)
-            production, storage = create_production_storage(
-                fuel_code, quantity if is_production else -quantity, logger, zoneKey
+        fuel_code = series.attributes["MktPSRType.psrType"]
+        fuel_em_type = ENTSOE_PARAMETER_BY_GROUP[fuel_code]
+        quantities = series.values["quantity"]
+        # Since all values in ENTSOE are positive, we need to check if
+        # the value is production or consumption so we can set the quantity
+        # to a negative value if it is consumption.
+        if "inBiddingZone_Domain.mRID" not in series.attributes:
+            quantities = -quantities
+        if fuel_code in ENTSOE_STORAGE_PARAMETERS:
+            # Only include consumption if it's for storage. In other cases
+            # it is power plant self-consumption which should be ignored.
+            production_breakdowns.append_batch(
+                zoneKey=zoneKey,
+                datetimes=series.datetimes,
+                source=SOURCE,
+                sourceType=source_type,
+                storage={fuel_em_type: _round(-quantities)},
             )
-            production_breakdowns.append(
+        else:
+            self_consumption = (quantities < 0) & (quantities > -50)
+            for quantity in quantities[self_consumption].tolist():
+                logger.info(
+                    f"Self consumption value {quantity} for {fuel_em_type} has been set to 0.",
+                    extra={"key": zoneKey, "fuel_type": fuel_em_type},
+                )
+            production_breakdowns.append_batch(
                 zoneKey=zoneKey,
-                datetime=datetime,
+                datetimes=series.datetimes,
                 source=SOURCE,
                 sourceType=source_type,
-                production=production,
-                storage=storage,
+                production={
+                    fuel_em_type: _round(np.where(self_consumption, 0, quantities))
+                },
             )
         all_production_breakdowns.append(production_breakdowns)
     return ProductionBreakdownList.merge_production_breakdowns(
@@ -840,31 +853,19 @@ def parse_self_consumption(xml_text: str):
 
     if not xml_text:
         return None
-    soup = BeautifulSoup(xml_text, "html.parser")
     res = {}
-    for timeseries in soup.find_all("timeseries"):
-        is_consumption = (
-            len(timeseries.find_all("outBiddingZone_Domain.mRID".lower())) > 0
-        )
+    for series in iter_series(xml_text):
+        is_consumption = "outBiddingZone_Domain.mRID" in series.attributes
         if not is_consumption:
             continue
-        psr_type = str(
-            timeseries.find_all("mktpsrtype")[0].find_all("psrtype")[0].contents[0]
-        )
+        psr_type = series.attributes["MktPSRType.psrType"]
         if psr_type in ENTSOE_STORAGE_PARAMETERS:
             continue
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start: arrow.Arrow = arrow.get(
-            timeseries.find_all("start")[0].contents[0]
-        )
 
-        for entry in timeseries.find_all("point"):
-            quantity = float(entry.find_all("quantity")[0].contents[0])
+        for dt, quantity in zip(series.datetimes, series.values["quantity"].tolist()):
             if quantity == 0:
                 continue
-            position = int(entry.find_all("position")[0].contents[0])
-            datetime = datetime_from_position(datetime_start, position, resolution)
-            res[datetime] = res[datetime] + quantity if datetime in res else quantity
+            res[dt] = res[dt] + quantity if dt in res else quantity
 
     return res
 
@@ -874,46 +875,21 @@ def parse_production_per_units(xml_text: str) -> Any | None:
 
     if not xml_text:
         return None
-    soup = BeautifulSoup(xml_text, "html.parser")
     # Get all points
-    for timeseries in soup.find_all("timeseries"):
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start: arrow.Arrow = arrow.get(
-            timeseries.find_all("start")[0].contents[0]
-        )
-        is_production = (
-            len(timeseries.find_all("inBiddingZone_Domain.mRID".lower())) > 0
-        )
-        psr_type = str(
-            timeseries.find_all("mktpsrtype")[0].find_all("psrtype")[0].contents[0]
-        )
-        unit_key = str(
-            timeseries.find_all("mktpsrtype")[0]
-            .find_all("powersystemresources")[0]
-            .find_all("mrid")[0]
-            .contents[0]
-        )
-        unit_name = str(
-            timeseries.find_all("mktpsrtype")[0]
-            .find_all("powersystemresources")[0]
-            .find_all("name")[0]
-            .contents[0]
-        )
+    for series in iter_series(xml_text):
+        is_production = "inBiddingZone_Domain.mRID" in series.attributes
         if not is_production:
             continue
-        for entry in timeseries.find_all("point"):
-            quantity = float(entry.find_all("quantity")[0].contents[0])
-            position = int(entry.find_all("position")[0].contents[0])
-            datetime = datetime_from_position(datetime_start, position, resolution)
-            key = (unit_key, datetime)
+        psr_type = series.attributes["MktPSRType.psrType"]
+        unit_key = series.attributes["MktPSRType.PowerSystemResources.mRID"]
+        unit_name = series.attributes["MktPSRType.PowerSystemResources.name"]
+        for dt, quantity in zip(series.datetimes, series.values["quantity"].tolist()):
+            key = (unit_key, dt)
             if key in values:
-                if is_production:
-                    values[key]["production"] += quantity
-                else:
-                    values[key]["production"] -= quantity
+                values[key]["production"] += quantity
             else:
                 values[key] = {
-                    "datetime": datetime,
+                    "datetime": dt,
                     "production": quantity,
                     "productionType": ENTSOE_PARAMETER_BY_GROUP[psr_type],
                     "unitKey": unit_key,
@@ -933,34 +909,24 @@ def parse_exchange(
         return None
     quantities = quantities or []
     datetimes = datetimes or []
-    soup = BeautifulSoup(xml_text, "html.parser")
+    index_by_datetime = {dt: i for i, dt in enumerate(datetimes)}
     # Get all points
-    for timeseries in soup.find_all("timeseries"):
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start: arrow.Arrow = arrow.get(
-            timeseries.find_all("start")[0].contents[0]
-        )
+    for series in iter_series(xml_text):
         # Only use contract_marketagreement.type == A01 (Total to avoid double counting some columns)
-        if (
-            timeseries.find_all("contract_marketagreement.type")
-            and timeseries.find_all("contract_marketagreement.type")[0].contents[0]
-            != "A05"
-        ):
+        if series.attributes.get("contract_MarketAgreement.type", "A05") != "A05":
             continue
 
-        for entry in timeseries.find_all("point"):
-            quantity = float(entry.find_all("quantity")[0].contents[0])
-            if not is_import:
-                quantity *= -1
-            position = int(entry.find_all("position")[0].contents[0])
-            datetime = datetime_from_position(datetime_start, position, resolution)
+        series_quantities = series.values["quantity"]
+        if not is_import:
+            series_quantities = -series_quantities
+        for dt, quantity in zip(series.datetimes, series_quantities.tolist()):
             # Find out whether or not we should update the net production
-            try:
-                i = datetimes.index(datetime)
-                quantities[i] += quantity
-            except ValueError:  # Not in list
+            if dt in index_by_datetime:
+                quantities[index_by_datetime[dt]] += quantity
+            else:
+                index_by_datetime[dt] = len(datetimes)
                 quantities.append(quantity)
-                datetimes.append(datetime)
+                datetimes.append(dt)
 
     return quantities, datetimes
 
@@ -972,24 +938,15 @@ def parse_prices(
 ) -> PriceList:
     if not xml_text:
         return PriceList(logger)
-    soup = BeautifulSoup(xml_text, "html.parser")
     prices = PriceList(logger)
-    for timeseries in soup.find_all("timeseries"):
-        currency = str(timeseries.find_all("currency_unit.name")[0].contents[0])
-        resolution = str(timeseries.find_all("resolution")[0].contents[0])
-        datetime_start: arrow.Arrow = arrow.get(
-            timeseries.find_all("start")[0].contents[0]
+    for series in iter_series(xml_text):
+        prices.append_batch(
+            zoneKey=zoneKey,
+            datetimes=series.datetimes,
+            prices=series.values["price.amount"],
+            source="entsoe.eu",
+            currency=series.attributes["currency_Unit.name"],
         )
-        for entry in timeseries.find_all("point"):
-            position = int(entry.find_all("position")[0].contents[0])
-            dt = datetime_from_position(datetime_start, position, resolution)
-            prices.append(
-                zoneKey=zoneKey,
-                datetime=dt,
-                price=float(entry.find_all("price.amount")[0].contents[0]),
-                source="entsoe.eu",
-                currency=currency,
-            )
 
     return prices
 
@@ -1035,6 +992,8 @@ def fetch_consumption(
     domain = ENTSOE_DOMAIN_MAPPINGS[zone_key]
     # Grab consumption
     parsed = None
+    # The production is only queried for the self-consumption if there is consumption
+    # data, so the queries aren't sent concurrently.
     try:
         raw_consumption = query_consumption(domain, session, target_datetime)
     except Exception as e:
@@ -1061,10 +1020,10 @@ def fetch_consumption(
                 raw_production,
             )
         if self_consumption is not None:
+            datetime_indices = {dt: i for i, dt in enumerate(datetimes)}
             for dt, value in self_consumption.items():
-                try:
-                    i = datetimes.index(dt)
-                except ValueError:
+                i = datetime_indices.get(dt)
+                if i is None:
                     logger.warning(
                         f"No corresponding consumption value found for self-consumption at {dt}"
                     )
@@ -1111,27 +1070,33 @@ def fetch_production(
     """
     if not session:
         session = Session()
-    non_aggregated_data: list[ProductionBreakdownList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_production = query_production(
-                domain, session, target_datetime=target_datetime
-            )
-        except Exception as e:
+    zone_keys = ZONE_KEY_AGGREGATES.get(zone_key, [zone_key])
+    queries = {
+        _zone_key: partial(
+            query_production,
+            ENTSOE_DOMAIN_MAPPINGS[_zone_key],
+            session,
+            target_datetime=target_datetime,
+        )
+        for _zone_key in zone_keys
+    }
+    parsed_production: dict[str, ProductionBreakdownList] = {}
+    for result in query_ENTSOE_concurrently(queries, logger):
+        if result.error is not None:
             raise ParserException(
                 parser="ENTSOE.py",
-                message=f"Failed to fetch production for {_zone_key}",
+                message=f"Failed to fetch production for {result.key}",
                 zone_key=zone_key,
-            ) from e
-        if raw_production is None:
+            ) from result.error
+        if result.text is None:
             raise ParserException(
                 parser="ENTSOE.py",
-                message=f"No production data found for {_zone_key}",
+                message=f"No production data found for {result.key}",
                 zone_key=zone_key,
             )
         # Aggregated data are regrouped unde the same zone key.
-        non_aggregated_data.append(parse_production(raw_production, logger, zone_key))
+        parsed_production[result.key] = parse_production(result.text, logger, zone_key)
+    non_aggregated_data = [parsed_production[_zone_key] for _zone_key in zone_keys]
 
     aggregated_zone_data = ProductionBreakdownList.merge_production_breakdowns(
         non_aggregated_data, logger
@@ -1160,12 +1125,19 @@ def fetch_production_per_units(
 
     domain = ENTSOE_EIC_MAPPING[zone_key]
     data = []
-    # Iterate over all psr types
+    # Query all psr types at once
+    queries = {
+        k: partial(query_production_per_units, k, domain, session, target_datetime)
+        for k in ENTSOE_PARAMETER_DESC.keys()
+    }
+    results = {
+        result.key: result for result in query_ENTSOE_concurrently(queries, logger)
+    }
     for k in ENTSOE_PARAMETER_DESC.keys():
         try:
-            raw_production_per_units = query_production_per_units(
-                k, domain, session, target_datetime
-            )
+            if results[k].error is not None:
+                raise results[k].error
+            raw_production_per_units = results[k].text
             if raw_production_per_units is not None:
                 values = parse_production_per_units(raw_production_per_units) or []
                 for v in values:
@@ -1214,6 +1186,8 @@ def fetch_exchange(
     # Create a hashmap with key (datetime)
     exchange_hashmap = {}
     # Grab exchange
+    # The exports are only queried if there are imports, so the queries aren't sent
+    # concurrently.
     # Import
     try:
         raw_exchange = query_exchange(domain1, domain2, session, target_datetime)
@@ -1300,6 +1274,8 @@ def fetch_exchange_forecast(
     # Create a hashmap with key (datetime)
     exchange_hashmap = {}
     # Grab exchange
+    # The exports are only queried if there are imports, so the queries aren't sent
+    # concurrently.
     # Import
     parsed = None
     try:
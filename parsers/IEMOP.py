@@ -1,9 +1,14 @@
 import logging
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
-from typing import NamedTuple
+from tempfile import TemporaryFile
+from typing import IO, NamedTuple
+from zipfile import ZipFile
 
 import pandas as pd
+from pandas.api.types import union_categoricals
 from requests import Response, Session
 
 from electricitymap.contrib.config.constants import PRODUCTION_MODES
@@ -13,8 +18,6 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import (
     EventSourceType,
-    ProductionMix,
-    StorageMix,
 )
 from electricitymap.contrib.lib.types import ZoneKey
 from parsers.lib.config import refetch_frequency
@@ -456,6 +459,20 @@ EXCHANGE_KEY_MAPPING = {
 KIND_TO_URL = {"production": DIPC_URL, "exchange": RTDHS_URL}
 KIND_TO_POST_ID = {"production": "5754", "exchange": "5770"}
 STORAGE_METHODS_TO_MODE = {"hydro_storage": "hydro", "battery": "battery"}
+PRODUCTION_REPORT_DTYPES = {
+    "TIME_INTERVAL": str,
+    "REGION_NAME": "category",
+    "RESOURCE_NAME": "category",
+    "SCHED_MW": float,
+}
+PRODUCTION_COLUMNS_MAPPING = {
+    "REGION_NAME": "zone_key",
+    "RESOURCE_NAME": "resource_name",
+    "SCHED_MW": "value",
+}
+# A full day refetch downloads ~288 reports.
+MAX_CONCURRENT_DOWNLOADS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 MODES_TO_RESOURCE_KIND = {
     **{m: "production" for m in PRODUCTION_MODES},
     **{m: "storage" for m in STORAGE_METHODS_TO_MODE.keys()},
@@ -547,51 +564,118 @@ def filter_reports_items(
     return _reports_items
 
 
-def download_production_market_reports_items(
-    session: Session, reports_items: list[MarketReportsItem], logger: Logger
+def _download_market_report(
+    session: Session, reports_item: MarketReportsItem, logger: Logger
+) -> IO[bytes]:
+    """Streams a market report to a temporary file, deleted once closed."""
+    logger.debug(f"Downloading market reports for {reports_item.filename}")
+    report_file = TemporaryFile()
+    res: Response = session.get(reports_item.link, stream=True)
+    with res:
+        for chunk in res.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            report_file.write(chunk)
+    report_file.seek(0)
+    return report_file
+
+
+def _read_market_reports(
+    session: Session,
+    reports_items: list[MarketReportsItem],
+    read_report: Callable[[IO[bytes], MarketReportsItem], pd.DataFrame],
+    logger: Logger,
+) -> Iterator[pd.DataFrame]:
+    """
+    Downloads the market reports concurrently and yields their frames, in the order of
+    the reports, as soon as they are read.
+    """
+
+    def download_and_read(reports_item: MarketReportsItem) -> pd.DataFrame:
+        with _download_market_report(session, reports_item, logger) as report_file:
+            return read_report(report_file, reports_item)
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+        yield from executor.map(download_and_read, reports_items)
+
+
+def _concat_as_read(
+    dfs: Iterable[pd.DataFrame], concat: Callable[[list[pd.DataFrame]], pd.DataFrame]
 ) -> pd.DataFrame:
-    from io import BytesIO
-    from zipfile import ZipFile
+    """
+    Concatenates the frames as they are read, a batch at a time, so that the frames
+    of all the reports aren't held in memory on top of the concatenated one.
+    """
+    df: pd.DataFrame | None = None
+    pending: list[pd.DataFrame] = []
+    for _df in dfs:
+        pending.append(_df)
+        if len(pending) == MAX_CONCURRENT_DOWNLOADS:
+            df = concat(pending if df is None else [df, *pending])
+            pending = []
+    if df is None or pending:
+        df = concat(pending if df is None else [df, *pending])
+    return df
 
-    COLUMNS_MAPPING = {
-        "REGION_NAME": "zone_key",
-        "RESOURCE_NAME": "resource_name",
-        "SCHED_MW": "value",
-    }
 
-    _all_items_df = []
-    for reports_item in reports_items:
-        logger.debug(f"Downloading market reports for {reports_item.filename}")
-        res: Response = session.get(reports_item.link)
-        _item_dfs = []
-        # zip containing a list of csv files which we want to concatenate in a single dataframe
-        with ZipFile(BytesIO(res.content)) as zip_file:
-            for csv_filename in zip_file.namelist():
-                if csv_filename.endswith(".csv"):
-                    with zip_file.open(csv_filename) as csv_file:
-                        _df = pd.read_csv(csv_file, header=0)
-                        # The last line is EOF
-                        _df = _df[:-1]
-                        # All numeric types
-                        _df = _df.apply(pd.to_numeric, errors="ignore")
-                        # Add datetime column
-                        _df = convert_column_to_datetime(_df, "TIME_INTERVAL")
-                        # Localize to TIMEZONE
-                        _df["datetime"] = _df["datetime"].dt.tz_localize(TIMEZONE)
-                        # Remove 5 minute interval as we want start of interval convention
-                        _df["datetime"] = _df["datetime"] - timedelta(minutes=5)
-                        # Misc
-                        _df["REGION_NAME"] = _df["REGION_NAME"].apply(
-                            lambda x: REGION_TO_ZONE_KEY[x]
-                        )
-                        _df["filename"] = csv_filename
-                        _df = _df[["datetime", "filename", *COLUMNS_MAPPING.keys()]]
-                        _df = _df.rename(columns=COLUMNS_MAPPING)
-                        _item_dfs.append(_df)
-
-        _all_items_df.append(pd.concat(_item_dfs, ignore_index=True))
-
-    df = pd.concat(_all_items_df, ignore_index=True)
+def _read_production_market_report(
+    report_file: IO[bytes], reports_item: MarketReportsItem
+) -> pd.DataFrame:
+    """Extracts the unit level production of the csv files of a market report."""
+    _item_dfs = []
+    # zip containing a list of csv files which we want to concatenate in a single dataframe
+    with ZipFile(report_file) as zip_file:
+        for csv_filename in zip_file.namelist():
+            if csv_filename.endswith(".csv"):
+                with zip_file.open(csv_filename) as csv_file:
+                    _df = pd.read_csv(
+                        csv_file,
+                        header=0,
+                        usecols=list(PRODUCTION_REPORT_DTYPES),
+                        dtype=PRODUCTION_REPORT_DTYPES,
+                    )
+                # The last line is EOF
+                _df = _df[:-1]
+                # Add datetime column
+                _df = convert_column_to_datetime(_df, "TIME_INTERVAL")
+                # Localize to TIMEZONE
+                _df["datetime"] = _df["datetime"].dt.tz_localize(TIMEZONE)
+                # Remove 5 minute interval as we want start of interval convention
+                _df["datetime"] = _df["datetime"] - timedelta(minutes=5)
+                # Misc
+                unknown_regions = set(_df["REGION_NAME"].cat.categories) - set(
+                    REGION_TO_ZONE_KEY
+                )
+                if unknown_regions:
+                    raise ParserException(
+                        parser="IEMOP.py",
+                        message=f"Unknown regions {sorted(unknown_regions)} in {csv_filename}",
+                    )
+                _df["REGION_NAME"] = _df["REGION_NAME"].map(REGION_TO_ZONE_KEY)
+                _df["filename"] = csv_filename
+                _df = _df[["datetime", "filename", *PRODUCTION_COLUMNS_MAPPING.keys()]]
+                _df = _df.rename(columns=PRODUCTION_COLUMNS_MAPPING)
+                _item_dfs.append(_df)
+    return _concat_report_dfs(_item_dfs)
+
+
+def _concat_report_dfs(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    df = pd.concat(dfs, ignore_index=True)
+    # Categorical columns with different categories are concatenated as objects.
+    for column in ["zone_key", "resource_name"]:
+        df[column] = union_categoricals([_df[column] for _df in dfs])
+    return df
+
+
+def download_production_market_reports_items(
+    session: Session, reports_items: list[MarketReportsItem], logger: Logger
+) -> pd.DataFrame:
+    # Reports are streamed to disk and parsed as soon as they arrive,
+    # so only the frames are held in memory.
+    df = _concat_as_read(
+        _read_market_reports(
+            session, reports_items, _read_production_market_report, logger
+        ),
+        _concat_report_dfs,
+    )
 
     # Add kind column for production/storage
     df.loc[:, "resource_kind"] = ""
@@ -620,7 +704,7 @@ def filter_valid_values(df: pd.DataFrame, logger: Logger) -> pd.DataFrame:
         subset=["datetime", "zone_key", "resource_name"], keep="first"
     )
     # Fill a list of all unknown resources
-    unknown_resources = df[df["mode"] == "unknown"]["resource_name"].unique()
+    unknown_resources = df[df["mode"] == "unknown"]["resource_name"].unique().tolist()
     logger.warning(
         f"PH - production: Unknown resources found: {unknown_resources}. Please report this issue to the Electricity Maps team"
     )
@@ -629,11 +713,14 @@ def filter_valid_values(df: pd.DataFrame, logger: Logger) -> pd.DataFrame:
 
 def match_resources_to_modes(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
-    # Remove 0 padding in resource name
-    df["resource_name"] = df["resource_name"].apply(lambda x: x.strip("0"))
+    # Remove 0 padding in resource name.
+    # Resource names are categorical, so names are only mapped once per resource.
+    df["resource_name"] = df["resource_name"].map(lambda x: x.strip("0"))
     # Match resource name to mode
-    df["mode"] = df["resource_name"].apply(
-        lambda x: RESOURCE_NAME_TO_MODE[x] if x in RESOURCE_NAME_TO_MODE else "unknown"
+    df["mode"] = (
+        df["resource_name"]
+        .map(lambda x: RESOURCE_NAME_TO_MODE.get(x, "unknown"))
+        .astype(str)
     )
     # Match resource name to kind
     df["resource_kind"] = df["mode"].map(MODES_TO_RESOURCE_KIND)
@@ -674,43 +761,43 @@ def pivot_per_mode(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _read_exchange_market_report(
+    report_file: IO[bytes], reports_item: MarketReportsItem
+) -> pd.DataFrame:
+    """Extracts the HVDC flows of a market report."""
+    _df = pd.read_csv(report_file)
+    _df = _df[:-1]
+    _df = convert_column_to_datetime(_df, "RUN_TIME")
+    _df["zone_key"] = _df["HVDC_NAME"].apply(
+        lambda x: EXCHANGE_KEY_MAPPING[x]["zone_key"]
+    )
+    _df["net_flow"] = _df.apply(
+        lambda x: EXCHANGE_KEY_MAPPING[x["HVDC_NAME"]]["flow"] * x["FLOW_FROM"],
+        axis=1,
+    )
+    return _df[["datetime", "zone_key", "net_flow"]]
+
+
 def download_exchange_market_reports_items(
     session: Session, reports_items: list[MarketReportsItem], logger: Logger
 ) -> pd.DataFrame:
-    _all_items_df = []
-    for reports_item in reports_items:
-        logger.debug(f"Downloading market reports for {reports_item.filename}")
-        r: Response = session.get(reports_item.link)
-        _df = pd.read_csv(r.url)
-        _df = _df[:-1]
-        _df = convert_column_to_datetime(_df, "RUN_TIME")
-        _df["zone_key"] = _df["HVDC_NAME"].apply(
-            lambda x: EXCHANGE_KEY_MAPPING[x]["zone_key"]
-        )
-        _df["net_flow"] = _df.apply(
-            lambda x: EXCHANGE_KEY_MAPPING[x["HVDC_NAME"]]["flow"] * x["FLOW_FROM"],
-            axis=1,
-        )
-        _df = _df[["datetime", "zone_key", "net_flow"]]
-        _all_items_df.append(_df)
-
-    df = (
-        pd.concat(_all_items_df, ignore_index=True)
-        .set_index("datetime")
-        .tz_localize(TIMEZONE)
+    df = _concat_as_read(
+        _read_market_reports(
+            session, reports_items, _read_exchange_market_report, logger
+        ),
+        lambda dfs: pd.concat(dfs, ignore_index=True),
     )
-    return df
+    return df.set_index("datetime").tz_localize(TIMEZONE)
 
 
 def convert_column_to_datetime(df: pd.DataFrame, datetime_column: str) -> pd.DataFrame:
     """convert datetime column to datetime format"""
-    dt1 = pd.to_datetime(
-        df[datetime_column],
-        format="%m/%d/%Y %I:%M:%S %p",
-        errors="coerce",
+    values = df[datetime_column].astype(str)
+    # Midnight is given without time, e.g. 09/14/2023
+    values = values.where(values.str.len() > len("mm/dd/yyyy"), values + " 12:00:00 AM")
+    df["datetime"] = pd.to_datetime(
+        values, format="%m/%d/%Y %I:%M:%S %p", errors="coerce"
     )
-    dt2 = pd.to_datetime(df[datetime_column], format="%m/%d/%Y", errors="coerce")
-    df["datetime"] = dt1.combine_first(dt2)
     return df
 
 
@@ -740,21 +827,13 @@ def fetch_production(
     )
 
     production_breakdown = ProductionBreakdownList(logger)
-    for tstamp, row in df.iterrows():
-        production_mix = ProductionMix()
-        for mode in [m for m in row.index if "production." in m]:
-            production_mix.add_value(mode.replace("production.", ""), row[mode])
-        storage_mix = StorageMix()
-        for mode in [m for m in row.index if "storage." in m]:
-            storage_mix.add_value(mode.replace("storage.", ""), row[mode])
-        production_breakdown.append(
-            zone_key,
-            tstamp.to_pydatetime(),
-            SOURCE,
-            production_mix,
-            storage_mix,
-            sourceType=EventSourceType.measured,
-        )
+    # Values are rounded to the precision of `Mix.add_value`.
+    production_breakdown.append_frame(
+        df.round(6),
+        zoneKey=zone_key,
+        source=SOURCE,
+        sourceType=EventSourceType.measured,
+    )
 
     return production_breakdown.to_list()
 
@@ -4,37 +4,21 @@ from logging import Logger, getLogger
 
 # The arrow library is used to handle datetimes
 import arrow
+from aiohttp import ClientSession
 
 # The request library is used to fetch content through HTTP
 from requests import Session
 
+from parsers.lib.config import async_version
 from parsers.lib.validation import validate
 
 # please try to write PEP8 compliant code (use a linter). One of PEP8's
 # requirement is to limit your line length to 79 characters.
 
+PRODUCTION_URL = "https://amper.landsnet.is/generation/api/Values"
 
-def fetch_production(
-    zone_key: str = "IS",
-    session: Session | None = None,
-    target_datetime: datetime | None = None,
-    logger: Logger = getLogger(__name__),
-) -> dict:
-    """Requests the last known production mix (in MW) of a given country."""
-    r = session or Session()
-    if target_datetime is None:
-        url = "https://amper.landsnet.is/generation/api/Values"
-    else:
-        # WHEN HISTORICAL DATA IS NOT AVAILABLE
-        raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    res = r.get(url)
-    assert res.status_code == 200, (
-        "Exception when fetching production for "
-        f"{zone_key}: error when calling url={url}"
-    )
-
-    obj = res.json()
+def _parse_production(zone_key: str, obj: dict, logger: Logger) -> dict:
     data = {
         "zoneKey": zone_key,
         "production": {},
@@ -52,6 +36,50 @@ def fetch_production(
     return validated_data
 
 
+async def fetch_production_async(
+    zone_key: str = "IS",
+    session: ClientSession | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict:
+    """Coroutine version of `fetch_production`, with an aiohttp session."""
+    if target_datetime is not None:
+        # WHEN HISTORICAL DATA IS NOT AVAILABLE
+        raise NotImplementedError("This parser is not yet able to parse past dates")
+    if session is None:
+        async with ClientSession() as session:
+            return await fetch_production_async(zone_key, session, logger=logger)
+
+    async with session.get(PRODUCTION_URL) as res:
+        assert res.status == 200, (
+            "Exception when fetching production for "
+            f"{zone_key}: error when calling url={PRODUCTION_URL}"
+        )
+        obj = await res.json(content_type=None)
+    return _parse_production(zone_key, obj, logger)
+
+
+@async_version(fetch_production_async)
+def fetch_production(
+    zone_key: str = "IS",
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict:
+    """Requests the last known production mix (in MW) of a given country."""
+    r = session or Session()
+    if target_datetime is not None:
+        # WHEN HISTORICAL DATA IS NOT AVAILABLE
+        raise NotImplementedError("This parser is not yet able to parse past dates")
+
+    res = r.get(PRODUCTION_URL)
+    assert res.status_code == 200, (
+        "Exception when fetching production for "
+        f"{zone_key}: error when calling url={PRODUCTION_URL}"
+    )
+    return _parse_production(zone_key, res.json(), logger)
+
+
 if __name__ == "__main__":
     """Main method, never used by the Electricity Map backend, but handy for testing."""
 
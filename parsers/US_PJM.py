@@ -15,6 +15,7 @@ from requests import Response, Session
 
 from parsers.lib.config import refetch_frequency
 from parsers.lib.exceptions import ParserException
+from parsers.lib.single_flight import coalesce
 
 # Used for consumption forecast data.
 API_ENDPOINT = "https://api.pjm.com/api/v1/"
@@ -63,6 +64,8 @@ FUEL_MAPPING = {
 }
 
 
+# Fetched before every API call.
+@coalesce()
 def get_api_subscription_key(session: Session) -> str:
     pjm_settings: Response = session.get(
         "https://dataminer2.pjm.com/config/settings.json"
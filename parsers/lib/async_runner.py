@@ -0,0 +1,297 @@
+"""
+Runs many parsers on a single asyncio event loop.
+
+The requests of all the parsers are sent through one aiohttp connection pool, by
+an event loop running in a background thread. Synchronous parsers keep using the
+`requests.Session` API: `AioHttpAdapter` is a transport adapter sending their
+requests through the pool, so headers, cookies, redirects and the response cache
+of the sessions work as before. Synchronous parsers still need a worker thread
+while they wait for their responses. Parsers with a coroutine version (`async def
+fetch_*`, see `parsers.lib.config.async_version`) are run as tasks of the loop with
+the aiohttp session instead, without any thread: only the connection pool caps how
+many of them wait on the network at once.
+"""
+
+import asyncio
+import inspect
+import os
+import ssl
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cache
+from http.client import HTTPMessage
+from logging import Logger, getLogger
+from threading import Thread, get_ident
+from types import SimpleNamespace
+from typing import Any, TypeVar
+
+import aiohttp
+from requests import PreparedRequest, Response, Session, adapters
+from requests.cookies import extract_cookies_to_jar
+from requests.exceptions import ConnectionError, SSLError, Timeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from yarl import URL
+
+from parsers.lib.config import get_async_version
+from parsers.lib.parsers import PARSER_KEY_TO_DICT
+from parsers.lib.runner import JobResult, ParserJob, ParserRunner, _as_list
+from parsers.lib.single_flight import coalescing
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """An event loop running in a daemon thread, with one aiohttp session for all the requests."""
+
+    def __init__(self, max_connections: int = 100, max_connections_per_host: int = 4):
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(
+            target=self.loop.run_forever, name="parsers-event-loop", daemon=True
+        )
+        self._thread.start()
+        self.client_session: aiohttp.ClientSession = self.run(
+            self._create_client_session(max_connections, max_connections_per_host)
+        )
+
+    @staticmethod
+    async def _create_client_session(
+        max_connections: int, max_connections_per_host: int
+    ) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=max_connections, limit_per_host=max_connections_per_host
+            ),
+            # Cookies are kept by the requests sessions.
+            cookie_jar=aiohttp.DummyCookieJar(),
+            timeout=aiohttp.ClientTimeout(total=None),
+        )
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the loop and waits for its result, from another thread."""
+        if get_ident() == self._thread.ident:
+            coroutine.close()
+            raise RuntimeError("Cannot wait for the event loop from its own thread")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self) -> None:
+        self.run(self.client_session.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AioHttpAdapter(adapters.BaseAdapter):
+    """Sends the requests of a `requests.Session` through the aiohttp session of an event loop."""
+
+    def __init__(self, event_loop: EventLoopThread):
+        super().__init__()
+        self.event_loop = event_loop
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | None = None,
+        verify: bool | str = True,
+        cert: str | tuple[str, str] | None = None,
+        proxies: dict[str, str] | None = None,
+    ) -> Response:
+        # The whole body is read even when streaming, it's small for all the parsers.
+        try:
+            status, reason, headers, content = self.event_loop.run(
+                self._send(request, timeout, verify, cert, proxies)
+            )
+        except aiohttp.ClientSSLError as e:
+            raise SSLError(e, request=request) from e
+        except asyncio.TimeoutError as e:
+            raise Timeout(e, request=request) from e
+        except aiohttp.ClientError as e:
+            raise ConnectionError(e, request=request) from e
+        return self._build_response(request, status, reason, headers, content)
+
+    async def _send(
+        self,
+        request: PreparedRequest,
+        timeout: float | tuple[float, float] | None,
+        verify: bool | str,
+        cert: str | tuple[str, str] | None,
+        proxies: dict[str, str] | None,
+    ) -> tuple[int, str, list[tuple[str, str]], bytes]:
+        connect_timeout, read_timeout = (
+            timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        )
+        body = request.body
+        async with self.event_loop.client_session.request(
+            request.method or "GET",
+            # Already encoded by requests.
+            URL(request.url or "", encoded=True),
+            headers=dict(request.headers),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
+            # Redirects are followed by the requests session.
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+            ssl=_ssl_context(verify, cert),
+            proxy=select_proxy(request.url or "", proxies or {}),
+        ) as response:
+            content = await response.read()
+            headers = [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in response.raw_headers
+            ]
+            return response.status, response.reason or "", headers, content
+
+    def _build_response(
+        self,
+        request: PreparedRequest,
+        status: int,
+        reason: str,
+        headers: list[tuple[str, str]],
+        content: bytes,
+    ) -> Response:
+        message = HTTPMessage()
+        response_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+        for name, value in headers:
+            message[name] = value
+            # Repeated headers are joined, as urllib3 does.
+            response_headers[name] = (
+                f"{response_headers[name]}, {value}"
+                if name in response_headers
+                else value
+            )
+        response = Response()
+        response.url = request.url or ""
+        response.status_code = status
+        response.reason = reason
+        response.headers = response_headers
+        response._content = content
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = request
+        response.connection = self
+        # requests reads the cookies from the headers of the urllib3 response.
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=message))
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def close(self) -> None:
+        # The event loop is closed by its owner.
+        pass
+
+
+@cache
+def _ssl_context(
+    verify: bool | str, cert: str | tuple[str, str] | None
+) -> ssl.SSLContext | bool:
+    """
+    The `ssl` argument of aiohttp for the `verify` and `cert` arguments of requests.
+    Contexts are reused, as aiohttp pools the connections by context.
+    """
+    if cert is None and isinstance(verify, bool):
+        return verify
+    if isinstance(verify, str):
+        context = ssl.create_default_context(
+            **{"capath" if os.path.isdir(verify) else "cafile": verify}
+        )
+    else:
+        context = ssl.create_default_context()
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+    if cert is not None:
+        context.load_cert_chain(*((cert,) if isinstance(cert, str) else cert))
+    return context
+
+
+class AsyncParserRunner(ParserRunner):
+    """
+    Runs parser jobs concurrently on an event loop, see the module docstring.
+    Synchronous parsers are run in `max_workers` threads, the number of connections
+    to each host is capped by the connection pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_requests_per_host: int = 4,
+        logger: Logger = getLogger(__name__),
+        cache_responses: bool = False,
+        max_connections: int = 100,
+        profile: bool = False,
+    ):
+        super().__init__(
+            max_workers, max_requests_per_host, logger, cache_responses, profile
+        )
+        self.event_loop = EventLoopThread(max_connections, max_requests_per_host)
+        self._adapter = AioHttpAdapter(self.event_loop)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _create_session(self) -> Session:
+        session = Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def parser(self, job: ParserJob) -> Callable:
+        """Returns the coroutine version of the parser of a job if it has one, or the parser."""
+        registry = PARSER_KEY_TO_DICT[job.data_type]
+        if get_async_version(registry[job.key]) is None:
+            return super().parser(job)
+        if self.profile:
+            return registry.profiled(
+                job.key, job.data_type, self._add_profile, async_version=True
+            )
+        return get_async_version(registry[job.key])
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self.event_loop.close()
+
+    def __enter__(self) -> "AsyncParserRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run(
+        self, jobs: Iterable[ParserJob], target_datetime: datetime | None = None
+    ) -> list[JobResult]:
+        """Runs the jobs and returns their results in the order of the jobs."""
+        return self.event_loop.run(self.run_async(jobs, target_datetime))
+
+    async def run_async(
+        self, jobs: Iterable[ParserJob], target_datetime: datetime | None = None
+    ) -> list[JobResult]:
+        """
+        Runs the jobs on the running loop. Coroutine parsers all run at once, the
+        synchronous ones wait for one of the `max_workers` threads.
+        """
+        # The parsers of the run share their concurrent downloads of the same document.
+        with coalescing():
+            return list(
+                await asyncio.gather(
+                    *(self.run_job_async(job, target_datetime) for job in jobs)
+                )
+            )
+
+    async def run_job_async(
+        self, job: ParserJob, target_datetime: datetime | None = None
+    ) -> JobResult:
+        parser = self.parser(job)
+        if not inspect.iscoroutinefunction(parser):
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.run_job, job, target_datetime
+            )
+        start = time.perf_counter()
+        try:
+            args, kwargs = self.parser_arguments(
+                job, parser, self.event_loop.client_session, target_datetime
+            )
+            events = _as_list(await parser(*args, **kwargs))
+            return self._validated(job, events, time.perf_counter() - start)
+        except Exception as e:
+            return self._failed(job, time.perf_counter() - start, e)
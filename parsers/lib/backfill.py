@@ -0,0 +1,190 @@
+"""
+Backfills a date range by calling a parser once per refetch window.
+
+A parser decorated with `refetch_frequency(frequency)` returns the `frequency` of
+data preceding its target datetime, so a range is covered by calling it every
+`frequency`. Target datetimes are aligned on a grid starting at the Unix epoch,
+so that overlapping or resumed backfills plan the same calls.
+
+Calls run concurrently and their records are streamed as they complete to a
+newline-delimited JSON file. The records of overlapping responses are only
+written once. The targets already fetched are checkpointed next to the output,
+so that an interrupted backfill resumes where it stopped when run again.
+"""
+
+import json
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from parsers.lib.config import get_refetch_frequency
+from parsers.lib.parsers import PARSER_KEY_TO_DICT
+from parsers.lib.runner import ParserJob, ParserRunner
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Fields identifying a record, records sharing them are only written once.
+RECORD_KEY_FIELDS = ("zoneKey", "sortedZoneKeys", "unitKey", "datetime")
+
+
+class BackfillResult(NamedTuple):
+    targets: int
+    skipped: int
+    records: int
+    duplicates: int
+    failed: dict[datetime, str]
+
+
+def plan_target_datetimes(
+    frequency: timedelta, start: datetime, end: datetime
+) -> list[datetime]:
+    """
+    Returns the target datetimes covering [start, end) with one call per frequency:
+    the grid points within the range followed by `end`, which covers the last window.
+    """
+    if start.tzinfo is None or end.tzinfo is None:
+        raise ValueError("start and end must be timezone aware")
+    if frequency <= timedelta(0):
+        raise ValueError(f"Invalid refetch frequency {frequency}")
+    if start >= end:
+        return []
+    # The first grid point at or after start.
+    target = EPOCH + -((EPOCH - start) // frequency) * frequency
+    targets = []
+    while target < end:
+        targets.append(target)
+        target += frequency
+    return [*targets, end.astimezone(timezone.utc)]
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.name}.checkpoint")
+
+
+def read_checkpoint(path: Path) -> set[datetime]:
+    """Returns the target datetimes already fetched."""
+    if not path.exists():
+        return set()
+    with open(path) as f:
+        return {datetime.fromisoformat(line) for line in f.read().split()}
+
+
+def record_key(record: dict[str, Any]) -> tuple:
+    return tuple(record.get(field) for field in RECORD_KEY_FIELDS)
+
+
+def read_record_keys(path: Path) -> set[tuple]:
+    """Returns the keys of the records already written."""
+    if not path.exists():
+        return set()
+    with open(path) as f:
+        return {record_key(json.loads(line)) for line in f if line.strip()}
+
+
+def serialize_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Converts the datetimes of a record to UTC ISO 8601 strings."""
+    value = record.get("datetime")
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        record = {**record, "datetime": value.astimezone(timezone.utc).isoformat()}
+    return record
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def run_backfill(
+    job: ParserJob,
+    start: datetime,
+    end: datetime,
+    output_path: Path,
+    runner: ParserRunner | None = None,
+    logger: Logger = getLogger(__name__),
+) -> BackfillResult:
+    """
+    Fetches the data of a parser between start and end and appends it to output_path.
+    Targets which failed are logged and left out of the checkpoint, so they are
+    retried by the next run.
+    """
+    runner = runner or ParserRunner(logger=logger)
+    frequency = get_refetch_frequency(PARSER_KEY_TO_DICT[job.data_type][job.key])
+    targets = plan_target_datetimes(frequency, start, end)
+    checkpoint = checkpoint_path(output_path)
+    completed = read_checkpoint(checkpoint)
+    pending = [target for target in targets if target not in completed]
+    written = read_record_keys(output_path)
+    logger.info(
+        f"Backfilling {job.key} {job.data_type} from {start} to {end}: "
+        f"{len(targets)} calls every {frequency}, {len(targets) - len(pending)} done"
+    )
+
+    records = duplicates = 0
+    failed: dict[datetime, str] = {}
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        open(output_path, "a") as output,
+        open(checkpoint, "a") as checkpoint_file,
+        ThreadPoolExecutor(max_workers=runner.max_workers) as executor,
+    ):
+        for target, future in _run_bounded(
+            executor, runner, job, pending, 2 * runner.max_workers
+        ):
+            try:
+                events = future.result()
+            except Exception as e:
+                logger.exception(f"{job.key} {job.data_type} failed for {target}")
+                failed[target] = f"{type(e).__name__}: {e}"
+                continue
+            for event in map(serialize_record, events):
+                key = record_key(event)
+                if key in written:
+                    duplicates += 1
+                    continue
+                written.add(key)
+                output.write(json.dumps(event, default=_json_default) + "\n")
+                records += 1
+            # Records are flushed before the target is checkpointed, so a target is
+            # never marked as done without its records.
+            output.flush()
+            checkpoint_file.write(f"{target.isoformat()}\n")
+            checkpoint_file.flush()
+
+    return BackfillResult(
+        len(targets), len(targets) - len(pending), records, duplicates, failed
+    )
+
+
+def _run_bounded(
+    executor: ThreadPoolExecutor,
+    runner: ParserRunner,
+    job: ParserJob,
+    targets: Iterable[datetime],
+    max_pending: int,
+):
+    """
+    Yields the target datetimes and their futures as they complete, submitting at
+    most max_pending calls at once.
+    """
+    targets = iter(targets)
+    pending: dict[Future, datetime] = {}
+    while True:
+        for target in targets:
+            pending[executor.submit(runner.fetch, job, target)] = target
+            if len(pending) >= max_pending:
+                break
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
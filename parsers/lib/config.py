@@ -1,10 +1,15 @@
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import timedelta
+from functools import wraps
 from logging import getLogger
 
 from requests import Session
 from requests.adapters import HTTPAdapter, Retry
 
+# Parsers without a refetch frequency are assumed to return a day of data.
+DEFAULT_REFETCH_FREQUENCY = timedelta(days=1)
+
 
 def refetch_frequency(frequency: timedelta):
     """Specifies the refetch frequency of a parser.
@@ -16,6 +21,7 @@ def refetch_frequency(frequency: timedelta):
     assert isinstance(frequency, timedelta)
 
     def wrap(f):
+        @wraps(f)
         def wrapped_f(*args, **kwargs):
             result = f(*args, **kwargs)
             return result
@@ -26,10 +32,34 @@ def refetch_frequency(frequency: timedelta):
     return wrap
 
 
+def get_refetch_frequency(parser: Callable) -> timedelta:
+    """Returns the refetch frequency of a parser, see `refetch_frequency`."""
+    return getattr(parser, "REFETCH_FREQUENCY", DEFAULT_REFETCH_FREQUENCY)
+
+
+def async_version(coroutine: Callable):
+    """Specifies the coroutine version of a parser, taking an aiohttp session.
+    `AsyncParserRunner` runs it on its event loop rather than running the parser in a
+    worker thread, the parser itself is still used everywhere else.
+    """
+
+    def wrap(f):
+        f.ASYNC_VERSION = coroutine
+        return f
+
+    return wrap
+
+
+def get_async_version(parser: Callable) -> Callable | None:
+    """Returns the coroutine version of a parser, if it has one, see `async_version`."""
+    return getattr(parser, "ASYNC_VERSION", None)
+
+
 def retry_policy(retry_policy: Retry):
     assert isinstance(retry_policy, Retry)
 
     def wrap(f):
+        @wraps(f)
         def wrapped_f(*args, **kwargs):
             session = args[1] if len(args) > 2 else kwargs.get("session")
             logger = kwargs.get("logger", getLogger(__name__))
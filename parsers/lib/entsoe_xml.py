@@ -0,0 +1,172 @@
+"""
+Streaming decoder for ENTSOE publication documents.
+
+ENTSOE documents (GL_MarketDocument, Publication_MarketDocument, ...) are made of
+TimeSeries, each of them containing one or more Periods of Points:
+
+    <TimeSeries>
+        <inBiddingZone_Domain.mRID>10YFI-1--------U</inBiddingZone_Domain.mRID>
+        <MktPSRType>
+            <psrType>B01</psrType>
+        </MktPSRType>
+        <Period>
+            <timeInterval>
+                <start>2023-05-08T07:00Z</start>
+                <end>2023-05-10T07:00Z</end>
+            </timeInterval>
+            <resolution>PT60M</resolution>
+            <Point>
+                <position>1</position>
+                <quantity>543</quantity>
+            </Point>
+            ...
+        </Period>
+    </TimeSeries>
+
+The document is parsed incrementally with lxml and every TimeSeries is discarded
+once decoded, so memory usage doesn't grow with the size of the document.
+"""
+
+import re
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from typing import IO, NamedTuple
+
+import numpy as np
+from lxml import etree
+
+RESOLUTION_PATTERN = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?)?$")
+
+
+class EntsoeSeries(NamedTuple):
+    """
+    One Period of a TimeSeries.
+    attributes: The text of the TimeSeries leaf elements, keyed by their local name.
+    Nested elements are keyed by their dotted path, e.g. `MktPSRType.psrType`.
+    resolution: The ISO 8601 duration of the period, e.g. PT15M.
+    positions: The positions of the points, starting at 1.
+    values: The values of the points keyed by element name, e.g. `quantity` or `price.amount`.
+    """
+
+    attributes: dict[str, str]
+    start: datetime
+    end: datetime | None
+    resolution: str
+    positions: np.ndarray
+    values: dict[str, np.ndarray]
+
+    @property
+    def resolution_timedelta(self) -> timedelta:
+        return parse_resolution(self.resolution)
+
+    @property
+    def datetimes(self) -> list[datetime]:
+        """The datetimes of the points, computed from the start of the period and their position."""
+        resolution = self.resolution_timedelta
+        return [
+            self.start + resolution * (position - 1)
+            for position in self.positions.tolist()
+        ]
+
+
+def parse_resolution(resolution: str) -> timedelta:
+    """Converts an ISO 8601 duration made of days, hours and minutes to a timedelta."""
+    match = RESOLUTION_PATTERN.match(resolution)
+    if match is None or not any(match.groups()):
+        raise NotImplementedError(f"Could not recognise resolution {resolution}")
+    days, hours, minutes = (int(group or 0) for group in match.groups())
+    return timedelta(days=days, hours=hours, minutes=minutes)
+
+
+def _parse_datetime(text: str) -> datetime:
+    """Parses ENTSOE UTC datetimes, e.g. 2023-05-08T07:00Z."""
+    return datetime.fromisoformat(text.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _leaf_attributes(element: etree._Element, prefix: str = "") -> dict[str, str]:
+    """Collects the text of all the leaf elements, Periods excluded."""
+    attributes = {}
+    for child in element:
+        if not isinstance(child.tag, str):  # Skip comments.
+            continue
+        name = _local_name(child.tag)
+        if name == "Period":
+            continue
+        if len(child):
+            attributes.update(_leaf_attributes(child, f"{prefix}{name}."))
+        else:
+            attributes[f"{prefix}{name}"] = (child.text or "").strip()
+    return attributes
+
+
+def _decode_period(period: etree._Element, attributes: dict[str, str]) -> EntsoeSeries:
+    namespace = etree.QName(period).namespace
+    ns = f"{{{namespace}}}" if namespace else ""
+    start = period.findtext(f"{ns}timeInterval/{ns}start")
+    end = period.findtext(f"{ns}timeInterval/{ns}end")
+    resolution = period.findtext(f"{ns}resolution")
+    if start is None or resolution is None:
+        raise ValueError("Period is missing its start or its resolution")
+    points = period.findall(f"{ns}Point")
+    positions = [element.text for element in period.iterfind(f"{ns}Point/{ns}position")]
+    value_names = [
+        _local_name(child.tag)
+        for child in (points[0] if points else [])
+        if isinstance(child.tag, str) and _local_name(child.tag) != "position"
+    ]
+    values = {}
+    for name in value_names:
+        texts = [element.text for element in period.iterfind(f"{ns}Point/{ns}{name}")]
+        if len(texts) != len(points):
+            # Some points don't have this value, look them up one by one.
+            texts = [point.findtext(f"{ns}{name}", default="nan") for point in points]
+        values[name] = np.array(texts, dtype=float)
+    return EntsoeSeries(
+        attributes=attributes,
+        start=_parse_datetime(start.strip()),
+        end=_parse_datetime(end.strip()) if end else None,
+        resolution=resolution.strip(),
+        positions=np.array(positions, dtype=np.int64),
+        values=values,
+    )
+
+
+def iter_series(document: str | bytes | IO[bytes]) -> Iterator[EntsoeSeries]:
+    """
+    Decodes an ENTSOE document one TimeSeries at a time.
+    Yields one EntsoeSeries per Period of each TimeSeries, in document order.
+    """
+    for periods in iter_time_series(document):
+        yield from periods
+
+
+def iter_time_series(
+    document: str | bytes | IO[bytes],
+) -> Iterator[list[EntsoeSeries]]:
+    """
+    Decodes an ENTSOE document one TimeSeries at a time.
+    Yields the EntsoeSeries of the Periods of each TimeSeries, in document order.
+    """
+    if isinstance(document, str):
+        document = document.encode("utf-8")
+    if isinstance(document, bytes):
+        document = BytesIO(document)
+    for _, element in etree.iterparse(
+        document, events=("end",), tag="{*}TimeSeries", huge_tree=True
+    ):
+        attributes = _leaf_attributes(element)
+        decoded = [
+            _decode_period(child, attributes)
+            for child in element
+            if isinstance(child.tag, str) and _local_name(child.tag) == "Period"
+        ]
+        # Free the memory used by the TimeSeries and the ones before it.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+        yield decoded
@@ -1,31 +1,20 @@
 import importlib
+import time
+from collections.abc import Callable, Iterator, Mapping
+from logging import getLogger
+from typing import TYPE_CHECKING
 
 from electricitymap.contrib.config import EXCHANGES_CONFIG, ZONES_CONFIG
+from parsers.lib.config import get_async_version
 
-# Prepare all parsers
-CONSUMPTION_PARSERS = {}
-PRODUCTION_PARSERS = {}
-PRODUCTION_PER_MODE_FORECAST_PARSERS = {}
-PRODUCTION_PER_UNIT_PARSERS = {}
-EXCHANGE_PARSERS = {}
-PRICE_PARSERS = {}
-CONSUMPTION_FORECAST_PARSERS = {}
-GENERATION_FORECAST_PARSERS = {}
-EXCHANGE_FORECAST_PARSERS = {}
-PRODUCTION_CAPACITY_PARSERS = {}
-
-PARSER_KEY_TO_DICT = {
-    "consumption": CONSUMPTION_PARSERS,
-    "production": PRODUCTION_PARSERS,
-    "productionPerUnit": PRODUCTION_PER_UNIT_PARSERS,
-    "productionPerModeForecast": PRODUCTION_PER_MODE_FORECAST_PARSERS,
-    "exchange": EXCHANGE_PARSERS,
-    "price": PRICE_PARSERS,
-    "consumptionForecast": CONSUMPTION_FORECAST_PARSERS,
-    "generationForecast": GENERATION_FORECAST_PARSERS,
-    "exchangeForecast": EXCHANGE_FORECAST_PARSERS,
-    "productionCapacity": PRODUCTION_CAPACITY_PARSERS,
-}
+if TYPE_CHECKING:
+    from parsers.lib.profiling import ParserProfile
+
+logger = getLogger(__name__)
+
+# Time spent importing each parser module, in seconds, keyed by module name.
+# Dependencies shared between parser modules are accounted to the first one imported.
+IMPORT_TIMES: dict[str, float] = {}
 
 
 def _parser_key_to_parser_folder(parser_key: str):
@@ -36,19 +25,113 @@ def _parser_key_to_parser_folder(parser_key: str):
     )
 
 
+class ParserRegistry(Mapping[str, Callable]):
+    """
+    Maps zone and exchange keys to parser functions.
+    Parsers are registered as `module.function` strings and their module is only
+    imported the first time the parser is accessed, so running a single parser
+    doesn't import the dependencies of all the others.
+    """
+
+    def __init__(self, parser_folder: str):
+        self.parser_folder = parser_folder
+        self._paths: dict[str, str] = {}
+        self._functions: dict[str, Callable] = {}
+
+    def register(self, key: str, path: str) -> None:
+        self._paths[key] = path
+        self._functions.pop(key, None)
+
+    def path(self, key: str) -> str:
+        """Returns the `module.function` string of the parser, without importing it."""
+        return self._paths[key]
+
+    def __getitem__(self, key: str) -> Callable:
+        if key not in self._functions:
+            mod_name, fun_name = self._paths[key].split(".")
+            module_path = f"{self.parser_folder}.{mod_name}"
+            self._functions[key] = getattr(_import_parser_module(module_path), fun_name)
+        return self._functions[key]
+
+    def profiled(
+        self,
+        key: str,
+        data_type: str,
+        on_profile: "Callable[[ParserProfile], None] | None" = None,
+        async_version: bool = False,
+    ) -> Callable:
+        """
+        Returns the parser, or its coroutine version if `async_version` is set, profiling
+        each of its calls, see `parsers.lib.profiling`. The profiles are logged unless
+        `on_profile` is given.
+        """
+        # Imported here so that the registry doesn't load the profiling hooks unless used.
+        from parsers.lib.profiling import log_profile, profiled
+
+        parser = get_async_version(self[key]) if async_version else self[key]
+        return profiled(parser, key, data_type, on_profile or log_profile)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._paths
+
+
+def _import_parser_module(module_path: str):
+    if module_path not in IMPORT_TIMES:
+        start = time.perf_counter()
+        module = importlib.import_module(module_path)
+        IMPORT_TIMES[module_path] = time.perf_counter() - start
+        logger.debug(f"Imported {module_path} in {IMPORT_TIMES[module_path]:.3f}s")
+        return module
+    return importlib.import_module(module_path)
+
+
+def import_time_report() -> list[tuple[str, float]]:
+    """Returns the parser modules imported so far, slowest first."""
+    return sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True)
+
+
+# Prepare all parsers
+PARSER_KEY_TO_DICT: dict[str, ParserRegistry] = {
+    parser_key: ParserRegistry(_parser_key_to_parser_folder(parser_key))
+    for parser_key in [
+        "consumption",
+        "production",
+        "productionPerUnit",
+        "productionPerModeForecast",
+        "exchange",
+        "price",
+        "consumptionForecast",
+        "generationForecast",
+        "exchangeForecast",
+        "productionCapacity",
+    ]
+}
+
+CONSUMPTION_PARSERS = PARSER_KEY_TO_DICT["consumption"]
+PRODUCTION_PARSERS = PARSER_KEY_TO_DICT["production"]
+PRODUCTION_PER_MODE_FORECAST_PARSERS = PARSER_KEY_TO_DICT["productionPerModeForecast"]
+PRODUCTION_PER_UNIT_PARSERS = PARSER_KEY_TO_DICT["productionPerUnit"]
+EXCHANGE_PARSERS = PARSER_KEY_TO_DICT["exchange"]
+PRICE_PARSERS = PARSER_KEY_TO_DICT["price"]
+CONSUMPTION_FORECAST_PARSERS = PARSER_KEY_TO_DICT["consumptionForecast"]
+GENERATION_FORECAST_PARSERS = PARSER_KEY_TO_DICT["generationForecast"]
+EXCHANGE_FORECAST_PARSERS = PARSER_KEY_TO_DICT["exchangeForecast"]
+PRODUCTION_CAPACITY_PARSERS = PARSER_KEY_TO_DICT["productionCapacity"]
+
+
 # Read all zones
 for zone_id, zone_config in ZONES_CONFIG.items():
     for parser_key, v in zone_config.get("parsers", {}).items():
-        mod_name, fun_name = v.split(".")
-        mod = importlib.import_module(
-            f"{_parser_key_to_parser_folder(parser_key)}.%s" % mod_name
-        )
-        PARSER_KEY_TO_DICT[parser_key][zone_id] = getattr(mod, fun_name)
+        PARSER_KEY_TO_DICT[parser_key].register(zone_id, v)
 
 
 # Read all exchanges
 for exchange_id, exchange_config in EXCHANGES_CONFIG.items():
     for parser_key, v in exchange_config.get("parsers", {}).items():
-        mod_name, fun_name = v.split(".")
-        mod = importlib.import_module("parsers.%s" % mod_name)
-        PARSER_KEY_TO_DICT[parser_key][exchange_id] = getattr(mod, fun_name)
+        PARSER_KEY_TO_DICT[parser_key].register(exchange_id, v)
@@ -0,0 +1,333 @@
+"""
+Opt-in instrumentation of parser calls.
+
+A profiled parser call records its wall time split into phases:
+- network: time with at least one HTTP request in flight,
+- events: time spent in the event models (mixes, events and event lists), which
+  includes the pydantic validation and the merges,
+- parse: the rest of the time, spent by the parser itself,
+along with the number of requests, the bytes downloaded and the points returned.
+
+The hooks timing the requests and the event models are only installed while a
+parser is being profiled, the original methods are restored once no parser is.
+Requests sent from threads started by the parser are accounted to it as long as
+it is the only parser being profiled.
+"""
+
+import inspect
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from logging import Logger, getLogger
+from threading import Lock, local
+from typing import Any
+
+import requests
+
+_current_profile: ContextVar["ParserProfile | None"] = ContextVar(
+    "current_profile", default=None
+)
+_active_profiles: set["ParserProfile"] = set()
+_hooks_lock = Lock()
+_hooks_users = 0
+# The attributes replaced by the hooks, with their own value before, None if inherited.
+_patched_attributes: list[tuple[type, str, Any]] = []
+
+
+class ParserProfile:
+    """The timings and counters of a parser call, see the module docstring."""
+
+    def __init__(self, key: str, data_type: str):
+        self.key = key
+        self.data_type = data_type
+        self.wall_time = 0.0
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.points = 0
+        self.error: str | None = None
+        self._phase_times: Counter[str] = Counter()
+        self._lock = Lock()
+        self._in_flight = 0
+        self._network_start = 0.0
+
+    def _request_started(self) -> None:
+        with self._lock:
+            self.requests += 1
+            if self._in_flight == 0:
+                self._network_start = time.perf_counter()
+            self._in_flight += 1
+
+    def _request_finished(self, bytes_downloaded: int) -> None:
+        with self._lock:
+            self.bytes_downloaded += bytes_downloaded
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._phase_times["network"] += (
+                    time.perf_counter() - self._network_start
+                )
+
+    def _add_events_time(self, duration: float) -> None:
+        with self._lock:
+            self._phase_times["events"] += duration
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """The wall time of each phase in seconds, they add up to the wall time."""
+        network, events = self._phase_times["network"], self._phase_times["events"]
+        return {
+            "network": network,
+            "parse": max(self.wall_time - network - events, 0.0),
+            "events": events,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "data_type": self.data_type,
+            "wall_time": self.wall_time,
+            "phases": self.phases,
+            "requests": self.requests,
+            "bytes_downloaded": self.bytes_downloaded,
+            "points": self.points,
+            "error": self.error,
+        }
+
+    def format(self) -> str:
+        """A human readable breakdown of the phases."""
+        lines = [f"{self.key} {self.data_type} took {self.wall_time:.2f}s"]
+        for phase, duration in self.phases.items():
+            share = duration / self.wall_time if self.wall_time else 0
+            lines.append(f"  {phase:<8} {duration:7.3f}s {share:6.1%}")
+        lines.append(
+            f"  {self.requests} requests, {self.bytes_downloaded / 1024:.1f}KiB "
+            f"downloaded, {self.points} points"
+        )
+        return "\n".join(lines)
+
+
+def _profile() -> "ParserProfile | None":
+    profile = _current_profile.get()
+    if profile is None and len(_active_profiles) == 1:
+        # Most likely a thread started by the only parser being profiled.
+        for profile in _active_profiles:
+            return profile
+    return profile
+
+
+def _timed_send(send: Callable) -> Callable:
+    @wraps(send)
+    def wrapped_send(self, request, **kwargs):
+        profile = _profile()
+        if profile is None:
+            return send(self, request, **kwargs)
+        profile._request_started()
+        bytes_downloaded = 0
+        try:
+            response = send(self, request, **kwargs)
+            bytes_downloaded = (
+                int(response.headers.get("Content-Length") or 0)
+                if kwargs.get("stream")
+                else len(response.content or b"")
+            )
+            return response
+        finally:
+            profile._request_finished(bytes_downloaded)
+
+    return wrapped_send
+
+
+# Calls of the event models made by other event models aren't timed twice.
+_events_depth = local()
+
+
+def _timed_events(function: Callable) -> Callable:
+    @wraps(function)
+    def wrapped_function(*args, **kwargs):
+        profile = _profile()
+        depth = getattr(_events_depth, "value", 0)
+        if profile is None or depth:
+            return function(*args, **kwargs)
+        _events_depth.value = 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _events_depth.value = 0
+            profile._add_events_time(time.perf_counter() - start)
+
+    return wrapped_function
+
+
+def _patch(cls: type, name: str, value: Any) -> None:
+    _patched_attributes.append((cls, name, cls.__dict__.get(name)))
+    setattr(cls, name, value)
+
+
+def _instrument_methods(cls: type, names: Iterable[str]) -> None:
+    for name in names:
+        attribute = cls.__dict__.get(name, getattr(cls, name, None))
+        if getattr(attribute, "__isabstractmethod__", False):
+            continue
+        if isinstance(attribute, staticmethod):
+            _patch(cls, name, staticmethod(_timed_events(attribute.__func__)))
+        elif isinstance(attribute, classmethod):
+            _patch(cls, name, classmethod(_timed_events(attribute.__func__)))
+        elif callable(attribute):
+            _patch(cls, name, _timed_events(attribute))
+
+
+def _install_hooks() -> None:
+    from electricitymap.contrib.lib.models import event_lists, events
+
+    _patch(requests.Session, "send", _timed_send(requests.Session.send))
+    for cls in vars(events).values():
+        if not isinstance(cls, type) or cls.__module__ != events.__name__:
+            continue
+        if issubclass(cls, events.Mix) and cls is not events.Mix:
+            _instrument_methods(cls, ["__init__"])
+        elif issubclass(cls, events.Event):
+            _instrument_methods(
+                cls,
+                [name for name in ("create", "create_batch") if name in vars(cls)],
+            )
+    for cls in vars(event_lists).values():
+        if isinstance(cls, type) and issubclass(cls, event_lists.EventList):
+            _instrument_methods(
+                cls,
+                [
+                    name
+                    for name, attribute in vars(cls).items()
+                    if not name.startswith("_") and not isinstance(attribute, property)
+                ],
+            )
+
+
+def _remove_hooks() -> None:
+    while _patched_attributes:
+        cls, name, original = _patched_attributes.pop()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+@contextmanager
+def _hooks() -> Iterator[None]:
+    """Installs the hooks for the duration of the context, shared by nested contexts."""
+    global _hooks_users
+    with _hooks_lock:
+        if _hooks_users == 0:
+            _install_hooks()
+        _hooks_users += 1
+    try:
+        yield
+    finally:
+        with _hooks_lock:
+            _hooks_users -= 1
+            if _hooks_users == 0:
+                _remove_hooks()
+
+
+def log_profile(profile: ParserProfile, logger: Logger = getLogger(__name__)) -> None:
+    """Logs the profile as a structured record, in the `profile` extra field."""
+    logger.info(
+        f"{profile.key} {profile.data_type} parser took {profile.wall_time:.2f}s",
+        extra={"key": profile.key, "profile": profile.to_dict()},
+    )
+
+
+@contextmanager
+def profile_parser(
+    key: str,
+    data_type: str,
+    on_profile: Callable[[ParserProfile], None] | None = None,
+) -> Iterator[ParserProfile]:
+    """
+    Profiles the parser calls made in the context. The profile is complete on exit,
+    when it is passed to `on_profile`.
+    """
+    profile = ParserProfile(key, data_type)
+    try:
+        with _hooks():
+            token = _current_profile.set(profile)
+            _active_profiles.add(profile)
+            start = time.perf_counter()
+            try:
+                yield profile
+            except Exception as e:
+                profile.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                profile.wall_time = time.perf_counter() - start
+                _active_profiles.discard(profile)
+                _current_profile.reset(token)
+    finally:
+        if on_profile is not None:
+            on_profile(profile)
+
+
+def _count_points(result: Any) -> int:
+    return 1 if isinstance(result, dict) else len(result or [])
+
+
+def profiled(
+    parser: Callable,
+    key: str,
+    data_type: str,
+    on_profile: Callable[[ParserProfile], None] = log_profile,
+) -> Callable:
+    """Wraps a parser to profile each of its calls, the profiles are passed to `on_profile`."""
+    if inspect.iscoroutinefunction(parser):
+
+        @wraps(parser)
+        async def async_profiled_parser(*args, **kwargs):
+            with profile_parser(key, data_type, on_profile) as profile:
+                result = await parser(*args, **kwargs)
+                profile.points = _count_points(result)
+            return result
+
+        return async_profiled_parser
+
+    @wraps(parser)
+    def profiled_parser(*args, **kwargs):
+        with profile_parser(key, data_type, on_profile) as profile:
+            result = parser(*args, **kwargs)
+            profile.points = _count_points(result)
+        return result
+
+    return profiled_parser
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def format_prometheus(profiles: Iterable[ParserProfile]) -> str:
+    """Formats the profiles as Prometheus counters, in the text exposition format."""
+    metrics: dict[str, tuple[str, list[str]]] = {
+        "parser_phase_seconds_total": ("Wall time of the parsers per phase.", []),
+        "parser_requests_total": ("HTTP requests sent by the parsers.", []),
+        "parser_downloaded_bytes_total": ("Bytes downloaded by the parsers.", []),
+        "parser_points_total": ("Points returned by the parsers.", []),
+        "parser_failures_total": ("Failed parser calls.", []),
+    }
+    totals: Counter[tuple[str, str]] = Counter()
+    for profile in profiles:
+        labels = f'zone_key="{_escape(profile.key)}",data_type="{_escape(profile.data_type)}"'
+        for phase, duration in profile.phases.items():
+            totals[
+                ("parser_phase_seconds_total", f'{labels},phase="{phase}"')
+            ] += duration
+        totals[("parser_requests_total", labels)] += profile.requests
+        totals[("parser_downloaded_bytes_total", labels)] += profile.bytes_downloaded
+        totals[("parser_points_total", labels)] += profile.points
+        totals[("parser_failures_total", labels)] += profile.error is not None
+    for (name, labels), value in totals.items():
+        metrics[name][1].append(f"{name}{{{labels}}} {value:g}")
+    lines = []
+    for name, (description, samples) in metrics.items():
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} counter", *samples]
+    return "\n".join(lines) + "\n"
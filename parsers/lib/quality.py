@@ -2,15 +2,54 @@
 This library contains validation functions applied to all parsers by the feeder.
 This is a higher level validation than validation.py
 """
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
-from typing import Any
+from itertools import chain
+from typing import Any, NamedTuple
 from warnings import warn
 
 import arrow
+import numpy as np
+import pandas as pd
 
-from electricitymap.contrib.config import EXCHANGES_CONFIG, emission_factors
+from electricitymap.contrib.config import EMISSION_FACTORS, EXCHANGES_CONFIG
 from electricitymap.contrib.lib.types import ZoneKey
 
+STANDARD_KEYS = ["datetime", "source"]
+REQUIRED_KEYS = {
+    "production": ["zoneKey", "production"] + STANDARD_KEYS,
+    "consumption": ["zoneKey", "consumption"] + STANDARD_KEYS,
+    "exchange": ["sortedZoneKeys", "netFlow"] + STANDARD_KEYS,
+    "price": ["zoneKey", "currency", "price"] + STANDARD_KEYS,
+    "consumptionForecast": ["zoneKey", "value"] + STANDARD_KEYS,
+    "productionPerModeForecast": ["zoneKey", "production"] + STANDARD_KEYS,
+    "generationForecast": ["zoneKey", "value"] + STANDARD_KEYS,
+    "exchangeForecast": ["zoneKey", "netFlow"] + STANDARD_KEYS,
+}
+# Zones which may have no coal, gas, oil or unknown production.
+ZONES_WITHOUT_REQUIRED_MODES = [
+    "CH",
+    "NO",
+    "AU-TAS",
+    "DK-BHM",
+    "US-CAR-YAD",
+    "US-NW-SCL",
+    "US-NW-CHPD",
+    "US-NW-WWA",
+    "US-NW-GCPD",
+    "US-NW-TPWR",
+    "US-NW-WAUW",
+    "US-SE-SEPA",
+    "US-NW-GWA",
+    "US-NW-DOPD",
+    "LU",
+]
+REQUIRED_MODES = ["unknown", "coal", "oil", "gas"]
+MAX_PRODUCTION = 500000  # 500GW
+MAX_NET_FLOW = 100000  # 100GW
+INTERCONNECTOR_CAPACITY_MARGIN = 0.1
+NUMBER_TYPES = (int, float, np.number)
+
 
 class ValidationError(ValueError):
     pass
@@ -20,23 +59,12 @@ def validate_datapoint_format(datapoint: dict[str, Any], kind: str, zone_key: Zo
     """
     Checks that a datapoint has the required keys. A parser can only be merged if the datapoints for each function have the correct format.
     """
-    standard_keys = ["datetime", "source"]
-    keys_dict = {
-        "production": ["zoneKey", "production"] + standard_keys,
-        "consumption": ["zoneKey", "consumption"] + standard_keys,
-        "exchange": ["sortedZoneKeys", "netFlow"] + standard_keys,
-        "price": ["zoneKey", "currency", "price"] + standard_keys,
-        "consumptionForecast": ["zoneKey", "value"] + standard_keys,
-        "productionPerModeForecast": ["zoneKey", "production"] + standard_keys,
-        "generationForecast": ["zoneKey", "value"] + standard_keys,
-        "exchangeForecast": ["zoneKey", "netFlow"] + standard_keys,
-    }
-    for key in keys_dict[kind]:
+    for key in REQUIRED_KEYS[kind]:
         if key not in datapoint.keys():
             raise ValidationError(
                 "{} - data point does not have the required keys:  {} is missing".format(
                     zone_key,
-                    [key for key in keys_dict[kind] if key not in datapoint.keys()],
+                    [key for key in REQUIRED_KEYS[kind] if key not in datapoint.keys()],
                 ),
             )
 
@@ -62,7 +90,7 @@ def validate_consumption(obj: dict, zone_key: ZoneKey) -> None:
             f"{zone_key}: consumption has negative value {obj['consumption']}"
         )
     # Plausibility Check, no more than 500GW
-    if abs(obj.get("consumption") or 0) > 500000:
+    if abs(obj.get("consumption") or 0) > MAX_PRODUCTION:
         raise ValidationError(
             f"{zone_key}: consumption is not realistic (>500GW) {obj['consumption']}"
         )
@@ -87,7 +115,7 @@ def validate_exchange(item, k) -> None:
     # Use https://github.com/electricitymaps/electricitymaps-contrib/blob/master/parsers/example.py for expected format
     if item.get("sortedZoneKeys", None) and item.get("netFlow", None):
         zone_names: list[str] = item["sortedZoneKeys"]
-        if abs(item.get("netFlow", 0)) > 100000:
+        if abs(item.get("netFlow", 0)) > MAX_NET_FLOW:
             raise ValidationError(
                 f"netFlow {item['netFlow']} exceeds physical plausibility (>100GW) for {k}"
             )
@@ -96,7 +124,7 @@ def validate_exchange(item, k) -> None:
                 "capacity" in EXCHANGES_CONFIG[zone_names]
             ):
                 interconnector_capacities = EXCHANGES_CONFIG[zone_names]["capacity"]
-                margin = 0.1
+                margin = INTERCONNECTOR_CAPACITY_MARGIN
                 if not (
                     min(interconnector_capacities) * (1 - margin)
                     <= item["netFlow"]
@@ -132,24 +160,7 @@ def validate_production(obj: dict[str, Any], zone_key: ZoneKey) -> None:
         and obj.get("production", {}).get("coal", None) is None
         and obj.get("production", {}).get("oil", None) is None
         and obj.get("production", {}).get("gas", None) is None
-        and zone_key
-        not in [
-            "CH",
-            "NO",
-            "AU-TAS",
-            "DK-BHM",
-            "US-CAR-YAD",
-            "US-NW-SCL",
-            "US-NW-CHPD",
-            "US-NW-WWA",
-            "US-NW-GCPD",
-            "US-NW-TPWR",
-            "US-NW-WAUW",
-            "US-SE-SEPA",
-            "US-NW-GWA",
-            "US-NW-DOPD",
-            "LU",
-        ]
+        and zone_key not in ZONES_WITHOUT_REQUIRED_MODES
     ):
         raise ValidationError(
             "Coal, gas or oil or unknown production value is required for"
@@ -177,15 +188,357 @@ def validate_production(obj: dict[str, Any], zone_key: ZoneKey) -> None:
         if value < 0:
             raise ValidationError(f"{zone_key}: key {key} has negative value {value}")
         # Plausibility Check, no more than 500GW
-        if value > 500000:
+        if value > MAX_PRODUCTION:
             raise ValidationError(
                 f"{zone_key}: production for {key} is not realistic (>500GW) {value}"
             )
 
+    zone_emission_factors = EMISSION_FACTORS.latest(zone_key)
     for key in obj.get("production", {}).keys():
-        if key not in emission_factors(zone_key).keys():
+        if key not in zone_emission_factors:
             raise ValidationError(
                 f"Couldn't find emission factor for '{key}' in '{zone_key}'. Maybe you misspelled one of the production keys?"
             )
 
     validate_reasonable_time(obj, zone_key)
+
+
+class BatchValidationResult(NamedTuple):
+    """
+    The result of validating the events of a parser output at once: which events
+    are invalid and the error the scalar validator would raise for each of them.
+    """
+
+    invalid: np.ndarray
+    errors: list[str | None]
+
+    @property
+    def messages(self) -> dict[int, str]:
+        """The error messages of the invalid events, keyed by row."""
+        return {i: error for i, error in enumerate(self.errors) if error is not None}
+
+
+class _EventColumns:
+    """
+    Column access to events, either a list of dicts or a DataFrame with one column
+    per key present in all of its events.
+    """
+
+    def __init__(self, events: Iterable[dict[str, Any]] | pd.DataFrame):
+        if isinstance(events, pd.DataFrame):
+            self._frame: pd.DataFrame | None = events
+            self._events: list[dict[str, Any]] = []
+            self.size = len(events)
+        else:
+            self._frame = None
+            self._events = list(events)
+            self.size = len(self._events)
+
+    def has(self, key: str) -> np.ndarray:
+        if self._frame is not None:
+            return np.full(self.size, key in self._frame.columns)
+        return np.fromiter(
+            (key in event for event in self._events), dtype=bool, count=self.size
+        )
+
+    def get(self, key: str) -> list:
+        if self._frame is not None:
+            if key not in self._frame.columns:
+                return [None] * self.size
+            return self._frame[key].tolist()
+        return [event.get(key) for event in self._events]
+
+    def row(self, i: int) -> dict[str, Any]:
+        if self._frame is not None:
+            return self._frame.iloc[i].to_dict()
+        return self._events[i]
+
+
+class _BatchErrors:
+    """Records the first failed check of each row, in the order of the checks."""
+
+    def __init__(self, size: int):
+        self.invalid = np.zeros(size, dtype=bool)
+        self.errors: list[str | None] = [None] * size
+
+    def check(self, failed: np.ndarray, message: Callable[[int], str]) -> None:
+        """Marks the rows failing a check, formatting a message for each of them."""
+        failed = failed & ~self.invalid
+        for i in np.flatnonzero(failed):
+            self.errors[i] = message(i)
+        self.invalid |= failed
+
+    def result(self) -> BatchValidationResult:
+        return BatchValidationResult(self.invalid, self.errors)
+
+
+def _floats(values: Iterable[Any], size: int) -> np.ndarray:
+    """Converts values to a float array, None and non numbers being NaN."""
+    return np.fromiter(
+        (value if isinstance(value, NUMBER_TYPES) else np.nan for value in values),
+        dtype=float,
+        count=size,
+    )
+
+
+def _production_values(productions: list[dict[str, Any]], modes: list[str]):
+    """Returns the production values as a 2-D float array, one column per mode."""
+    frame = pd.DataFrame.from_records(productions, columns=modes)
+    for mode in frame.columns[frame.dtypes == object]:
+        frame[mode] = _floats(frame[mode], len(frame))
+    return frame.to_numpy(dtype=float).reshape(len(productions), len(modes))
+
+
+def _check_format(
+    errors: _BatchErrors, columns: _EventColumns, kind: str, zone_key: ZoneKey
+) -> None:
+    has_keys = {key: columns.has(key) for key in REQUIRED_KEYS[kind]}
+    missing = np.logical_or.reduce([~has for has in has_keys.values()])
+
+    def message(i: int) -> str:
+        missing_keys = [key for key, has in has_keys.items() if not has[i]]
+        return f"{zone_key} - data point does not have the required keys:  {missing_keys} is missing"
+
+    errors.check(missing, message)
+
+
+def _check_reasonable_time(errors: _BatchErrors, datetimes: list[Any], k: str) -> None:
+    """Checks the datetimes of the rows which are not invalid yet."""
+    rows = np.flatnonzero(~errors.invalid)
+    if not len(rows):
+        return
+    # Arrow keeps the timezone of datetimes and assumes UTC for naive ones, other
+    # values are parsed one by one as validate_reasonable_time does.
+    data_times = {
+        i: datetimes[i]
+        if isinstance(datetimes[i], datetime)
+        else arrow.get(datetimes[i]).datetime
+        for i in rows
+    }
+    years = np.array([data_times[i].year for i in rows])
+    before_2000 = np.zeros(errors.invalid.size, dtype=bool)
+    before_2000[rows[years < 2000]] = True
+    errors.check(
+        before_2000,
+        lambda i: f"Data from {k} can't be before year 2000, it was from: {arrow.get(data_times[i])}",
+    )
+    rows = rows[years >= 2000]
+    arrow_now = arrow.utcnow()
+    timestamps = np.fromiter(
+        (
+            (
+                data_times[i]
+                if data_times[i].tzinfo
+                else data_times[i].replace(tzinfo=timezone.utc)
+            ).timestamp()
+            for i in rows
+        ),
+        dtype=float,
+        count=len(rows),
+    )
+    future = np.zeros(errors.invalid.size, dtype=bool)
+    future[rows] = timestamps > arrow_now.datetime.timestamp()
+    errors.check(
+        future,
+        lambda i: f"Data from {k} can't be in the future, data was {arrow.get(data_times[i])}, now is {arrow_now}",
+    )
+
+
+def validate_consumption_batch(
+    events: Iterable[dict[str, Any]] | pd.DataFrame, zone_key: ZoneKey
+) -> BatchValidationResult:
+    """Validates consumption events at once, see validate_consumption."""
+    columns = _EventColumns(events)
+    errors = _BatchErrors(columns.size)
+    _check_format(errors, columns, "consumption", zone_key)
+    consumptions = columns.get("consumption")
+    # `consumption or 0` in the scalar validator.
+    values = np.nan_to_num(_floats(consumptions, columns.size), nan=0.0)
+    errors.check(
+        values < 0,
+        lambda i: f"{zone_key}: consumption has negative value {consumptions[i]}",
+    )
+    errors.check(
+        np.abs(values) > MAX_PRODUCTION,
+        lambda i: f"{zone_key}: consumption is not realistic (>500GW) {consumptions[i]}",
+    )
+    _check_reasonable_time(errors, columns.get("datetime"), zone_key)
+    return errors.result()
+
+
+def validate_exchange_batch(
+    events: Iterable[dict[str, Any]] | pd.DataFrame, k: str
+) -> BatchValidationResult:
+    """Validates exchange events at once, see validate_exchange."""
+    columns = _EventColumns(events)
+    errors = _BatchErrors(columns.size)
+    _check_format(errors, columns, "exchange", k)
+    sorted_zone_keys = columns.get("sortedZoneKeys")
+    errors.check(
+        np.array([keys != k for keys in sorted_zone_keys], dtype=bool),
+        lambda i: f"Sorted country codes {sorted_zone_keys[i]} and {k} don't match",
+    )
+    datetimes = columns.get("datetime")
+    errors.check(
+        np.array([type(dt) != datetime for dt in datetimes], dtype=bool),
+        lambda i: f"datetime {datetimes[i]} is not valid for {k}",
+    )
+    _check_reasonable_time(errors, datetimes, k)
+
+    net_flows = columns.get("netFlow")
+    values = _floats(net_flows, columns.size)
+    checked = np.array(
+        [bool(keys) and bool(flow) for keys, flow in zip(sorted_zone_keys, net_flows)],
+        dtype=bool,
+    )
+    errors.check(
+        checked & (np.abs(values) > MAX_NET_FLOW),
+        lambda i: f"netFlow {net_flows[i]} exceeds physical plausibility (>100GW) for {k}",
+    )
+    # The interconnector capacity only applies to keys of two characters, as in
+    # validate_exchange. The bounds are looked up once per key.
+    bounds = {}
+    for keys in set(sorted_zone_keys):
+        if (
+            isinstance(keys, str)
+            and len(keys) == 2
+            and keys in EXCHANGES_CONFIG
+            and "capacity" in EXCHANGES_CONFIG[keys]
+        ):
+            capacities = EXCHANGES_CONFIG[keys]["capacity"]
+            bounds[keys] = (
+                min(capacities) * (1 - INTERCONNECTOR_CAPACITY_MARGIN),
+                max(capacities) * (1 + INTERCONNECTOR_CAPACITY_MARGIN),
+            )
+    if bounds:
+        lower, upper = (
+            np.array(
+                [bounds.get(keys, (-np.inf, np.inf))[j] for keys in sorted_zone_keys]
+            )
+            for j in (0, 1)
+        )
+        errors.check(
+            checked & ~((lower <= values) & (values <= upper)),
+            lambda i: f"netFlow {net_flows[i]} exceeds interconnector capacity for {k}",
+        )
+    return errors.result()
+
+
+def validate_production_batch(
+    events: Iterable[dict[str, Any]] | pd.DataFrame, zone_key: ZoneKey
+) -> BatchValidationResult:
+    """Validates production events at once, see validate_production."""
+    columns = _EventColumns(events)
+    size = columns.size
+    errors = _BatchErrors(size)
+    _check_format(errors, columns, "production", zone_key)
+    if columns.has("countryCode").any():
+        warn(
+            "object has field `countryCode`. It should have "
+            f"`zoneKey` instead. In {columns.row(int(columns.has('countryCode').argmax()))}"
+        )
+    datetimes = columns.get("datetime")
+    errors.check(
+        np.array([not isinstance(dt, datetime) for dt in datetimes], dtype=bool),
+        lambda i: f"datetime {datetimes[i]} is not valid for {zone_key}",
+    )
+    event_zone_keys = [
+        zone or country
+        for zone, country in zip(columns.get("zoneKey"), columns.get("countryCode"))
+    ]
+    errors.check(
+        np.array([zone != zone_key for zone in event_zone_keys], dtype=bool),
+        lambda i: f"Zone keys {columns.row(i).get('zoneKey', None)} and {zone_key} don't match in {columns.row(i)}",
+    )
+
+    productions = [production or {} for production in columns.get("production")]
+    # One column per production mode, in the order they first appear.
+    modes = list(dict.fromkeys(chain.from_iterable(productions)))
+    values = _production_values(productions, modes)
+    no_value = np.ones(size, dtype=bool)
+    for mode in REQUIRED_MODES:
+        if mode in modes:
+            no_value &= np.array([p.get(mode) is None for p in productions], dtype=bool)
+    errors.check(
+        no_value & (zone_key not in ZONES_WITHOUT_REQUIRED_MODES),
+        lambda _: f"Coal, gas or oil or unknown production value is required for {zone_key}",
+    )
+    if zone_key in ["US-CAR-YAD"]:
+        hydro = _floats((p.get("hydro", 0) for p in productions), size)
+        errors.check(
+            hydro < 5,
+            lambda _: f"Hydro production value is required to be greater than 5 for {zone_key}",
+        )
+
+    storages = columns.get("storage")
+    errors.check(
+        np.array([bool(s) and not isinstance(s, dict) for s in storages], dtype=bool),
+        lambda i: f"storage value must be a dict, was {storages[i]}",
+    )
+    errors.check(
+        np.array(
+            [
+                isinstance(s, dict) and bool(set(s) - {"battery", "hydro"})
+                for s in storages
+            ],
+            dtype=bool,
+        ),
+        lambda i: f"unexpected keys in storage: {set(storages[i]) - {'battery', 'hydro'}}",
+    )
+
+    def production_error(i: int) -> str:
+        for key, value in productions[i].items():
+            if value is None:
+                continue
+            if value < 0:
+                return f"{zone_key}: key {key} has negative value {value}"
+            if value > MAX_PRODUCTION:
+                return f"{zone_key}: production for {key} is not realistic (>500GW) {value}"
+        raise AssertionError("No invalid production value")
+
+    with np.errstate(invalid="ignore"):
+        implausible = ((values < 0) | (values > MAX_PRODUCTION)).any(axis=1)
+    errors.check(implausible, production_error)
+
+    zone_emission_factors = EMISSION_FACTORS.latest(zone_key)
+    unknown_modes = [mode for mode in modes if mode not in zone_emission_factors]
+    without_emission_factor = np.zeros(size, dtype=bool)
+    for mode in unknown_modes:
+        without_emission_factor |= np.fromiter(
+            (mode in p for p in productions), dtype=bool, count=size
+        )
+
+    def emission_factor_error(i: int) -> str:
+        key = next(key for key in productions[i] if key not in zone_emission_factors)
+        return f"Couldn't find emission factor for '{key}' in '{zone_key}'. Maybe you misspelled one of the production keys?"
+
+    errors.check(without_emission_factor, emission_factor_error)
+    _check_reasonable_time(errors, datetimes, zone_key)
+    return errors.result()
+
+
+BATCH_VALIDATORS: dict[
+    str,
+    Callable[[Iterable[dict[str, Any]] | pd.DataFrame, str], BatchValidationResult],
+] = {
+    "production": validate_production_batch,
+    "consumption": validate_consumption_batch,
+    "exchange": validate_exchange_batch,
+}
+
+
+def validate_batch(
+    events: Iterable[dict[str, Any]] | pd.DataFrame, kind: str, zone_key: ZoneKey
+) -> BatchValidationResult:
+    """
+    Validates the events of a parser output at once. Production, consumption and
+    exchange events get the feeder validation, other kinds are only checked for
+    their required keys, if they have any.
+    """
+    if kind in BATCH_VALIDATORS:
+        return BATCH_VALIDATORS[kind](events, zone_key)
+    columns = _EventColumns(events)
+    errors = _BatchErrors(columns.size)
+    if kind in REQUIRED_KEYS:
+        _check_format(errors, columns, kind, zone_key)
+    return errors.result()
@@ -0,0 +1,261 @@
+"""
+Runs many parsers at once with bounded concurrency.
+
+Parsers are I/O bound, so they are run in a thread pool. Requests are sent
+through one shared session per parser module, and the number of requests in
+flight to a single host is capped so that running a whole group of zones doesn't
+hammer the data source they share.
+"""
+
+import inspect
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from logging import Logger, getLogger
+from threading import BoundedSemaphore, Lock
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from parsers.lib.parsers import PARSER_KEY_TO_DICT
+from parsers.lib.profiling import ParserProfile
+from parsers.lib.quality import validate_batch
+from parsers.lib.session import get_cache_metrics, mount_response_cache
+from parsers.lib.single_flight import coalescing
+
+EXCHANGE_DATA_TYPES = ["exchange", "exchangeForecast"]
+
+
+class ParserJob(NamedTuple):
+    key: str
+    data_type: str
+
+    @property
+    def source(self) -> str:
+        """The parser module, e.g. ENTSOE for ENTSOE.fetch_production."""
+        return PARSER_KEY_TO_DICT[self.data_type].path(self.key).split(".")[0]
+
+
+class JobResult(NamedTuple):
+    job: ParserJob
+    latency: float
+    points: int
+    invalid_points: int
+    error: str | None = None
+
+
+def select_jobs(
+    keys: Iterable[str] = (),
+    sources: Iterable[str] = (),
+    data_types: Iterable[str] = (),
+) -> list[ParserJob]:
+    """
+    Returns the jobs for the given zone or exchange keys and for all the keys whose
+    parser belongs to one of the given sources (e.g. ENTSOE), restricted to the
+    given data types.
+    If no data type is given, production is used for zones and exchange for exchanges.
+    """
+    keys, sources, data_types = set(keys), set(sources), list(data_types)
+    jobs = []
+    for data_type in data_types or ["production", "exchange"]:
+        registry = PARSER_KEY_TO_DICT[data_type]
+        for key in registry:
+            if key in keys or registry.path(key).split(".")[0] in sources:
+                jobs.append(ParserJob(key, data_type))
+    unknown_keys = keys - {job.key for job in jobs}
+    if unknown_keys:
+        raise ValueError(
+            f"No {', '.join(data_types) or 'production or exchange'} parser for "
+            f"{', '.join(sorted(unknown_keys))}"
+        )
+    return sorted(jobs)
+
+
+class HostLimitedSession(Session):
+    """A session capping the number of concurrent requests to each host."""
+
+    def __init__(self, host_semaphore: Callable[[str], BoundedSemaphore]):
+        super().__init__()
+        self.host_semaphore = host_semaphore
+
+    def request(self, method, url, *args, **kwargs):
+        with self.host_semaphore(urlsplit(url).netloc):
+            return super().request(method, url, *args, **kwargs)
+
+
+class ParserRunner:
+    """Runs parser jobs in a thread pool, sharing one session per parser module."""
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_requests_per_host: int = 4,
+        logger: Logger = getLogger(__name__),
+        cache_responses: bool = False,
+        profile: bool = False,
+    ):
+        self.max_workers = max_workers
+        self.max_requests_per_host = max_requests_per_host
+        self.cache_responses = cache_responses
+        self.profile = profile
+        self.logger = logger
+        # The profiles of the parser calls, when profiling.
+        self.profiles: list[ParserProfile] = []
+        self._lock = Lock()
+        self._host_semaphores: dict[str, BoundedSemaphore] = {}
+        self._sessions: dict[str, Session] = {}
+
+    def _host_semaphore(self, host: str) -> BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = BoundedSemaphore(
+                    self.max_requests_per_host
+                )
+            return self._host_semaphores[host]
+
+    def session(self, source: str) -> Session:
+        """Returns the session shared by all the parsers of a module."""
+        with self._lock:
+            if source not in self._sessions:
+                session = self._create_session()
+                if self.cache_responses:
+                    mount_response_cache(session, source)
+                self._sessions[source] = session
+            return self._sessions[source]
+
+    def _create_session(self) -> Session:
+        session = HostLimitedSession(self._host_semaphore)
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def cache_metrics(self) -> Counter[str]:
+        """Returns the HTTP cache hits, revalidations and misses of all the sessions."""
+        metrics: Counter[str] = Counter()
+        for session in self._sessions.values():
+            metrics.update(get_cache_metrics(session))
+        return metrics
+
+    def parser(self, job: ParserJob) -> Callable:
+        registry = PARSER_KEY_TO_DICT[job.data_type]
+        if self.profile:
+            return registry.profiled(job.key, job.data_type, self._add_profile)
+        return registry[job.key]
+
+    def _add_profile(self, profile: ParserProfile) -> None:
+        with self._lock:
+            self.profiles.append(profile)
+
+    def parser_arguments(
+        self,
+        job: ParserJob,
+        parser: Callable,
+        session: Any,
+        target_datetime: datetime | None = None,
+    ) -> tuple[list[str], dict[str, Any]]:
+        """The arguments to call the parser of a job with, the session if it takes one."""
+        args = (
+            job.key.split("->") if job.data_type in EXCHANGE_DATA_TYPES else [job.key]
+        )
+        kwargs: dict[str, Any] = {
+            "target_datetime": target_datetime,
+            "logger": self.logger,
+        }
+        if "session" in inspect.signature(parser).parameters:
+            kwargs["session"] = session
+        return args, kwargs
+
+    def fetch(
+        self, job: ParserJob, target_datetime: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Calls the parser of the job and returns its events as a list."""
+        parser = self.parser(job)
+        args, kwargs = self.parser_arguments(
+            job, parser, self.session(job.source), target_datetime
+        )
+        return _as_list(parser(*args, **kwargs))
+
+    def run_job(
+        self, job: ParserJob, target_datetime: datetime | None = None
+    ) -> JobResult:
+        start = time.perf_counter()
+        try:
+            events = self.fetch(job, target_datetime)
+            return self._validated(job, events, time.perf_counter() - start)
+        except Exception as e:
+            return self._failed(job, time.perf_counter() - start, e)
+
+    def _failed(self, job: ParserJob, latency: float, e: Exception) -> JobResult:
+        self.logger.exception(f"{job.key} {job.data_type} parser failed")
+        return JobResult(job, latency, 0, 0, f"{type(e).__name__}: {e}")
+
+    def _validated(
+        self, job: ParserJob, events: list[dict[str, Any]], latency: float
+    ) -> JobResult:
+        # Production, consumption and exchanges get the feeder validation, other
+        # data types are only checked for their required keys.
+        validation = validate_batch(events, job.data_type, job.key)
+        for i, error in validation.messages.items():
+            self.logger.warning(
+                f"Validation failed @ {events[i].get('datetime')}: {error}"
+            )
+        return JobResult(job, latency, len(events), len(validation.messages))
+
+    def run(
+        self, jobs: Iterable[ParserJob], target_datetime: datetime | None = None
+    ) -> list[JobResult]:
+        """Runs the jobs and returns their results in the order of the jobs."""
+        jobs = list(jobs)
+        results: dict[ParserJob, JobResult] = {}
+        # The parsers of the run share their concurrent downloads of the same document.
+        with coalescing(), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.run_job, job, target_datetime): job for job in jobs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return [results[job] for job in jobs]
+
+
+def _as_list(res: Any) -> list[dict[str, Any]]:
+    return [res] if isinstance(res, dict) else list(res or [])
+
+
+def format_summary(results: list[JobResult], elapsed_time: float) -> str:
+    """Formats the results as a table followed by the totals of the run."""
+    rows = [("key", "data type", "status", "points", "invalid", "latency")]
+    for result in results:
+        rows.append(
+            (
+                result.job.key,
+                result.job.data_type,
+                "failed" if result.error else "ok",
+                str(result.points),
+                str(result.invalid_points),
+                f"{result.latency:.2f}s",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    ]
+
+    failures = defaultdict(list)
+    for result in results:
+        if result.error:
+            failures[result.error].append(result.job.key)
+    points = sum(result.points for result in results)
+    lines += [
+        "---------------------",
+        f"{len(results)} parsers, {sum(bool(result.error) for result in results)} failed",
+        f"{points} points, {sum(result.invalid_points for result in results)} invalid",
+        f"took {elapsed_time:.2f}s ({points / elapsed_time if elapsed_time else 0:.1f} points/s)",
+        *[f"{error}: {', '.join(keys)}" for error, keys in failures.items()],
+    ]
+    return "\n".join(lines)
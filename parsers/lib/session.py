@@ -1,7 +1,22 @@
+import functools
+import hashlib
+import json
+import os
+import sqlite3
 import ssl
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterable
+from datetime import timedelta
+from pathlib import Path
+from threading import Lock
+from typing import NamedTuple
 
 import urllib3
-from requests import Session, adapters
+from requests import PreparedRequest, Response, Session, adapters
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 
 
 class LegacyHttpAdapter(adapters.HTTPAdapter):
@@ -20,3 +35,291 @@ def get_session_with_legacy_adapter():
     session.mount("https://", LegacyHttpAdapter())
     session.mount("http://", LegacyHttpAdapter())
     return session
+
+
+# Responses are cached for this long by default, see `mount_response_cache`.
+DEFAULT_CACHE_TTL = timedelta(minutes=5)
+# Sources publishing less often than every few minutes can be cached for longer.
+CACHE_TTLS: dict[str, timedelta] = {
+    "EIA": timedelta(minutes=5),
+    "ENTSOE": timedelta(minutes=5),
+    "IEMOP": timedelta(minutes=15),
+    # Capacities are published yearly at most, see capacity_update.
+    "capacity": timedelta(days=1),
+}
+# Responses older than the longest TTL are stale for every source.
+MAX_CACHE_AGE = max([DEFAULT_CACHE_TTL, *CACHE_TTLS.values()])
+# Request headers that don't change the response, the others are part of the cache key.
+UNKEYED_HEADERS = frozenset(
+    [
+        "accept-encoding",
+        "connection",
+        "content-length",
+        "if-modified-since",
+        "if-none-match",
+        "user-agent",
+    ]
+)
+
+
+def _default_cache_path() -> Path:
+    if "ELECTRICITYMAPS_HTTP_CACHE_PATH" in os.environ:
+        return Path(os.environ["ELECTRICITYMAPS_HTTP_CACHE_PATH"])
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home, "electricitymaps", "http_cache.sqlite")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    reason: str
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    def is_fresh(self, ttl: timedelta) -> bool:
+        return time.time() - self.stored_at < ttl.total_seconds()
+
+    def validators(self) -> dict[str, str]:
+        """The headers making a conditional request for this response."""
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+
+class ResponseCache(ABC):
+    """Stores responses by key. Subclass it to plug another storage backend."""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Returns the response stored for the key, if any, fresh or not."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Stores the response, replacing the one stored for the key."""
+        pass
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Stores responses in a SQLite database, shared between threads and processes.
+    Responses stored more than `max_age` ago are deleted when the cache is opened
+    and written to.
+    The headers are stored as JSON and the content as a blob, so reading the cache
+    never runs code.
+    """
+
+    def __init__(
+        self, path: Path | str | None = None, max_age: timedelta = MAX_CACHE_AGE
+    ):
+        self.path = Path(path) if path else _default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Pickled responses stored by older versions, never loaded.
+            self._connection.execute("DROP TABLE IF EXISTS responses")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cached_responses (key TEXT PRIMARY KEY, "
+                "status_code INTEGER NOT NULL, reason TEXT, headers TEXT NOT NULL, "
+                "content BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cached_responses_stored_at "
+                "ON cached_responses (stored_at)"
+            )
+            self._prune()
+
+    def _prune(self) -> None:
+        self._connection.execute(
+            "DELETE FROM cached_responses WHERE stored_at < ?",
+            (time.time() - self.max_age.total_seconds(),),
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, reason, headers, content, stored_at "
+                "FROM cached_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, reason, headers, content, stored_at = row
+        return CachedResponse(
+            status_code, reason, json.loads(headers), content, stored_at
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cached_responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    response.reason,
+                    json.dumps(response.headers),
+                    response.content,
+                    response.stored_at,
+                ),
+            )
+            self._prune()
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cached_responses")
+
+
+@functools.cache
+def _shared_sqlite_cache() -> SQLiteResponseCache:
+    return SQLiteResponseCache()
+
+
+class CachingAdapter(adapters.BaseAdapter):
+    """
+    Caches the successful responses of the adapter it wraps, for GET requests and
+    the other methods given, e.g. POST requests querying an API.
+    Responses are cached by URL, body for other methods than GET and request headers,
+    e.g. the authentication ones, see `UNKEYED_HEADERS`.
+    Fresh responses are served from the cache. Stale responses with an ETag or a
+    Last-Modified header are revalidated with a conditional request.
+    The outcome of each request is counted in `metrics`: hit, revalidated or miss.
+    """
+
+    def __init__(
+        self,
+        adapter: adapters.BaseAdapter,
+        source: str,
+        ttl: timedelta,
+        cache: ResponseCache,
+        methods: Iterable[str] = ("GET",),
+    ):
+        super().__init__()
+        self.adapter = adapter
+        self.source = source
+        self.ttl = ttl
+        self.cache = cache
+        self.methods = frozenset(methods)
+        self.metrics: Counter[str] = Counter()
+        self._metrics_lock = Lock()
+
+    def _key(self, request: PreparedRequest) -> str:
+        # Hashed so that the tokens in the URLs and headers aren't stored in clear.
+        key = hashlib.sha256(f"{self.source} {request.url}".encode())
+        headers = sorted(
+            (name.lower(), value)
+            for name, value in request.headers.items()
+            if name.lower() not in UNKEYED_HEADERS
+        )
+        key.update(json.dumps(headers).encode())
+        if request.method != "GET":
+            body = request.body or b""
+            key.update(f" {request.method} ".encode())
+            key.update(body.encode() if isinstance(body, str) else body)
+        return key.hexdigest()
+
+    def _count(self, outcome: str) -> None:
+        with self._metrics_lock:
+            self.metrics[outcome] += 1
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        if request.method not in self.methods or kwargs.get("stream"):
+            return self.adapter.send(request, **kwargs)
+
+        key = self._key(request)
+        cached = self.cache.get(key)
+        if cached is not None and cached.is_fresh(self.ttl):
+            self._count("hit")
+            return self._build_response(request, cached)
+
+        if cached is not None:
+            request = request.copy()
+            request.headers.update(cached.validators())
+        response = self.adapter.send(request, **kwargs)
+        if cached is not None and response.status_code == 304:
+            self._count("revalidated")
+            cached = cached._replace(stored_at=time.time())
+            self.cache.set(key, cached)
+            return self._build_response(request, cached)
+
+        self._count("miss")
+        if response.status_code == 200:
+            self.cache.set(
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    reason=response.reason,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    stored_at=time.time(),
+                ),
+            )
+        return response
+
+    def _build_response(
+        self, request: PreparedRequest, cached: CachedResponse
+    ) -> Response:
+        response = Response()
+        response.url = request.url
+        response.status_code = cached.status_code
+        response.reason = cached.reason
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response._content = cached.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_response_cache(
+    session: Session,
+    source: str,
+    ttl: timedelta | None = None,
+    cache: ResponseCache | None = None,
+    methods: Iterable[str] = ("GET",),
+) -> Session:
+    """
+    Caches the responses of a session, on top of the adapters already mounted.
+    The responses are cached for the TTL of the source, in the shared SQLite cache
+    unless another cache is given. Only GET requests are cached unless other
+    methods are given.
+    """
+    ttl = ttl or CACHE_TTLS.get(source, DEFAULT_CACHE_TTL)
+    cache = cache or _shared_sqlite_cache()
+    for prefix in ["https://", "http://"]:
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, CachingAdapter):
+            adapter = adapter.adapter
+        session.mount(prefix, CachingAdapter(adapter, source, ttl, cache, methods))
+    return session
+
+
+def get_cached_session(
+    source: str,
+    ttl: timedelta | None = None,
+    cache: ResponseCache | None = None,
+    methods: Iterable[str] = ("GET",),
+) -> Session:
+    """
+    Returns a session caching its responses, to be passed to the `session` parameter
+    of the fetch functions of the source.
+    """
+    return mount_response_cache(Session(), source, ttl, cache, methods)
+
+
+def get_cache_metrics(session: Session) -> Counter[str]:
+    """Returns the number of cache hits, revalidations and misses of a session."""
+    metrics: Counter[str] = Counter()
+    for adapter in dict.fromkeys(session.adapters.values()):
+        if isinstance(adapter, CachingAdapter):
+            metrics.update(adapter.metrics)
+    return metrics
@@ -0,0 +1,175 @@
+"""
+Coalesces the downloads of the same upstream document by several parsers.
+
+Many parsers download the same document for several data types or zones. While
+coalescing is enabled, e.g. by the parser runner for one run, a function
+decorated with `coalesce` runs once for the calls with the same arguments made
+while it's running: the other calls wait for it and share its result. Failures
+are shared with the calls waiting for them, but aren't kept.
+Outside of `coalescing()`, the decorated functions are called as is.
+
+The results are shared between the callers, the decorated functions should
+return immutable values, e.g. the text of a response rather than the response.
+"""
+
+import inspect
+import time
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import wraps
+from threading import Event, Lock
+from typing import Any
+
+# Only the calls made while the function is running share its result.
+DEFAULT_COALESCING_TTL = timedelta(0)
+
+
+class _Call:
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.expires_at = float("inf")
+
+
+class SingleFlight:
+    """
+    Runs a function once per key at a time, and shares its result with the calls
+    for the same key until `ttl` after it returned.
+    The calls and the downloads they saved are counted in `metrics`.
+    """
+
+    def __init__(self, name: str, ttl: timedelta = DEFAULT_COALESCING_TTL):
+        self.name = name
+        self.ttl = ttl
+        self.metrics: Counter[str] = Counter()
+        self._lock = Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self.metrics["calls"] += 1
+            now = time.monotonic()
+            call = self._calls.get(key)
+            if call is None or call.expires_at <= now:
+                self._calls = {
+                    other_key: other_call
+                    for other_key, other_call in self._calls.items()
+                    if other_call.expires_at > now
+                }
+                self._calls[key] = call = _Call()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            with self._lock:
+                self.metrics["saved"] += 1
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            raise
+        finally:
+            call.expires_at = time.monotonic() + self.ttl.total_seconds()
+            call.done.set()
+        return call.result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+
+_SINGLE_FLIGHTS: list[SingleFlight] = []
+# The number of `coalescing()` blocks running, coalescing is enabled when positive.
+_enabled = 0
+_enabled_lock = Lock()
+
+
+@contextmanager
+def coalescing() -> Iterator[None]:
+    """
+    Enables coalescing in the block, the shared results are forgotten when the last
+    block running exits.
+    """
+    global _enabled
+    with _enabled_lock:
+        _enabled += 1
+    try:
+        yield
+    finally:
+        with _enabled_lock:
+            _enabled -= 1
+            if _enabled == 0:
+                clear_coalesced_calls()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def coalesce(
+    ttl: timedelta = DEFAULT_COALESCING_TTL,
+    ignore: Iterable[str] = ("logger",),
+):
+    """
+    Coalesces the calls of a function with the same arguments while coalescing is
+    enabled, see the module docstring. The arguments in `ignore` aren't part of the
+    key. Sessions are compared by identity, so only the parsers sharing a session,
+    e.g. those of one module run by the parser runner, share the download.
+    """
+    ignored = frozenset(ignore)
+
+    def wrap(f):
+        signature = inspect.signature(f)
+        single_flight = SingleFlight(f"{f.__module__}.{f.__qualname__}", ttl)
+        _SINGLE_FLIGHTS.append(single_flight)
+
+        @wraps(f)
+        def wrapped_f(*args, **kwargs):
+            if not _enabled:
+                return f(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                (name, _freeze(value))
+                for name, value in bound.arguments.items()
+                if name not in ignored
+            )
+            return single_flight.do(key, f, *args, **kwargs)
+
+        wrapped_f.single_flight = single_flight
+        return wrapped_f
+
+    return wrap
+
+
+def get_coalescing_metrics() -> Counter[str]:
+    """Returns the number of coalesced calls and of duplicate downloads they saved."""
+    metrics: Counter[str] = Counter()
+    for single_flight in _SINGLE_FLIGHTS:
+        with single_flight._lock:
+            metrics.update(single_flight.metrics)
+    return metrics
+
+
+def clear_coalesced_calls() -> None:
+    """Forgets the shared results, e.g. between tests mocking the same documents."""
+    for single_flight in _SINGLE_FLIGHTS:
+        single_flight.clear()
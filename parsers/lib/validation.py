@@ -1,6 +1,7 @@
 """Centralised validation function for all parsers."""
 
 import math
+from datetime import datetime, timedelta, timezone
 from logging import Logger, getLogger
 from typing import Any
 
@@ -41,14 +42,21 @@ def check_expected_range(
 
 
 def validate_production_diffs(
-    datapoints: list[dict[str, Any]], max_diff: dict, logger: Logger
+    datapoints: list[dict[str, Any]],
+    max_diff: dict,
+    logger: Logger,
+    interval: timedelta | None = None,
 ):
     """
     Parameters
     ----------
     datapoints: a list of datapoints having a 'production' field
-    max_diff: dict representing the max allowed diff (in MW) per energy type
+    max_diff: dict representing the max allowed diff (in MW) per energy type, between
+      two datapoints one interval apart. The key 'total' checks the sum of all types.
     logger
+    interval: the interval max_diff applies to, defaults to the median interval
+      between the datapoints. Diffs across longer or shorter intervals are scaled, so
+      that gaps in the data allow bigger diffs.
 
     Returns
     -------
@@ -58,51 +66,124 @@ def validate_production_diffs(
     if len(datapoints) < 2:
         return datapoints
 
-    # ignore points that are None
-    # TODO(olc): do diffs on each chunks of consecutive non-None points
-    # intead of simply remove None
-    datapoints = [x for x in datapoints if x]
-
-    # sort datapoins by datetime
-    datapoints = sorted(datapoints, key=lambda x: x["datetime"])
-
-    ok_diff = pd.Series(np.ones_like(datapoints, dtype=bool))
-    for energy, max_diff in max_diff.items():
-        if "energy" == "total":
-            series = pd.Series(
-                [
-                    np.nansum([v for v in datapoint["production"].values()])
-                    for datapoint in datapoints
-                ]
+    # Missing datapoints (None) split the others in segments of consecutive
+    # datapoints, diffs are not computed between two segments.
+    missing = np.fromiter(
+        (not datapoint for datapoint in datapoints), dtype=bool, count=len(datapoints)
+    )
+    segments = np.cumsum(missing)[~missing]
+    datapoints = [datapoint for datapoint in datapoints if datapoint]
+    if not datapoints:
+        return []
+
+    # sort datapoints by datetime
+    timestamps = np.array(
+        [
+            dt.timestamp() if isinstance(dt, datetime) and dt.tzinfo else _timestamp(dt)
+            for dt in (datapoint["datetime"] for datapoint in datapoints)
+        ]
+    )
+    order = np.argsort(timestamps, kind="stable")
+    if (order != np.arange(len(order))).any():
+        datapoints = [datapoints[i] for i in order]
+        segments, timestamps = segments[order], timestamps[order]
+
+    values = _production_diff_values(datapoints, list(max_diff))
+    too_high = find_production_diff_outliers(
+        timestamps, values, list(max_diff.values()), segments, interval
+    )
+
+    for j in np.flatnonzero(too_high.any(axis=0)):
+        wrongs_ixs = np.flatnonzero(too_high[:, j])
+        wrongs_ixs_and_previous = sorted(set(wrongs_ixs - 1) | set(wrongs_ixs))
+        to_display = [
+            (datapoints[i]["datetime"], values[i, j]) for i in wrongs_ixs_and_previous
+        ]
+        logger.warning(
+            "some datapoints have a too high production value difference "
+            f"for {list(max_diff)[j]}: {to_display}"
+        )
+
+    return [datapoints[i] for i in np.flatnonzero(~too_high.any(axis=1))]
+
+
+def find_production_diff_outliers(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    max_diffs: list[float],
+    segments: np.ndarray | None = None,
+    interval: timedelta | None = None,
+) -> np.ndarray:
+    """
+    Finds the values differing too much from the previous value of their segment,
+    see validate_production_diffs.
+
+    Parameters
+    ----------
+    timestamps: sorted seconds since the epoch, one per row
+    values: 2-D array of production values, one column per energy type
+    max_diffs: the max allowed diff (in MW) of each column
+    segments: the segment of each row, diffs are only computed within a segment
+    interval: the interval the max diffs apply to, defaults to the median interval
+
+    Returns
+    -------
+    a boolean array of the shape of values, True where the diff is too big
+    """
+    if segments is None:
+        segments = np.zeros(len(timestamps), dtype=int)
+    hours = np.diff(timestamps) / 3600
+    consecutive = segments[1:] == segments[:-1]
+    if interval is None:
+        steps = hours[consecutive & (hours > 0)]
+        interval_hours = float(np.median(steps)) if len(steps) else 1.0
+    else:
+        interval_hours = interval / timedelta(hours=1)
+
+    # Diffs in MW per interval, nan is always allowed (can be disallowed using
+    # `validate` function). The first datapoint of each segment is always OK.
+    # Datapoints sharing a timestamp, e.g. on DST changes, compare their raw diff.
+    too_high = np.zeros(values.shape, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(hours > 0, interval_hours / hours, 1.0)
+        diffs = np.abs(np.diff(values, axis=0)) * scale[:, None]
+        too_high[1:] = (diffs >= np.asarray(max_diffs, dtype=float)) & (
+            consecutive[:, None]
+        )
+    return too_high
+
+
+def _production_diff_values(
+    datapoints: list[dict[str, Any]], energies: list[str]
+) -> np.ndarray:
+    """
+    Returns the production of each datapoint as a 2-D array with one column per
+    energy type, missing values being nan. The 'total' column sums all types.
+    """
+    productions = [datapoint["production"] for datapoint in datapoints]
+    columns = np.full((len(datapoints), len(energies)), np.nan)
+    for j, energy in enumerate(energies):
+        if energy == "total":
+            # The explicit index keeps a row per datapoint when all are empty.
+            totals = pd.DataFrame(productions, index=range(len(productions))).astype(
+                float
             )
+            columns[:, j] = totals.sum(axis=1, min_count=1).to_numpy()
         else:
-            series = pd.Series(
-                [
-                    datapoint["production"].get(energy, np.nan)
-                    for datapoint in datapoints
-                ]
-            )
-        # nan is always allowed (can be disallowed using `validate` function)
-        new_diffs = (np.abs(series.diff()) < max_diff) | series.isna()
-        if not new_diffs[1:].all():
-            wrongs_ixs = new_diffs[~new_diffs].index
-            wrongs_ixs_and_previous = sorted(
-                {ix - 1 for ix in wrongs_ixs} | set(wrongs_ixs)
+            # None values are converted to nan.
+            columns[:, j] = np.array(
+                [production.get(energy) for production in productions], dtype=float
             )
-            to_display = [
-                (datapoints[i]["datetime"], datapoints[i]["production"][energy])
-                for i in wrongs_ixs_and_previous
-                if i > 0
-            ]
-            logger.warning(
-                "some datapoints have a too high production value difference "
-                f"for {energy}: {to_display}"
-            )
-        ok_diff &= new_diffs
-    # first datapoint is always OK
-    ok_diff.iloc[0] = True
+    return columns
+
 
-    return [datapoints[i] for i in ok_diff[ok_diff].index]
+def _timestamp(dt: datetime) -> float:
+    """Seconds since the epoch, naive datetimes being UTC."""
+    if not isinstance(dt, datetime):
+        dt = pd.Timestamp(dt)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 def validate_consumption(
@@ -0,0 +1,13 @@
+from collections.abc import Callable
+
+from parsers.lib.parsers import ParserRegistry
+
+
+class FunctionRegistry(ParserRegistry):
+    """A parser registry of functions, registered under their `module.function` path."""
+
+    def __init__(self, parsers: dict[str, Callable]):
+        super().__init__("parsers")
+        for key, parser in parsers.items():
+            self.register(key, f"{parser.__module__.split('.')[-1]}.{parser.__name__}")
+            self._functions[key] = parser
@@ -0,0 +1,231 @@
+import json
+import time
+import unittest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import requests
+
+from parsers.lib.async_runner import AioHttpAdapter, AsyncParserRunner, EventLoopThread
+from parsers.lib.config import async_version
+from parsers.lib.runner import ParserJob
+from parsers.test.lib.helpers import FunctionRegistry
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/redirect":
+            self._reply(302, b"", {"Location": "/echo"})
+        elif path == "/login":
+            self._reply(200, b"ok", {"Set-Cookie": "token=abc; Path=/"})
+        elif path == "/slow":
+            time.sleep(0.5)
+            self._reply(200, b"late")
+        else:
+            self.do_POST()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.dumps(
+            {
+                "path": self.path,
+                "method": self.command,
+                "cookie": self.headers.get("Cookie"),
+                "user_agent": self.headers.get("User-Agent"),
+                "body": self.rfile.read(length).decode(),
+            }
+        )
+        self._reply(
+            200, body.encode(), {"Content-Type": "application/json; charset=utf-8"}
+        )
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+
+class TestAioHttpAdapter(LocalServerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.event_loop = EventLoopThread()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.event_loop.close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.session = requests.Session()
+        self.session.mount("http://", AioHttpAdapter(self.event_loop))
+
+    def test_get(self):
+        response = self.session.get(f"{self.url}/echo", params={"a": "1 2"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["content-type"], "application/json; charset=utf-8"
+        )
+        self.assertEqual(response.encoding, "utf-8")
+        self.assertEqual(response.json()["path"], "/echo?a=1+2")
+        self.assertIn("python-requests", response.json()["user_agent"])
+        self.assertEqual(json.loads(response.content), json.loads(response.text))
+
+    def test_post(self):
+        response = self.session.post(f"{self.url}/echo", data={"a": "b"})
+        self.assertEqual(response.json()["body"], "a=b")
+        response = self.session.post(f"{self.url}/echo", json={"a": "b"})
+        self.assertEqual(json.loads(response.json()["body"]), {"a": "b"})
+
+    def test_cookies_and_redirects(self):
+        self.session.get(f"{self.url}/login")
+        self.assertEqual(self.session.cookies["token"], "abc")
+        response = self.session.get(f"{self.url}/redirect")
+        self.assertEqual([r.status_code for r in response.history], [302])
+        self.assertEqual(response.json()["path"], "/echo")
+        self.assertEqual(response.json()["cookie"], "token=abc")
+
+    def test_errors(self):
+        with self.assertRaises(requests.Timeout):
+            self.session.get(f"{self.url}/slow", timeout=0.1)
+        with self.assertRaises(requests.ConnectionError):
+            self.session.get("http://127.0.0.1:1/")
+
+    def test_loop_cannot_wait_for_itself(self):
+        async def wait_for_itself():
+            return self.event_loop.run(wait_for_itself())
+
+        with self.assertRaises(RuntimeError):
+            self.event_loop.run(wait_for_itself())
+
+
+# The URL of the local server, set by the tests.
+SERVER = {"url": ""}
+
+
+def fetch_production(zone_key, session=None, target_datetime=None, logger=None):
+    echo = session.get(f"{SERVER['url']}/echo").json()
+    return {
+        "zoneKey": zone_key,
+        "datetime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+        "production": {"gas": 100.0},
+        "source": echo["path"],
+    }
+
+
+async def fetch_price(zone_key, session=None, target_datetime=None, logger=None):
+    async with session.get(f"{SERVER['url']}/echo") as response:
+        echo = await response.json()
+    return [
+        {
+            "zoneKey": zone_key,
+            "datetime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "currency": "EUR",
+            "price": 1.0,
+            "source": echo["path"],
+        }
+    ]
+
+
+async def fetch_consumption(zone_key, session=None, target_datetime=None, logger=None):
+    raise ValueError("No data")
+
+
+async def fetch_exchange_async(
+    zone_key1, zone_key2, session=None, target_datetime=None, logger=None
+):
+    async with session.get(f"{SERVER['url']}/slow") as response:
+        await response.read()
+    return []
+
+
+@async_version(fetch_exchange_async)
+def fetch_exchange(
+    zone_key1, zone_key2, session=None, target_datetime=None, logger=None
+):
+    raise AssertionError("The coroutine version is run")
+
+
+class TestAsyncParserRunner(LocalServerTestCase):
+    def setUp(self):
+        SERVER["url"] = self.url
+        registries = {
+            "production": FunctionRegistry(
+                {"DE": fetch_production, "FR": fetch_production}
+            ),
+            "price": FunctionRegistry({"DE": fetch_price}),
+            "consumption": FunctionRegistry({"DE": fetch_consumption}),
+            "exchange": FunctionRegistry(
+                {key: fetch_exchange for key in ["DE->FR", "DE->NL", "DE->PL"]}
+            ),
+        }
+        for module in ["parsers.lib.async_runner", "parsers.lib.runner"]:
+            patcher = patch(f"{module}.PARSER_KEY_TO_DICT", registries)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_run(self):
+        jobs = [
+            ParserJob("DE", "production"),
+            ParserJob("DE", "price"),
+            ParserJob("FR", "production"),
+            ParserJob("DE", "consumption"),
+        ]
+        with AsyncParserRunner(max_workers=2) as runner:
+            with self.assertLogs("parsers.lib.async_runner", "ERROR"):
+                results = runner.run(jobs)
+            self.assertIs(
+                runner.session("A").get_adapter(self.url),
+                runner.session("B").get_adapter(self.url),
+            )
+        self.assertEqual([result.job for result in results], jobs)
+        self.assertEqual(
+            [(result.points, result.invalid_points) for result in results],
+            [(1, 0), (1, 0), (1, 0), (0, 0)],
+        )
+        self.assertEqual(results[3].error, "ValueError: No data")
+
+    def test_coroutine_versions_dont_wait_for_threads(self):
+        jobs = [ParserJob(key, "exchange") for key in ["DE->FR", "DE->NL", "DE->PL"]]
+        with AsyncParserRunner(max_workers=1) as runner:
+            start = time.perf_counter()
+            results = runner.run(jobs)
+            # The slow responses were awaited at the same time.
+            self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual([result.error for result in results], [None] * 3)
+
+    def test_profile_coroutine_versions(self):
+        with AsyncParserRunner(profile=True) as runner:
+            (result,) = runner.run([ParserJob("DE->FR", "exchange")])
+        self.assertIsNone(result.error)
+        self.assertEqual(
+            [(profile.key, profile.error) for profile in runner.profiles],
+            [("DE->FR", None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
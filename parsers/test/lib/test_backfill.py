@@ -0,0 +1,145 @@
+import inspect
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from parsers.lib.backfill import (
+    checkpoint_path,
+    plan_target_datetimes,
+    read_checkpoint,
+    run_backfill,
+)
+from parsers.lib.config import refetch_frequency
+from parsers.lib.runner import ParserJob, ParserRunner
+from parsers.test.lib.helpers import FunctionRegistry
+
+CALLS = []
+
+
+@refetch_frequency(timedelta(days=1))
+def fetch_production(zone_key, session=None, target_datetime=None, logger=None):
+    CALLS.append(target_datetime)
+    if target_datetime == datetime(2023, 1, 3, tzinfo=timezone.utc):
+        raise ValueError("No data")
+    # Two days of data, so consecutive calls overlap.
+    return [
+        {
+            "zoneKey": zone_key,
+            "datetime": target_datetime - timedelta(hours=hours),
+            "production": {"gas": 100.0},
+            "source": "test.org",
+        }
+        for hours in range(48)
+    ]
+
+
+class TestPlanTargetDatetimes(unittest.TestCase):
+    def test_plan(self):
+        self.assertEqual(
+            plan_target_datetimes(
+                timedelta(days=1),
+                datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+                datetime(2023, 1, 4, tzinfo=timezone.utc),
+            ),
+            [
+                datetime(2023, 1, 2, tzinfo=timezone.utc),
+                datetime(2023, 1, 3, tzinfo=timezone.utc),
+                datetime(2023, 1, 4, tzinfo=timezone.utc),
+            ],
+        )
+        self.assertEqual(
+            plan_target_datetimes(
+                timedelta(hours=6),
+                datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+                datetime(2023, 1, 1, 17, tzinfo=timezone.utc),
+            ),
+            [
+                datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+                datetime(2023, 1, 1, 17, tzinfo=timezone.utc),
+            ],
+        )
+
+    def test_overlapping_ranges_share_targets(self):
+        first = plan_target_datetimes(
+            timedelta(days=2),
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 1, 20, tzinfo=timezone.utc),
+        )
+        second = plan_target_datetimes(
+            timedelta(days=2),
+            datetime(2023, 1, 10, 5, tzinfo=timezone.utc),
+            datetime(2023, 1, 30, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            sorted(set(first[:-1]) & set(second)),
+            [
+                datetime(2023, 1, day, tzinfo=timezone.utc)
+                for day in (11, 13, 15, 17, 19)
+            ],
+        )
+
+    def test_naive_datetimes(self):
+        with self.assertRaises(ValueError):
+            plan_target_datetimes(
+                timedelta(days=1), datetime(2023, 1, 1), datetime(2023, 1, 2)
+            )
+
+
+class TestRunBackfill(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        registries = {"production": FunctionRegistry({"DE": fetch_production})}
+        for module in ["parsers.lib.backfill", "parsers.lib.runner"]:
+            patcher = patch(f"{module}.PARSER_KEY_TO_DICT", registries)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output_path = Path(directory.name, "DE.ndjson")
+
+    def _backfill(self):
+        return run_backfill(
+            ParserJob("DE", "production"),
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 1, 5, tzinfo=timezone.utc),
+            self.output_path,
+            runner=ParserRunner(max_workers=2),
+        )
+
+    def _records(self):
+        with open(self.output_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_backfill_and_resume(self):
+        result = self._backfill()
+        self.assertEqual(result.targets, 5)
+        self.assertEqual(result.skipped, 0)
+        self.assertEqual(
+            list(result.failed), [datetime(2023, 1, 3, tzinfo=timezone.utc)]
+        )
+        records = self._records()
+        self.assertEqual(result.records, len(records))
+        # Overlapping responses are only written once.
+        datetimes = [record["datetime"] for record in records]
+        self.assertEqual(len(datetimes), len(set(datetimes)))
+        self.assertEqual(result.duplicates, 4 * 48 - len(records))
+        self.assertIn("2023-01-04T00:00:00+00:00", datetimes)
+        self.assertEqual(
+            read_checkpoint(checkpoint_path(self.output_path)),
+            set(CALLS) - {datetime(2023, 1, 3, tzinfo=timezone.utc)},
+        )
+
+        # Resuming only retries the failed target.
+        CALLS.clear()
+        result = self._backfill()
+        self.assertEqual(CALLS, [datetime(2023, 1, 3, tzinfo=timezone.utc)])
+        self.assertEqual(result.skipped, 4)
+        self.assertEqual(result.records, 0)
+        self.assertEqual(len(self._records()), len(records))
+
+    def test_refetch_frequency_keeps_signature(self):
+        self.assertIn("session", inspect.signature(fetch_production).parameters)
+        self.assertEqual(fetch_production.REFETCH_FREQUENCY, timedelta(days=1))
@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from parsers.lib.entsoe_xml import iter_series, iter_time_series, parse_resolution
+
+MULTI_PERIOD_DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument>
+    <TimeSeries>
+        <mRID>1</mRID>
+        <contract_MarketAgreement.type>A05</contract_MarketAgreement.type>
+        <Period>
+            <timeInterval>
+                <start>2023-05-06T22:00Z</start>
+                <end>2023-05-06T23:00Z</end>
+            </timeInterval>
+            <resolution>PT15M</resolution>
+            <Point><position>1</position><quantity>10</quantity></Point>
+            <Point><position>3</position><quantity>12.5</quantity></Point>
+        </Period>
+        <Period>
+            <timeInterval>
+                <start>2023-05-07T22:00Z</start>
+                <end>2023-05-08T22:00Z</end>
+            </timeInterval>
+            <resolution>P1D</resolution>
+            <Point><position>1</position><quantity>20</quantity></Point>
+        </Period>
+    </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+class TestIterSeries(unittest.TestCase):
+    def test_decodes_production_document(self):
+        with open("parsers/test/mocks/ENTSOE/FI_production.xml", "rb") as f:
+            series = list(iter_series(f))
+        assert len(series) == 11
+        assert series[0].attributes["MktPSRType.psrType"] == "B01"
+        assert "inBiddingZone_Domain.mRID" in series[0].attributes
+        assert series[0].start == datetime(2023, 5, 8, 7, tzinfo=timezone.utc)
+        assert series[0].end == datetime(2023, 5, 10, 7, tzinfo=timezone.utc)
+        assert series[0].resolution == "PT60M"
+        assert len(series[0].positions) == len(series[0].values["quantity"]) == 48
+        assert series[0].values["quantity"][0] == 543
+        assert series[0].datetimes[1] == datetime(2023, 5, 8, 8, tzinfo=timezone.utc)
+
+    def test_decodes_prices_document(self):
+        with open("parsers/test/mocks/ENTSOE/FR_prices.xml") as f:
+            series = list(iter_series(f.read()))
+        assert series[0].attributes["currency_Unit.name"] == "EUR"
+        assert series[0].values["price.amount"][0] == 106.78
+
+    def test_yields_one_series_per_period(self):
+        series = list(iter_series(MULTI_PERIOD_DOCUMENT))
+        assert len(series) == 2
+        assert series[0].attributes["contract_MarketAgreement.type"] == "A05"
+        assert series[0].datetimes == [
+            datetime(2023, 5, 6, 22, tzinfo=timezone.utc),
+            datetime(2023, 5, 6, 22, 30, tzinfo=timezone.utc),
+        ]
+        assert series[0].values["quantity"].tolist() == [10, 12.5]
+        assert series[1].datetimes == [datetime(2023, 5, 7, 22, tzinfo=timezone.utc)]
+
+    def test_yields_the_periods_of_each_time_series(self):
+        (periods,) = list(iter_time_series(MULTI_PERIOD_DOCUMENT))
+        assert [period.resolution for period in periods] == ["PT15M", "P1D"]
+
+
+class TestParseResolution(unittest.TestCase):
+    def test_parse_resolution(self):
+        assert parse_resolution("PT15M") == timedelta(minutes=15)
+        assert parse_resolution("PT60M") == timedelta(hours=1)
+        assert parse_resolution("PT1H") == timedelta(hours=1)
+        assert parse_resolution("P1D") == timedelta(days=1)
+
+    def test_unknown_resolution_raises(self):
+        with self.assertRaises(NotImplementedError):
+            parse_resolution("P1Y")
@@ -0,0 +1,50 @@
+import sys
+import unittest
+
+from parsers.lib.parsers import (
+    IMPORT_TIMES,
+    PARSER_KEY_TO_DICT,
+    ParserRegistry,
+    import_time_report,
+)
+
+
+class TestParserRegistry(unittest.TestCase):
+    def test_parsers_are_imported_on_access(self):
+        registry = ParserRegistry("parsers")
+        registry.register("XX", "NOT_A_PARSER_MODULE.fetch_production")
+        # The mapping interface doesn't import the parser.
+        self.assertIn("XX", registry)
+        self.assertEqual(list(registry), ["XX"])
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(registry.path("XX"), "NOT_A_PARSER_MODULE.fetch_production")
+        self.assertNotIn("parsers.NOT_A_PARSER_MODULE", sys.modules)
+        with self.assertRaises(ModuleNotFoundError):
+            registry["XX"]
+
+    def test_unknown_key_raises(self):
+        registry = ParserRegistry("parsers")
+        self.assertNotIn("XX", registry)
+        self.assertIsNone(registry.get("XX"))
+        with self.assertRaises(KeyError):
+            registry["XX"]
+
+    def test_configured_parser(self):
+        registry = PARSER_KEY_TO_DICT["production"]
+        self.assertEqual(registry.path("DK-DK1"), "ENTSOE.fetch_production")
+        parser = registry["DK-DK1"]
+        from parsers.ENTSOE import fetch_production
+
+        self.assertIs(parser, fetch_production)
+        self.assertIn("parsers.ENTSOE", IMPORT_TIMES)
+        self.assertIn("parsers.ENTSOE", dict(import_time_report()))
+
+    def test_capacity_parsers_folder(self):
+        self.assertEqual(
+            PARSER_KEY_TO_DICT["productionCapacity"].parser_folder,
+            "electricitymap.contrib.capacity_parsers",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
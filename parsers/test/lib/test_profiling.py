@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import subprocess
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from requests import Session
+from requests_mock import ANY, GET, Adapter
+
+from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
+from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.lib.types import ZoneKey
+from parsers.lib.profiling import format_prometheus, profile_parser, profiled
+
+logger = logging.getLogger(__name__)
+
+
+def _mocked_session() -> Session:
+    adapter = Adapter()
+    adapter.register_uri(GET, ANY, text="x" * 1000)
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_production(zone_key, session=None, target_datetime=None, logger=logger):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        texts = list(
+            executor.map(lambda i: session.get(f"https://a.org/{i}").text, range(2))
+        )
+    time.sleep(0.05)
+    production_breakdowns = ProductionBreakdownList(logger)
+    for i, text in enumerate(texts):
+        production_breakdowns.append(
+            zoneKey=ZoneKey(zone_key),
+            datetime=datetime(2023, 1, 1, tzinfo=timezone.utc) + timedelta(hours=i),
+            source="a.org",
+            production=ProductionMix(wind=len(text)),
+        )
+    return production_breakdowns.to_list()
+
+
+class TestProfiling(unittest.TestCase):
+    def test_profiled_parser(self):
+        profiles = []
+        parser = profiled(fetch_production, "DE", "production", profiles.append)
+        data = parser("DE", session=_mocked_session())
+        self.assertEqual(len(data), 2)
+        (profile,) = profiles
+        self.assertEqual(
+            (profile.requests, profile.bytes_downloaded, profile.points),
+            (2, 2000, 2),
+        )
+        self.assertAlmostEqual(sum(profile.phases.values()), profile.wall_time)
+        self.assertGreater(profile.phases["parse"], 0.05)
+        self.assertGreater(profile.phases["network"], 0)
+        self.assertGreater(profile.phases["events"], 0)
+        self.assertIn("2 requests, 2.0KiB downloaded, 2 points", profile.format())
+
+    def test_requests_outside_of_profiles_are_not_counted(self):
+        session = _mocked_session()
+        with profile_parser("DE", "production") as profile:
+            pass
+        session.get("https://a.org")
+        self.assertEqual(profile.requests, 0)
+
+    def test_hooks_are_removed_on_exit(self):
+        send = Session.send
+        append = ProductionBreakdownList.append
+        mix_init = ProductionMix.__init__
+        with profile_parser("DE", "production"):
+            with profile_parser("FR", "production"):
+                self.assertIsNot(Session.send, send)
+            # Still installed for the outer profile.
+            self.assertIsNot(ProductionBreakdownList.append, append)
+        self.assertIs(Session.send, send)
+        self.assertIs(ProductionBreakdownList.append, append)
+        self.assertIs(ProductionMix.__init__, mix_init)
+
+    def test_registry_doesnt_import_profiling(self):
+        modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, parsers.lib.parsers; print('parsers.lib.profiling' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(modules.strip(), "False")
+
+    def test_failure(self):
+        def fetch_price(zone_key, session=None, target_datetime=None, logger=None):
+            raise ValueError("No data")
+
+        profiles = []
+        with self.assertRaises(ValueError):
+            profiled(fetch_price, "DE", "price", profiles.append)("DE")
+        self.assertEqual(profiles[0].error, "ValueError: No data")
+
+    def test_coroutine_parser(self):
+        async def fetch_price(
+            zone_key, session=None, target_datetime=None, logger=None
+        ):
+            return {"zoneKey": zone_key}
+
+        profiles = []
+        parser = profiled(fetch_price, "DE", "price", profiles.append)
+        self.assertEqual(asyncio.run(parser("DE")), {"zoneKey": "DE"})
+        self.assertEqual(profiles[0].points, 1)
+
+    def test_format_prometheus(self):
+        profiles = []
+        parser = profiled(fetch_production, "DE", "production", profiles.append)
+        for _ in range(2):
+            parser("DE", session=_mocked_session())
+        metrics = format_prometheus(profiles)
+        self.assertIn("# TYPE parser_requests_total counter", metrics)
+        self.assertIn(
+            'parser_requests_total{zone_key="DE",data_type="production"} 4', metrics
+        )
+        self.assertIn(
+            'parser_phase_seconds_total{zone_key="DE",data_type="production",phase="network"}',
+            metrics,
+        )
+        self.assertIn(
+            'parser_failures_total{zone_key="DE",data_type="production"} 0', metrics
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import time
+import unittest
+from datetime import datetime, timezone
+from threading import Lock
+from unittest.mock import Mock, patch
+
+from parsers.lib.runner import (
+    JobResult,
+    ParserJob,
+    ParserRunner,
+    format_summary,
+    select_jobs,
+)
+from parsers.test.lib.helpers import FunctionRegistry
+
+CONCURRENCY = {"current": 0, "max": 0}
+CONCURRENCY_LOCK = Lock()
+
+
+def fetch_production(zone_key, session=None, target_datetime=None, logger=None):
+    with CONCURRENCY_LOCK:
+        CONCURRENCY["current"] += 1
+        CONCURRENCY["max"] = max(CONCURRENCY["max"], CONCURRENCY["current"])
+    time.sleep(0.05)
+    with CONCURRENCY_LOCK:
+        CONCURRENCY["current"] -= 1
+    return [
+        {
+            "zoneKey": zone_key,
+            "datetime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "production": {"gas": 100.0},
+            "source": "test.org",
+        },
+        {
+            "zoneKey": zone_key,
+            "datetime": datetime(2023, 1, 1, 1, tzinfo=timezone.utc),
+            "production": {"gas": -100.0},
+            "source": "test.org",
+        },
+    ]
+
+
+def fetch_price(zone_key, session=None, target_datetime=None, logger=None):
+    raise ValueError("No data")
+
+
+def fetch_exchange(zone_key1, zone_key2, target_datetime=None, logger=None):
+    return []
+
+
+class TestParserRunner(unittest.TestCase):
+    def setUp(self):
+        registries = {
+            "production": FunctionRegistry(
+                {
+                    "DE": fetch_production,
+                    "FR": fetch_production,
+                    "NL": fetch_production,
+                    "GB": Mock(__module__="OTHER", __name__="fetch_production"),
+                }
+            ),
+            "price": FunctionRegistry({"DE": fetch_price}),
+            "exchange": FunctionRegistry({"DE->FR": fetch_exchange}),
+        }
+        patcher = patch("parsers.lib.runner.PARSER_KEY_TO_DICT", registries)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_select_jobs(self):
+        self.assertEqual(
+            select_jobs(["GB", "DE->FR"]),
+            [ParserJob("DE->FR", "exchange"), ParserJob("GB", "production")],
+        )
+        self.assertEqual(
+            select_jobs(sources=["test_runner"], data_types=["production"]),
+            [
+                ParserJob("DE", "production"),
+                ParserJob("FR", "production"),
+                ParserJob("NL", "production"),
+            ],
+        )
+        with self.assertRaises(ValueError):
+            select_jobs(["XX"])
+
+    def test_run(self):
+        jobs = [
+            ParserJob("DE", "production"),
+            ParserJob("FR", "production"),
+            ParserJob("NL", "production"),
+            ParserJob("DE", "price"),
+            ParserJob("DE->FR", "exchange"),
+        ]
+        with self.assertLogs("parsers.lib.runner", "WARNING"):
+            results = ParserRunner(max_workers=4).run(jobs)
+        self.assertEqual([result.job for result in results], jobs)
+        # The negative production value fails the validation.
+        self.assertEqual(
+            [(result.points, result.invalid_points) for result in results],
+            [(2, 1), (2, 1), (2, 1), (0, 0), (0, 0)],
+        )
+        self.assertEqual(results[3].error, "ValueError: No data")
+        self.assertGreater(CONCURRENCY["max"], 1)
+
+    def test_validation_failure(self):
+        with patch(
+            "parsers.lib.runner.validate_batch", side_effect=KeyError("production")
+        ), self.assertLogs("parsers.lib.runner", "ERROR"):
+            (result,) = ParserRunner().run([ParserJob("DE", "production")])
+        self.assertEqual(result.error, "KeyError: 'production'")
+
+    def test_profile(self):
+        jobs = [ParserJob("DE", "production"), ParserJob("DE", "price")]
+        runner = ParserRunner(profile=True)
+        with self.assertLogs("parsers.lib.runner", "WARNING"):
+            runner.run(jobs)
+        self.assertEqual(
+            sorted(
+                (profile.key, profile.data_type, profile.points, profile.error)
+                for profile in runner.profiles
+            ),
+            [
+                ("DE", "price", 0, "ValueError: No data"),
+                ("DE", "production", 2, None),
+            ],
+        )
+
+    def test_parsers_of_a_module_share_a_session(self):
+        runner = ParserRunner()
+        self.assertIs(runner.session("ENTSOE"), runner.session("ENTSOE"))
+        self.assertIsNot(runner.session("ENTSOE"), runner.session("EIA"))
+        self.assertIs(runner._host_semaphore("a.org"), runner._host_semaphore("a.org"))
+
+    def test_format_summary(self):
+        summary = format_summary(
+            [
+                JobResult(ParserJob("DE", "production"), 1.5, 24, 1),
+                JobResult(ParserJob("FR", "production"), 0.5, 0, 0, "ValueError: x"),
+            ],
+            elapsed_time=2,
+        )
+        self.assertIn("DE   production  ok      24      1        1.50s", summary)
+        self.assertIn("2 parsers, 1 failed", summary)
+        self.assertIn("24 points, 1 invalid", summary)
+        self.assertIn("ValueError: x: FR", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import sqlite3
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+from requests import Session
+from requests_mock import GET, POST, Adapter
+
+from parsers.lib.session import (
+    CachedResponse,
+    SQLiteResponseCache,
+    get_cache_metrics,
+    mount_response_cache,
+)
+
+URL = "https://example.com/data?token=secret"
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = SQLiteResponseCache(Path(self.tmp_dir.name, "cache.sqlite"))
+        self.adapter = Adapter()
+        self.session = Session()
+        self.session.mount("https://", self.adapter)
+
+    def test_fresh_responses_are_served_from_the_cache(self):
+        self.adapter.register_uri(GET, URL, text="data")
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.assertEqual(self.session.get(URL).text, "data")
+        self.assertEqual(self.session.get(URL).text, "data")
+        self.assertEqual(self.adapter.call_count, 1)
+        self.assertEqual(get_cache_metrics(self.session), {"miss": 1, "hit": 1})
+
+    def test_cache_is_shared_between_sessions(self):
+        self.adapter.register_uri(GET, URL, text="data")
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.session.get(URL)
+        other_session = Session()
+        other_session.mount("https://", self.adapter)
+        mount_response_cache(other_session, "TEST", cache=self.cache)
+        self.assertEqual(other_session.get(URL).text, "data")
+        self.assertEqual(self.adapter.call_count, 1)
+
+    def test_stale_responses_are_revalidated(self):
+        self.adapter.register_uri(
+            GET,
+            URL,
+            [
+                {"text": "data", "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        mount_response_cache(
+            self.session, "TEST", ttl=timedelta(seconds=-1), cache=self.cache
+        )
+        self.session.get(URL)
+        response = self.session.get(URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "data")
+        self.assertEqual(self.adapter.last_request.headers["If-None-Match"], '"v1"')
+        self.assertEqual(get_cache_metrics(self.session), {"miss": 1, "revalidated": 1})
+
+    def test_errors_are_not_cached(self):
+        self.adapter.register_uri(GET, URL, [{"status_code": 500}, {"text": "data"}])
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.assertEqual(self.session.get(URL).status_code, 500)
+        self.assertEqual(self.session.get(URL).text, "data")
+        self.assertEqual(self.adapter.call_count, 2)
+
+    def test_post_requests_are_cached_by_body_when_enabled(self):
+        self.adapter.register_uri(POST, URL, text="data")
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.session.post(URL, data="a")
+        self.session.post(URL, data="a")
+        self.assertEqual(self.adapter.call_count, 2)
+        mount_response_cache(
+            self.session, "TEST", cache=self.cache, methods=("GET", "POST")
+        )
+        self.session.post(URL, data="a")
+        self.session.post(URL, data="a")
+        self.session.post(URL, data="b")
+        self.assertEqual(self.adapter.call_count, 4)
+        self.assertEqual(get_cache_metrics(self.session), {"miss": 2, "hit": 1})
+
+    def test_sqlite_cache_doesnt_store_tokens(self):
+        self.cache.set("key", CachedResponse(200, "OK", {}, b"data", time.time()))
+        self.assertEqual(self.cache.get("key").content, b"data")
+        self.assertIsNone(self.cache.get("other key"))
+        self.adapter.register_uri(GET, URL, text="data")
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.session.get(URL, headers={"Authorization": "Bearer secret"})
+        rows = self.cache._connection.execute(
+            "SELECT key, headers, content FROM cached_responses"
+        ).fetchall()
+        self.assertFalse(
+            any("secret" in key or "secret" in headers for key, headers, _ in rows)
+        )
+
+    def test_sqlite_cache_deletes_old_responses(self):
+        now = time.time()
+        self.cache.set("old", CachedResponse(200, "OK", {}, b"data", now - 2 * 86400))
+        self.cache.set("recent", CachedResponse(200, "OK", {}, b"data", now - 60))
+        self.assertIsNone(self.cache.get("old"))
+        self.assertIsNotNone(self.cache.get("recent"))
+        cache = SQLiteResponseCache(self.cache.path, max_age=timedelta(seconds=30))
+        self.assertIsNone(cache.get("recent"))
+
+    def test_requests_are_cached_by_headers(self):
+        self.adapter.register_uri(GET, URL, text="data")
+        mount_response_cache(self.session, "TEST", cache=self.cache)
+        self.session.get(URL, headers={"Authorization": "a"})
+        self.session.get(URL, headers={"Authorization": "a", "User-Agent": "other"})
+        self.assertEqual(self.adapter.call_count, 1)
+        self.session.get(URL, headers={"Authorization": "b"})
+        self.session.get(URL, headers={"X-Api-Key": "a"})
+        self.assertEqual(self.adapter.call_count, 3)
+
+    def test_sqlite_cache_drops_pickled_responses(self):
+        path = Path(self.tmp_dir.name, "old_cache.sqlite")
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE responses (key TEXT PRIMARY KEY, response BLOB)"
+            )
+            connection.execute("INSERT INTO responses VALUES ('key', x'00')")
+        connection.close()
+        cache = SQLiteResponseCache(path)
+        self.assertIsNone(cache.get("key"))
+        tables = cache._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).fetchall()
+        self.assertEqual(tables, [("cached_responses",)])
+        cache.set(
+            "key", CachedResponse(200, "OK", {"ETag": '"v1"'}, b"data", time.time())
+        )
+        self.assertEqual(cache.get("key").content, b"data")
+        self.assertEqual(cache.get("key").headers, {"ETag": '"v1"'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Event
+
+from parsers.lib.single_flight import (
+    SingleFlight,
+    coalesce,
+    coalescing,
+    get_coalescing_metrics,
+)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_call(self):
+        single_flight = SingleFlight("test")
+        started, release = Event(), Event()
+        calls = []
+
+        def download():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "document"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(single_flight.do, "url", download)
+            started.wait()
+            followers = [
+                executor.submit(single_flight.do, "url", download) for _ in range(3)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in [leader, *followers]]
+
+        self.assertEqual(results, ["document"] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(single_flight.metrics, {"calls": 4, "saved": 3})
+
+    def test_returned_results_are_not_kept_by_default(self):
+        single_flight = SingleFlight("test")
+        values = iter(range(10))
+        self.assertEqual(single_flight.do("url", next, values), 0)
+        self.assertEqual(single_flight.do("url", next, values), 1)
+
+    def test_results_expire(self):
+        single_flight = SingleFlight("test", ttl=timedelta(seconds=0.05))
+        values = iter(range(10))
+        self.assertEqual(single_flight.do("url", next, values), 0)
+        self.assertEqual(single_flight.do("url", next, values), 0)
+        self.assertEqual(single_flight.do("other url", next, values), 1)
+        time.sleep(0.1)
+        self.assertEqual(single_flight.do("url", next, values), 2)
+
+    def test_failures_are_not_kept(self):
+        single_flight = SingleFlight("test")
+
+        def fail():
+            raise ValueError("Server error")
+
+        with self.assertRaises(ValueError):
+            single_flight.do("url", fail)
+        self.assertEqual(single_flight.do("url", lambda: "document"), "document")
+        self.assertEqual(single_flight.metrics["saved"], 0)
+
+
+class TestCoalesce(unittest.TestCase):
+    def test_calls_are_not_coalesced_by_default(self):
+        calls = []
+
+        @coalesce(ttl=timedelta(minutes=1))
+        def query(report):
+            calls.append(report)
+            return report
+
+        self.assertEqual(query("A"), "A")
+        self.assertEqual(query("A"), "A")
+        self.assertEqual(calls, ["A", "A"])
+        self.assertEqual(query.single_flight.metrics, {})
+
+    def test_key_ignores_logger(self):
+        calls = []
+
+        @coalesce(ttl=timedelta(minutes=1))
+        def query(report, session, params, logger=None):
+            calls.append(report)
+            params["APIKey"] = "token"
+            return f"{report} {len(calls)}"
+
+        session = object()
+        before = get_coalescing_metrics()
+        with coalescing():
+            self.assertEqual(query("A", session, {"a": 1, "b": [2]}), "A 1")
+            self.assertEqual(query("A", session, {"b": [2], "a": 1}, logger=1), "A 1")
+            self.assertEqual(query("A", object(), {"a": 1, "b": [2]}), "A 2")
+            self.assertEqual(query(report="A", session=session, params={"a": 2}), "A 3")
+        self.assertEqual(calls, ["A", "A", "A"])
+        self.assertEqual(query.single_flight.metrics, {"calls": 4, "saved": 1})
+        self.assertEqual(get_coalescing_metrics() - before, {"calls": 4, "saved": 1})
+
+        # The results are forgotten at the end of the block.
+        with coalescing():
+            self.assertEqual(query("A", session, {"a": 1, "b": [2]}), "A 4")
+
+
+if __name__ == "__main__":
+    unittest.main()
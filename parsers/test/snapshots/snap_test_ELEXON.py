@@ -0,0 +1,1832 @@
+# snapshottest: v1 - https://goo.gl/zC4yUc
+
+from snapshottest import Snapshot
+
+snapshots = Snapshot()
+
+snapshots["test_fetch_production_snapshot 1"] = [
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T00:00:00+00:00",
+        "production": {
+            "biomass": 1894.0,
+            "coal": 446.0,
+            "gas": 9652.0,
+            "hydro": 427.0,
+            "nuclear": 5293.0,
+            "oil": 0.0,
+            "solar": 151.0,
+            "unknown": 276.0,
+            "wind": 12945.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T00:30:00+00:00",
+        "production": {
+            "biomass": 1872.0,
+            "coal": 463.0,
+            "gas": 9718.0,
+            "hydro": 419.0,
+            "nuclear": 5308.0,
+            "oil": 3.0,
+            "solar": 142.0,
+            "unknown": 255.0,
+            "wind": 13064.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1122.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T01:00:00+00:00",
+        "production": {
+            "biomass": 1902.0,
+            "coal": 470.0,
+            "gas": 9896.0,
+            "hydro": 465.0,
+            "nuclear": 5394.0,
+            "oil": 3.0,
+            "solar": 180.0,
+            "unknown": 276.0,
+            "wind": 13053.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1446.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T01:30:00+00:00",
+        "production": {
+            "biomass": 1937.0,
+            "coal": 471.0,
+            "gas": 9979.0,
+            "hydro": 423.0,
+            "nuclear": 5475.0,
+            "oil": 0.0,
+            "solar": 156.0,
+            "unknown": 298.0,
+            "wind": 13163.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T02:00:00+00:00",
+        "production": {
+            "biomass": 1944.0,
+            "coal": 501.0,
+            "gas": 10074.0,
+            "hydro": 429.0,
+            "nuclear": 5508.0,
+            "oil": 0.0,
+            "solar": 176.0,
+            "unknown": 264.0,
+            "wind": 13413.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T02:30:00+00:00",
+        "production": {
+            "biomass": 1955.0,
+            "coal": 460.0,
+            "gas": 10140.0,
+            "hydro": 444.0,
+            "nuclear": 5560.0,
+            "oil": 0.0,
+            "solar": 149.0,
+            "unknown": 256.0,
+            "wind": 13335.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T03:00:00+00:00",
+        "production": {
+            "biomass": 1972.0,
+            "coal": 504.0,
+            "gas": 10237.0,
+            "hydro": 475.0,
+            "nuclear": 5627.0,
+            "oil": 4.0,
+            "solar": 152.0,
+            "unknown": 293.0,
+            "wind": 13445.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T03:30:00+00:00",
+        "production": {
+            "biomass": 2024.0,
+            "coal": 462.0,
+            "gas": 10289.0,
+            "hydro": 436.0,
+            "nuclear": 5661.0,
+            "oil": 0.0,
+            "solar": 137.0,
+            "unknown": 312.0,
+            "wind": 13516.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -849.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T04:00:00+00:00",
+        "production": {
+            "biomass": 2025.0,
+            "coal": 511.0,
+            "gas": 10361.0,
+            "hydro": 453.0,
+            "nuclear": 5681.0,
+            "oil": 0.0,
+            "solar": 173.0,
+            "unknown": 267.0,
+            "wind": 13763.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -243.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T04:30:00+00:00",
+        "production": {
+            "biomass": 2022.0,
+            "coal": 497.0,
+            "gas": 10430.0,
+            "hydro": 481.0,
+            "nuclear": 5681.0,
+            "oil": 0.0,
+            "solar": 151.0,
+            "unknown": 282.0,
+            "wind": 13739.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T05:00:00+00:00",
+        "production": {
+            "biomass": 2020.0,
+            "coal": 522.0,
+            "gas": 10459.0,
+            "hydro": 480.0,
+            "nuclear": 5705.0,
+            "oil": 22.0,
+            "solar": 144.0,
+            "unknown": 298.0,
+            "wind": 13702.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T05:30:00+00:00",
+        "production": {
+            "biomass": 2017.0,
+            "coal": 469.0,
+            "gas": 10437.0,
+            "hydro": 465.0,
+            "nuclear": 5696.0,
+            "oil": 14.0,
+            "solar": 175.0,
+            "unknown": 263.0,
+            "wind": 13823.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T06:00:00+00:00",
+        "production": {
+            "biomass": 2027.0,
+            "coal": 497.0,
+            "gas": 10451.0,
+            "hydro": 448.0,
+            "nuclear": 5729.0,
+            "oil": 14.0,
+            "solar": 181.0,
+            "unknown": 312.0,
+            "wind": 13873.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T06:30:00+00:00",
+        "production": {
+            "biomass": 2007.0,
+            "coal": 496.0,
+            "gas": 10444.0,
+            "hydro": 445.0,
+            "nuclear": 5697.0,
+            "oil": 0.0,
+            "solar": 146.0,
+            "unknown": 275.0,
+            "wind": 13764.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -170.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T07:00:00+00:00",
+        "production": {
+            "biomass": 2053.0,
+            "coal": 500.0,
+            "gas": 10399.0,
+            "hydro": 465.0,
+            "nuclear": 5685.0,
+            "oil": 0.0,
+            "solar": 187.0,
+            "unknown": 287.0,
+            "wind": 13703.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T07:30:00+00:00",
+        "production": {
+            "biomass": 2008.0,
+            "coal": 475.0,
+            "gas": 10343.0,
+            "hydro": 459.0,
+            "nuclear": 5682.0,
+            "oil": 18.0,
+            "solar": 175.0,
+            "unknown": 270.0,
+            "wind": 13635.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T08:00:00+00:00",
+        "production": {
+            "biomass": 2030.0,
+            "coal": 485.0,
+            "gas": 10338.0,
+            "hydro": 445.0,
+            "nuclear": 5634.0,
+            "oil": 12.0,
+            "solar": 160.0,
+            "unknown": 277.0,
+            "wind": 13605.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T08:30:00+00:00",
+        "production": {
+            "biomass": 1977.0,
+            "coal": 475.0,
+            "gas": 10253.0,
+            "hydro": 442.0,
+            "nuclear": 5627.0,
+            "oil": 12.0,
+            "solar": 511.0,
+            "unknown": 299.0,
+            "wind": 13547.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T09:00:00+00:00",
+        "production": {
+            "biomass": 1959.0,
+            "coal": 452.0,
+            "gas": 10143.0,
+            "hydro": 426.0,
+            "nuclear": 5540.0,
+            "oil": 30.0,
+            "solar": 858.0,
+            "unknown": 304.0,
+            "wind": 13464.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -453.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T09:30:00+00:00",
+        "production": {
+            "biomass": 1943.0,
+            "coal": 470.0,
+            "gas": 10070.0,
+            "hydro": 451.0,
+            "nuclear": 5486.0,
+            "oil": 23.0,
+            "solar": 1180.0,
+            "unknown": 248.0,
+            "wind": 13338.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T10:00:00+00:00",
+        "production": {
+            "biomass": 1944.0,
+            "coal": 453.0,
+            "gas": 9941.0,
+            "hydro": 469.0,
+            "nuclear": 5471.0,
+            "oil": 0.0,
+            "solar": 1441.0,
+            "unknown": 249.0,
+            "wind": 13291.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T10:30:00+00:00",
+        "production": {
+            "biomass": 1935.0,
+            "coal": 485.0,
+            "gas": 9908.0,
+            "hydro": 439.0,
+            "nuclear": 5371.0,
+            "oil": 24.0,
+            "solar": 1631.0,
+            "unknown": 292.0,
+            "wind": 13134.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T11:00:00+00:00",
+        "production": {
+            "biomass": 1926.0,
+            "coal": 457.0,
+            "gas": 9752.0,
+            "hydro": 435.0,
+            "nuclear": 5338.0,
+            "oil": 2.0,
+            "solar": 1828.0,
+            "unknown": 286.0,
+            "wind": 12937.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -830.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T11:30:00+00:00",
+        "production": {
+            "biomass": 1898.0,
+            "coal": 437.0,
+            "gas": 9662.0,
+            "hydro": 403.0,
+            "nuclear": 5303.0,
+            "oil": 26.0,
+            "solar": 1935.0,
+            "unknown": 260.0,
+            "wind": 12743.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T12:00:00+00:00",
+        "production": {
+            "biomass": 1824.0,
+            "coal": 477.0,
+            "gas": 9525.0,
+            "hydro": 405.0,
+            "nuclear": 5233.0,
+            "oil": 26.0,
+            "solar": 1934.0,
+            "unknown": 269.0,
+            "wind": 12721.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1196.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T12:30:00+00:00",
+        "production": {
+            "biomass": 1818.0,
+            "coal": 443.0,
+            "gas": 9414.0,
+            "hydro": 405.0,
+            "nuclear": 5168.0,
+            "oil": 29.0,
+            "solar": 1884.0,
+            "unknown": 287.0,
+            "wind": 12629.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T13:00:00+00:00",
+        "production": {
+            "biomass": 1796.0,
+            "coal": 447.0,
+            "gas": 9253.0,
+            "hydro": 394.0,
+            "nuclear": 5107.0,
+            "oil": 7.0,
+            "solar": 1794.0,
+            "unknown": 226.0,
+            "wind": 12479.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T13:30:00+00:00",
+        "production": {
+            "biomass": 1764.0,
+            "coal": 456.0,
+            "gas": 9154.0,
+            "hydro": 431.0,
+            "nuclear": 5046.0,
+            "oil": 0.0,
+            "solar": 1665.0,
+            "unknown": 258.0,
+            "wind": 12433.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T14:00:00+00:00",
+        "production": {
+            "biomass": 1765.0,
+            "coal": 432.0,
+            "gas": 9060.0,
+            "hydro": 385.0,
+            "nuclear": 4969.0,
+            "oil": 6.0,
+            "solar": 1419.0,
+            "unknown": 244.0,
+            "wind": 12204.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T14:30:00+00:00",
+        "production": {
+            "biomass": 1730.0,
+            "coal": 423.0,
+            "gas": 8950.0,
+            "hydro": 425.0,
+            "nuclear": 4921.0,
+            "oil": 7.0,
+            "solar": 1126.0,
+            "unknown": 235.0,
+            "wind": 12076.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T15:00:00+00:00",
+        "production": {
+            "biomass": 1737.0,
+            "coal": 436.0,
+            "gas": 8874.0,
+            "hydro": 371.0,
+            "nuclear": 4822.0,
+            "oil": 0.0,
+            "solar": 830.0,
+            "unknown": 228.0,
+            "wind": 12072.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T15:30:00+00:00",
+        "production": {
+            "biomass": 1705.0,
+            "coal": 409.0,
+            "gas": 8781.0,
+            "hydro": 398.0,
+            "nuclear": 4806.0,
+            "oil": 0.0,
+            "solar": 477.0,
+            "unknown": 226.0,
+            "wind": 11939.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T16:00:00+00:00",
+        "production": {
+            "biomass": 1697.0,
+            "coal": 414.0,
+            "gas": 8686.0,
+            "hydro": 399.0,
+            "nuclear": 4783.0,
+            "oil": 0.0,
+            "solar": 113.0,
+            "unknown": 217.0,
+            "wind": 11685.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T16:30:00+00:00",
+        "production": {
+            "biomass": 1661.0,
+            "coal": 407.0,
+            "gas": 8696.0,
+            "hydro": 397.0,
+            "nuclear": 4760.0,
+            "oil": 0.0,
+            "solar": 135.0,
+            "unknown": 225.0,
+            "wind": 11688.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1404.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T17:00:00+00:00",
+        "production": {
+            "biomass": 1684.0,
+            "coal": 426.0,
+            "gas": 8609.0,
+            "hydro": 398.0,
+            "nuclear": 4711.0,
+            "oil": 14.0,
+            "solar": 165.0,
+            "unknown": 221.0,
+            "wind": 11676.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T17:30:00+00:00",
+        "production": {
+            "biomass": 1697.0,
+            "coal": 412.0,
+            "gas": 8554.0,
+            "hydro": 363.0,
+            "nuclear": 4699.0,
+            "oil": 0.0,
+            "solar": 139.0,
+            "unknown": 210.0,
+            "wind": 11709.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T18:00:00+00:00",
+        "production": {
+            "biomass": 1637.0,
+            "coal": 395.0,
+            "gas": 8539.0,
+            "hydro": 397.0,
+            "nuclear": 4661.0,
+            "oil": 4.0,
+            "solar": 146.0,
+            "unknown": 235.0,
+            "wind": 11601.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -912.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T18:30:00+00:00",
+        "production": {
+            "biomass": 1642.0,
+            "coal": 377.0,
+            "gas": 8572.0,
+            "hydro": 369.0,
+            "nuclear": 4671.0,
+            "oil": 0.0,
+            "solar": 105.0,
+            "unknown": 256.0,
+            "wind": 11612.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -844.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T19:00:00+00:00",
+        "production": {
+            "biomass": 1660.0,
+            "coal": 435.0,
+            "gas": 8581.0,
+            "hydro": 393.0,
+            "nuclear": 4711.0,
+            "oil": 15.0,
+            "solar": 164.0,
+            "unknown": 210.0,
+            "wind": 11574.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T19:30:00+00:00",
+        "production": {
+            "biomass": 1702.0,
+            "coal": 378.0,
+            "gas": 8571.0,
+            "hydro": 357.0,
+            "nuclear": 4703.0,
+            "oil": 1.0,
+            "solar": 113.0,
+            "unknown": 234.0,
+            "wind": 11676.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T20:00:00+00:00",
+        "production": {
+            "biomass": 1676.0,
+            "coal": 401.0,
+            "gas": 8620.0,
+            "hydro": 366.0,
+            "nuclear": 4717.0,
+            "oil": 0.0,
+            "solar": 158.0,
+            "unknown": 228.0,
+            "wind": 11757.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T20:30:00+00:00",
+        "production": {
+            "biomass": 1703.0,
+            "coal": 414.0,
+            "gas": 8713.0,
+            "hydro": 404.0,
+            "nuclear": 4759.0,
+            "oil": 18.0,
+            "solar": 162.0,
+            "unknown": 262.0,
+            "wind": 11743.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1464.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T21:00:00+00:00",
+        "production": {
+            "biomass": 1714.0,
+            "coal": 417.0,
+            "gas": 8780.0,
+            "hydro": 365.0,
+            "nuclear": 4797.0,
+            "oil": 0.0,
+            "solar": 134.0,
+            "unknown": 253.0,
+            "wind": 11819.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T21:30:00+00:00",
+        "production": {
+            "biomass": 1717.0,
+            "coal": 417.0,
+            "gas": 8824.0,
+            "hydro": 393.0,
+            "nuclear": 4853.0,
+            "oil": 24.0,
+            "solar": 163.0,
+            "unknown": 238.0,
+            "wind": 11832.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -913.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T22:00:00+00:00",
+        "production": {
+            "biomass": 1751.0,
+            "coal": 451.0,
+            "gas": 8896.0,
+            "hydro": 392.0,
+            "nuclear": 4893.0,
+            "oil": 27.0,
+            "solar": 151.0,
+            "unknown": 227.0,
+            "wind": 12064.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T22:30:00+00:00",
+        "production": {
+            "biomass": 1782.0,
+            "coal": 453.0,
+            "gas": 9026.0,
+            "hydro": 391.0,
+            "nuclear": 4958.0,
+            "oil": 0.0,
+            "solar": 132.0,
+            "unknown": 271.0,
+            "wind": 12215.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T23:00:00+00:00",
+        "production": {
+            "biomass": 1775.0,
+            "coal": 455.0,
+            "gas": 9130.0,
+            "hydro": 378.0,
+            "nuclear": 4994.0,
+            "oil": 13.0,
+            "solar": 116.0,
+            "unknown": 230.0,
+            "wind": 12152.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-09T23:30:00+00:00",
+        "production": {
+            "biomass": 1814.0,
+            "coal": 420.0,
+            "gas": 9205.0,
+            "hydro": 436.0,
+            "nuclear": 5037.0,
+            "oil": 0.0,
+            "solar": 119.0,
+            "unknown": 264.0,
+            "wind": 12355.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1127.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T00:00:00+00:00",
+        "production": {
+            "biomass": 1883.0,
+            "coal": 454.0,
+            "gas": 9623.0,
+            "hydro": 406.0,
+            "nuclear": 5245.0,
+            "oil": 20.0,
+            "solar": 135.0,
+            "unknown": 292.0,
+            "wind": 12888.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T00:30:00+00:00",
+        "production": {
+            "biomass": 1914.0,
+            "coal": 478.0,
+            "gas": 9767.0,
+            "hydro": 453.0,
+            "nuclear": 5301.0,
+            "oil": 0.0,
+            "solar": 133.0,
+            "unknown": 258.0,
+            "wind": 12905.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1119.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T01:00:00+00:00",
+        "production": {
+            "biomass": 1900.0,
+            "coal": 477.0,
+            "gas": 9879.0,
+            "hydro": 449.0,
+            "nuclear": 5361.0,
+            "oil": 1.0,
+            "solar": 167.0,
+            "unknown": 253.0,
+            "wind": 13153.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T01:30:00+00:00",
+        "production": {
+            "biomass": 1936.0,
+            "coal": 466.0,
+            "gas": 9933.0,
+            "hydro": 467.0,
+            "nuclear": 5432.0,
+            "oil": 0.0,
+            "solar": 132.0,
+            "unknown": 260.0,
+            "wind": 13156.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T02:00:00+00:00",
+        "production": {
+            "biomass": 1940.0,
+            "coal": 481.0,
+            "gas": 10075.0,
+            "hydro": 441.0,
+            "nuclear": 5514.0,
+            "oil": 27.0,
+            "solar": 160.0,
+            "unknown": 304.0,
+            "wind": 13401.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -321.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T02:30:00+00:00",
+        "production": {
+            "biomass": 1971.0,
+            "coal": 488.0,
+            "gas": 10178.0,
+            "hydro": 455.0,
+            "nuclear": 5545.0,
+            "oil": 30.0,
+            "solar": 141.0,
+            "unknown": 261.0,
+            "wind": 13351.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T03:00:00+00:00",
+        "production": {
+            "biomass": 2016.0,
+            "coal": 510.0,
+            "gas": 10249.0,
+            "hydro": 441.0,
+            "nuclear": 5574.0,
+            "oil": 0.0,
+            "solar": 183.0,
+            "unknown": 251.0,
+            "wind": 13592.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T03:30:00+00:00",
+        "production": {
+            "biomass": 1996.0,
+            "coal": 512.0,
+            "gas": 10312.0,
+            "hydro": 460.0,
+            "nuclear": 5648.0,
+            "oil": 0.0,
+            "solar": 184.0,
+            "unknown": 284.0,
+            "wind": 13648.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1042.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T04:00:00+00:00",
+        "production": {
+            "biomass": 1996.0,
+            "coal": 483.0,
+            "gas": 10383.0,
+            "hydro": 483.0,
+            "nuclear": 5692.0,
+            "oil": 26.0,
+            "solar": 164.0,
+            "unknown": 254.0,
+            "wind": 13792.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T04:30:00+00:00",
+        "production": {
+            "biomass": 2030.0,
+            "coal": 484.0,
+            "gas": 10428.0,
+            "hydro": 488.0,
+            "nuclear": 5710.0,
+            "oil": 0.0,
+            "solar": 147.0,
+            "unknown": 304.0,
+            "wind": 13704.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T05:00:00+00:00",
+        "production": {
+            "biomass": 2035.0,
+            "coal": 521.0,
+            "gas": 10418.0,
+            "hydro": 471.0,
+            "nuclear": 5698.0,
+            "oil": 5.0,
+            "solar": 165.0,
+            "unknown": 279.0,
+            "wind": 13750.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T05:30:00+00:00",
+        "production": {
+            "biomass": 2063.0,
+            "coal": 476.0,
+            "gas": 10465.0,
+            "hydro": 471.0,
+            "nuclear": 5722.0,
+            "oil": 15.0,
+            "solar": 193.0,
+            "unknown": 292.0,
+            "wind": 13712.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -621.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T06:00:00+00:00",
+        "production": {
+            "biomass": 2031.0,
+            "coal": 490.0,
+            "gas": 10430.0,
+            "hydro": 443.0,
+            "nuclear": 5696.0,
+            "oil": 10.0,
+            "solar": 148.0,
+            "unknown": 271.0,
+            "wind": 13850.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T06:30:00+00:00",
+        "production": {
+            "biomass": 2037.0,
+            "coal": 521.0,
+            "gas": 10443.0,
+            "hydro": 479.0,
+            "nuclear": 5686.0,
+            "oil": 8.0,
+            "solar": 178.0,
+            "unknown": 272.0,
+            "wind": 13858.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1316.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T07:00:00+00:00",
+        "production": {
+            "biomass": 2028.0,
+            "coal": 494.0,
+            "gas": 10434.0,
+            "hydro": 481.0,
+            "nuclear": 5672.0,
+            "oil": 0.0,
+            "solar": 141.0,
+            "unknown": 276.0,
+            "wind": 13852.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1324.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T07:30:00+00:00",
+        "production": {
+            "biomass": 2034.0,
+            "coal": 493.0,
+            "gas": 10365.0,
+            "hydro": 457.0,
+            "nuclear": 5647.0,
+            "oil": 0.0,
+            "solar": 136.0,
+            "unknown": 301.0,
+            "wind": 13663.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T08:00:00+00:00",
+        "production": {
+            "biomass": 2014.0,
+            "coal": 517.0,
+            "gas": 10308.0,
+            "hydro": 442.0,
+            "nuclear": 5634.0,
+            "oil": 0.0,
+            "solar": 146.0,
+            "unknown": 283.0,
+            "wind": 13641.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T08:30:00+00:00",
+        "production": {
+            "biomass": 2012.0,
+            "coal": 480.0,
+            "gas": 10227.0,
+            "hydro": 455.0,
+            "nuclear": 5606.0,
+            "oil": 25.0,
+            "solar": 527.0,
+            "unknown": 307.0,
+            "wind": 13559.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T09:00:00+00:00",
+        "production": {
+            "biomass": 1996.0,
+            "coal": 486.0,
+            "gas": 10178.0,
+            "hydro": 435.0,
+            "nuclear": 5545.0,
+            "oil": 10.0,
+            "solar": 859.0,
+            "unknown": 252.0,
+            "wind": 13506.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T09:30:00+00:00",
+        "production": {
+            "biomass": 1952.0,
+            "coal": 447.0,
+            "gas": 10087.0,
+            "hydro": 431.0,
+            "nuclear": 5499.0,
+            "oil": 15.0,
+            "solar": 1182.0,
+            "unknown": 258.0,
+            "wind": 13263.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1356.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T10:00:00+00:00",
+        "production": {
+            "biomass": 1931.0,
+            "coal": 446.0,
+            "gas": 9960.0,
+            "hydro": 435.0,
+            "nuclear": 5441.0,
+            "oil": 0.0,
+            "solar": 1445.0,
+            "unknown": 274.0,
+            "wind": 13343.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -606.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T10:30:00+00:00",
+        "production": {
+            "biomass": 1895.0,
+            "coal": 440.0,
+            "gas": 9847.0,
+            "hydro": 442.0,
+            "nuclear": 5414.0,
+            "oil": 9.0,
+            "solar": 1670.0,
+            "unknown": 287.0,
+            "wind": 13095.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T11:00:00+00:00",
+        "production": {
+            "biomass": 1873.0,
+            "coal": 464.0,
+            "gas": 9759.0,
+            "hydro": 430.0,
+            "nuclear": 5314.0,
+            "oil": 0.0,
+            "solar": 1812.0,
+            "unknown": 268.0,
+            "wind": 12999.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T11:30:00+00:00",
+        "production": {
+            "biomass": 1882.0,
+            "coal": 439.0,
+            "gas": 9635.0,
+            "hydro": 417.0,
+            "nuclear": 5281.0,
+            "oil": 1.0,
+            "solar": 1933.0,
+            "unknown": 235.0,
+            "wind": 12794.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T12:00:00+00:00",
+        "production": {
+            "biomass": 1882.0,
+            "coal": 455.0,
+            "gas": 9544.0,
+            "hydro": 440.0,
+            "nuclear": 5210.0,
+            "oil": 19.0,
+            "solar": 1959.0,
+            "unknown": 252.0,
+            "wind": 12633.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T12:30:00+00:00",
+        "production": {
+            "biomass": 1855.0,
+            "coal": 440.0,
+            "gas": 9369.0,
+            "hydro": 444.0,
+            "nuclear": 5115.0,
+            "oil": 0.0,
+            "solar": 1904.0,
+            "unknown": 269.0,
+            "wind": 12541.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T13:00:00+00:00",
+        "production": {
+            "biomass": 1807.0,
+            "coal": 431.0,
+            "gas": 9296.0,
+            "hydro": 408.0,
+            "nuclear": 5081.0,
+            "oil": 0.0,
+            "solar": 1788.0,
+            "unknown": 270.0,
+            "wind": 12469.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T13:30:00+00:00",
+        "production": {
+            "biomass": 1809.0,
+            "coal": 454.0,
+            "gas": 9172.0,
+            "hydro": 395.0,
+            "nuclear": 5021.0,
+            "oil": 11.0,
+            "solar": 1672.0,
+            "unknown": 249.0,
+            "wind": 12361.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T14:00:00+00:00",
+        "production": {
+            "biomass": 1774.0,
+            "coal": 404.0,
+            "gas": 9078.0,
+            "hydro": 403.0,
+            "nuclear": 4973.0,
+            "oil": 0.0,
+            "solar": 1405.0,
+            "unknown": 254.0,
+            "wind": 12239.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T14:30:00+00:00",
+        "production": {
+            "biomass": 1723.0,
+            "coal": 410.0,
+            "gas": 8952.0,
+            "hydro": 386.0,
+            "nuclear": 4895.0,
+            "oil": 6.0,
+            "solar": 1129.0,
+            "unknown": 251.0,
+            "wind": 12073.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T15:00:00+00:00",
+        "production": {
+            "biomass": 1756.0,
+            "coal": 440.0,
+            "gas": 8845.0,
+            "hydro": 410.0,
+            "nuclear": 4824.0,
+            "oil": 0.0,
+            "solar": 855.0,
+            "unknown": 247.0,
+            "wind": 12019.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -787.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T15:30:00+00:00",
+        "production": {
+            "biomass": 1701.0,
+            "coal": 398.0,
+            "gas": 8797.0,
+            "hydro": 407.0,
+            "nuclear": 4836.0,
+            "oil": 0.0,
+            "solar": 484.0,
+            "unknown": 233.0,
+            "wind": 11840.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -731.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T16:00:00+00:00",
+        "production": {
+            "biomass": 1670.0,
+            "coal": 396.0,
+            "gas": 8694.0,
+            "hydro": 400.0,
+            "nuclear": 4760.0,
+            "oil": 0.0,
+            "solar": 167.0,
+            "unknown": 225.0,
+            "wind": 11833.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T16:30:00+00:00",
+        "production": {
+            "biomass": 1677.0,
+            "coal": 436.0,
+            "gas": 8710.0,
+            "hydro": 398.0,
+            "nuclear": 4737.0,
+            "oil": 0.0,
+            "solar": 117.0,
+            "unknown": 208.0,
+            "wind": 11670.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T17:00:00+00:00",
+        "production": {
+            "biomass": 1661.0,
+            "coal": 406.0,
+            "gas": 8651.0,
+            "hydro": 381.0,
+            "nuclear": 4688.0,
+            "oil": 19.0,
+            "solar": 106.0,
+            "unknown": 208.0,
+            "wind": 11640.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T17:30:00+00:00",
+        "production": {
+            "biomass": 1655.0,
+            "coal": 385.0,
+            "gas": 8588.0,
+            "hydro": 350.0,
+            "nuclear": 4687.0,
+            "oil": 0.0,
+            "solar": 138.0,
+            "unknown": 254.0,
+            "wind": 11529.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T18:00:00+00:00",
+        "production": {
+            "biomass": 1691.0,
+            "coal": 428.0,
+            "gas": 8558.0,
+            "hydro": 351.0,
+            "nuclear": 4653.0,
+            "oil": 0.0,
+            "solar": 140.0,
+            "unknown": 220.0,
+            "wind": 11581.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T18:30:00+00:00",
+        "production": {
+            "biomass": 1636.0,
+            "coal": 404.0,
+            "gas": 8571.0,
+            "hydro": 381.0,
+            "nuclear": 4671.0,
+            "oil": 0.0,
+            "solar": 128.0,
+            "unknown": 204.0,
+            "wind": 11570.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -812.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T19:00:00+00:00",
+        "production": {
+            "biomass": 1697.0,
+            "coal": 409.0,
+            "gas": 8565.0,
+            "hydro": 379.0,
+            "nuclear": 4711.0,
+            "oil": 0.0,
+            "solar": 113.0,
+            "unknown": 234.0,
+            "wind": 11713.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T19:30:00+00:00",
+        "production": {
+            "biomass": 1669.0,
+            "coal": 408.0,
+            "gas": 8562.0,
+            "hydro": 396.0,
+            "nuclear": 4707.0,
+            "oil": 5.0,
+            "solar": 153.0,
+            "unknown": 259.0,
+            "wind": 11733.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T20:00:00+00:00",
+        "production": {
+            "biomass": 1702.0,
+            "coal": 391.0,
+            "gas": 8647.0,
+            "hydro": 386.0,
+            "nuclear": 4697.0,
+            "oil": 23.0,
+            "solar": 107.0,
+            "unknown": 230.0,
+            "wind": 11676.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T20:30:00+00:00",
+        "production": {
+            "biomass": 1689.0,
+            "coal": 406.0,
+            "gas": 8691.0,
+            "hydro": 371.0,
+            "nuclear": 4762.0,
+            "oil": 19.0,
+            "solar": 109.0,
+            "unknown": 220.0,
+            "wind": 11825.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T21:00:00+00:00",
+        "production": {
+            "biomass": 1697.0,
+            "coal": 387.0,
+            "gas": 8791.0,
+            "hydro": 363.0,
+            "nuclear": 4793.0,
+            "oil": 0.0,
+            "solar": 150.0,
+            "unknown": 265.0,
+            "wind": 11810.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T21:30:00+00:00",
+        "production": {
+            "biomass": 1722.0,
+            "coal": 444.0,
+            "gas": 8855.0,
+            "hydro": 417.0,
+            "nuclear": 4809.0,
+            "oil": 29.0,
+            "solar": 160.0,
+            "unknown": 256.0,
+            "wind": 11972.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T22:00:00+00:00",
+        "production": {
+            "biomass": 1717.0,
+            "coal": 444.0,
+            "gas": 8906.0,
+            "hydro": 412.0,
+            "nuclear": 4902.0,
+            "oil": 23.0,
+            "solar": 159.0,
+            "unknown": 272.0,
+            "wind": 12119.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T22:30:00+00:00",
+        "production": {
+            "biomass": 1758.0,
+            "coal": 429.0,
+            "gas": 9038.0,
+            "hydro": 375.0,
+            "nuclear": 4941.0,
+            "oil": 0.0,
+            "solar": 156.0,
+            "unknown": 244.0,
+            "wind": 12148.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1401.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T23:00:00+00:00",
+        "production": {
+            "biomass": 1762.0,
+            "coal": 432.0,
+            "gas": 9139.0,
+            "hydro": 421.0,
+            "nuclear": 5023.0,
+            "oil": 1.0,
+            "solar": 138.0,
+            "unknown": 220.0,
+            "wind": 12308.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": 0.0},
+        "zoneKey": "GB",
+    },
+    {
+        "correctedModes": [],
+        "datetime": "2023-01-10T23:30:00+00:00",
+        "production": {
+            "biomass": 1772.0,
+            "coal": 466.0,
+            "gas": 9260.0,
+            "hydro": 424.0,
+            "nuclear": 5027.0,
+            "oil": 27.0,
+            "solar": 169.0,
+            "unknown": 275.0,
+            "wind": 12307.0,
+        },
+        "source": "bmreports.com",
+        "sourceType": "measured",
+        "storage": {"hydro": -1113.0},
+        "zoneKey": "GB",
+    },
+]
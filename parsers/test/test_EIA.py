@@ -1,8 +1,10 @@
 import json
 import os
+import tempfile
 import unittest
 from datetime import datetime, timezone
 from importlib import resources
+from pathlib import Path
 
 from requests import Session
 from requests_mock import ANY, GET, Adapter
@@ -10,6 +12,7 @@ from requests_mock import ANY, GET, Adapter
 from electricitymap.contrib.lib.models.events import EventSourceType
 from electricitymap.contrib.lib.types import ZoneKey
 from parsers import EIA
+from parsers.lib.session import SQLiteResponseCache, mount_response_cache
 
 
 class TestEIA(unittest.TestCase):
@@ -379,6 +382,74 @@ class TestEIAProduction(TestEIA):
         )
         self.check_production_matches(data_list, expected)
 
+    def test_fetch_production_mix_past_uses_a_single_query(self):
+        def datapoint(respondent, fueltype, value):
+            return {
+                "period": "2022-10-31T12",
+                "respondent": respondent,
+                "fueltype": fueltype,
+                "value": value,
+            }
+
+        self.adapter.register_uri(
+            GET,
+            ANY,
+            json={
+                "response": {
+                    "data": [
+                        datapoint("PACW", "NG", 300),
+                        datapoint("AVRN", "NG", 30),
+                        datapoint("PACW", "WND", 10),
+                        # Only the gas production of AVRN is transferred to PACW.
+                        datapoint("AVRN", "WND", 99),
+                    ]
+                }
+            },
+        )
+        data_list = EIA.fetch_production_mix(
+            ZoneKey("US-NW-PACW"),
+            self.session,
+            target_datetime=datetime(2022, 10, 31, 11, tzinfo=timezone.utc),
+        )
+        self.assertEqual(self.adapter.call_count, 1)
+        query = self.adapter.last_request.qs
+        self.assertEqual(query["facets[respondent][]"], ["pacw", "avrn"])
+        self.assertEqual(len(query["facets[fueltype][]"]), len(EIA.TYPES))
+        self.check_production_matches(
+            data_list,
+            [
+                {
+                    "zoneKey": "US-NW-PACW",
+                    "source": "eia.gov",
+                    "production": {"gas": 330, "wind": 10},
+                    "storage": {},
+                }
+            ],
+        )
+
+    def test_fetch_production_mix_reuses_cached_responses(self):
+        self.adapter.register_uri(
+            GET,
+            ANY,
+            json=json.loads(
+                resources.files("parsers.test.mocks.EIA")
+                .joinpath("US_NW_AVRN-wind.json")
+                .read_text()
+            ),
+        )
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        mount_response_cache(
+            self.session,
+            "EIA",
+            cache=SQLiteResponseCache(Path(tmp_dir.name, "cache.sqlite")),
+        )
+        first = EIA.fetch_production_mix(ZoneKey("US-NW-PGE"), self.session)
+        self.assertEqual(self.adapter.call_count, len(EIA.TYPES))
+        second = EIA.fetch_production_mix(ZoneKey("US-NW-PGE"), self.session)
+        self.assertEqual(self.adapter.call_count, len(EIA.TYPES))
+        self.assertEqual(first, second)
+
 
 class TestEIAExchanges(TestEIA):
     def test_fetch_exchange(self):
@@ -483,5 +554,144 @@ class TestEIAConsumption(TestEIA):
             self.assertEqual(data["sourceType"], EventSourceType.forecasted)
 
 
+class TestEIABulk(TestEIA):
+    target_datetime = datetime(2023, 5, 1, 10, tzinfo=timezone.utc)
+
+    def test_fetch_consumption_bulk_follows_pagination(self):
+        def datapoint(respondent, period, value):
+            return {
+                "period": period,
+                "respondent": respondent,
+                "type": "D",
+                "value": value,
+            }
+
+        self.adapter.register_uri(
+            GET,
+            ANY,
+            [
+                {
+                    "json": {
+                        "response": {
+                            "total": "3",
+                            "data": [
+                                datapoint("BPAT", "2023-05-01T10", 4792),
+                                datapoint("CISO", "2023-05-01T10", 20000),
+                            ],
+                        }
+                    }
+                },
+                {
+                    "json": {
+                        "response": {
+                            "total": "3",
+                            "data": [datapoint("BPAT", "2023-05-01T11", 6215)],
+                        }
+                    }
+                },
+            ],
+        )
+        consumptions = EIA.fetch_consumption_bulk(
+            [ZoneKey("US-NW-BPAT"), ZoneKey("US-CAL-CISO")],
+            self.session,
+            target_datetime=self.target_datetime,
+        )
+        self.assertEqual(self.adapter.call_count, 2)
+        self.assertEqual(self.adapter.request_history[1].qs["offset"], ["2"])
+        self.assertEqual(
+            [event["consumption"] for event in consumptions["US-NW-BPAT"]],
+            [4792, 6215],
+        )
+        self.assertEqual(
+            [event["consumption"] for event in consumptions["US-CAL-CISO"]], [20000]
+        )
+
+    def test_fetch_consumption_bulk_ends_at_the_latest_period(self):
+        datapoint = {"period": "2023-04-29T10", "respondent": "CISO", "value": 20000}
+        self.adapter.register_uri(
+            GET, ANY, json={"response": {"total": "1", "data": [datapoint]}}
+        )
+        consumptions = EIA.fetch_consumption_bulk(
+            [ZoneKey("US-CAL-CISO")], self.session
+        )
+        self.assertEqual(self.adapter.call_count, 2)
+        latest_request, window_request = self.adapter.request_history
+        self.assertEqual(latest_request.qs["length"], ["1"])
+        self.assertEqual(latest_request.qs["sort[0][direction]"], ["desc"])
+        self.assertEqual(window_request.qs["start"], ["2023-04-28t10"])
+        self.assertEqual(window_request.qs["end"], ["2023-04-29t10"])
+        self.assertEqual(
+            [event["consumption"] for event in consumptions["US-CAL-CISO"]], [20000]
+        )
+
+    def test_fetch_production_mix_bulk_shared_respondent(self):
+        self.adapter.register_uri(
+            GET,
+            ANY,
+            json={
+                "response": {
+                    "total": 1,
+                    "data": [
+                        {
+                            "period": "2023-05-01T10",
+                            "respondent": "CFE",
+                            "fueltype": "NG",
+                            "value": 100,
+                        }
+                    ],
+                }
+            },
+        )
+        production_mixes = EIA.fetch_production_mix_bulk(
+            [ZoneKey("MX-BC"), ZoneKey("MX-NO")],
+            self.session,
+            target_datetime=self.target_datetime,
+        )
+        self.assertEqual(self.adapter.call_count, 1)
+        for zone_key in ["MX-BC", "MX-NO"]:
+            self.assertEqual(len(production_mixes[zone_key]), 1)
+            self.assertEqual(production_mixes[zone_key][0]["zoneKey"], zone_key)
+            self.assertEqual(production_mixes[zone_key][0]["production"]["gas"], 100)
+
+    def test_fetch_exchange_bulk_integrates_remapped_exchanges(self):
+        def datapoint(fromba, toba, value):
+            return {
+                "period": "2020-01-07T05",
+                "fromba": fromba,
+                "toba": toba,
+                "value": value,
+            }
+
+        self.adapter.register_uri(
+            GET,
+            ANY,
+            json={
+                "response": {
+                    "total": 3,
+                    "data": [
+                        datapoint("FPC", "FPL", 10),
+                        datapoint("FPC", "NSB", 5),
+                        datapoint("BPAT", "NWMT", 7),
+                    ],
+                }
+            },
+        )
+        exchanges = EIA.fetch_exchange_bulk(
+            ["US-FLA-FPC->US-FLA-FPL", "US-NW-BPAT->US-NW-NWMT"],
+            self.session,
+            target_datetime=self.target_datetime,
+        )
+        self.assertEqual(self.adapter.call_count, 1)
+        self.assertEqual(
+            set(self.adapter.last_request.qs["facets[fromba][]"]), {"fpc", "bpat"}
+        )
+        self.assertEqual(
+            [event["netFlow"] for event in exchanges["US-FLA-FPC->US-FLA-FPL"]], [15]
+        )
+        self.assertEqual(
+            [event["netFlow"] for event in exchanges["US-NW-BPAT->US-NW-NWMT"]], [7]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
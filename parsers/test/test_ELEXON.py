@@ -0,0 +1,151 @@
+import json
+import os
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from importlib import resources
+
+import pandas as pd
+from requests import Session
+from requests_mock import GET, Adapter
+
+from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
+from parsers import ELEXON
+
+
+def _read_mock(name: str) -> str:
+    return resources.files("parsers.test.mocks.ELEXON").joinpath(name).read_text()
+
+
+class TestSettlementPeriods(unittest.TestCase):
+    def test_datetimes_match_scalar_conversion(self):
+        dates = pd.Series(["2023-01-09"] * 48)
+        periods = pd.Series(range(1, 49))
+        datetimes = ELEXON.datetimes_from_date_sp(dates, periods, "%Y-%m-%d")
+        self.assertEqual(
+            datetimes.tolist(),
+            [ELEXON.datetime_from_date_sp(date(2023, 1, 9), sp) for sp in range(1, 49)],
+        )
+        self.assertEqual(datetimes[0], datetime(2023, 1, 9, 0, 0, tzinfo=timezone.utc))
+
+    def test_clock_change_days(self):
+        for settlement_date, n_periods in (("20230326", 46), ("20231029", 50)):
+            datetimes = ELEXON.datetimes_from_date_sp(
+                pd.Series([int(settlement_date)] * n_periods),
+                pd.Series(range(1, n_periods + 1)),
+                "%Y%m%d",
+            )
+            self.assertTrue((datetimes.diff()[1:] == timedelta(minutes=30)).all())
+            self.assertEqual(
+                ELEXON.datetime_from_date_sp(
+                    datetime.strptime(settlement_date, "%Y%m%d"), n_periods
+                ),
+                datetimes.iloc[-1],
+            )
+        # Clocks go forward at 01:00 UTC, the third period starts at 02:00 BST.
+        self.assertEqual(
+            ELEXON.datetime_from_date_sp(date(2023, 3, 26), 3),
+            datetime(2023, 3, 26, 1, 0, tzinfo=timezone.utc),
+        )
+
+
+class TestParseProduction(unittest.TestCase):
+    def test_parse_b1620(self):
+        production_breakdowns = ELEXON.parse_production(_read_mock("B1620.csv"))
+        self.assertIsInstance(production_breakdowns, ProductionBreakdownList)
+        data_points = production_breakdowns.to_list()
+        self.assertEqual(len(data_points), 48)
+        first = data_points[0]
+        self.assertEqual(first["zoneKey"], "GB")
+        self.assertEqual(first["source"], "bmreports.com")
+        self.assertEqual(
+            first["datetime"], datetime(2023, 1, 9, 0, 0, tzinfo=timezone.utc)
+        )
+        # Wind onshore and offshore are summed.
+        self.assertAlmostEqual(first["production"]["wind"], 2602.530 + 6274.272)
+        self.assertEqual(first["production"]["nuclear"], 4430.391)
+        # Pumped storage is negative when pumping in the report.
+        self.assertEqual(first["storage"], {"hydro": 262.359})
+        self.assertEqual(
+            data_points[-1]["datetime"],
+            datetime(2023, 1, 9, 23, 30, tzinfo=timezone.utc),
+        )
+
+    def test_parse_empty_b1620(self):
+        self.assertEqual(len(ELEXON.parse_production("")), 0)
+
+    def test_parse_unknown_resource_type(self):
+        csv_text = _read_mock("B1620.csv").replace(",Biomass,", ",Fusion,")
+        with self.assertRaises(ELEXON.ParserException):
+            ELEXON.parse_production(csv_text)
+
+
+def _fetch_mocked_production() -> list[dict]:
+    os.environ["ELEXON_TOKEN"] = "token"
+    session = Session()
+    adapter = Adapter()
+    session.mount("https://", adapter)
+    adapter.register_uri(
+        GET,
+        ELEXON.ELEXON_ENDPOINT.format("FUELINST"),
+        text=_read_mock("FUELINST.csv"),
+    )
+    adapter.register_uri(
+        GET,
+        "https://data.nationalgrideso.com/demand/historic-demand-data/datapackage.json",
+        json={
+            "resources": [{"name": "historic_demand_data_2023", "id": "historic-2023"}]
+        },
+    )
+    adapter.register_uri(
+        GET,
+        ELEXON.ESO_NATIONAL_GRID_ENDPOINT,
+        json=json.loads(_read_mock("eso_demand_data_update.json")),
+    )
+    return ELEXON.fetch_production(
+        session=session,
+        target_datetime=datetime(2023, 1, 10, 12, tzinfo=timezone.utc),
+    )
+
+
+def test_fetch_production_snapshot(snapshot):
+    snapshot.assert_match(
+        [
+            {
+                "datetime": element["datetime"].isoformat(),
+                "production": element["production"],
+                "storage": element["storage"],
+                "source": element["source"],
+                "zoneKey": element["zoneKey"],
+                "sourceType": element["sourceType"].value,
+                "correctedModes": sorted(element["correctedModes"]),
+            }
+            for element in _fetch_mocked_production()
+        ]
+    )
+
+
+class TestFetchProduction(unittest.TestCase):
+    def test_fetch_production(self):
+        data = _fetch_mocked_production()
+        self.assertEqual(len(data), 96)
+        first = data[0]
+        self.assertEqual(
+            first["datetime"], datetime(2023, 1, 9, 0, 0, tzinfo=timezone.utc)
+        )
+        # The last spot time of the settlement period is used, with the embedded
+        # generation reported by ESO added to it.
+        self.assertEqual(
+            first["production"],
+            {
+                "biomass": 1894,
+                "coal": 446,
+                "gas": 9652,
+                "hydro": 427,
+                "nuclear": 5293,
+                "oil": 0,
+                "solar": 151,
+                "unknown": 276,
+                "wind": 12945,
+            },
+        )
+        self.assertEqual(first["storage"], {"hydro": 0})
@@ -2,6 +2,7 @@ import logging
 import os
 import unittest
 from datetime import datetime, timezone
+from threading import Barrier
 from unittest import mock
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from requests_mock import ANY, GET, Adapter
 
 from electricitymap.contrib.lib.types import ZoneKey
 from parsers import ENTSOE
+from parsers.lib.exceptions import ParserException
 
 
 class TestENTSOE(unittest.TestCase):
@@ -105,6 +107,32 @@ class TestFetchProduction(TestENTSOE):
             self.assertEqual(production[-1]["production"]["coal"], 111 + 124)
             self.assertEqual(production[-1]["production"]["gas"], 198)
 
+    def test_fetch_production_aggregated_zone(self):
+        with open(
+            "parsers/test/mocks/ENTSOE/FI_production.xml", "rb"
+        ) as production_fi_data:
+            self.adapter.register_uri(
+                GET,
+                ANY,
+                content=production_fi_data.read(),
+            )
+            production = ENTSOE.fetch_production(ZoneKey("IT-SO"), self.session)
+            # Both sub zones have been queried and their production summed up.
+            self.assertEqual(
+                sorted(
+                    request.qs["in_domain"][0]
+                    for request in self.adapter.request_history
+                ),
+                sorted(
+                    ENTSOE.ENTSOE_DOMAIN_MAPPINGS[zone_key].lower()
+                    for zone_key in ENTSOE.ZONE_KEY_AGGREGATES["IT-SO"]
+                ),
+            )
+            self.assertEqual(len(production), 48)
+            self.assertEqual(production[0]["zoneKey"], "IT-SO")
+            self.assertEqual(production[0]["production"]["biomass"], 2 * (543 + 7))
+            self.assertEqual(production[0]["production"]["nuclear"], 2 * 3466)
+
     def test_fetch_production_with_storage(self):
         with open(
             "parsers/test/mocks/ENTSOE/NO-NO5_production.xml", "rb"
@@ -126,6 +154,16 @@ class TestFetchProduction(TestENTSOE):
             self.assertEqual(production[0]["production"]["gas"], 0)
             self.assertEqual(production[0]["production"]["hydro"], 1065)
 
+    def test_parse_production_rounds_values(self):
+        with open("parsers/test/mocks/ENTSOE/FI_production.xml") as production_fi_data:
+            xml = production_fi_data.read().replace(
+                "<quantity>543</quantity>", "<quantity>543.1234567</quantity>", 1
+            )
+        production = ENTSOE.parse_production(
+            xml, logging.getLogger(), ZoneKey("FI")
+        ).to_list()
+        self.assertEqual(production[0]["production"]["biomass"], 550.123457)
+
     def test_fetch_with_negative_values(self):
         with open(
             "parsers/test/mocks/ENTSOE/NO-NO5_production-negatives.xml", "rb"
@@ -161,6 +199,51 @@ class TestFetchProduction(TestENTSOE):
                 mock_warning.assert_called()
 
 
+class TestDependentQueries(TestENTSOE):
+    def test_production_isnt_queried_without_consumption(self):
+        self.adapter.register_uri(GET, ANY, text="")
+        self.assertIsNone(ENTSOE.fetch_consumption(ZoneKey("FR"), self.session))
+        self.assertEqual(self.adapter.call_count, 1)
+
+    def test_exports_arent_queried_without_imports(self):
+        self.adapter.register_uri(GET, ANY, text="")
+        with self.assertRaises(ParserException):
+            ENTSOE.fetch_exchange(ZoneKey("DE"), ZoneKey("FR"), self.session)
+        self.assertEqual(self.adapter.call_count, 1)
+        with self.assertRaises(ParserException):
+            ENTSOE.fetch_exchange_forecast(ZoneKey("DE"), ZoneKey("FR"), self.session)
+        self.assertEqual(self.adapter.call_count, 2)
+
+
+class TestQueryENTSOEConcurrently(unittest.TestCase):
+    def test_queries_run_concurrently(self):
+        # Each query waits for the other one, this only completes if they run in parallel.
+        barrier = Barrier(2, timeout=5)
+
+        def query(text):
+            barrier.wait()
+            return text
+
+        def failing_query():
+            raise ValueError("No data")
+
+        results = {
+            result.key: result
+            for result in ENTSOE.query_ENTSOE_concurrently(
+                {
+                    "import": lambda: query("import"),
+                    "export": lambda: query("export"),
+                    "failing": failing_query,
+                },
+                logging.getLogger(__name__),
+            )
+        }
+        self.assertEqual(results["import"].text, "import")
+        self.assertEqual(results["export"].text, "export")
+        self.assertIsNone(results["failing"].text)
+        self.assertIsInstance(results["failing"].error, ValueError)
+
+
 class TestENTSOE_Refetch(unittest.TestCase):
     def test_refetch_token(self) -> None:
         token = mock.Mock(return_value="token")
@@ -1,11 +1,25 @@
 from datetime import datetime, timezone
+from logging import getLogger
+from threading import Barrier
+from zoneinfo import ZoneInfo
 
+import pandas as pd
 import pytest
 from requests import Session
-from requests_mock import GET, POST, Adapter
+from requests_mock import ANY, GET, POST, Adapter
 
 from electricitymap.contrib.lib.types import ZoneKey
-from parsers.IEMOP import REPORTS_ADMIN_URL, fetch_production
+from parsers.IEMOP import (
+    DIPC_URL,
+    REPORTS_ADMIN_URL,
+    RTDHS_URL,
+    TIMEZONE,
+    MarketReportsItem,
+    convert_column_to_datetime,
+    download_exchange_market_reports_items,
+    download_production_market_reports_items,
+    fetch_production,
+)
 
 zone_keys = [ZoneKey("PH-LU"), ZoneKey("PH-MI"), ZoneKey("PH-VI")]
 
@@ -50,3 +64,89 @@ def test_production(snapshot, zone_key: ZoneKey):
             for element in production
         ]
     )
+
+
+def test_download_production_market_reports_items():
+    session = Session()
+    adapter = Adapter()
+    session.mount("https://", adapter)
+    with open("parsers/test/mocks/IEMOP/reports_content", "rb") as f:
+        reports_content = f.read()
+    reports_items = [
+        MarketReportsItem(
+            datetime(2023, 9, 14, hour),
+            f"DIPCER_2023091{hour}00.zip",
+            f"{DIPC_URL}{hour}",
+        )
+        for hour in range(12)
+    ]
+    adapter.register_uri(GET, ANY, content=reports_content)
+    single_df = download_production_market_reports_items(
+        session, reports_items[:1], getLogger(__name__)
+    )
+
+    # Each download waits for another one, this only completes if they run in parallel.
+    barrier = Barrier(2, timeout=5)
+
+    def concurrent_content(request, context):
+        barrier.wait()
+        return reports_content
+
+    adapter.register_uri(GET, ANY, content=concurrent_content)
+    df = download_production_market_reports_items(
+        session, reports_items, getLogger(__name__)
+    )
+    assert len(df) == 12 * len(single_df)
+    assert adapter.call_count == 13
+    assert df["resource_name"].dtype == "category"
+    assert set(df["zone_key"]) == {"PH-LU", "PH-MI", "PH-VI"}
+    assert df["datetime"].min() == datetime(2023, 9, 13, 23, tzinfo=ZoneInfo(TIMEZONE))
+    assert df["datetime"].max() == datetime(
+        2023, 9, 13, 23, 55, tzinfo=ZoneInfo(TIMEZONE)
+    )
+
+
+def test_download_exchange_market_reports_items():
+    session = Session()
+    adapter = Adapter()
+    session.mount("https://", adapter)
+    reports_items = [
+        MarketReportsItem(
+            datetime(2023, 9, 14, hour),
+            f"RTDHS_2023091{hour}00.csv",
+            f"{RTDHS_URL}{hour}",
+        )
+        for hour in range(4)
+    ]
+    # Each download waits for another one, this only completes if they run in parallel.
+    barrier = Barrier(2, timeout=5)
+
+    def concurrent_content(request, context):
+        barrier.wait()
+        hour = request.url.removeprefix(RTDHS_URL)
+        return (
+            "RUN_TIME,HVDC_NAME,FLOW_FROM\n"
+            f"09/14/2023 0{hour}:05:00 AM,MINVIS1,{hour}\n"
+            f"09/14/2023 0{hour}:05:00 AM,VISLUZ1,{hour}\n"
+            "EOF,,\n"
+        ).encode()
+
+    adapter.register_uri(GET, ANY, content=concurrent_content)
+    df = download_exchange_market_reports_items(
+        session, reports_items, getLogger(__name__)
+    )
+    assert adapter.call_count == 4
+    assert df["net_flow"].tolist() == [0, -0, 1, -1, 2, -2, 3, -3]
+    assert df["zone_key"].tolist() == ["PH-MI->PH-VI", "PH-LU->PH-VI"] * 4
+    assert df.index[-1] == datetime(2023, 9, 14, 3, 5, tzinfo=ZoneInfo(TIMEZONE))
+
+
+def test_convert_column_to_datetime():
+    df = pd.DataFrame(
+        {"TIME_INTERVAL": ["09/13/2023 11:55:00 PM", "09/14/2023", "EOF"]}
+    )
+    assert convert_column_to_datetime(df, "TIME_INTERVAL")["datetime"].tolist() == [
+        pd.Timestamp(2023, 9, 13, 23, 55),
+        pd.Timestamp(2023, 9, 14),
+        pd.NaT,
+    ]
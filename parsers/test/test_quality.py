@@ -3,10 +3,17 @@
 """Tests for quality.py."""
 import unittest
 
+import pandas as pd
+
 from parsers.lib.quality import (
+    ValidationError,
+    validate_batch,
     validate_consumption,
+    validate_consumption_batch,
     validate_exchange,
+    validate_exchange_batch,
     validate_production,
+    validate_production_batch,
 )
 from parsers.test.mocks.quality_check import *
 
@@ -96,5 +103,103 @@ class ProductionTestCase(unittest.TestCase):
         self.assertFalse(validate_production(p9, "FR"), msg="This datapoint is good!")
 
 
+def _scalar_errors(validator, events, key) -> list[str | None]:
+    errors = []
+    for event in events:
+        try:
+            validator(event, key)
+            errors.append(None)
+        except ValidationError as e:
+            errors.append(str(e))
+    return errors
+
+
+def _without_now(errors: list[str | None]) -> list[str | None]:
+    """The time the future is checked against differs between validations."""
+    return [error and error.split(", now is")[0] for error in errors]
+
+
+class BatchValidationTestCase(unittest.TestCase):
+    """Tests that the batch validators give the results of the scalar ones."""
+
+    def assertSameErrors(self, validator, batch_validator, events, key):
+        result = batch_validator(events, key)
+        expected = _scalar_errors(validator, events, key)
+        self.assertEqual(_without_now(result.errors), _without_now(expected))
+        self.assertEqual(
+            result.invalid.tolist(), [error is not None for error in expected]
+        )
+        return result
+
+    def test_production(self):
+        events = [
+            p1,
+            p2,
+            p3,
+            p4,
+            p5,
+            p6,
+            p8,
+            p9,
+            {**p9, "production": {**p9["production"], "hydro": 600000.0}},
+            {**p9, "production": {**p9["production"], "fusion": 10.0}},
+            {**p9, "storage": {"hydro": -10.0, "pumped": 1.0}},
+            {**p9, "storage": 12},
+            {**p9, "datetime": dt.replace(year=1999)},
+            {**p9, "zoneKey": None, "countryCode": "FR"},
+        ]
+        for key in ["FR", "CH", "BR"]:
+            with self.subTest(key=key):
+                self.assertSameErrors(
+                    validate_production, validate_production_batch, events, key
+                )
+        self.assertSameErrors(
+            validate_production, validate_production_batch, [p10, p11, p12, p13], "PL"
+        )
+
+    def test_consumption(self):
+        events = [
+            c1,
+            c2,
+            c3,
+            {**c1, "consumption": 600000},
+            {**c1, "datetime": "2023-01-01"},
+        ]
+        self.assertSameErrors(
+            validate_consumption, validate_consumption_batch, events, "FR"
+        )
+
+    def test_exchange(self):
+        events = [e1, e2, e3, e4, {**e1, "netFlow": 200000.0}, {**e1, "netFlow": 0}]
+        for key in ["DK->NO", "DK->NA"]:
+            with self.subTest(key=key):
+                self.assertSameErrors(
+                    validate_exchange, validate_exchange_batch, events, key
+                )
+
+    def test_columnar_events(self):
+        result = validate_batch(pd.DataFrame([p9, p8, p9]), "production", "FR")
+        self.assertEqual(result.invalid.tolist(), [False, True, False])
+        self.assertEqual(
+            result.messages, {1: "FR: key geothermal has negative value -453.8"}
+        )
+
+    def test_other_kinds(self):
+        result = validate_batch(
+            [{"zoneKey": "FR", "datetime": dt, "source": "mysource.com"}], "price", "FR"
+        )
+        self.assertEqual(
+            result.errors,
+            [
+                "FR - data point does not have the required keys:  ['currency', 'price'] is missing"
+            ],
+        )
+
+    def test_kinds_without_required_keys(self):
+        result = validate_batch([{"datetime": dt}], "productionPerUnit", "DK-DK1")
+        self.assertEqual(result.invalid.tolist(), [False])
+        self.assertEqual(result.messages, {})
+
+
 if __name__ == "__main__":
     unittest.main()
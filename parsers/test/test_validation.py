@@ -1,9 +1,10 @@
 """Tests for validation.py."""
 import logging
 import unittest
+from datetime import datetime, timedelta, timezone
 
-from parsers.lib.validation import validate
-from parsers.test.mocks.quality_check import *
+from parsers.lib.validation import validate, validate_production_diffs
+from parsers.test.mocks.quality_check import p15
 
 
 class ProductionTestCase(unittest.TestCase):
@@ -17,5 +18,85 @@ class ProductionTestCase(unittest.TestCase):
         self.assertEqual(validated, None)
 
 
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _datapoints(hours_and_coal):
+    return [
+        {
+            "zoneKey": "FR",
+            "datetime": START + timedelta(hours=hours),
+            "production": {"coal": coal, "gas": 100.0},
+            "source": "mysource.com",
+        }
+        for hours, coal in hours_and_coal
+    ]
+
+
+class ProductionDiffsTestCase(unittest.TestCase):
+    """Tests for validate_production_diffs"""
+
+    test_logger = logging.getLogger()
+    test_logger.setLevel(logging.ERROR)
+
+    def assertValidHours(self, datapoints, expected_hours, **kwargs):
+        validated = validate_production_diffs(
+            datapoints, logger=self.test_logger, **kwargs
+        )
+        self.assertEqual(
+            [(d["datetime"] - START) / timedelta(hours=1) for d in validated],
+            expected_hours,
+        )
+
+    def test_too_high_diff(self):
+        datapoints = _datapoints([(0, 100), (1, 150), (2, 600), (3, 620), (4, None)])
+        # Points are sorted, the spike is removed and missing values are allowed.
+        self.assertValidHours(datapoints[::-1], [0, 1, 3, 4], max_diff={"coal": 200})
+
+    def test_segments(self):
+        datapoints = _datapoints([(0, 100), (1, 150), (2, 600), (3, 620)])
+        # No diff is computed across a missing datapoint.
+        self.assertValidHours(
+            [*datapoints[:2], None, *datapoints[2:]],
+            [0, 1, 2, 3],
+            max_diff={"coal": 200},
+        )
+
+    def test_gaps_are_scaled(self):
+        datapoints = _datapoints([(0, 100), (1, 150), (2, 200), (5, 650), (6, 700)])
+        # A diff of 450MW over 3 hours is 150MW per hour.
+        self.assertValidHours(datapoints, [0, 1, 2, 5, 6], max_diff={"coal": 200})
+        self.assertValidHours(
+            datapoints,
+            [0, 1, 2, 6],
+            max_diff={"coal": 200},
+            interval=timedelta(hours=3),
+        )
+        self.assertValidHours(
+            datapoints,
+            [0, 1, 2, 6],
+            max_diff={"coal": 100},
+            interval=timedelta(hours=1),
+        )
+
+    def test_total(self):
+        datapoints = _datapoints([(0, 100), (1, 150), (2, 600)])
+        datapoints[2]["production"]["gas"] = -350.0
+        self.assertValidHours(datapoints, [0, 1, 2], max_diff={"total": 200})
+        datapoints[2]["production"]["gas"] = 100.0
+        self.assertValidHours(datapoints, [0, 1], max_diff={"total": 200})
+
+    def test_shared_timestamps(self):
+        datapoints = _datapoints([(0, 100), (1, 101), (1, 102), (2, 400)])
+        # Datapoints sharing a timestamp compare their raw diff.
+        self.assertValidHours(datapoints, [0, 1, 1], max_diff={"coal": 200})
+
+    def test_empty_productions(self):
+        datapoints = _datapoints([(0, 100), (1, 150)])
+        for datapoint in datapoints:
+            datapoint["production"] = {}
+        self.assertValidHours(datapoints, [0, 1], max_diff={"total": 200})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Usage: poetry run run_parsers FR DE --data-type production --data-type price
+"""
+
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from logging import WARNING, basicConfig, getLogger
+
+import click
+
+from parsers.lib.profiling import format_prometheus
+from parsers.lib.runner import ParserRunner, format_summary, select_jobs
+from parsers.lib.single_flight import get_coalescing_metrics
+
+logger = getLogger(__name__)
+
+
+@click.command()
+@click.argument("keys", nargs=-1)
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    help="Runs all the zones and exchanges of a parser module, e.g. ENTSOE.",
+)
+@click.option("--data-type", "data_types", multiple=True)
+@click.option("--max-workers", default=16, show_default=True)
+@click.option("--max-requests-per-host", default=4, show_default=True)
+@click.option("--target_datetime", default=None, show_default=True)
+@click.option(
+    "--http-cache",
+    is_flag=True,
+    help="Caches the responses on disk, see parsers.lib.session.mount_response_cache.",
+)
+@click.option(
+    "--async-io",
+    is_flag=True,
+    help="Sends the requests through one event loop, see parsers.lib.async_runner.",
+)
+@click.option(
+    "--profile-metrics",
+    default=None,
+    help="Profiles the parsers and writes Prometheus counters to this file, see parsers.lib.profiling.",
+)
+def run_parsers(
+    keys: tuple[str, ...],
+    sources: tuple[str, ...],
+    data_types: tuple[str, ...],
+    max_workers: int,
+    max_requests_per_host: int,
+    target_datetime: str | None,
+    http_cache: bool,
+    async_io: bool,
+    profile_metrics: str | None,
+):
+    """
+    Runs many parsers concurrently, validates their results and prints a summary
+    with the latency, the number of points and the failures of each parser.
+    \n
+    Examples
+    -------
+    >>> poetry run run_parsers FR DE "DE->FR"
+    >>> poetry run run_parsers --source ENTSOE --data-type production --data-type price
+    >>> poetry run run_parsers --source ENTSOE --max-requests-per-host 2
+    >>> poetry run run_parsers --source ENTSOE --profile-metrics parsers.prom
+    >>> poetry run run_parsers --source EIA --http-cache
+    >>> poetry run run_parsers --source ENTSOE --async-io --max-workers 64
+    """
+    basicConfig(
+        level=WARNING, format="%(asctime)s %(levelname)-8s %(name)-30s %(message)s"
+    )
+    if "productionCapacity" in data_types:
+        raise ValueError(
+            "productionCapacity is not supported by this script. Please use `poetry run update_capacity` instead."
+        )
+    if not keys and not sources:
+        raise click.UsageError("Give at least one zone, exchange or --source.")
+    parsed_target_datetime = None
+    if target_datetime is not None:
+        parsed_target_datetime = datetime.fromisoformat(target_datetime)
+
+    jobs = select_jobs(keys, sources, data_types)
+    runner_class: type[ParserRunner] = ParserRunner
+    if async_io:
+        # aiohttp is only needed in this mode.
+        from parsers.lib.async_runner import AsyncParserRunner
+
+        runner_class = AsyncParserRunner
+    runner = runner_class(
+        max_workers,
+        max_requests_per_host,
+        logger,
+        cache_responses=http_cache,
+        profile=profile_metrics is not None,
+    )
+    start = time.perf_counter()
+    # The async runner closes its event loop and connections on exit.
+    with runner if async_io else nullcontext(runner):
+        results = runner.run(jobs, target_datetime=parsed_target_datetime)
+    print(format_summary(results, time.perf_counter() - start))
+    if http_cache:
+        metrics = runner.cache_metrics()
+        print(
+            f"HTTP cache: {metrics['hit']} hits, {metrics['revalidated']} revalidated, "
+            f"{metrics['miss']} misses"
+        )
+    if profile_metrics is not None:
+        with open(profile_metrics, "w") as f:
+            f.write(format_prometheus(runner.profiles))
+    coalescing_metrics = get_coalescing_metrics()
+    if coalescing_metrics["saved"]:
+        print(
+            f"Coalesced downloads: {coalescing_metrics['saved']} duplicate downloads "
+            f"saved out of {coalescing_metrics['calls']}"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    run_parsers()
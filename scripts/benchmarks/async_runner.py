@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+"""
+Compares the threaded ParserRunner with the AsyncParserRunner on a mocked fleet of
+zones, whose parsers each make a few requests to a local server answering after a
+delay. Synchronous parsers are run with both runners, and coroutine versions of
+the same parsers with the AsyncParserRunner.
+
+Example usage:
+  poetry run python -m scripts.benchmarks.async_runner --zones 400 --max-workers 64
+"""
+
+import argparse
+import asyncio
+import logging
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+from parsers.lib.async_runner import AsyncParserRunner
+from parsers.lib.parsers import PARSER_KEY_TO_DICT
+from parsers.lib.runner import ParserJob, ParserRunner
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_PER_PARSER = 3
+
+
+class MockServer:
+    """Answers every request after a delay, counting the connections it accepted."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.connections: set[int] = set()
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        threading.Thread(
+            target=self._serve, args=(ready,), name="mock-server", daemon=True
+        ).start()
+        ready.wait()
+
+    def _serve(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self.loop)
+        app = web.Application()
+        app.router.add_get("/{zone}", self._handle)
+        runner = web.AppRunner(app, access_log=None)
+        self.loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+        self.loop.run_until_complete(site.start())
+        self.url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        ready.set()
+        self.loop.run_forever()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.connections.add(id(request.transport))
+        await asyncio.sleep(self.delay)
+        return web.json_response({"zone": request.match_info["zone"], "gas": 100.0})
+
+
+def _event(zone_key: str, payload: dict) -> dict:
+    return {
+        "zoneKey": zone_key,
+        "datetime": datetime(2023, 1, 1, tzinfo=timezone.utc),
+        "production": {"gas": payload["gas"]},
+        "source": "mock.server",
+    }
+
+
+def make_parsers(url: str) -> tuple[Callable, Callable]:
+    def fetch_production(zone_key, session=None, target_datetime=None, logger=None):
+        payloads = [
+            session.get(f"{url}/{zone_key}").json() for _ in range(REQUESTS_PER_PARSER)
+        ]
+        return [_event(zone_key, payload) for payload in payloads]
+
+    async def async_fetch_production(
+        zone_key, session=None, target_datetime=None, logger=None
+    ):
+        payloads = []
+        for _ in range(REQUESTS_PER_PARSER):
+            async with session.get(f"{url}/{zone_key}") as response:
+                payloads.append(await response.json())
+        return [_event(zone_key, payload) for payload in payloads]
+
+    return fetch_production, async_fetch_production
+
+
+def with_parser(runner_class: type[ParserRunner], parser: Callable):
+    """A runner calling the given parser for all the jobs."""
+
+    class MockedRunner(runner_class):
+        def parser(self, job: ParserJob) -> Callable:
+            return parser
+
+    return MockedRunner
+
+
+def measure(
+    make_runner: Callable[[], ParserRunner], jobs: list[ParserJob]
+) -> tuple[float, int, int]:
+    """Returns the duration, the peak of allocated memory and the peak number of threads."""
+    peak_threads = threading.active_count()
+    done = threading.Event()
+
+    def count_threads():
+        nonlocal peak_threads
+        while not done.wait(0.005):
+            peak_threads = max(peak_threads, threading.active_count())
+
+    counter = threading.Thread(target=count_threads, daemon=True)
+    counter.start()
+    tracemalloc.start()
+    start = time.perf_counter()
+    runner = make_runner()
+    results = runner.run(jobs)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(runner, AsyncParserRunner):
+        runner.close()
+    done.set()
+    counter.join()
+    failures = [result.error for result in results if result.error]
+    assert not failures, failures[:3]
+    return duration, peak_memory, peak_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, default=400)
+    parser.add_argument("--max-workers", type=int, default=64)
+    parser.add_argument("--delay", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    server = MockServer(args.delay)
+    jobs = [
+        ParserJob(key, "production")
+        for key in list(PARSER_KEY_TO_DICT["production"])[: args.zones]
+    ]
+    fetch_production, async_fetch_production = make_parsers(server.url)
+    # Connections are capped per host, and all the mocked zones share one host.
+    max_per_host = args.max_workers
+    modes = [
+        (
+            "threads",
+            lambda: with_parser(ParserRunner, fetch_production)(
+                args.max_workers, max_per_host, logger
+            ),
+        ),
+        (
+            "async shim",
+            lambda: with_parser(AsyncParserRunner, fetch_production)(
+                args.max_workers, max_per_host, logger
+            ),
+        ),
+        (
+            "coroutines",
+            lambda: with_parser(AsyncParserRunner, async_fetch_production)(
+                len(jobs), max_per_host, logger
+            ),
+        ),
+    ]
+
+    print(
+        f"Running {len(jobs)} mocked parsers making {REQUESTS_PER_PARSER} requests "
+        f"of {args.delay * 1000:.0f}ms each, {args.max_workers} workers:"
+    )
+    for name, make_runner in modes:
+        server.connections.clear()
+        duration, peak_memory, peak_threads = measure(make_runner, jobs)
+        print(
+            f"  {name + ':':<12} {duration:.2f}s ({len(jobs) / duration:.0f} parsers/s), "
+            f"peak memory {peak_memory / 2**20:.1f}MiB, {peak_threads} threads, "
+            f"{len(server.connections)} connections"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks the time it takes a new process to import the config and its pydantic
+models, with an empty compiled config cache (cold) and with a populated one (warm).
+
+Example usage:
+  poetry run python -m scripts.benchmarks.config_startup --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+IMPORT_CONFIG = "import electricitymap.contrib.config.model"
+
+
+def _time_import(env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", IMPORT_CONFIG], env=env, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline = _time_import({**os.environ, "ELECTRICITYMAPS_CONFIG_CACHE": "0"})
+    cold_timings, warm_timings = [], []
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {**os.environ, "ELECTRICITYMAPS_CONFIG_CACHE_DIR": cache_dir}
+            cold_timings.append(_time_import(env))
+            warm_timings.append(_time_import(env))
+    cold, warm = min(cold_timings), min(warm_timings)
+    print("Importing the config in a new process:")
+    print(f"  no cache:   {baseline:.3f}s")
+    print(f"  cold:       {cold:.3f}s")
+    print(f"  warm:       {warm:.3f}s")
+    print(f"  speedup:    {baseline / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
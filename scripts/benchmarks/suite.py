@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks the hot paths of the event models and of the heaviest parsers, offline,
+and stores the timings as JSON to compare them across commits.
+
+The parsers are run against the recorded mocks of `parsers/test/mocks`, there is no
+recorded OpenNEM response so a week of synthetic data is used for OPENNEM.
+Comparing with a baseline exits with an error if a benchmark got slower by more
+than the threshold.
+
+Example usage:
+  poetry run python -m scripts.benchmarks.suite --output baseline.json
+  poetry run python -m scripts.benchmarks.suite --compare baseline.json
+  poetry run python -m scripts.benchmarks.suite --only parsers.ENTSOE --repeat 10
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from requests import Session
+from requests_mock import ANY, GET, POST, Adapter
+
+from electricitymap.contrib.lib.models.event_lists import (
+    ExchangeList,
+    ProductionBreakdownList,
+)
+from electricitymap.contrib.lib.models.events import (
+    Exchange,
+    ProductionBreakdown,
+    ProductionMix,
+    StorageMix,
+)
+from electricitymap.contrib.lib.types import ZoneKey
+from scripts.benchmarks.timing import time_calls
+
+logger = logging.getLogger(__name__)
+
+MOCKS = Path("parsers/test/mocks")
+# A week of 5 minutes data points.
+N_EVENTS = 7 * 24 * 12
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+MODES = ["biomass", "coal", "gas", "hydro", "nuclear", "solar", "wind", "unknown"]
+
+# Each setup function prepares its inputs and returns the function to time.
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def wrap(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return wrap
+
+
+def _datetimes(n: int = N_EVENTS) -> list[datetime]:
+    return [START + timedelta(minutes=5 * i) for i in range(n)]
+
+
+def _mocked_session(*responses: tuple[str, Any, dict[str, Any]]) -> Session:
+    """A session answering the (method, URL, response) given, for all the schemes."""
+    adapter = Adapter()
+    for method, url, response in responses:
+        adapter.register_uri(method, url, **response)
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _production_breakdowns(modes: list[str], seed: int) -> ProductionBreakdownList:
+    rng = random.Random(seed)
+    production_breakdowns = ProductionBreakdownList(logger)
+    for dt in _datetimes():
+        production_breakdowns.append(
+            zoneKey=ZoneKey("DE"),
+            datetime=dt,
+            source=f"source{seed}.org",
+            production=ProductionMix(**{mode: rng.uniform(0, 1000) for mode in modes}),
+            storage=StorageMix(hydro=rng.uniform(-100, 100)),
+        )
+    return production_breakdowns
+
+
+@benchmark("events.ProductionBreakdown.create")
+def production_breakdown_create() -> Callable[[], object]:
+    rng = random.Random(42)
+    datetimes = _datetimes(1000)
+    values = [{mode: rng.uniform(0, 1000) for mode in MODES} for _ in datetimes]
+
+    def create():
+        for dt, production in zip(datetimes, values, strict=True):
+            ProductionBreakdown.create(
+                logger,
+                ZoneKey("DE"),
+                dt,
+                "example.org",
+                ProductionMix(**production),
+                StorageMix(hydro=production["hydro"] - 500),
+            )
+
+    return create
+
+
+@benchmark("events.Exchange.create")
+def exchange_create() -> Callable[[], object]:
+    rng = random.Random(42)
+    datetimes = _datetimes(1000)
+    net_flows = [rng.uniform(-1000, 1000) for _ in datetimes]
+
+    def create():
+        for dt, net_flow in zip(datetimes, net_flows, strict=True):
+            Exchange.create(logger, ZoneKey("DE->FR"), dt, "example.org", net_flow)
+
+    return create
+
+
+@benchmark("event_lists.ProductionBreakdownList.to_list")
+def production_breakdown_list_to_list() -> Callable[[], object]:
+    return _production_breakdowns(MODES, seed=0).to_list
+
+
+@benchmark("event_lists.merge_production_breakdowns")
+def merge_production_breakdowns() -> Callable[[], object]:
+    production_breakdowns = [
+        _production_breakdowns(MODES[i::4], seed=i) for i in range(4)
+    ]
+    return lambda: ProductionBreakdownList.merge_production_breakdowns(
+        production_breakdowns, logger
+    )
+
+
+@benchmark("event_lists.merge_exchanges")
+def merge_exchanges() -> Callable[[], object]:
+    rng = random.Random(42)
+    exchanges = []
+    for i in range(4):
+        exchange_list = ExchangeList(logger)
+        for dt in _datetimes():
+            exchange_list.append(
+                zoneKey=ZoneKey("DE->FR"),
+                datetime=dt,
+                source=f"source{i}.org",
+                netFlow=rng.uniform(-1000, 1000),
+            )
+        exchanges.append(exchange_list)
+    return lambda: ExchangeList.merge_exchanges(exchanges, logger)
+
+
+def _production_batch() -> tuple[list[datetime], dict[str, list[float]]]:
+    """A week of production values per mode, with a few negative values."""
+    rng = random.Random(42)
+    datetimes = _datetimes()
+    return datetimes, {
+        mode: [rng.uniform(-10, 1000) for _ in datetimes] for mode in MODES
+    }
+
+
+def _append_batch(columnar: bool) -> Callable[[], ProductionBreakdownList]:
+    datetimes, production = _production_batch()
+
+    def append_batch():
+        production_breakdowns = ProductionBreakdownList(logger, columnar=columnar)
+        production_breakdowns.append_batch(
+            zoneKey=ZoneKey("DE"),
+            datetimes=datetimes,
+            source="example.org",
+            production=production,
+            storage={"hydro": production["hydro"]},
+        )
+        return production_breakdowns
+
+    return append_batch
+
+
+@benchmark("event_lists.ProductionBreakdownList.append_batch")
+def production_breakdown_list_append_batch() -> Callable[[], object]:
+    return _append_batch(columnar=False)
+
+
+@benchmark("event_lists.ProductionBreakdownList.append_batch.columnar")
+def columnar_production_breakdown_list_append_batch() -> Callable[[], object]:
+    return _append_batch(columnar=True)
+
+
+@benchmark("event_lists.ProductionBreakdownList.to_list.columnar")
+def columnar_production_breakdown_list_to_list() -> Callable[[], object]:
+    return _append_batch(columnar=True)().to_list
+
+
+@benchmark("config.import")
+def config_import() -> Callable[[], object]:
+    # In a new process, with the compiled config cache of the environment.
+    return lambda: subprocess.run(
+        [sys.executable, "-c", "import electricitymap.contrib.config"], check=True
+    )
+
+
+@benchmark("parsers.ENTSOE.parse_production")
+def entsoe_parse_production() -> Callable[[], object]:
+    from parsers.ENTSOE import parse_production
+
+    documents = {
+        ZoneKey("FI"): (MOCKS / "ENTSOE/FI_production.xml").read_text(),
+        ZoneKey("NO-NO5"): (MOCKS / "ENTSOE/NO-NO5_production.xml").read_text(),
+    }
+
+    def parse():
+        for zone_key, xml in documents.items():
+            parse_production(xml, logger, zone_key)
+
+    return parse
+
+
+@benchmark("parsers.ENTSOE.parse_production.large")
+def entsoe_parse_production_large() -> Callable[[], object]:
+    from parsers.ENTSOE import parse_production
+
+    # Repeats the TimeSeries of the document to emulate the size of a yearly refetch.
+    xml = (MOCKS / "ENTSOE/FI_production.xml").read_text()
+    start = xml.index("<TimeSeries>")
+    end = xml.rindex("</TimeSeries>") + len("</TimeSeries>")
+    xml = xml[:start] + xml[start:end] * 20 + xml[end:]
+    return lambda: parse_production(xml, logger, ZoneKey("FI"))
+
+
+@benchmark("parsers.ENTSOE.parse_prices")
+def entsoe_parse_prices() -> Callable[[], object]:
+    from parsers.ENTSOE import parse_prices
+
+    xml = (MOCKS / "ENTSOE/FR_prices.xml").read_text()
+    return lambda: parse_prices(xml, ZoneKey("FR"), logger)
+
+
+@benchmark("parsers.ELEXON.parse_production")
+def elexon_parse_production() -> Callable[[], object]:
+    from parsers.ELEXON import parse_production
+
+    csv_text = (MOCKS / "ELEXON/B1620.csv").read_text()
+    return lambda: parse_production(csv_text)
+
+
+@benchmark("parsers.ELEXON.parse_production_FUELINST")
+def elexon_parse_production_fuelinst() -> Callable[[], object]:
+    from parsers.ELEXON import (
+        parse_additional_eso_production,
+        parse_production_FUELINST,
+        process_production_events,
+    )
+
+    csv_text = (MOCKS / "ELEXON/FUELINST.csv").read_text()
+    records = json.loads((MOCKS / "ELEXON/eso_demand_data_update.json").read_text())[
+        "result"
+    ]["records"]
+    target_datetime = datetime(2023, 1, 10, 12, tzinfo=timezone.utc)
+
+    def parse():
+        fuel_inst_data = parse_production_FUELINST(csv_text, target_datetime, logger)
+        additional_data = parse_additional_eso_production(records)
+        process_production_events(fuel_inst_data, additional_data, logger).to_list()
+
+    return parse
+
+
+def _repeat_b1620(csv_text: str, days: int) -> str:
+    """Repeats the rows of the report over consecutive settlement dates."""
+    lines = csv_text.strip().split("\n")
+    header, rows, footer = lines[:5], lines[5:-1], lines[-1:]
+    report_date = date.fromisoformat(rows[0].split(",")[7])
+    repeated = [
+        row.replace(
+            f",{report_date.isoformat()},",
+            f",{(report_date + timedelta(days=day)).isoformat()},",
+        )
+        for day in range(days)
+        for row in rows
+    ]
+    return "\n".join(header + repeated + footer) + "\n"
+
+
+@benchmark("parsers.ELEXON.parse_production.week")
+def elexon_parse_production_week() -> Callable[[], object]:
+    from parsers.ELEXON import parse_production
+
+    csv_text = _repeat_b1620((MOCKS / "ELEXON/B1620.csv").read_text(), days=7)
+    return lambda: parse_production(csv_text)
+
+
+@benchmark("parsers.IEMOP.fetch_production")
+def iemop_fetch_production() -> Callable[[], object]:
+    from parsers.IEMOP import REPORTS_ADMIN_URL, fetch_production
+
+    session = _mocked_session(
+        (
+            POST,
+            REPORTS_ADMIN_URL,
+            {"content": (MOCKS / "IEMOP/list_reports_items.json").read_bytes()},
+        ),
+        (GET, ANY, {"content": (MOCKS / "IEMOP/reports_content").read_bytes()}),
+    )
+    target_datetime = datetime(2023, 9, 14, tzinfo=timezone.utc)
+    return lambda: fetch_production(ZoneKey("PH-LU"), session, target_datetime)
+
+
+@benchmark("parsers.EIA.fetch_production_mix")
+def eia_fetch_production_mix() -> Callable[[], object]:
+    from parsers.EIA import fetch_production_mix
+
+    os.environ.setdefault("EIA_KEY", "token")
+    text = (MOCKS / "EIA/US_NW_AVRN-wind.json").read_text()
+    # A new session for every call, so no response is cached across repeats.
+    return lambda: fetch_production_mix(
+        ZoneKey("US-NW-PGE"), _mocked_session((GET, ANY, {"text": text}))
+    )
+
+
+@benchmark("parsers.EIA.fetch_exchange")
+def eia_fetch_exchange() -> Callable[[], object]:
+    from parsers.EIA import fetch_exchange
+
+    os.environ.setdefault("EIA_KEY", "token")
+    text = (MOCKS / "EIA/US-NW-BPAT-US-NW-NWMT-exchange.json").read_text()
+    # A new session for every call, so no response is cached across repeats.
+    return lambda: fetch_exchange(
+        ZoneKey("US-NW-BPAT"),
+        ZoneKey("US-NW-NWMT"),
+        _mocked_session((GET, ANY, {"text": text})),
+    )
+
+
+def _opennem_payload() -> dict[str, Any]:
+    """A week of power data for SA1, shaped like the OpenNEM API responses."""
+    rng = random.Random(42)
+    end = START + timedelta(minutes=5 * (N_EVENTS - 1))
+    datasets = []
+    for fuel_tech, interval, n_points in [
+        ("coal_black", "5m", N_EVENTS),
+        ("gas_ccgt", "5m", N_EVENTS),
+        ("wind", "5m", N_EVENTS),
+        ("hydro", "5m", N_EVENTS),
+        ("solar_utility", "5m", N_EVENTS),
+        ("battery_charging", "5m", N_EVENTS),
+        ("battery_discharging", "5m", N_EVENTS),
+        ("solar_rooftop", "30m", N_EVENTS // 6),
+    ]:
+        datasets.append(
+            {
+                "id": f"au.nem.sa1.fuel_tech.{fuel_tech}.power",
+                "type": "power",
+                "data_type": "power",
+                "region": "SA1",
+                "x_capacity_at_present": 1000.0,
+                "history": {
+                    "interval": interval,
+                    "start": START.isoformat(),
+                    "last": (
+                        START + timedelta(minutes=30 * (n_points - 1))
+                        if interval == "30m"
+                        else end
+                    ).isoformat(),
+                    "data": [rng.uniform(0, 1000) for _ in range(n_points)],
+                },
+            }
+        )
+    return {"data": datasets}
+
+
+@benchmark("parsers.OPENNEM.fetch_production")
+def opennem_fetch_production() -> Callable[[], object]:
+    from parsers.OPENNEM import fetch_production
+
+    session = _mocked_session((GET, ANY, {"json": _opennem_payload()}))
+    return lambda: fetch_production(ZoneKey("AU-SA"), session)
+
+
+def _production_events(n_events: int) -> list[dict[str, Any]]:
+    """Hourly production events, with a negative value and a spike every 500 hours."""
+    rng = random.Random(42)
+    return [
+        {
+            "zoneKey": ZoneKey("DE"),
+            "datetime": START + timedelta(hours=hour),
+            "production": {
+                "biomass": rng.uniform(0, 1000),
+                "coal": rng.uniform(0, 1000) + (5000 if hour % 500 == 0 else 0),
+                "gas": rng.uniform(0, 1000),
+                "hydro": rng.uniform(0, 1000),
+                "nuclear": rng.uniform(0, 1000),
+                "oil": rng.uniform(0, 1000),
+                "solar": rng.uniform(-1 if hour % 100 == 0 else 0, 1000),
+                "wind": rng.uniform(0, 1000),
+            },
+            "storage": {"hydro": rng.uniform(-100, 100)},
+            "source": "example.org",
+        }
+        for hour in range(n_events)
+    ]
+
+
+@benchmark("parsers.lib.quality.validate_production")
+def quality_validate_production() -> Callable[[], object]:
+    from parsers.lib.quality import ValidationError, validate_production
+
+    events = _production_events(1000)
+
+    def validate():
+        for event in events:
+            try:
+                validate_production(event, ZoneKey("DE"))
+            except ValidationError:
+                pass
+
+    return validate
+
+
+@benchmark("parsers.lib.quality.validate_production_batch")
+def quality_validate_production_batch() -> Callable[[], object]:
+    from parsers.lib.quality import validate_production_batch
+
+    events = _production_events(10000)
+    return lambda: validate_production_batch(events, ZoneKey("DE"))
+
+
+@benchmark("parsers.lib.validation.validate_production_diffs")
+def validation_validate_production_diffs() -> Callable[[], object]:
+    from parsers.lib.validation import validate_production_diffs
+
+    # A year of hourly data points.
+    events = _production_events(365 * 24)
+    max_diffs = {"coal": 1200, "hydro": 5200, "solar": 3500, "wind": 5000}
+    return lambda: validate_production_diffs(events, max_diffs, logger)
+
+
+@benchmark("parsers.lib.validation.find_production_diff_outliers")
+def validation_find_production_diff_outliers() -> Callable[[], object]:
+    import numpy as np
+
+    from parsers.lib.validation import find_production_diff_outliers
+
+    events = _production_events(365 * 24)
+    max_diffs = {"coal": 1200, "hydro": 5200, "solar": 3500, "wind": 5000}
+    timestamps = np.array([event["datetime"].timestamp() for event in events])
+    values = np.array(
+        [[event["production"][mode] for mode in max_diffs] for event in events]
+    )
+    return lambda: find_production_diff_outliers(
+        timestamps, values, list(max_diffs.values())
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: list[str], repeat: int) -> dict[str, Any]:
+    """Runs the benchmarks and returns their timings with the environment they ran in."""
+    results = {}
+    for name in names:
+        function = BENCHMARKS[name]()
+        # Warm up the imports and caches.
+        function()
+        timings = time_calls(function, repeat)
+        results[name] = {"min": min(timings), "median": statistics.median(timings)}
+        print(
+            f"  {name:<60} {results[name]['min'] * 1000:9.2f}ms "
+            f"(median {results[name]['median'] * 1000:.2f}ms)"
+        )
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Prints the timings relative to the baseline and returns the benchmarks which regressed."""
+    print(f"Compared with {baseline.get('commit') or 'the baseline'}:")
+    regressions = []
+    for name, timings in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        ratio = timings["min"] / baseline["benchmarks"][name]["min"]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        print(f"  {name:<60} {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="Only run the benchmarks starting with this prefix, can be repeated.",
+    )
+    parser.add_argument("--output", type=Path, help="Stores the results as JSON.")
+    parser.add_argument("--compare", type=Path, help="Results of a previous run.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown over the baseline reported as a regression.",
+    )
+    parser.add_argument("--list", action="store_true", help="Lists the benchmarks.")
+    args = parser.parse_args()
+    # The mocks contain values which are logged on purpose, don't flood the output.
+    logging.basicConfig(level=logging.CRITICAL)
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not names:
+        parser.error(f"No benchmark starting with {', '.join(args.only)}")
+
+    print(f"Running {len(names)} benchmarks, best of {args.repeat}:")
+    results = run(names, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        regressions = compare(
+            results, json.loads(args.compare.read_text()), args.threshold
+        )
+        if regressions:
+            sys.exit(f"Regressions: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""Timing helpers shared by the benchmarks."""
+
+import time
+from collections.abc import Callable
+
+
+def time_calls(function: Callable[[], object], repeat: int) -> list[float]:
+    """Calls the function `repeat` times and returns the duration of each call, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
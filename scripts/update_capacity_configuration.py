@@ -1,9 +1,13 @@
+import difflib
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from logging import INFO, basicConfig, getLogger
+from pathlib import Path
 from typing import Any
 
+import yaml
 from requests import Session
 
 from electricitymap.contrib.config import CONFIG_DIR, ZONE_PARENT
@@ -11,7 +15,7 @@ from electricitymap.contrib.config.constants import PRODUCTION_MODES, STORAGE_MO
 from electricitymap.contrib.config.reading import read_zones_config
 from electricitymap.contrib.lib.types import ZoneKey
 from parsers.lib.parsers import PARSER_KEY_TO_DICT
-from scripts.utils import write_zone_config
+from scripts.utils import write_zone_config, zone_config_path
 
 logger = getLogger(__name__)
 basicConfig(level=INFO)
@@ -34,8 +38,8 @@ for zone_id, zone_config in ZONES_CONFIG.items():
 
 def update_zone(
     zone: ZoneKey, target_datetime: datetime, session: Session, update_aggregate: bool
-) -> None:
-    """Generate capacity config and update the zone config yaml for a zone"""
+) -> list[Path]:
+    """Generate capacity config and update the zone config yaml for a zone, returns the paths of the updated yamls"""
     if zone not in CAPACITY_PARSERS:
         raise ValueError(f"No capacity parser developed for {zone}")
     parser = CAPACITY_PARSERS[zone]
@@ -45,15 +49,18 @@ def update_zone(
     )
     if not zone_capacity:
         raise ValueError(f"No capacity data for {zone} in {target_datetime.date()}")
-    update_zone_capacity_config(zone, zone_capacity)
+    paths = [update_zone_capacity_config(zone, zone_capacity)]
 
     if update_aggregate:
         zone_parent = ZONE_PARENT[zone]
-        update_aggregated_capacity_config(zone_parent)
+        paths.append(update_aggregated_capacity_config(zone_parent))
+    return [path for path in paths if path is not None]
 
 
-def update_source(source: str, target_datetime: datetime, session: Session) -> None:
-    """Generate capacity config and update the zone config yaml for all zones included in source"""
+def fetch_source_capacity(
+    source: str, target_datetime: datetime, session: Session
+) -> dict[ZoneKey, dict[str, Any]]:
+    """Fetch the capacity data of all zones included in source"""
     if source not in CAPACITY_PARSER_SOURCE_TO_ZONES:
         raise ValueError(f"No capacity parser developed for {source}")
     parser = getattr(
@@ -61,12 +68,87 @@ def update_source(source: str, target_datetime: datetime, session: Session) -> N
         "fetch_production_capacity_for_all_zones",
     )
     source_capacity = parser(target_datetime=target_datetime, session=session)
+    for zone in [zone for zone in source_capacity if not source_capacity[zone]]:
+        print(f"No capacity data for {zone} in {target_datetime.date()}")
+        del source_capacity[zone]
+    return source_capacity
+
+
+def generate_capacity_updates(
+    sources: list[str],
+    target_datetime: datetime,
+    session: Session,
+    max_workers: int = 4,
+) -> dict[ZoneKey, dict[str, Any]]:
+    """
+    Fetch the capacity data of the sources concurrently and generate the updated
+    configs of the zones whose capacity changed, without writing them. The sources
+    are applied in order, so a zone included in several sources gets the data of
+    all of them. Nothing is returned if fetching any of the sources fails.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        source_capacities = list(
+            executor.map(
+                lambda source: fetch_source_capacity(source, target_datetime, session),
+                sources,
+            )
+        )
+
+    updated_zone_configs: dict[ZoneKey, dict[str, Any]] = {}
+    for source_capacity in source_capacities:
+        for zone, data in source_capacity.items():
+            zone_config = updated_zone_configs.get(zone, ZONES_CONFIG.get(zone))
+            if zone_config is None:
+                raise ValueError(f"Zone {zone} does not exist in the zones config")
+            updated_zone_configs[zone] = generate_zone_config(zone_config, data)
+    return {
+        zone: zone_config
+        for zone, zone_config in updated_zone_configs.items()
+        if zone_config != ZONES_CONFIG[zone]
+    }
+
+
+def format_zone_config_diff(zone_key: ZoneKey, zone_config: dict[str, Any]) -> str:
+    """Format the changes of a zone config as a unified diff of the yaml files"""
+    path = zone_config_path(zone_key).relative_to(CONFIG_DIR.parent)
+    return "".join(
+        difflib.unified_diff(
+            yaml.dump(ZONES_CONFIG[zone_key], default_flow_style=False).splitlines(
+                keepends=True
+            ),
+            yaml.dump(zone_config, default_flow_style=False).splitlines(keepends=True),
+            fromfile=f"a/{path}",
+            tofile=f"b/{path}",
+        )
+    )
+
 
-    for zone in source_capacity:
-        if not source_capacity[zone]:
-            print(f"No capacity data for {zone} in {target_datetime.date()}")
-            continue
-        update_zone_capacity_config(zone, source_capacity[zone])
+def update_sources(
+    sources: list[str],
+    target_datetime: datetime,
+    session: Session,
+    dry_run: bool = False,
+    max_workers: int = 4,
+) -> list[Path]:
+    """
+    Update the zone config yamls with the capacity data of several sources at once.
+    The configs are only written once all the sources are fetched and only if their
+    capacity changed. In a dry run the changes are printed as a diff instead.
+    Returns the paths of the updated zone configs.
+    """
+    updated_zone_configs = generate_capacity_updates(
+        sources, target_datetime, session, max_workers
+    )
+    if dry_run:
+        for zone, zone_config in updated_zone_configs.items():
+            print(format_zone_config_diff(zone, zone_config), end="")
+        print(f"{len(updated_zone_configs)} zone configs would be updated")
+        return []
+    paths = []
+    for zone, zone_config in updated_zone_configs.items():
+        paths.append(write_zone_config(zone, zone_config))
+        ZONES_CONFIG[zone] = zone_config
+    return paths
 
 
 def sort_config_keys(config: dict[str, Any]) -> dict[str, Any]:
@@ -74,12 +156,12 @@ def sort_config_keys(config: dict[str, Any]) -> dict[str, Any]:
     return {k: config[k] for k in sorted(config)}
 
 
-def update_zone_capacity_config(zone_key: ZoneKey, data: dict) -> None:
-    """Update the capacity config for a zone"""
-    if zone_key not in ZONES_CONFIG:
-        raise ValueError(f"Zone {zone_key} does not exist in the zones config")
-
-    _new_zone_config = deepcopy(ZONES_CONFIG[zone_key])
+def generate_zone_config(
+    zone_config: dict[str, Any], data: dict[str, Any]
+) -> dict[str, Any]:
+    """Generate the zone config updated with the capacity data"""
+    # Only the capacity changes, generate_zone_capacity_config copies it.
+    _new_zone_config = {**zone_config}
     if "capacity" in _new_zone_config:
         capacity = _new_zone_config["capacity"]
 
@@ -91,12 +173,19 @@ def update_zone_capacity_config(zone_key: ZoneKey, data: dict) -> None:
     else:
         capacity = data
 
-    _new_zone_config["capacity"] = capacity
-
     # sort keys
-    _new_zone_config["capacity"] = sort_config_keys(_new_zone_config["capacity"])
+    _new_zone_config["capacity"] = sort_config_keys(capacity)
+    return _new_zone_config
+
 
-    write_zone_config(zone_key, _new_zone_config)
+def update_zone_capacity_config(zone_key: ZoneKey, data: dict) -> Path:
+    """Update the capacity config for a zone"""
+    if zone_key not in ZONES_CONFIG:
+        raise ValueError(f"Zone {zone_key} does not exist in the zones config")
+
+    return write_zone_config(
+        zone_key, generate_zone_config(ZONES_CONFIG[zone_key], data)
+    )
 
 
 def generate_zone_capacity_config(
@@ -261,7 +350,7 @@ def generate_aggregated_capacity_config_list(
     return updated_aggregated_capacity_config
 
 
-def update_aggregated_capacity_config(parent_zone: ZoneKey) -> None:
+def update_aggregated_capacity_config(parent_zone: ZoneKey) -> Path | None:
     """Update the aggregated capacity config for a parent zone"""
     if parent_zone not in ZONES_CONFIG:
         raise ValueError(f"Zone {parent_zone} does not exist in the zones config")
@@ -273,7 +362,7 @@ def update_aggregated_capacity_config(parent_zone: ZoneKey) -> None:
         # sort keys
         _new_zone_config["capacity"] = sort_config_keys(_new_zone_config["capacity"])
         ZONES_CONFIG[parent_zone] = _new_zone_config
-        write_zone_config(parent_zone, _new_zone_config)
+        return write_zone_config(parent_zone, _new_zone_config)
     else:
         logger.warning(
             f"{parent_zone} capacity could not be updated because not all capacities are available"
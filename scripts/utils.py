@@ -92,9 +92,13 @@ class YamlFilePatcher:
         print(f"🧹 Patched {self.file_path.relative_to(ROOT_PATH)}")
 
 
-def write_zone_config(zone_key: ZoneKey, zone_config: dict[str, Any]) -> None:
-    with open(
-        CONFIG_DIR.joinpath(f"zones/{zone_key}.yaml"), "w", encoding="utf-8"
-    ) as f:
+def zone_config_path(zone_key: ZoneKey) -> pathlib.Path:
+    return CONFIG_DIR.joinpath(f"zones/{zone_key}.yaml")
+
+
+def write_zone_config(zone_key: ZoneKey, zone_config: dict[str, Any]) -> pathlib.Path:
+    file_path = zone_config_path(zone_key)
+    with open(file_path, "w", encoding="utf-8") as f:
         f.write(yaml.dump(zone_config, default_flow_style=False))
     print(f"Updated {zone_key}.yaml with new capacity data")
+    return file_path
@@ -3,9 +3,12 @@
 Usage: poetry run test_parser FR production
 """
 
+import cProfile
 import pprint
+import pstats
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
 from logging import DEBUG, basicConfig, getLogger
 from typing import Any
@@ -13,7 +16,8 @@ from typing import Any
 import click
 
 from electricitymap.contrib.lib.types import ZoneKey
-from parsers.lib.parsers import PARSER_KEY_TO_DICT
+from parsers.lib.parsers import PARSER_KEY_TO_DICT, import_time_report
+from parsers.lib.profiling import ParserProfile
 from parsers.lib.quality import (
     ValidationError,
     validate_consumption,
@@ -25,11 +29,56 @@ logger = getLogger(__name__)
 basicConfig(level=DEBUG, format="%(asctime)s %(levelname)-8s %(name)-30s %(message)s")
 
 
+@contextmanager
+def code_profiler(output: str) -> Iterator[None]:
+    """
+    Profiles the code run in the context, with pyinstrument if the output is an HTML
+    file and with cProfile otherwise, whose slowest functions are also printed.
+    """
+    if output.endswith(".html"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise click.UsageError(
+                "pyinstrument is needed for HTML profiles, install it or use a .prof output."
+            ) from e
+        profiler = Profiler()
+        with profiler:
+            yield
+        with open(output, "w") as f:
+            f.write(profiler.output_html())
+        print(f"Wrote the pyinstrument profile to {output}")
+        return
+
+    with cProfile.Profile() as profiler:
+        yield
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(20)
+    stats.dump_stats(output)
+    print(f"Wrote the cProfile stats to {output}")
+
+
 @click.command()
 @click.argument("zone")
 @click.argument("data-type", default="")
 @click.option("--target_datetime", default=None, show_default=True)
-def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the time spent in network, parsing and event models.",
+)
+@click.option(
+    "--profile-output",
+    default=None,
+    help="Also dump a cProfile profile to this file, or a pyinstrument one for a .html file.",
+)
+def test_parser(
+    zone: ZoneKey,
+    data_type: str,
+    target_datetime: str | None,
+    profile: bool,
+    profile_output: str | None,
+):
     """
     Parameters
     ----------
@@ -44,6 +93,7 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
     >>> poetry run test_parser FR production
     >>> poetry run test_parser "NO-NO3->SE" exchange
     >>> poetry run test_parser GE production --target_datetime="2022-04-10 15:00"
+    >>> poetry run test_parser FR production --profile --profile-output FR.prof
 
     """
     if data_type == "productionCapacity":
@@ -53,22 +103,28 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
     parsed_target_datetime = None
     if target_datetime is not None:
         parsed_target_datetime = datetime.fromisoformat(target_datetime)
-    start = time.time()
 
     if not data_type:
         data_type = "exchange" if "->" in zone else "production"
 
-    parser: Callable[..., list[dict[str, Any]] | dict[str, Any]] = PARSER_KEY_TO_DICT[
-        data_type
-    ][zone]
+    profile = profile or profile_output is not None
+    profiles: list[ParserProfile] = []
+    parser: Callable[..., list[dict[str, Any]] | dict[str, Any]] = (
+        PARSER_KEY_TO_DICT[data_type].profiled(zone, data_type, profiles.append)
+        if profile
+        else PARSER_KEY_TO_DICT[data_type][zone]
+    )
+    import_times = import_time_report()
 
+    start = time.time()
     if data_type in ["exchange", "exchangeForecast"]:
         args = zone.split("->")
     else:
         args = [zone]
-    res = parser(
-        *args, target_datetime=parsed_target_datetime, logger=getLogger(__name__)
-    )
+    with code_profiler(profile_output) if profile_output else nullcontext():
+        res = parser(
+            *args, target_datetime=parsed_target_datetime, logger=getLogger(__name__)
+        )
 
     if not res:
         raise ValueError(f"Error: parser returned nothing ({res})")
@@ -120,8 +176,13 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
             [
                 "---------------------",
                 f"took {elapsed_time:.2f}s",
+                *[
+                    f"importing {module} took {import_time:.2f}s"
+                    for module, import_time in import_times
+                ],
                 f"min returned datetime: {first_dt} UTC",
                 f"max returned datetime: {last_dt} UTC {max_dt_warning}",
+                *[parser_profile.format() for parser_profile in profiles],
             ]
         )
     )
@@ -1,8 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from electricitymap.contrib.config.capacity import get_capacity_data
+from electricitymap.contrib.config import ZONES_CONFIG
+from electricitymap.contrib.config.capacity import (
+    CapacityTimeline,
+    get_capacity_data,
+    get_capacity_value_with_datetime,
+    get_zone_capacity_data,
+    get_zone_capacity_timelines,
+)
+from electricitymap.contrib.lib.types import ZoneKey
 
 
 def test_get_capacity_data():
@@ -52,3 +62,87 @@ def test_get_capacity_from_list():
             capacity = item["value"]
 
     assert capacity == 3
+
+
+def test_capacity_timeline():
+    timeline = CapacityTimeline.from_config(
+        [
+            {"datetime": "2023-06-01", "value": 8},
+            {"datetime": "2022-01-01", "value": 5},
+            {"datetime": "2024-01-01", "value": None},
+        ]
+    )
+    assert timeline.at(datetime(2021, 1, 1)) == 5
+    assert timeline.at(datetime(2023, 6, 1)) == 8
+    assert timeline.at(datetime(2023, 5, 31, 23, tzinfo=timezone.utc)) == 5
+    assert timeline.at(datetime(2024, 6, 1)) is None
+    # Aware datetimes are compared in UTC, 2023-06-01 01:00+02:00 is before June.
+    assert (
+        timeline.at(datetime(2023, 6, 1, 1, tzinfo=timezone(timedelta(hours=2)))) == 5
+    )
+
+
+def test_get_capacity_value_with_datetime_matches_timeline():
+    mode_capacity = [
+        {"datetime": "2023-06-01", "value": 8},
+        {"datetime": "2022-01-01T00:00:00+02:00", "value": 5},
+        {"datetime": "2024-01-01", "value": None},
+    ]
+    timeline = CapacityTimeline.from_config(mode_capacity)
+    for dt in [
+        datetime(2021, 12, 31, 23),
+        datetime(2023, 6, 1),
+        datetime(2023, 6, 1, 1, tzinfo=timezone(timedelta(hours=2))),
+        datetime(2024, 6, 1, tzinfo=timezone.utc),
+    ]:
+        assert get_capacity_value_with_datetime(mode_capacity, dt) == timeline.at(dt)
+
+
+def test_capacity_timeline_at_many():
+    timeline = CapacityTimeline.from_config(
+        [
+            {"datetime": "2022-01-01", "value": 5},
+            {"datetime": "2023-06-01", "value": 8},
+            {"datetime": "2024-01-01", "value": None},
+        ]
+    )
+    datetimes = pd.date_range("2021-01-01", "2025-01-01", freq="MS", tz="UTC")
+    capacities = timeline.at_many(datetimes)
+    assert isinstance(capacities, np.ndarray)
+    np.testing.assert_array_equal(
+        capacities,
+        [
+            np.nan if timeline.at(dt) is None else timeline.at(dt)
+            for dt in datetimes.to_pydatetime()
+        ],
+    )
+    np.testing.assert_array_equal(
+        timeline.at_many([datetime(2023, 6, 1), datetime(2023, 5, 31)]), [8, 5]
+    )
+    # Capacities in the old format are valid at any datetime.
+    np.testing.assert_array_equal(
+        CapacityTimeline.from_config(3).at_many(datetimes[:2]), [3, 3]
+    )
+
+
+def test_get_zone_capacity_data():
+    capacity = get_zone_capacity_data(ZoneKey("NL"), datetime(2023, 1, 1))
+    assert capacity == get_capacity_data(
+        ZONES_CONFIG[ZoneKey("NL")]["capacity"], datetime(2023, 1, 1)
+    )
+    assert get_zone_capacity_timelines(ZoneKey("NL")) is get_zone_capacity_timelines(
+        ZoneKey("NL")
+    )
+
+
+def test_get_capacity_data_follows_config_changes():
+    capacity_config = ZONES_CONFIG[ZoneKey("NL")]["capacity"]
+    nuclear = capacity_config["nuclear"]
+    get_capacity_data(capacity_config, datetime(2023, 1, 1))
+    try:
+        capacity_config["nuclear"] = 1.0
+        assert (
+            get_capacity_data(capacity_config, datetime(2023, 1, 1))["nuclear"] == 1.0
+        )
+    finally:
+        capacity_config["nuclear"] = nuclear
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from electricitymap.contrib.config.compiled import config_hash, load_compiled
+
+
+class TestLoadCompiled(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_dir = Path(self.tmp_dir.name, "config")
+        self.config_dir.joinpath("zones").mkdir(parents=True)
+        self.config_dir.joinpath("zones", "DE.yaml").write_text("timezone: CET\n")
+        self.cache_dir = Path(self.tmp_dir.name, "cache")
+        env = patch.dict(
+            os.environ, {"ELECTRICITYMAPS_CONFIG_CACHE_DIR": str(self.cache_dir)}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(config_hash.cache_clear)
+
+    def test_artifact_is_built_once(self):
+        build = MagicMock(return_value={"DE": {"timezone": "CET"}})
+        self.assertEqual(load_compiled("yaml", self.config_dir, build), build())
+        build.reset_mock()
+        self.assertEqual(
+            load_compiled("yaml", self.config_dir, build), {"DE": {"timezone": "CET"}}
+        )
+        build.assert_not_called()
+
+    def test_artifact_is_rebuilt_when_config_changes(self):
+        load_compiled("yaml", self.config_dir, lambda: "before")
+        self.config_dir.joinpath("zones", "DE.yaml").write_text("timezone: UTC\n")
+        config_hash.cache_clear()
+        self.assertEqual(
+            load_compiled("yaml", self.config_dir, lambda: "after"), "after"
+        )
+        # The artifact compiled from the previous config is removed.
+        self.assertEqual(len(list(self.cache_dir.glob("yaml-*.pickle"))), 1)
+
+    def test_cache_can_be_disabled(self):
+        with patch.dict(os.environ, {"ELECTRICITYMAPS_CONFIG_CACHE": "0"}):
+            load_compiled("yaml", self.config_dir, lambda: "value")
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_corrupted_artifact_is_rebuilt(self):
+        load_compiled("yaml", self.config_dir, lambda: "value")
+        for path in self.cache_dir.glob("yaml-*.pickle"):
+            path.write_bytes(b"corrupted")
+        with self.assertLogs("electricitymap.contrib.config.compiled", "WARNING"):
+            value = load_compiled("yaml", self.config_dir, lambda: "rebuilt")
+        self.assertEqual(value, "rebuilt")
+        self.assertEqual(
+            load_compiled("yaml", self.config_dir, lambda: None), "rebuilt"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(buffer=True)
@@ -0,0 +1,84 @@
+import unittest
+from datetime import datetime, timezone
+
+from electricitymap.contrib import config
+from electricitymap.contrib.config.emission_factors import EmissionFactorIndex
+from electricitymap.contrib.lib.types import ZoneKey
+
+DEFAULTS = {
+    "coal": {"source": "IPCC 2014", "value": 820},
+    "battery discharge": [
+        {"datetime": "2016-01-01", "value": 551.2},
+        {"datetime": "2015-01-01", "value": 411.8},
+    ],
+}
+ZONE_OVERRIDES = {
+    ZoneKey("DE"): {
+        "coal": [
+            {"datetime": "2019-01-01", "value": 1000},
+            {"datetime": "2020-01-01", "value": 900},
+            {"datetime": "2020-01-01", "value": 800},
+        ],
+    },
+}
+
+
+class EmissionFactorIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = EmissionFactorIndex(DEFAULTS, ZONE_OVERRIDES)
+
+    def test_latest(self):
+        self.assertEqual(
+            self.index.latest(ZoneKey("DE")),
+            {"coal": 900, "battery discharge": 551.2},
+        )
+        # Zones without overrides use the defaults.
+        self.assertEqual(
+            self.index.latest(ZoneKey("FR")),
+            {"coal": 820, "battery discharge": 551.2},
+        )
+
+    def test_latest_is_immutable(self):
+        with self.assertRaises(TypeError):
+            self.index.latest(ZoneKey("DE"))["coal"] = 0  # type: ignore
+
+    def test_at(self):
+        self.assertEqual(
+            self.index.at(ZoneKey("DE"), datetime(2019, 6, 1, tzinfo=timezone.utc)),
+            {"coal": 1000, "battery discharge": 551.2},
+        )
+        self.assertEqual(
+            self.index.value(
+                ZoneKey("DE"), "coal", datetime(2020, 1, 1, tzinfo=timezone.utc)
+            ),
+            900,
+        )
+        self.assertEqual(
+            self.index.value(
+                ZoneKey("FR"), "battery discharge", datetime(2015, 12, 31)
+            ),
+            411.8,
+        )
+        # The earliest value is used before it is effective.
+        self.assertEqual(
+            self.index.value(ZoneKey("DE"), "coal", datetime(2000, 1, 1)), 1000
+        )
+
+    def test_unknown_mode(self):
+        with self.assertRaises(KeyError):
+            self.index.value(ZoneKey("DE"), "wind")
+
+    def test_config_index(self):
+        for zone_key in ["DE", "FR", "KR", "US-CAL-CISO"]:
+            self.assertEqual(
+                config.emission_factors(ZoneKey(zone_key)),
+                dict(config.EMISSION_FACTORS_LIFECYCLE.latest(ZoneKey(zone_key))),
+            )
+        self.assertLess(
+            config.EMISSION_FACTORS_DIRECT.value(ZoneKey("FR"), "solar"),
+            config.EMISSION_FACTORS_LIFECYCLE.value(ZoneKey("FR"), "solar"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(buffer=True)
@@ -1,10 +1,16 @@
 import unittest
+from datetime import datetime
+from unittest.mock import patch
 
 from scripts.update_capacity_configuration import (
+    ZONES_CONFIG,
+    format_zone_config_diff,
     generate_aggregated_capacity_config_dict,
     generate_aggregated_capacity_config_list,
+    generate_capacity_updates,
     generate_zone_capacity_config,
     generate_zone_capacity_list,
+    update_sources,
 )
 
 
@@ -268,3 +274,68 @@ class updateCapacityConfigurationTestCase(unittest.TestCase):
         assert len(expected) == len(updated_capacity)
         assert expected[0] in updated_capacity
         assert expected[1] in updated_capacity
+
+
+SOURCE_CAPACITIES = {
+    "EMBER": {
+        "IS": {"wind": {"datetime": "2022-01-01", "source": "abc", "value": 3}},
+    },
+    "IRENA": {
+        "IS": {"solar": {"datetime": "2022-01-01", "source": "def", "value": 9}},
+        "NI": {
+            mode: {"datetime": "2022-01-01", "source": "def", "value": value}
+            for mode, value in ZONES_CONFIG["NI"]["capacity"].items()
+        },
+    },
+}
+
+
+def fetch_source_capacity(source, target_datetime, session):
+    return SOURCE_CAPACITIES[source]
+
+
+@patch(
+    "scripts.update_capacity_configuration.fetch_source_capacity",
+    fetch_source_capacity,
+)
+class updateSourcesTestCase(unittest.TestCase):
+    def test_generate_capacity_updates(self):
+        with patch.dict(
+            ZONES_CONFIG,
+            {
+                "NI": {
+                    **ZONES_CONFIG["NI"],
+                    "capacity": SOURCE_CAPACITIES["IRENA"]["NI"],
+                }
+            },
+        ):
+            updated_zone_configs = generate_capacity_updates(
+                ["EMBER", "IRENA"], datetime(2022, 1, 1), None
+            )
+        self.assertEqual(list(updated_zone_configs), ["IS"])
+        self.assertEqual(
+            updated_zone_configs["IS"]["capacity"],
+            {
+                "solar": SOURCE_CAPACITIES["IRENA"]["IS"]["solar"],
+                "wind": SOURCE_CAPACITIES["EMBER"]["IS"]["wind"],
+            },
+        )
+        self.assertEqual(
+            {**updated_zone_configs["IS"], "capacity": None},
+            {**ZONES_CONFIG["IS"], "capacity": None},
+        )
+
+    def test_format_zone_config_diff(self):
+        updated_zone_configs = generate_capacity_updates(
+            ["EMBER"], datetime(2022, 1, 1), None
+        )
+        diff = format_zone_config_diff("IS", updated_zone_configs["IS"])
+        self.assertTrue(diff.startswith("--- a/config/zones/IS.yaml\n"))
+        self.assertIn("-  wind: 2\n", diff)
+        self.assertIn("+  wind:\n", diff)
+
+    @patch("scripts.update_capacity_configuration.write_zone_config")
+    def test_dry_run(self, write_zone_config):
+        paths = update_sources(["EMBER"], datetime(2022, 1, 1), None, dry_run=True)
+        self.assertEqual(paths, [])
+        write_zone_config.assert_not_called()